@@ -3,34 +3,18 @@
 import argparse
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from rich.console import Console
 
 from swecli.ui_textual.style_tokens import CYAN, ERROR, SUCCESS, WARNING
 
-from swecli.core.runtime.approval import ApprovalManager
-from swecli.core.runtime import ConfigManager, ModeManager
-from swecli.core.context_engineering.history import SessionManager, UndoManager
-from swecli.core.runtime.services import RuntimeService
-from swecli.models.agent_deps import AgentDependencies
-from swecli.models.message import ChatMessage, Role
-from swecli.ui_textual.runner import launch_textual_cli
-from swecli.setup import run_setup_wizard
-from swecli.setup.wizard import config_exists
-from swecli.core.context_engineering.tools.implementations import (
-    BashTool,
-    EditTool,
-    FileOperations,
-    VLMTool,
-    WebFetchTool,
-    WebScreenshotTool,
-    WriteTool,
-)
-from swecli.core.context_engineering.tools.implementations.web_search_tool import WebSearchTool
-from swecli.core.context_engineering.tools.implementations.notebook_edit_tool import (
-    NotebookEditTool,
-)
-from swecli.core.context_engineering.tools.implementations.ask_user_tool import AskUserTool
+# Everything else (the Textual UI, the runtime and the tools) is imported by the
+# command that needs it, so `swecli --version`, `swecli config` and `swecli mcp`
+# start without loading them. tests/manual/benchmark_startup.py tracks this.
+if TYPE_CHECKING:
+    from swecli.core.context_engineering.history import SessionManager
+    from swecli.core.runtime import ConfigManager
 
 
 def main() -> None:
@@ -47,6 +31,7 @@ Examples:
   swecli "do something"           # Start session with initial message
   swecli run ui                   # Start web UI (backend + frontend) and open browser
   swecli -p "create hello.py"     # Non-interactive mode
+  swecli batch tasks.jsonl -j 8   # Run a manifest of prompts concurrently
   swecli mcp list                 # List MCP servers
   swecli mcp add myserver uvx mcp-server-example
         """,
@@ -214,8 +199,43 @@ Examples:
         help="Host for backend API server (default: 127.0.0.1)",
     )
 
+    # Batch subcommand
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="Run prompts from a JSONL manifest headlessly",
+        description=(
+            "Run every task in a JSONL manifest ({prompt, working_dir, model, limits} per "
+            "line) on a worker pool and write one JSON result per task."
+        ),
+    )
+    batch_parser.add_argument("manifest", help="JSONL manifest of tasks")
+    batch_parser.add_argument(
+        "--output",
+        "-o",
+        metavar="PATH",
+        help="Results file (default: <manifest>.results.jsonl)",
+    )
+    batch_parser.add_argument(
+        "--workers",
+        "-j",
+        type=int,
+        default=4,
+        metavar="N",
+        help="Number of tasks to run concurrently (default: 4)",
+    )
+    batch_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip tasks that already succeeded in the results file",
+    )
+    batch_parser.add_argument(
+        "--model",
+        metavar="MODEL",
+        help="Model for tasks that don't set one",
+    )
+
     # Support bare positional prompt: swecli "hello" opens interactive TUI with initial message
-    known_subcommands = {"config", "mcp", "run"}
+    known_subcommands = {"config", "mcp", "run", "batch"}
     argv = sys.argv[1:]
     bare_prompt = None
 
@@ -277,6 +297,16 @@ Examples:
         _handle_run_command(args)
         return
 
+    # Handle batch runs
+    if args.command == "batch":
+        _handle_batch_command(args)
+        return
+
+    from swecli.core.context_engineering.history import SessionManager
+    from swecli.core.runtime import ConfigManager
+    from swecli.setup import run_setup_wizard
+    from swecli.setup.wizard import config_exists
+
     console = Console()
 
     # Run setup wizard if config doesn't exist
@@ -355,6 +385,8 @@ Examples:
 
             return
 
+        from swecli.ui_textual.runner import launch_textual_cli
+
         launch_textual_cli(
             message=bare_prompt,
             working_dir=working_dir,
@@ -393,6 +425,8 @@ def _handle_config_command(args) -> None:
         sys.exit(1)
 
     if args.config_command == "setup":
+        from swecli.setup import run_setup_wizard
+
         # Run setup wizard (can be used to reconfigure)
         if not run_setup_wizard():
             console.print(f"[{WARNING}]Setup cancelled.[/{WARNING}]")
@@ -698,9 +732,70 @@ def _handle_run_command(args) -> None:
             sys.exit(1)
 
 
+def _handle_batch_command(args) -> None:
+    """Run a JSONL manifest of prompts headlessly.
+
+    Args:
+        args: Parsed command-line arguments
+    """
+    from swecli.core.runtime.services import BatchRunner, load_manifest
+
+    console = Console()
+    manifest = Path(args.manifest)
+    if not manifest.is_file():
+        console.print(f"[{ERROR}]Error: Manifest not found: {manifest}[/{ERROR}]")
+        sys.exit(1)
+
+    output = Path(args.output) if args.output else manifest.with_suffix(".results.jsonl")
+    if output.exists() and output.stat().st_size and not args.resume:
+        console.print(
+            f"[{ERROR}]Error: {output} already has results. "
+            f"Use --resume to continue it or --output to write elsewhere.[/{ERROR}]"
+        )
+        sys.exit(1)
+
+    try:
+        tasks = load_manifest(manifest, Path(args.working_dir) if args.working_dir else None)
+    except ValueError as exc:
+        console.print(f"[{ERROR}]Error: {exc}[/{ERROR}]")
+        sys.exit(1)
+
+    if args.dangerously_skip_permissions:
+        console.print(
+            f"[{WARNING}]Warning: --dangerously-skip-permissions is enabled. "
+            f"All operations will be auto-approved without confirmation.[/{WARNING}]"
+        )
+
+    def report(record: dict) -> None:
+        color = SUCCESS if record["status"] == "success" else ERROR
+        seconds = record["timings"]["total_seconds"]
+        console.print(f"[{color}]{record['status']:>7}[/{color}]  {record['id']}  ({seconds:.1f}s)")
+
+    runner = BatchRunner(
+        output,
+        workers=args.workers,
+        auto_approve=args.dangerously_skip_permissions,
+        config_overrides={"model": args.model} if args.model else None,
+        on_result=report,
+    )
+    try:
+        summary = runner.run(tasks, resume=args.resume)
+    except KeyboardInterrupt:
+        console.print(f"\n[{WARNING}]Interrupted. Re-run with --resume to continue.[/{WARNING}]")
+        sys.exit(130)
+
+    total_tokens = summary.usage.get("total_tokens", 0)
+    console.print(
+        f"{summary.succeeded} succeeded, {summary.failed} failed, {summary.skipped} skipped "
+        f"in {summary.elapsed_seconds:.1f}s ({total_tokens} tokens) -> {output}"
+    )
+    if summary.failed:
+        sys.exit(1)
+
+
 def _run_non_interactive(
-    config_manager: ConfigManager,
-    session_manager: SessionManager,
+    config_manager: "ConfigManager",
+    session_manager: "SessionManager",
     prompt: str,
     dangerously_skip_permissions: bool = False,
 ) -> None:
@@ -712,6 +807,15 @@ def _run_non_interactive(
         prompt: User prompt to execute
         dangerously_skip_permissions: If True, auto-approve all operations
     """
+    from swecli.core.base.factories import build_default_tools
+    from swecli.core.context_engineering.history import UndoManager
+    from swecli.core.context_engineering.tools.implementations.ask_user_tool import AskUserTool
+    from swecli.core.runtime import ModeManager
+    from swecli.core.runtime.approval import ApprovalManager
+    from swecli.core.runtime.services import RuntimeService
+    from swecli.models.agent_deps import AgentDependencies
+    from swecli.models.message import ChatMessage, Role
+
     console = Console()
 
     if dangerously_skip_permissions:
@@ -727,29 +831,10 @@ def _run_non_interactive(
         approval_manager.auto_approve_remaining = True
     undo_manager = UndoManager(config.max_undo_history)
 
-    file_ops = FileOperations(config, config_manager.working_dir)
-    write_tool = WriteTool(config, config_manager.working_dir)
-    edit_tool = EditTool(config, config_manager.working_dir)
-    bash_tool = BashTool(config, config_manager.working_dir)
-    web_fetch_tool = WebFetchTool(config, config_manager.working_dir)
-    web_search_tool = WebSearchTool(config, config_manager.working_dir)
-    notebook_edit_tool = NotebookEditTool(config_manager.working_dir)
-    ask_user_tool = AskUserTool()  # Uses console fallback in non-interactive mode
-    vlm_tool = VLMTool(config, config_manager.working_dir)
-    web_screenshot_tool = WebScreenshotTool(config, config_manager.working_dir)
-
     runtime_service = RuntimeService(config_manager, mode_manager)
     runtime_suite = runtime_service.build_suite(
-        file_ops=file_ops,
-        write_tool=write_tool,
-        edit_tool=edit_tool,
-        bash_tool=bash_tool,
-        web_fetch_tool=web_fetch_tool,
-        web_search_tool=web_search_tool,
-        notebook_edit_tool=notebook_edit_tool,
-        ask_user_tool=ask_user_tool,
-        vlm_tool=vlm_tool,
-        web_screenshot_tool=web_screenshot_tool,
+        **build_default_tools(config, config_manager.working_dir),
+        ask_user_tool=AskUserTool(),  # Uses console fallback in non-interactive mode
         mcp_manager=None,
     )
 
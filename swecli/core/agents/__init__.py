@@ -1,16 +1,7 @@
 """Agent implementations and supporting components."""
 
-from .components import (
-    AgentHttpClient,
-    HttpResult,
-    PlanningPromptBuilder,
-    ResponseCleaner,
-    SystemPromptBuilder,
-    ToolSchemaBuilder,
-    resolve_api_config,
-)
-from .swecli_agent import SwecliAgent
-from .planning_agent import PlanningAgent
+from importlib import import_module
+from typing import Dict, Tuple
 
 __all__ = [
     "AgentHttpClient",
@@ -23,3 +14,26 @@ __all__ = [
     "SwecliAgent",
     "PlanningAgent",
 ]
+
+# Loaded on first access: importing e.g. ``swecli.core.agents.prompts`` should
+# not pull in the HTTP clients
+_EXPORTS: Dict[str, Tuple[str, str]] = {
+    "AgentHttpClient": ("swecli.core.agents.components", "AgentHttpClient"),
+    "HttpResult": ("swecli.core.agents.components", "HttpResult"),
+    "PlanningPromptBuilder": ("swecli.core.agents.components", "PlanningPromptBuilder"),
+    "ResponseCleaner": ("swecli.core.agents.components", "ResponseCleaner"),
+    "SystemPromptBuilder": ("swecli.core.agents.components", "SystemPromptBuilder"),
+    "ToolSchemaBuilder": ("swecli.core.agents.components", "ToolSchemaBuilder"),
+    "resolve_api_config": ("swecli.core.agents.components", "resolve_api_config"),
+    "SwecliAgent": ("swecli.core.agents.swecli_agent", "SwecliAgent"),
+    "PlanningAgent": ("swecli.core.agents.planning_agent", "PlanningAgent"),
+}
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'swecli.core.agents' has no attribute '{name}'")
+    module_path, attr_name = _EXPORTS[name]
+    attr = getattr(import_module(module_path), attr_name)
+    globals()[name] = attr
+    return attr
@@ -3,6 +3,8 @@
 from .api import (
     AgentHttpClient,
     HttpResult,
+    ToolSchemaFreezer,
+    annotate_cache_usage,
     resolve_api_config,
     create_http_client,
     create_http_client_for_provider,
@@ -17,10 +19,16 @@ from .prompts import (
     ThinkingPromptBuilder,
 )
 from .response import ParsedPlan, ResponseCleaner, extract_plan_from_response, parse_plan
-from .schemas import PLANNING_TOOLS, PlanningToolSchemaBuilder, ToolSchemaBuilder
+from .schemas import (
+    CONCURRENT_SAFE_TOOLS,
+    PLANNING_TOOLS,
+    PlanningToolSchemaBuilder,
+    ToolSchemaBuilder,
+)
 
 __all__ = [
     "AgentHttpClient",
+    "CONCURRENT_SAFE_TOOLS",
     "EnvironmentCollector",
     "EnvironmentContext",
     "HttpResult",
@@ -32,6 +40,8 @@ __all__ = [
     "SystemPromptBuilder",
     "ThinkingPromptBuilder",
     "ToolSchemaBuilder",
+    "ToolSchemaFreezer",
+    "annotate_cache_usage",
     "build_max_tokens_param",
     "build_temperature_param",
     "create_http_client",
@@ -14,15 +14,34 @@ from .configuration import (
     resolve_api_config,
 )
 from .http_client import AgentHttpClient, HttpResult
+from .prompt_cache import ToolSchemaFreezer, add_anthropic_cache_breakpoints, annotate_cache_usage
+from .streaming import ChatCompletionAccumulator, SSEEvent, StreamedResponse, iter_sse_events
+from .transport import (
+    ConnectionPool,
+    ConnectionStats,
+    connection_pool_stats,
+    get_connection_pool,
+)
 
 __all__ = [
     "AgentHttpClient",
     "AnthropicAdapter",
+    "ChatCompletionAccumulator",
+    "ConnectionPool",
+    "ConnectionStats",
     "HttpResult",
     "OpenAIResponsesAdapter",
+    "SSEEvent",
+    "StreamedResponse",
+    "ToolSchemaFreezer",
+    "add_anthropic_cache_breakpoints",
+    "annotate_cache_usage",
     "build_max_tokens_param",
     "build_temperature_param",
+    "connection_pool_stats",
     "create_http_client",
     "create_http_client_for_provider",
+    "get_connection_pool",
+    "iter_sse_events",
     "resolve_api_config",
 ]
@@ -4,13 +4,21 @@ import logging
 import time
 from typing import Any, Dict, List, Optional
 
-import requests
-
 from swecli.core.agents.components.api.http_client import (
     MAX_RETRIES,
     RETRYABLE_STATUS_CODES,
     RETRY_DELAYS,
+    AgentHttpClient,
+    finalize_stream_result,
+)
+from swecli.core.agents.components.api.prompt_cache import add_anthropic_cache_breakpoints
+from swecli.core.agents.components.api.streaming import (
+    ChatCompletionAccumulator,
+    SSEEvent,
+    TextDeltaCallback,
+    ToolCallCallback,
 )
+from swecli.core.agents.components.api.transport import get_connection_pool
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +34,7 @@ class AnthropicAdapter:
             "x-api-key": api_key,
             "anthropic-version": "2023-06-01",
         }
+        self._pool = get_connection_pool(api_url)
 
     def convert_request(self, openai_payload: Dict[str, Any]) -> Dict[str, Any]:
         """Convert OpenAI-style payload to Anthropic format.
@@ -34,6 +43,7 @@ class AnthropicAdapter:
         - Requires max_tokens (not optional)
         - tool_choice format is different: {"type": "auto"} instead of "auto"
         - System message must be extracted from messages array
+        - Prompt caching needs explicit ``cache_control`` breakpoints
         """
         messages = openai_payload.get("messages", [])
 
@@ -78,7 +88,7 @@ class AnthropicAdapter:
                     "name": tool_choice.get("function", {}).get("name")
                 }
 
-        return anthropic_payload
+        return add_anthropic_cache_breakpoints(anthropic_payload)
 
     def _convert_tools(self, openai_tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Convert OpenAI tool format to Anthropic format."""
@@ -174,13 +184,29 @@ class AnthropicAdapter:
         }
         return mapping.get(anthropic_reason or "", "stop")
 
-    def _convert_usage(self, anthropic_usage: Dict[str, Any]) -> Dict[str, int]:
+    def _convert_usage(self, anthropic_usage: Dict[str, Any]) -> Dict[str, Any]:
         """Convert Anthropic usage to OpenAI format."""
-        return {
-            "prompt_tokens": anthropic_usage.get("input_tokens", 0),
-            "completion_tokens": anthropic_usage.get("output_tokens", 0),
-            "total_tokens": anthropic_usage.get("input_tokens", 0) + anthropic_usage.get("output_tokens", 0),
+        usage = self._prompt_usage(anthropic_usage)
+        usage["completion_tokens"] = anthropic_usage.get("output_tokens", 0)
+        usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+        return usage
+
+    @staticmethod
+    def _prompt_usage(anthropic_usage: Dict[str, Any]) -> Dict[str, Any]:
+        """Map Anthropic input token counters to OpenAI's ``prompt_tokens`` fields.
+
+        Anthropic's ``input_tokens`` only counts tokens after the last cache
+        breakpoint; cache reads and writes are reported separately.
+        """
+        cache_read = anthropic_usage.get("cache_read_input_tokens") or 0
+        cache_write = anthropic_usage.get("cache_creation_input_tokens") or 0
+        usage: Dict[str, Any] = {
+            "prompt_tokens": anthropic_usage.get("input_tokens", 0) + cache_read + cache_write,
         }
+        if {"cache_read_input_tokens", "cache_creation_input_tokens"} & anthropic_usage.keys():
+            usage["prompt_tokens_details"] = {"cached_tokens": cache_read}
+            usage["cache_creation_input_tokens"] = cache_write
+        return usage
 
     def post_json(self, payload: Dict[str, Any], *, task_monitor: Any = None) -> Any:
         """Make a request to Anthropic API with retry logic.
@@ -195,13 +221,13 @@ class AnthropicAdapter:
         @dataclass
         class HttpResult:
             success: bool
-            response: Union[requests.Response, None] = None
+            response: Any = None
             error: Union[str, None] = None
             interrupted: bool = False
 
         @dataclass
         class MockResponse:
-            """Mock response object that mimics requests.Response for compatibility."""
+            """Mock response object that mimics an HTTP response for compatibility."""
             status_code: int
             _json_data: Dict[str, Any]
             text: str
@@ -215,7 +241,7 @@ class AnthropicAdapter:
 
         for attempt in range(MAX_RETRIES + 1):
             try:
-                response = requests.post(
+                response = self._pool.post(
                     self.api_url,
                     headers=self.headers,
                     json=anthropic_payload,
@@ -263,3 +289,93 @@ class AnthropicAdapter:
                 return HttpResult(success=False, error=str(exc))
 
         return last_result or HttpResult(success=False, error="Unexpected retry exhaustion")
+
+    # ------------------------------------------------------------------
+    # Streaming
+    # ------------------------------------------------------------------
+
+    def apply_stream_event(self, accumulator: ChatCompletionAccumulator, event: SSEEvent) -> bool:
+        """Translate one Anthropic Messages stream event into accumulator calls.
+
+        Event sequence: ``message_start``, then per content block
+        ``content_block_start`` / ``content_block_delta`` / ``content_block_stop``,
+        then ``message_delta`` and ``message_stop``. A ``tool_use`` block is
+        complete at its ``content_block_stop``.
+
+        Returns:
+            False once the stream is finished, True otherwise
+        """
+        data = event.json()
+        event_type = data.get("type", event.event)
+
+        if event_type == "message_start":
+            message = data.get("message", {})
+            accumulator.response_id = message.get("id", "")
+            accumulator.model = message.get("model", "")
+            self._merge_stream_usage(accumulator, message.get("usage", {}))
+        elif event_type == "content_block_start":
+            block = data.get("content_block", {})
+            if block.get("type") == "tool_use":
+                accumulator.start_tool_call(data.get("index", 0), block.get("id", ""), block.get("name", ""))
+            elif block.get("type") == "text":
+                accumulator.add_text(block.get("text", ""))
+        elif event_type == "content_block_delta":
+            delta = data.get("delta", {})
+            delta_type = delta.get("type")
+            if delta_type == "text_delta":
+                accumulator.add_text(delta.get("text", ""))
+            elif delta_type == "input_json_delta":
+                accumulator.add_tool_arguments(data.get("index", 0), delta.get("partial_json", ""))
+            elif delta_type == "thinking_delta":
+                accumulator.add_reasoning(delta.get("thinking", ""))
+        elif event_type == "content_block_stop":
+            accumulator.finish_tool_call(data.get("index", 0))
+        elif event_type == "message_delta":
+            stop_reason = data.get("delta", {}).get("stop_reason")
+            if stop_reason:
+                accumulator.finish_reason = self._convert_stop_reason(stop_reason)
+            self._merge_stream_usage(accumulator, data.get("usage", {}))
+        elif event_type == "message_stop":
+            return False
+        elif event_type == "error":
+            error = data.get("error", {})
+            accumulator.error = error.get("message", str(error))
+            return False
+        return True
+
+    def _merge_stream_usage(
+        self, accumulator: ChatCompletionAccumulator, anthropic_usage: Dict[str, Any]
+    ) -> None:
+        """Fold partial Anthropic usage counters into the accumulator."""
+        if not anthropic_usage:
+            return
+        usage = dict(accumulator.usage)
+        if "input_tokens" in anthropic_usage:
+            usage.update(self._prompt_usage(anthropic_usage))
+        if "output_tokens" in anthropic_usage:
+            usage["completion_tokens"] = anthropic_usage["output_tokens"]
+        usage["total_tokens"] = usage.get("prompt_tokens", 0) + usage.get("completion_tokens", 0)
+        accumulator.usage = usage
+
+    def post_json_stream(
+        self,
+        payload: Dict[str, Any],
+        *,
+        task_monitor: Any = None,
+        on_text_delta: Optional[TextDeltaCallback] = None,
+        on_tool_call: Optional[ToolCallCallback] = None,
+    ) -> Any:
+        """Stream a request to the Anthropic API.
+
+        Uses the Messages streaming format and returns the assembled response
+        in OpenAI format, like :meth:`post_json`.
+        """
+        accumulator = ChatCompletionAccumulator(on_text_delta, on_tool_call)
+        anthropic_payload = {**self.convert_request(payload), "stream": True}
+        client = AgentHttpClient(self.api_url, self.headers, pool=self._pool)
+        result = client.stream_events(
+            anthropic_payload,
+            lambda event: self.apply_stream_event(accumulator, event),
+            task_monitor=task_monitor,
+        )
+        return finalize_stream_result(result, accumulator)
@@ -6,9 +6,17 @@ import logging
 import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Union
-
-import requests
+from typing import Any, Callable, Optional, Union
+
+from .streaming import (
+    ChatCompletionAccumulator,
+    SSEEvent,
+    TextDeltaCallback,
+    ToolCallCallback,
+    build_streamed_response,
+    read_event_stream,
+)
+from .transport import ConnectionPool, get_connection_pool
 
 logger = logging.getLogger(__name__)
 
@@ -23,24 +31,39 @@ class HttpResult:
     """Container describing the outcome of an HTTP request."""
 
     success: bool
-    response: Union[requests.Response, None] = None
+    response: Any = None
     error: Union[str, None] = None
     interrupted: bool = False
 
 
 class AgentHttpClient:
-    """Thin wrapper around requests with interrupt support and retry logic."""
+    """Chat completions client with interrupt support and retry logic.
+
+    Requests go through the keep-alive :class:`ConnectionPool` shared by every
+    client that talks to the same provider origin.
+    """
 
     # Timeout configuration: (connect_timeout, read_timeout)
     # connect_timeout: how long to wait to establish connection (10s)
     # read_timeout: how long to wait for response (300s = 5 minutes for long LLM responses)
     TIMEOUT = (10, 300)
 
-    def __init__(self, api_url: str, headers: dict[str, str]) -> None:
+    def __init__(
+        self,
+        api_url: str,
+        headers: dict[str, str],
+        pool: Optional[ConnectionPool] = None,
+    ) -> None:
         self._api_url = api_url
         self._headers = headers
+        self._pool = pool or get_connection_pool(api_url)
 
-    def _get_retry_delay(self, response: requests.Response, attempt: int) -> float:
+    @property
+    def pool(self) -> ConnectionPool:
+        """Connection pool used for this client's endpoint."""
+        return self._pool
+
+    def _get_retry_delay(self, response: Any, attempt: int) -> float:
         """Determine retry delay from Retry-After header or default backoff.
 
         Args:
@@ -77,6 +100,60 @@ class AgentHttpClient:
         Retries on HTTP 429 (rate limit) and 503 (service unavailable) with
         exponential backoff. Respects the ``Retry-After`` header when present.
         """
+        return self._post_with_retry(
+            lambda: self._execute_request(payload, task_monitor=task_monitor),
+            task_monitor=task_monitor,
+        )
+
+    def post_json_stream(
+        self,
+        payload: dict[str, Any],
+        *,
+        task_monitor: Union[Any, None] = None,
+        on_text_delta: Optional[TextDeltaCallback] = None,
+        on_tool_call: Optional[ToolCallCallback] = None,
+    ) -> HttpResult:
+        """Execute a streaming chat completion request.
+
+        Sends the payload with ``stream: true`` and assembles the SSE deltas
+        into a regular Chat Completions response, so callers can treat the
+        result exactly like :meth:`post_json`. Text deltas are forwarded to
+        ``on_text_delta`` as they arrive and each tool call is passed to
+        ``on_tool_call`` as soon as its arguments are complete.
+        """
+        accumulator = ChatCompletionAccumulator(on_text_delta, on_tool_call)
+        stream_payload = {
+            **payload,
+            "stream": True,
+            "stream_options": {"include_usage": True},
+        }
+        result = self.stream_events(
+            stream_payload, accumulator.apply_chat_event, task_monitor=task_monitor
+        )
+        return finalize_stream_result(result, accumulator)
+
+    def stream_events(
+        self,
+        payload: dict[str, Any],
+        handle_event: Callable[[SSEEvent], bool],
+        *,
+        task_monitor: Union[Any, None] = None,
+    ) -> HttpResult:
+        """POST a streaming request and dispatch each SSE event to ``handle_event``.
+
+        Shares the retry policy of :meth:`post_json`; retries only happen
+        before the first event, since a 429/503 arrives as the status line.
+        Provider adapters use this to plug in their own event formats.
+        """
+        return self._post_with_retry(
+            lambda: self._execute_stream_request(payload, handle_event, task_monitor),
+            task_monitor=task_monitor,
+        )
+
+    def _post_with_retry(
+        self, send: Callable[[], HttpResult], *, task_monitor: Union[Any, None] = None
+    ) -> HttpResult:
+        """Run ``send`` until it returns a non-retryable result."""
         last_result: Union[HttpResult, None] = None
 
         for attempt in range(MAX_RETRIES + 1):
@@ -84,7 +161,7 @@ class AgentHttpClient:
             if self._should_interrupt(task_monitor):
                 return HttpResult(success=False, error="Interrupted by user", interrupted=True)
 
-            result = self._execute_request(payload, task_monitor=task_monitor)
+            result = send()
 
             # On network/exception failure, don't retry — return immediately
             if not result.success:
@@ -137,7 +214,7 @@ class AgentHttpClient:
         # Fast path when no monitor is provided
         if task_monitor is None:
             try:
-                response = requests.post(
+                response = self._pool.post(
                     self._api_url,
                     headers=self._headers,
                     json=payload,
@@ -148,17 +225,23 @@ class AgentHttpClient:
                 return HttpResult(success=False, error=str(exc))
 
         # Interrupt-aware execution path
-        session = requests.Session()
         response_container: dict[str, Any] = {"response": None, "error": None}
+        cancelled = threading.Event()
 
         def make_request() -> None:
             try:
-                response_container["response"] = session.post(
+                response = self._pool.open_stream(
                     self._api_url,
                     headers=self._headers,
                     json=payload,
                     timeout=self.TIMEOUT,
                 )
+                response_container["response"] = response
+                try:
+                    if not cancelled.is_set():
+                        response.read()
+                finally:
+                    response.close()
             except Exception as exc:  # pragma: no cover - captured for caller
                 response_container["error"] = exc
 
@@ -183,9 +266,11 @@ class AgentHttpClient:
             if self._should_interrupt(task_monitor):
                 debug_log(
                     "HttpClient",
-                    f"INTERRUPT DETECTED at poll #{poll_count}, closing session",
+                    f"INTERRUPT DETECTED at poll #{poll_count}, cancelling request",
                 )
-                session.close()
+                # Drop only this request's connection; the pool stays warm
+                cancelled.set()
+                self._pool.cancel(response_container["response"])
                 return HttpResult(success=False, error="Interrupted by user", interrupted=True)
             request_thread.join(timeout=0.01)  # 10ms polling for ESC interrupt
 
@@ -193,3 +278,52 @@ class AgentHttpClient:
             return HttpResult(success=False, error=str(response_container["error"]))
 
         return HttpResult(success=True, response=response_container["response"])
+
+    def _execute_stream_request(
+        self,
+        payload: dict[str, Any],
+        handle_event: Callable[[SSEEvent], bool],
+        task_monitor: Union[Any, None] = None,
+    ) -> HttpResult:
+        """Execute a single streaming POST request."""
+        outcome = read_event_stream(
+            lambda: self._pool.open_stream(
+                self._api_url,
+                headers=self._headers,
+                json=payload,
+                timeout=self.TIMEOUT,
+            ),
+            handle_event,
+            lambda: self._should_interrupt(task_monitor),
+            cancel_response=self._pool.cancel,
+        )
+        if outcome.interrupted:
+            return HttpResult(success=False, error=outcome.error, interrupted=True)
+        if outcome.error:
+            return HttpResult(success=False, error=outcome.error)
+        return HttpResult(success=True, response=outcome.response)
+
+
+def finalize_stream_result(
+    result: HttpResult, accumulator: ChatCompletionAccumulator
+) -> HttpResult:
+    """Convert a raw streaming result into an assembled Chat Completions result.
+
+    Non-200 responses and transport errors pass through unchanged so callers
+    keep their existing error handling.
+    """
+    if not result.success or result.response is None:
+        return result
+    if result.response.status_code != 200:
+        return result
+    if accumulator.error:
+        return HttpResult(success=False, error=accumulator.error)
+
+    # Streams that end without a terminal event still carry usable tool calls
+    accumulator.finish_all_tool_calls()
+    if accumulator.first_token_latency is not None:
+        logger.debug("Stream first token after %.3fs", accumulator.first_token_latency)
+    return HttpResult(
+        success=True,
+        response=build_streamed_response(accumulator, dict(result.response.headers)),
+    )
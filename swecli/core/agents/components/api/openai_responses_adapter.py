@@ -13,13 +13,20 @@ import logging
 import time
 from typing import Any, Dict, List, Optional, Union
 
-import requests
-
 from swecli.core.agents.components.api.http_client import (
     MAX_RETRIES,
     RETRYABLE_STATUS_CODES,
     RETRY_DELAYS,
+    AgentHttpClient,
+    finalize_stream_result,
+)
+from swecli.core.agents.components.api.streaming import (
+    ChatCompletionAccumulator,
+    SSEEvent,
+    TextDeltaCallback,
+    ToolCallCallback,
 )
+from swecli.core.agents.components.api.transport import get_connection_pool
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +45,7 @@ class OpenAIResponsesAdapter:
             "Content-Type": "application/json",
             "Authorization": f"Bearer {api_key}",
         }
+        self._pool = get_connection_pool(api_url)
 
     # ------------------------------------------------------------------
     # Request conversion: Chat Completions -> Responses API
@@ -202,9 +210,6 @@ class OpenAIResponsesAdapter:
         elif status == "incomplete":
             finish_reason = "length"
 
-        # Usage
-        usage_raw = responses_data.get("usage", {})
-
         return {
             "id": responses_data.get("id", ""),
             "object": "chat.completion",
@@ -214,14 +219,23 @@ class OpenAIResponsesAdapter:
                 "message": message,
                 "finish_reason": finish_reason,
             }],
-            "usage": {
-                "prompt_tokens": usage_raw.get("input_tokens", 0),
-                "completion_tokens": usage_raw.get("output_tokens", 0),
-                "total_tokens": (
-                    usage_raw.get("input_tokens", 0) + usage_raw.get("output_tokens", 0)
-                ),
-            },
+            "usage": self._convert_usage(responses_data.get("usage") or {}),
+        }
+
+    @staticmethod
+    def _convert_usage(usage_raw: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert Responses API usage to Chat Completions format."""
+        usage: Dict[str, Any] = {
+            "prompt_tokens": usage_raw.get("input_tokens", 0),
+            "completion_tokens": usage_raw.get("output_tokens", 0),
+            "total_tokens": (
+                usage_raw.get("input_tokens", 0) + usage_raw.get("output_tokens", 0)
+            ),
         }
+        cached = (usage_raw.get("input_tokens_details") or {}).get("cached_tokens")
+        if cached is not None:
+            usage["prompt_tokens_details"] = {"cached_tokens": cached}
+        return usage
 
     # ------------------------------------------------------------------
     # HTTP POST with retry (same pattern as AnthropicAdapter)
@@ -239,7 +253,7 @@ class OpenAIResponsesAdapter:
         @dataclass
         class HttpResult:
             success: bool
-            response: Union[requests.Response, None] = None
+            response: Any = None
             error: Union[str, None] = None
             interrupted: bool = False
 
@@ -258,7 +272,7 @@ class OpenAIResponsesAdapter:
 
         for attempt in range(MAX_RETRIES + 1):
             try:
-                response = requests.post(
+                response = self._pool.post(
                     self.api_url,
                     headers=self.headers,
                     json=responses_payload,
@@ -306,3 +320,89 @@ class OpenAIResponsesAdapter:
                 return HttpResult(success=False, error=str(exc))
 
         return last_result or HttpResult(success=False, error="Unexpected retry exhaustion")
+
+    # ------------------------------------------------------------------
+    # Streaming
+    # ------------------------------------------------------------------
+
+    def apply_stream_event(self, accumulator: ChatCompletionAccumulator, event: SSEEvent) -> bool:
+        """Translate one Responses API stream event into accumulator calls.
+
+        Function calls are keyed by ``output_index``; a call is complete when
+        its ``response.output_item.done`` event arrives, which also carries the
+        authoritative argument string.
+
+        Returns:
+            False once the stream is finished, True otherwise
+        """
+        data = event.json()
+        event_type = data.get("type", event.event)
+
+        if event_type == "response.created":
+            response = data.get("response", {})
+            accumulator.response_id = response.get("id", "")
+            accumulator.model = response.get("model", "")
+        elif event_type == "response.output_text.delta":
+            accumulator.add_text(data.get("delta", ""))
+        elif event_type in (
+            "response.reasoning_summary_text.delta",
+            "response.reasoning_text.delta",
+        ):
+            accumulator.add_reasoning(data.get("delta", ""))
+        elif event_type == "response.output_item.added":
+            item = data.get("item", {})
+            if item.get("type") == "function_call":
+                accumulator.start_tool_call(
+                    data.get("output_index", 0),
+                    item.get("call_id", item.get("id", "")),
+                    item.get("name", ""),
+                )
+        elif event_type == "response.function_call_arguments.delta":
+            accumulator.add_tool_arguments(data.get("output_index", 0), data.get("delta", ""))
+        elif event_type == "response.output_item.done":
+            item = data.get("item", {})
+            if item.get("type") == "function_call":
+                index = data.get("output_index", 0)
+                accumulator.start_tool_call(
+                    index, item.get("call_id", item.get("id", "")), item.get("name", "")
+                )
+                if item.get("arguments") is not None:
+                    accumulator.set_tool_arguments(index, item["arguments"])
+                accumulator.finish_tool_call(index)
+        elif event_type in ("response.completed", "response.incomplete"):
+            accumulator.usage = self._convert_usage(data.get("response", {}).get("usage") or {})
+            if accumulator.tool_calls:
+                accumulator.finish_reason = "tool_calls"
+            elif event_type == "response.incomplete":
+                accumulator.finish_reason = "length"
+            return False
+        elif event_type in ("response.failed", "error"):
+            error = data.get("response", {}).get("error") or data.get("error") or data
+            accumulator.error = (
+                error.get("message", str(error)) if isinstance(error, dict) else str(error)
+            )
+            return False
+        return True
+
+    def post_json_stream(
+        self,
+        payload: Dict[str, Any],
+        *,
+        task_monitor: Any = None,
+        on_text_delta: Optional[TextDeltaCallback] = None,
+        on_tool_call: Optional[ToolCallCallback] = None,
+    ) -> Any:
+        """Stream a request to the Responses API.
+
+        Returns the assembled response in Chat Completions format, like
+        :meth:`post_json`.
+        """
+        accumulator = ChatCompletionAccumulator(on_text_delta, on_tool_call)
+        responses_payload = {**self.convert_request(payload), "stream": True}
+        client = AgentHttpClient(self.api_url, self.headers, pool=self._pool)
+        result = client.stream_events(
+            responses_payload,
+            lambda event: self.apply_stream_event(accumulator, event),
+            task_monitor=task_monitor,
+        )
+        return finalize_stream_result(result, accumulator)
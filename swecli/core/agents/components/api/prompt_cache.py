@@ -0,0 +1,164 @@
+"""Prompt-cache-friendly request layout and cache usage accounting.
+
+Providers reuse the longest request prefix they have already processed:
+OpenAI automatically, Anthropic up to the ``cache_control`` breakpoints in
+the request. Every agent iteration resends the system prompt, the tool
+schemas and the whole history, so the layout is kept byte-stable:
+
+- the system prompt comes first and is built once per session,
+- tool schemas are sorted by name and frozen (the same list is reused until
+  the tool set actually changes),
+- history is only ever appended to.
+
+For Anthropic, :func:`add_anthropic_cache_breakpoints` marks the end of the
+tools, the system prompt, the previous turn and the newest message, so each
+call reads the prefix cached by the one before it and writes one turn more.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+EPHEMERAL = {"type": "ephemeral"}
+MAX_ANTHROPIC_BREAKPOINTS = 4
+
+
+class ToolSchemaFreezer:
+    """Keep tool schemas byte-stable across requests."""
+
+    def __init__(self) -> None:
+        self._fingerprint: Optional[str] = None
+        self._frozen: List[Dict[str, Any]] = []
+
+    def freeze(self, schemas: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return ``schemas`` sorted by name with canonical key order.
+
+        The previously returned list is returned again as long as the
+        schemas are unchanged, so callers can't disturb the cached prefix by
+        rebuilding them in a different order.
+        """
+        ordered = sorted(schemas, key=_tool_name)
+        fingerprint = json.dumps(ordered, sort_keys=True, separators=(",", ":"))
+        if fingerprint != self._fingerprint:
+            self._fingerprint = fingerprint
+            self._frozen = json.loads(fingerprint)
+        return self._frozen
+
+
+def _tool_name(schema: Dict[str, Any]) -> str:
+    return schema.get("function", {}).get("name") or schema.get("name", "")
+
+
+def _with_cache_control(content: Any) -> Optional[List[Dict[str, Any]]]:
+    """Return ``content`` as blocks whose last block carries a breakpoint."""
+    if isinstance(content, str):
+        if not content:
+            return None
+        return [{"type": "text", "text": content, "cache_control": EPHEMERAL}]
+    if isinstance(content, list) and content and isinstance(content[-1], dict):
+        return [*content[:-1], {**content[-1], "cache_control": EPHEMERAL}]
+    return None
+
+
+def add_anthropic_cache_breakpoints(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Add ``cache_control`` breakpoints to an Anthropic Messages payload.
+
+    Breakpoints go on the last tool, the system prompt, the last message of
+    the previous turn (the newest message before the latest assistant
+    reply) and the newest message. String message content is always sent as
+    a text block, so a message serializes the same way whether or not it
+    currently holds a breakpoint. Messages are copied, not modified.
+
+    Returns:
+        The payload (updated in place)
+    """
+    budget = MAX_ANTHROPIC_BREAKPOINTS
+
+    tools = payload.get("tools")
+    if tools:
+        payload["tools"] = [*tools[:-1], {**tools[-1], "cache_control": EPHEMERAL}]
+        budget -= 1
+
+    system = payload.get("system")
+    if system:
+        blocks = _with_cache_control(system)
+        if blocks:
+            payload["system"] = blocks
+            budget -= 1
+
+    messages = [_as_blocks(message) for message in payload.get("messages") or []]
+    targets: List[int] = []
+    last = _last_cacheable(messages, len(messages))
+    if last is not None:
+        targets.append(last)
+        reply = next(
+            (i for i in range(last - 1, -1, -1) if messages[i].get("role") == "assistant"),
+            None,
+        )
+        if reply is not None:
+            previous = _last_cacheable(messages, reply)
+            if previous is not None:
+                targets.append(previous)
+
+    for index in targets[:budget]:
+        messages[index] = {
+            **messages[index],
+            "content": _with_cache_control(messages[index]["content"]),
+        }
+    if "messages" in payload:
+        payload["messages"] = messages
+    return payload
+
+
+def _as_blocks(message: Dict[str, Any]) -> Dict[str, Any]:
+    content = message.get("content")
+    if isinstance(content, str) and content:
+        return {**message, "content": [{"type": "text", "text": content}]}
+    return message
+
+
+def _last_cacheable(messages: List[Dict[str, Any]], end: int) -> Optional[int]:
+    """Index of the last message before ``end`` whose content can hold a breakpoint."""
+    for index in range(end - 1, -1, -1):
+        if _with_cache_control(messages[index].get("content")) is not None:
+            return index
+    return None
+
+
+def annotate_cache_usage(usage: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Add flat cached/uncached prompt token counts to an OpenAI-style usage block.
+
+    Reads ``prompt_tokens_details.cached_tokens`` (OpenAI, and the adapters'
+    converted Anthropic / Responses usage). Usage without cache details is
+    returned unchanged.
+    """
+    if not usage:
+        return usage
+    details = usage.get("prompt_tokens_details") or {}
+    cached = details.get("cached_tokens")
+    if not isinstance(cached, int):
+        return usage
+    prompt_tokens = usage.get("prompt_tokens", 0)
+    annotated = {
+        **usage,
+        "cached_prompt_tokens": cached,
+        "uncached_prompt_tokens": max(0, prompt_tokens - cached),
+    }
+    logger.debug(
+        "Prompt cache: %d of %d input tokens cached (%d written)",
+        cached,
+        prompt_tokens,
+        usage.get("cache_creation_input_tokens", 0),
+    )
+    return annotated
+
+
+__all__ = [
+    "ToolSchemaFreezer",
+    "add_anthropic_cache_breakpoints",
+    "annotate_cache_usage",
+]
@@ -0,0 +1,432 @@
+"""Server-sent event (SSE) helpers for streamed chat completions.
+
+Providers stream completions as SSE frames.  This module parses those frames,
+assembles the incremental deltas into the familiar Chat Completions response
+shape, and exposes hooks so callers can react to text and completed tool calls
+before the full response has arrived.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Sentinel payload that terminates OpenAI-style streams
+DONE_SENTINEL = "[DONE]"
+
+TextDeltaCallback = Callable[[str], None]
+ToolCallCallback = Callable[[Dict[str, Any]], None]
+
+
+@dataclass
+class SSEEvent:
+    """A single server-sent event frame."""
+
+    event: Optional[str]
+    data: str
+
+    def json(self) -> Any:
+        """Decode the event payload as JSON."""
+        return json.loads(self.data)
+
+
+def iter_sse_events(lines: Iterable[Union[bytes, str]]) -> Iterator[SSEEvent]:
+    """Parse raw SSE lines into events.
+
+    Follows the subset of the SSE spec used by LLM providers: ``event:`` and
+    ``data:`` fields, multi-line ``data`` joined with newlines, comments
+    (lines starting with ``:``) ignored, and a blank line dispatching the
+    pending event.
+
+    Args:
+        lines: Iterable of raw lines without trailing newlines
+
+    Yields:
+        Parsed SSEEvent objects
+    """
+    event_name: Optional[str] = None
+    data_lines: List[str] = []
+
+    for raw in lines:
+        line = raw.decode("utf-8") if isinstance(raw, bytes) else raw
+        line = line.rstrip("\r")
+
+        if not line:
+            if data_lines:
+                yield SSEEvent(event=event_name, data="\n".join(data_lines))
+            event_name = None
+            data_lines = []
+            continue
+
+        if line.startswith(":"):
+            continue
+
+        name, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+
+        if name == "event":
+            event_name = value
+        elif name == "data":
+            data_lines.append(value)
+
+    if data_lines:
+        yield SSEEvent(event=event_name, data="\n".join(data_lines))
+
+
+@dataclass
+class _ToolCallBuffer:
+    """Incrementally assembled tool call."""
+
+    id: str = ""
+    name: str = ""
+    arguments: List[str] = field(default_factory=list)
+    complete: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "type": "function",
+            "function": {
+                "name": self.name,
+                "arguments": "".join(self.arguments) or "{}",
+            },
+        }
+
+
+class ChatCompletionAccumulator:
+    """Assemble streamed deltas into a Chat Completions response.
+
+    Provider-specific stream parsers translate their events into calls on this
+    class. Text deltas are forwarded to ``on_text_delta`` as they arrive and
+    each tool call is handed to ``on_tool_call`` as soon as its arguments are
+    complete, so callers can start work before the stream ends.
+    """
+
+    def __init__(
+        self,
+        on_text_delta: Optional[TextDeltaCallback] = None,
+        on_tool_call: Optional[ToolCallCallback] = None,
+    ) -> None:
+        self._on_text_delta = on_text_delta
+        self._on_tool_call = on_tool_call
+        self._started_at = time.monotonic()
+        self._text_parts: List[str] = []
+        self._reasoning_parts: List[str] = []
+        self._tool_calls: Dict[int, _ToolCallBuffer] = {}
+        self.response_id = ""
+        self.model = ""
+        self.finish_reason: Optional[str] = None
+        self.usage: Dict[str, Any] = {}
+        self.error: Optional[str] = None
+        self.first_token_latency: Optional[float] = None
+
+    # ------------------------------------------------------------------
+    # Generic delta API
+    # ------------------------------------------------------------------
+
+    def _mark_first_token(self) -> None:
+        if self.first_token_latency is None:
+            self.first_token_latency = time.monotonic() - self._started_at
+
+    def add_text(self, text: str) -> None:
+        """Append a content delta and forward it to the text callback."""
+        if not text:
+            return
+        self._mark_first_token()
+        self._text_parts.append(text)
+        if self._on_text_delta is not None:
+            try:
+                self._on_text_delta(text)
+            except Exception:  # pragma: no cover - UI errors must not break the stream
+                logger.exception("Text delta callback failed")
+
+    def add_reasoning(self, text: str) -> None:
+        """Append a reasoning/thinking delta."""
+        if not text:
+            return
+        self._mark_first_token()
+        self._reasoning_parts.append(text)
+
+    def start_tool_call(self, index: int, call_id: str = "", name: str = "") -> None:
+        """Register (or update) the tool call at ``index``."""
+        self._mark_first_token()
+        buffer = self._tool_calls.setdefault(index, _ToolCallBuffer())
+        if call_id:
+            buffer.id = call_id
+        if name:
+            buffer.name = name
+
+    def add_tool_arguments(self, index: int, fragment: str) -> None:
+        """Append a JSON argument fragment to the tool call at ``index``."""
+        if not fragment:
+            return
+        self._tool_calls.setdefault(index, _ToolCallBuffer()).arguments.append(fragment)
+
+    def set_tool_arguments(self, index: int, arguments: str) -> None:
+        """Replace the arguments of the tool call at ``index`` with the final value."""
+        self._tool_calls.setdefault(index, _ToolCallBuffer()).arguments = [arguments]
+
+    def finish_tool_call(self, index: int) -> None:
+        """Mark the tool call at ``index`` complete and hand it to the callback."""
+        buffer = self._tool_calls.get(index)
+        if buffer is None or buffer.complete:
+            return
+        buffer.complete = True
+        if self._on_tool_call is not None:
+            self._on_tool_call(buffer.to_dict())
+
+    def finish_all_tool_calls(self) -> None:
+        """Complete every pending tool call in index order."""
+        for index in sorted(self._tool_calls):
+            self.finish_tool_call(index)
+
+    # ------------------------------------------------------------------
+    # OpenAI Chat Completions chunks
+    # ------------------------------------------------------------------
+
+    def apply_chat_event(self, event: SSEEvent) -> bool:
+        """Apply an OpenAI ``chat.completion.chunk`` SSE event.
+
+        Returns:
+            False once the stream signalled completion, True otherwise
+        """
+        if event.data.strip() == DONE_SENTINEL:
+            self.finish_all_tool_calls()
+            return False
+
+        chunk = event.json()
+        if "error" in chunk:
+            error = chunk["error"]
+            self.error = error.get("message", str(error)) if isinstance(error, dict) else str(error)
+            return False
+
+        self.response_id = chunk.get("id", self.response_id)
+        self.model = chunk.get("model", self.model)
+        if chunk.get("usage"):
+            self.usage = chunk["usage"]
+
+        for choice in chunk.get("choices") or []:
+            delta = choice.get("delta") or {}
+
+            reasoning = delta.get("reasoning_content") or delta.get("reasoning")
+            if isinstance(reasoning, str):
+                self.add_reasoning(reasoning)
+
+            content = delta.get("content")
+            if content:
+                self.add_text(content)
+
+            for tc in delta.get("tool_calls") or []:
+                index = tc.get("index", len(self._tool_calls))
+                # A delta for a later index means every earlier call is complete
+                for pending in sorted(self._tool_calls):
+                    if pending < index:
+                        self.finish_tool_call(pending)
+                func = tc.get("function") or {}
+                self.start_tool_call(index, tc.get("id", ""), func.get("name", ""))
+                self.add_tool_arguments(index, func.get("arguments", ""))
+
+            if choice.get("finish_reason"):
+                self.finish_reason = choice["finish_reason"]
+                self.finish_all_tool_calls()
+
+        return True
+
+    # ------------------------------------------------------------------
+    # Result
+    # ------------------------------------------------------------------
+
+    @property
+    def tool_calls(self) -> List[Dict[str, Any]]:
+        """Tool calls assembled so far, in index order."""
+        return [self._tool_calls[i].to_dict() for i in sorted(self._tool_calls)]
+
+    def build(self) -> Dict[str, Any]:
+        """Return the assembled response in Chat Completions format."""
+        tool_calls = self.tool_calls
+        message: Dict[str, Any] = {
+            "role": "assistant",
+            "content": "".join(self._text_parts) or None,
+        }
+        if self._reasoning_parts:
+            message["reasoning_content"] = "".join(self._reasoning_parts)
+        if tool_calls:
+            message["tool_calls"] = tool_calls
+
+        finish_reason = self.finish_reason or ("tool_calls" if tool_calls else "stop")
+
+        usage = {
+            "prompt_tokens": self.usage.get("prompt_tokens", 0),
+            "completion_tokens": self.usage.get("completion_tokens", 0),
+        }
+        usage["total_tokens"] = self.usage.get(
+            "total_tokens", usage["prompt_tokens"] + usage["completion_tokens"]
+        )
+        # Prompt cache accounting, when the provider reports it
+        for key in ("prompt_tokens_details", "cache_creation_input_tokens"):
+            if key in self.usage:
+                usage[key] = self.usage[key]
+
+        return {
+            "id": self.response_id,
+            "object": "chat.completion",
+            "model": self.model,
+            "choices": [{
+                "index": 0,
+                "message": message,
+                "finish_reason": finish_reason,
+            }],
+            "usage": usage,
+        }
+
+
+@dataclass
+class StreamedResponse:
+    """Response object that mimics an HTTP response for an assembled stream."""
+
+    status_code: int
+    _json_data: Dict[str, Any]
+    text: str
+    headers: Dict[str, str]
+    first_token_latency: Optional[float] = None
+
+    def json(self) -> Dict[str, Any]:
+        return self._json_data
+
+
+def build_streamed_response(
+    accumulator: ChatCompletionAccumulator, headers: Dict[str, str]
+) -> StreamedResponse:
+    """Wrap an accumulator's result in a StreamedResponse."""
+    data = accumulator.build()
+    return StreamedResponse(
+        status_code=200,
+        _json_data=data,
+        text=json.dumps(data),
+        headers=headers,
+        first_token_latency=accumulator.first_token_latency,
+    )
+
+
+# Queue item kinds produced by the reader thread
+_RESPONSE = "response"
+_EVENT = "event"
+_ERROR = "error"
+_END = "end"
+
+
+@dataclass
+class StreamOutcome:
+    """Result of reading an SSE stream."""
+
+    response: Any = None
+    error: Optional[str] = None
+    interrupted: bool = False
+
+
+def read_event_stream(
+    open_stream: Callable[[], Any],
+    handle_event: Callable[[SSEEvent], bool],
+    should_interrupt: Callable[[], bool],
+    poll_interval: float = 0.01,
+    cancel_response: Optional[Callable[[Any], None]] = None,
+) -> StreamOutcome:
+    """Open a streaming HTTP response and dispatch its SSE events.
+
+    The request and socket reads happen on a daemon thread; events are
+    dispatched to ``handle_event`` on the calling thread so callbacks (UI
+    updates, early tool execution) run where the caller expects them. The
+    caller polls ``should_interrupt`` between events and closes the response
+    when an interrupt is requested.
+
+    Args:
+        open_stream: Callable returning a streaming ``httpx.Response`` whose
+            body has not been read yet
+        handle_event: Called for each event; return False to stop reading
+        should_interrupt: Polled while waiting for the next event
+        poll_interval: Seconds between interrupt checks
+        cancel_response: Called with the open response on interrupt;
+            defaults to closing it
+
+    Returns:
+        StreamOutcome with the HTTP response (non-200 responses are returned
+        unread), an error message, or the interrupted flag
+    """
+    items: "queue.Queue[tuple[str, Any]]" = queue.Queue()
+    stop = threading.Event()
+    cancel = threading.Event()
+
+    def reader() -> None:
+        response = None
+        try:
+            response = open_stream()
+            items.put((_RESPONSE, response))
+            if response.status_code != 200:
+                # Load the error body so callers can inspect it
+                response.read()
+                return
+            for event in iter_sse_events(response.iter_lines()):
+                if cancel.is_set():
+                    return
+                if not stop.is_set():
+                    items.put((_EVENT, event))
+                # Once stopped, keep draining the tail so the connection is
+                # returned to the pool instead of being dropped
+        except Exception as exc:  # pragma: no cover - surfaced to the caller
+            if not stop.is_set():
+                items.put((_ERROR, exc))
+        finally:
+            if response is not None:
+                response.close()
+            items.put((_END, None))
+
+    thread = threading.Thread(target=reader, daemon=True)
+    thread.start()
+
+    outcome = StreamOutcome()
+    while True:
+        if should_interrupt():
+            stop.set()
+            cancel.set()
+            if outcome.response is not None:
+                # Closing blocks until the reader's pending read returns, so do
+                # it off the caller's thread to keep interrupts instant
+                threading.Thread(
+                    target=cancel_response or (lambda response: response.close()),
+                    args=(outcome.response,),
+                    daemon=True,
+                ).start()
+            return StreamOutcome(error="Interrupted by user", interrupted=True)
+
+        try:
+            kind, value = items.get(timeout=poll_interval)
+        except queue.Empty:
+            continue
+
+        if kind == _RESPONSE:
+            outcome.response = value
+        elif kind == _EVENT:
+            try:
+                keep_reading = handle_event(value)
+            except Exception as exc:
+                stop.set()
+                cancel.set()
+                outcome.response.close()
+                return StreamOutcome(response=outcome.response, error=str(exc))
+            if not keep_reading:
+                # Let the reader drain the tail so the connection stays reusable
+                stop.set()
+                return outcome
+        elif kind == _ERROR:
+            outcome.error = str(value)
+            return outcome
+        else:
+            return outcome
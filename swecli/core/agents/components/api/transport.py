@@ -0,0 +1,242 @@
+"""Shared keep-alive connection pools for LLM provider endpoints.
+
+Every agent HTTP client talking to the same provider origin (scheme, host and
+port) shares one thread-safe :class:`ConnectionPool`, so successive LLM calls
+in a ReAct turn (thinking, critique, action, compaction, topic detection)
+reuse warm TCP/TLS connections instead of paying for a fresh handshake each
+time. HTTP/2 is negotiated via ALPN when the optional ``h2`` package is
+installed; servers that only speak HTTP/1.1 fall back transparently.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+try:  # pragma: no cover - depends on optional dependency
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on optional dependency
+    HTTP2_AVAILABLE = False
+
+# Keep-alive limits per origin
+MAX_CONNECTIONS = 20
+MAX_KEEPALIVE_CONNECTIONS = 10
+KEEPALIVE_EXPIRY = 120.0  # Seconds an idle connection stays in the pool
+
+TimeoutSpec = Union[float, Tuple[float, float]]
+
+# httpcore trace events that bracket the connection handshake
+_HANDSHAKE_EVENTS = ("connection.connect_tcp", "connection.start_tls")
+
+
+@dataclass
+class ConnectionStats:
+    """Counters describing how well a pool reuses its connections."""
+
+    requests: int = 0
+    connections_opened: int = 0
+    connections_reused: int = 0
+    handshake_seconds: float = 0.0
+    cancelled: int = 0
+    http2_requests: int = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Fraction of requests served on an already-open connection."""
+        served = self.connections_opened + self.connections_reused
+        return self.connections_reused / served if served else 0.0
+
+    @property
+    def avg_handshake_ms(self) -> float:
+        """Average TCP+TLS handshake time per new connection, in milliseconds."""
+        if not self.connections_opened:
+            return 0.0
+        return self.handshake_seconds * 1000 / self.connections_opened
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["reuse_ratio"] = self.reuse_ratio
+        data["avg_handshake_ms"] = self.avg_handshake_ms
+        return data
+
+
+class _RequestTrace:
+    """Per-request httpcore trace hook that records handshake timings."""
+
+    def __init__(self) -> None:
+        self.new_connection = False
+        self.handshake_seconds = 0.0
+        self._started: Dict[str, float] = {}
+
+    def __call__(self, event_name: str, info: Dict[str, Any]) -> None:
+        for prefix in _HANDSHAKE_EVENTS:
+            if not event_name.startswith(prefix):
+                continue
+            self.new_connection = True
+            if event_name.endswith(".started"):
+                self._started[prefix] = time.perf_counter()
+            elif prefix in self._started:
+                self.handshake_seconds += time.perf_counter() - self._started.pop(prefix)
+            return
+
+
+class ConnectionPool:
+    """Thread-safe keep-alive connection pool for a single origin.
+
+    Wraps an ``httpx.Client``; the client's connection pool is safe to share
+    across threads. Responses returned by :meth:`post` are fully read;
+    :meth:`open_stream` returns an unread response that must be closed.
+    """
+
+    def __init__(
+        self,
+        origin: str,
+        *,
+        http2: Optional[bool] = None,
+        max_connections: int = MAX_CONNECTIONS,
+        max_keepalive_connections: int = MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = KEEPALIVE_EXPIRY,
+    ) -> None:
+        self.origin = origin
+        self.http2 = HTTP2_AVAILABLE if http2 is None else http2
+        self.stats = ConnectionStats()
+        self._stats_lock = threading.Lock()
+        self._client = httpx.Client(
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+        )
+
+    @staticmethod
+    def _timeout(timeout: TimeoutSpec) -> httpx.Timeout:
+        """Translate a requests-style ``(connect, read)`` tuple to httpx."""
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+        return httpx.Timeout(timeout)
+
+    def _send(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        payload: Any,
+        timeout: TimeoutSpec,
+    ) -> httpx.Response:
+        trace = _RequestTrace()
+        request = self._client.build_request(
+            "POST",
+            url,
+            headers=headers,
+            json=payload,
+            timeout=self._timeout(timeout),
+            extensions={"trace": trace},
+        )
+        response = self._client.send(request, stream=True)
+        self._record(trace, response)
+        return response
+
+    def _record(self, trace: _RequestTrace, response: httpx.Response) -> None:
+        with self._stats_lock:
+            self.stats.requests += 1
+            if trace.new_connection:
+                self.stats.connections_opened += 1
+                self.stats.handshake_seconds += trace.handshake_seconds
+            else:
+                self.stats.connections_reused += 1
+            if response.http_version == "HTTP/2":
+                self.stats.http2_requests += 1
+
+    def post(
+        self,
+        url: str,
+        *,
+        headers: Dict[str, str],
+        json: Any,
+        timeout: TimeoutSpec,
+    ) -> httpx.Response:
+        """POST ``json`` and return the fully-read response."""
+        response = self._send(url, headers, json, timeout)
+        try:
+            response.read()
+        finally:
+            response.close()
+        return response
+
+    def open_stream(
+        self,
+        url: str,
+        *,
+        headers: Dict[str, str],
+        json: Any,
+        timeout: TimeoutSpec,
+    ) -> httpx.Response:
+        """POST ``json`` and return the response with its body still unread."""
+        return self._send(url, headers, json, timeout)
+
+    def cancel(self, response: Optional[httpx.Response]) -> None:
+        """Abort an in-flight response.
+
+        Only the connection carrying ``response`` is dropped; the rest of the
+        pool stays warm for the next request.
+        """
+        with self._stats_lock:
+            self.stats.cancelled += 1
+        if response is not None:
+            try:
+                response.close()
+            except Exception:  # pragma: no cover - best effort
+                logger.debug("Failed to close cancelled response", exc_info=True)
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        self._client.close()
+
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def origin_of(url: str) -> str:
+    """Return the ``scheme://host:port`` origin used to key pools."""
+    parts = urlsplit(url)
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    return f"{parts.scheme}://{parts.hostname}:{port}"
+
+
+def get_connection_pool(url: str) -> ConnectionPool:
+    """Return the shared pool for ``url``'s origin, creating it on first use."""
+    origin = origin_of(url)
+    with _pools_lock:
+        pool = _pools.get(origin)
+        if pool is None:
+            pool = ConnectionPool(origin)
+            _pools[origin] = pool
+        return pool
+
+
+def connection_pool_stats() -> Dict[str, Dict[str, Any]]:
+    """Return reuse and handshake stats for every active pool, keyed by origin."""
+    with _pools_lock:
+        return {origin: pool.stats.to_dict() for origin, pool in _pools.items()}
+
+
+def close_connection_pools() -> None:
+    """Close and forget all shared pools (used at shutdown and in tests)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
@@ -1,4 +1,17 @@
-"""Environment context collection and formatting for system prompts."""
+"""Environment context collection and formatting for system prompts.
+
+Collecting the environment means several git subprocesses, tool probes, a
+directory walk and reading project instructions. ``EnvironmentCollector``
+caches each of these per working directory (shared by every collector, so
+repeated suite builds and batch tasks reuse them) and re-collects a field only
+when a cheap stamp of its sources changes: the git files it reads (``HEAD``,
+the index, the current branch ref, ``config``), the mtimes of the project
+directories and instruction files, or ``PATH`` for toolchain probes. Stale
+fields are collected concurrently. Edits to the working tree leave those git
+files untouched (the probes pass ``--no-optional-locks``, so they never
+refresh the index themselves), so ``git_status`` is also re-collected once it
+is ``GIT_STATUS_TTL`` seconds old.
+"""
 
 from __future__ import annotations
 
@@ -8,9 +21,14 @@ import os
 import platform
 import shutil
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable
+
+from swecli.core.paths import CONTEXT_FILE_NAME, get_paths
 
 if TYPE_CHECKING:
     from swecli.models.config import AppConfig
@@ -96,6 +114,17 @@ class EnvironmentContext:
 class EnvironmentCollector:
     """Collects environment data into an EnvironmentContext snapshot."""
 
+    MAX_WORKERS = 8
+    # Seconds a cached git status is reused while the index and HEAD are unchanged
+    GIT_STATUS_TTL = 5.0
+
+    # (scope, field) -> (source stamp, value); scope is the working dir, or
+    # "" for probes that don't depend on it
+    _cache: dict[tuple[str, str], tuple[Any, Any]] = {}
+    # working dir -> monotonic start of its current git status window
+    _status_windows: dict[str, float] = {}
+    _cache_lock = threading.Lock()
+
     def __init__(
         self,
         working_dir: Path,
@@ -106,38 +135,51 @@ class EnvironmentCollector:
         self._config = config
         self._config_manager = config_manager
 
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget every cached field, so the next collect starts from scratch."""
+        with cls._cache_lock:
+            cls._cache.clear()
+            cls._status_windows.clear()
+
     def collect(self) -> EnvironmentContext:
         """Collect all environment data and return an immutable snapshot."""
+        started = time.perf_counter()
         is_git = (self._working_dir / ".git").exists()
 
-        # Git fields
-        git_branch = None
-        git_default_branch = None
-        git_status = None
-        git_recent_commits = None
-        git_remote_url = None
-        if is_git:
-            git_branch = self._run_git("rev-parse", "--abbrev-ref", "HEAD")
-            git_default_branch = self._detect_default_branch()
-            git_status = self._collect_git_status()
-            git_recent_commits = self._run_git("log", "--oneline", "-5")
-            git_remote_url = self._run_git("config", "--get", "remote.origin.url")
+        values: dict[str, Any] = {}
+        stale: dict[str, tuple[tuple[str, str], Any, Callable[[], Any]]] = {}
+        for name, (scope, stamp_source, probe) in self._probes(is_git).items():
+            key = (scope, name)
+            stamp = stamp_source()
+            with self._cache_lock:
+                cached = self._cache.get(key)
+            if cached is not None and cached[0] == stamp:
+                values[name] = cached[1]
+            else:
+                stale[name] = (key, stamp, probe)
+
+        if stale:
+            workers = min(self.MAX_WORKERS, len(stale))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="env-probe") as pool:
+                futures = {name: pool.submit(probe) for name, (_, _, probe) in stale.items()}
+            with self._cache_lock:
+                for name, (key, stamp, _) in stale.items():
+                    values[name] = futures[name].result()
+                    # Stamped before probing: a change made meanwhile is seen next time
+                    self._cache[key] = (stamp, values[name])
+
+        logger.debug(
+            "Collected environment for %s in %.1f ms (%d of %d fields refreshed: %s)",
+            self._working_dir,
+            (time.perf_counter() - started) * 1000,
+            len(stale),
+            len(values),
+            ", ".join(stale) or "none",
+        )
 
-        # Shell & runtime
         venv = os.environ.get("VIRTUAL_ENV")
-        virtual_env = Path(venv).name if venv else None
-
-        node_version = self._detect_node_version()
-        pkg_managers = tuple(m for m in _PACKAGE_MANAGERS if shutil.which(m))
-
-        # Project structure
-        config_files = tuple(f for f in _CONFIG_FILES if (self._working_dir / f).exists())
-        tech_stack = self._infer_tech_stack(config_files)
-        tree = self._build_directory_tree()
-
-        # Project instructions
-        project_instructions = self._load_project_instructions()
-
+        config_files, tech_stack = values["project_files"]
         return EnvironmentContext(
             working_dir=str(self._working_dir),
             platform=self._map_platform(),
@@ -146,21 +188,110 @@ class EnvironmentCollector:
             model=self._config.model or "",
             model_provider=self._config.model_provider or "",
             is_git_repo=is_git,
-            git_branch=git_branch,
-            git_default_branch=git_default_branch,
-            git_status=git_status,
-            git_recent_commits=git_recent_commits,
-            git_remote_url=git_remote_url,
+            git_branch=values.get("git_branch"),
+            git_default_branch=values.get("git_default_branch"),
+            git_status=values.get("git_status"),
+            git_recent_commits=values.get("git_recent_commits"),
+            git_remote_url=values.get("git_remote_url"),
             shell=os.environ.get("SHELL"),
             python_version=platform.python_version(),
-            virtual_env=virtual_env,
-            node_version=node_version,
-            available_package_managers=pkg_managers,
+            virtual_env=Path(venv).name if venv else None,
+            node_version=values["node_version"],
+            available_package_managers=values["package_managers"],
             project_config_files=config_files,
             tech_stack=tech_stack,
-            directory_tree=tree,
-            project_instructions=project_instructions,
+            directory_tree=values["directory_tree"],
+            project_instructions=values["project_instructions"],
+        )
+
+    def _probes(self, is_git: bool) -> dict[str, tuple[str, Callable[[], Any], Callable[[], Any]]]:
+        """Map each cached field to its cache scope, stamp function and probe."""
+        root = str(self._working_dir)
+        path_env = self._path_stamp
+        probes: dict[str, tuple[str, Callable[[], Any], Callable[[], Any]]] = {
+            "node_version": ("", path_env, self._detect_node_version),
+            "package_managers": ("", path_env, self._detect_package_managers),
+            "project_files": (root, self._project_files_stamp, self._detect_project_files),
+            "directory_tree": (root, self._tree_stamp, self._build_directory_tree),
+            "project_instructions": (
+                root,
+                self._instructions_stamp,
+                self._load_project_instructions,
+            ),
+        }
+        if is_git:
+            git = _GitFiles(self._working_dir)
+            status_stamp = git.stamp("index", git.head_ref)
+            probes.update(
+                {
+                    "git_branch": (
+                        root,
+                        git.stamp(),
+                        lambda: self._run_git("rev-parse", "--abbrev-ref", "HEAD"),
+                    ),
+                    "git_default_branch": (
+                        root,
+                        git.stamp("refs/remotes/origin/HEAD", "refs/heads", "packed-refs"),
+                        self._detect_default_branch,
+                    ),
+                    "git_status": (
+                        root,
+                        lambda: (status_stamp(), self._git_status_window()),
+                        self._collect_git_status,
+                    ),
+                    "git_recent_commits": (
+                        root,
+                        git.stamp(git.head_ref, "packed-refs"),
+                        lambda: self._run_git("log", "--oneline", "-5"),
+                    ),
+                    "git_remote_url": (
+                        root,
+                        git.stamp("config"),
+                        lambda: self._run_git("config", "--get", "remote.origin.url"),
+                    ),
+                }
+            )
+        return probes
+
+    @staticmethod
+    def _path_stamp() -> Any:
+        return os.environ.get("PATH")
+
+    def _git_status_window(self) -> float:
+        """Start of the current ``GIT_STATUS_TTL`` window for this working dir."""
+        now = time.monotonic()
+        key = str(self._working_dir)
+        with self._cache_lock:
+            started = self._status_windows.get(key)
+            if started is None or now - started >= self.GIT_STATUS_TTL:
+                started = self._status_windows[key] = now
+        return started
+
+    def _project_files_stamp(self) -> Any:
+        # Entries added to or removed from the root change its mtime
+        return _stat_stamp(self._working_dir), _stat_stamp(self._working_dir / "package.json")
+
+    def _tree_stamp(self) -> Any:
+        """Mtimes of the directories listed by the depth-2 tree."""
+        stamps = [_stat_stamp(self._working_dir)]
+        try:
+            with os.scandir(self._working_dir) as entries:
+                for entry in entries:
+                    if _tree_visible(entry.name) and entry.is_dir():
+                        stamps.append((entry.name, _stat_stamp(Path(entry.path))))
+        except OSError:
+            return None
+        return tuple(sorted(stamps, key=str))
+
+    def _instructions_stamp(self) -> Any:
+        if not self._config_manager:
+            return None
+        files = [get_paths(self._working_dir).global_context_file]
+        files.extend(
+            directory / CONTEXT_FILE_NAME
+            for directory in (self._working_dir, *self._working_dir.parents)
         )
+        return tuple(_stat_stamp(path) for path in files)
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -173,8 +304,10 @@ class EnvironmentCollector:
 
     def _run_git(self, *args: str) -> str | None:
         try:
+            # No optional locks: probes run concurrently with each other and
+            # with the user's own git commands
             result = subprocess.run(
-                ["git", *args],
+                ["git", "--no-optional-locks", *args],
                 capture_output=True,
                 text=True,
                 cwd=self._working_dir,
@@ -220,6 +353,14 @@ class EnvironmentCollector:
             pass
         return None
 
+    @staticmethod
+    def _detect_package_managers() -> tuple[str, ...]:
+        return tuple(m for m in _PACKAGE_MANAGERS if shutil.which(m))
+
+    def _detect_project_files(self) -> tuple[tuple[str, ...], str | None]:
+        config_files = tuple(f for f in _CONFIG_FILES if (self._working_dir / f).exists())
+        return config_files, self._infer_tech_stack(config_files)
+
     def _infer_tech_stack(self, config_files: tuple[str, ...]) -> str | None:
         if "Cargo.toml" in config_files:
             return "Rust"
@@ -285,18 +426,7 @@ class EnvironmentCollector:
         except PermissionError:
             return
 
-        # Filter entries
-        visible: list[Path] = []
-        for entry in entries:
-            name = entry.name
-            if name.startswith(".") and name != ".opendev":
-                continue
-            if name in _TREE_SKIP_DIRS:
-                continue
-            # Skip egg-info dirs
-            if name.endswith(".egg-info"):
-                continue
-            visible.append(entry)
+        visible = [entry for entry in entries if _tree_visible(entry.name)]
 
         for i, entry in enumerate(visible):
             is_last = i == len(visible) - 1
@@ -319,6 +449,58 @@ class EnvironmentCollector:
         return None
 
 
+def _tree_visible(name: str) -> bool:
+    """Whether the directory tree lists an entry with this name."""
+    if name.startswith(".") and name != ".opendev":
+        return False
+    # Skip egg-info dirs
+    return name not in _TREE_SKIP_DIRS and not name.endswith(".egg-info")
+
+
+def _stat_stamp(path: Path) -> tuple[int, int] | None:
+    """Modification time and size of ``path``, or None if it doesn't exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class _GitFiles:
+    """Locates the files git fields are read from, for cache stamps.
+
+    Handles ``.git`` files (worktrees, submodules): ``HEAD`` and the index
+    live in the worktree's git dir, refs and config in the common dir.
+    """
+
+    def __init__(self, working_dir: Path) -> None:
+        self.git_dir = working_dir / ".git"
+        try:
+            if self.git_dir.is_file():
+                pointer = self.git_dir.read_text().strip()
+                if pointer.startswith("gitdir:"):
+                    self.git_dir = working_dir / pointer[len("gitdir:"):].strip()
+            self.common_dir = self.git_dir
+            commondir = self.git_dir / "commondir"
+            if commondir.is_file():
+                self.common_dir = self.git_dir / commondir.read_text().strip()
+            self.head = (self.git_dir / "HEAD").read_text().strip()
+        except OSError:
+            self.common_dir = self.git_dir
+            self.head = ""
+        # The checked-out branch's ref file ("refs/heads/main"), if any
+        self.head_ref = self.head[len("ref:"):].strip() if self.head.startswith("ref:") else ""
+
+    def stamp(self, *names: str) -> Callable[[], Any]:
+        """Return a stamp function over ``HEAD`` plus the named git files."""
+        paths = [
+            self.git_dir / name if name == "index" else self.common_dir / name
+            for name in names
+            if name
+        ]
+        return lambda: (self.head, *(_stat_stamp(path) for path in paths))
+
+
 # ======================================================================
 # Formatting functions
 # ======================================================================
@@ -4,11 +4,12 @@ This subpackage contains tool definitions and schema builders for
 NORMAL and PLAN mode agents.
 """
 
-from .definitions import _BUILTIN_TOOL_SCHEMAS
+from .definitions import CONCURRENT_SAFE_TOOLS, _BUILTIN_TOOL_SCHEMAS
 from .normal_builder import ToolSchemaBuilder
 from .planning_builder import PLANNING_TOOLS, PlanningToolSchemaBuilder
 
 __all__ = [
+    "CONCURRENT_SAFE_TOOLS",
     "PLANNING_TOOLS",
     "PlanningToolSchemaBuilder",
     "ToolSchemaBuilder",
@@ -9,6 +9,24 @@ from __future__ import annotations
 from typing import Any
 
 
+# Built-in tools without side effects. They may run concurrently within one
+# turn, and may start while the response is still streaming: if the stream
+# then fails, nothing was changed behind the conversation history's back.
+CONCURRENT_SAFE_TOOLS = frozenset(
+    {
+        "read_file",
+        "list_files",
+        "search",
+        "find_symbol",
+        "find_referencing_symbols",
+        "read_pdf",
+        "web_search",
+        "list_processes",
+        "get_process_output",
+        "list_todos",
+    }
+)
+
 _BUILTIN_TOOL_SCHEMAS: list[dict[str, Any]] = [
     {
         "type": "function",
@@ -704,7 +722,7 @@ _BUILTIN_TOOL_SCHEMAS: list[dict[str, Any]] = [
         "type": "function",
         "function": {
             "name": "read_pdf",
-            "description": "Extract text content from a PDF file (academic papers, documentation). Returns full text with page markers, detected sections (Abstract, Introduction, etc.), and metadata (title, author). Best for reading research papers to understand methodology and implement code.",
+            "description": "Extract text content from a PDF file (academic papers, documentation). Returns full text with page markers, detected sections (Abstract, Introduction, etc.), and metadata (title, author). Best for reading research papers to understand methodology and implement code. For long documents, read only what you need with 'pages' or 'section'.",
             "parameters": {
                 "type": "object",
                 "properties": {
@@ -712,6 +730,14 @@ _BUILTIN_TOOL_SCHEMAS: list[dict[str, Any]] = [
                         "type": "string",
                         "description": "Path to the PDF file (absolute or relative to working directory)",
                     },
+                    "pages": {
+                        "type": "string",
+                        "description": "Optional pages to read, e.g. '3', '2-5', '1,4-6' or '10-' (to the end)",
+                    },
+                    "section": {
+                        "type": "string",
+                        "description": "Optional section to read, by number ('4.2') or title ('Related Work'); returns only that section's pages",
+                    },
                 },
                 "required": ["file_path"],
             },
@@ -922,6 +948,12 @@ _BUILTIN_TOOL_SCHEMAS: list[dict[str, Any]] = [
                         "type": "string",
                         "description": "Optional: filter to specific MCP server name",
                     },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Optional: maximum number of tools to return, best matches first (default 10; all tools for '*')",
+                        "minimum": 1,
+                        "maximum": 100,
+                    },
                 },
                 "required": ["query"],
             },
@@ -124,6 +124,7 @@ class PlanningAgent(BaseAgent):
         messages: list[dict],
         task_monitor: Optional[Any] = None,
         thinking_visible: bool = False,  # Ignored for planning agent (compatibility parameter)
+        ui_callback: Optional[Any] = None,  # Ignored for planning agent (compatibility parameter)
     ) -> dict:
         payload = {
             "model": self.config.model,
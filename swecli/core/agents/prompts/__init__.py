@@ -1,10 +1,12 @@
 """System prompts for OpenDev agents."""
 
 from .loader import load_prompt, get_prompt_path
-from .injections import get_injection
+from .injections import get_injection, injected_user_message, is_injected_message
 
 __all__ = [
     "load_prompt",
     "get_prompt_path",
     "get_injection",
+    "injected_user_message",
+    "is_injected_message",
 ]
@@ -10,10 +10,15 @@ live in their own .txt files and are resolved by filename fallback.
 """
 
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict
 
 _TEMPLATES_DIR = Path(__file__).parent / "templates"
 
+# Marks user-role messages the agent loop adds mid-turn (nudges, signals,
+# thinking traces), so they aren't mistaken for the user's own input. The
+# key is dropped from the copies sent to the provider.
+INJECTED_MESSAGE_KEY = "_injected"
+
 # Module-level cache: parsed sections from injections.txt
 _sections: Dict[str, str] | None = None
 
@@ -86,3 +91,13 @@ def get_injection(injection_name: str, /, **kwargs: str) -> str:
         f"Unknown injection: {injection_name!r}. "
         f"Not found in injections.txt sections or as {template_file}"
     )
+
+
+def injected_user_message(content: str) -> Dict[str, Any]:
+    """Return a user-role message for text injected by the agent loop."""
+    return {"role": "user", "content": content, INJECTED_MESSAGE_KEY: True}
+
+
+def is_injected_message(message: Dict[str, Any]) -> bool:
+    """Whether ``message`` was added by the agent loop rather than the user."""
+    return bool(message.get(INJECTED_MESSAGE_KEY))
@@ -7,16 +7,20 @@ from typing import Any, Optional
 
 from swecli.core.base.abstract import BaseAgent
 from swecli.core.agents.components import (
+    CONCURRENT_SAFE_TOOLS,
     ResponseCleaner,
     SystemPromptBuilder,
     ThinkingPromptBuilder,
     ToolSchemaBuilder,
+    ToolSchemaFreezer,
+    annotate_cache_usage,
     build_max_tokens_param,
     build_temperature_param,
     create_http_client,
     create_http_client_for_provider,
 )
-from swecli.core.agents.prompts import get_injection
+from swecli.core.agents.prompts import get_injection, injected_user_message
+from swecli.core.context_engineering.images import strip_sent_images
 from swecli.models.config import AppConfig
 
 
@@ -34,6 +38,9 @@ class WebInterruptMonitor:
 class SwecliAgent(BaseAgent):
     """Custom agent that coordinates LLM interactions via HTTP."""
 
+    # Side-effect free tools that may start while the response is still streaming
+    EARLY_TOOL_NAMES = CONCURRENT_SAFE_TOOLS
+
     @staticmethod
     def _classify_error(error_text: str) -> str:
         """Classify error type for targeted nudge selection.
@@ -156,6 +163,8 @@ class SwecliAgent(BaseAgent):
         self._working_dir = working_dir
         self._env_context = env_context
         self._schema_builder = ToolSchemaBuilder(tool_registry, allowed_tools)
+        # Byte-stable tool schemas keep the provider's prompt cache warm
+        self._tool_freezer = ToolSchemaFreezer()
         super().__init__(config, tool_registry, mode_manager)
 
     @property
@@ -260,7 +269,9 @@ class SwecliAgent(BaseAgent):
         ).build()
 
     def build_tool_schemas(self, thinking_visible: bool = True) -> list[dict[str, Any]]:
-        return self._schema_builder.build(thinking_visible=thinking_visible)
+        return self._tool_freezer.freeze(
+            self._schema_builder.build(thinking_visible=thinking_visible)
+        )
 
     def _maybe_compact(self, messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Auto-compact messages if approaching the context window limit."""
@@ -273,6 +284,40 @@ class SwecliAgent(BaseAgent):
             return self._compactor.compact(messages, self.system_prompt)
         return messages
 
+    def _streaming_enabled(self) -> bool:
+        """Check the streaming flag (strict bool so partial configs keep the default)."""
+        return getattr(self.config, "enable_streaming", False) is True
+
+    def _post_completion(
+        self,
+        http_client: Any,
+        payload: dict[str, Any],
+        task_monitor: Optional[Any] = None,
+        *,
+        on_text_delta: Optional[Any] = None,
+        on_tool_call: Optional[Any] = None,
+    ) -> Any:
+        """Send a chat completion, streaming it when enabled and supported.
+
+        Streaming clients assemble the SSE deltas into the same response
+        shape as ``post_json``, so callers handle both paths identically.
+        """
+        if self._streaming_enabled() and hasattr(http_client, "post_json_stream"):
+            return http_client.post_json_stream(
+                payload,
+                task_monitor=task_monitor,
+                on_text_delta=on_text_delta,
+                on_tool_call=on_tool_call,
+            )
+        return http_client.post_json(payload, task_monitor=task_monitor)
+
+    @staticmethod
+    def _text_delta_callback(ui_callback: Optional[Any]) -> Optional[Any]:
+        """Return the UI hook for streamed text deltas, if the callback has one."""
+        if ui_callback is not None and hasattr(ui_callback, "on_assistant_delta"):
+            return ui_callback.on_assistant_delta
+        return None
+
     def call_thinking_llm(
         self,
         messages: list[dict],
@@ -417,6 +462,7 @@ class SwecliAgent(BaseAgent):
         messages: list[dict],
         task_monitor: Optional[Any] = None,
         thinking_visible: bool = True,
+        ui_callback: Optional[Any] = None,
     ) -> dict:
         """Call LLM with tools for action phase.
 
@@ -424,16 +470,23 @@ class SwecliAgent(BaseAgent):
             messages: Conversation messages
             task_monitor: Optional monitor for tracking progress
             thinking_visible: If False, excludes think tool from schemas
+            ui_callback: Optional UI callback; receives text deltas when streaming
 
         Returns:
             Dict with success status, content, tool_calls, etc.
         """
+        # Images from earlier turns are replaced by references; only the
+        # current turn's images are sent (and route to the VLM model)
+        messages, _ = strip_sent_images(messages)
+
         # Route to VLM model when images are present, otherwise use normal model
         model_id, http_client = self._resolve_vlm_model_and_client(messages)
 
         # Rebuild schemas with current thinking visibility
         # Think tool is excluded from schemas since thinking is now a pre-processing step
-        tool_schemas = self._schema_builder.build(thinking_visible=False)
+        tool_schemas = self._tool_freezer.freeze(
+            self._schema_builder.build(thinking_visible=False)
+        )
 
         # Always use auto tool_choice - no more force_think
         tool_choice = "auto"
@@ -447,7 +500,12 @@ class SwecliAgent(BaseAgent):
             **build_max_tokens_param(model_id, self.config.max_tokens),
         }
 
-        result = http_client.post_json(payload, task_monitor=task_monitor)
+        result = self._post_completion(
+            http_client,
+            payload,
+            task_monitor,
+            on_text_delta=self._text_delta_callback(ui_callback),
+        )
         if not result.success or result.response is None:
             return {
                 "success": False,
@@ -473,8 +531,8 @@ class SwecliAgent(BaseAgent):
         # This is the native thinking/reasoning trace from models like o1-preview
         reasoning_content = message_data.get("reasoning_content")
 
-        if task_monitor and "usage" in response_data:
-            usage = response_data["usage"]
+        usage = annotate_cache_usage(response_data.get("usage"))
+        if task_monitor and usage:
             total_tokens = usage.get("total_tokens", 0)
             if total_tokens > 0:
                 task_monitor.update_tokens(total_tokens)
@@ -485,7 +543,7 @@ class SwecliAgent(BaseAgent):
             "content": cleaned_content,
             "tool_calls": message_data.get("tool_calls"),
             "reasoning_content": reasoning_content,  # Native thinking trace from model
-            "usage": response_data.get("usage"),
+            "usage": usage,
         }
 
     def run_sync(
@@ -497,6 +555,41 @@ class SwecliAgent(BaseAgent):
         max_iterations: Optional[int] = None,  # None = unlimited
         task_monitor: Optional[Any] = None,  # Task monitor for interrupt support
         continue_after_subagent: bool = False,  # If True, don't inject stop signal after subagent
+    ) -> dict:
+        usage: dict[str, int] = {}
+        result = self._run_sync_loop(
+            message,
+            deps,
+            message_history,
+            ui_callback,
+            max_iterations,
+            task_monitor,
+            usage,
+        )
+        if usage:
+            # Token usage summed over every completion request in the run
+            result["usage"] = usage
+        return result
+
+    @staticmethod
+    def _add_usage(totals: dict[str, int], usage: Optional[dict]) -> None:
+        """Add the integer counters of a response's ``usage`` block to ``totals``."""
+        if not usage:
+            return
+        for key, value in usage.items():
+            if isinstance(value, int) and not isinstance(value, bool):
+                totals[key] = totals.get(key, 0) + value
+        totals["requests"] = totals.get("requests", 0) + 1
+
+    def _run_sync_loop(
+        self,
+        message: str,
+        deps: Any,
+        message_history: Optional[list[dict]],
+        ui_callback: Optional[Any],
+        max_iterations: Optional[int],
+        task_monitor: Optional[Any],
+        usage: dict[str, int],
     ) -> dict:
         messages = message_history or []
 
@@ -544,12 +637,13 @@ class SwecliAgent(BaseAgent):
             # Auto-compact context if approaching the model's token limit
             messages = self._maybe_compact(messages)
 
-            # Route to VLM model when images are present
-            model_id, http_client = self._resolve_vlm_model_and_client(messages)
+            # Send only the current turn's images, and route to VLM if there are any
+            request_messages, _ = strip_sent_images(messages)
+            model_id, http_client = self._resolve_vlm_model_and_client(request_messages)
 
             payload = {
                 "model": model_id,
-                "messages": messages,
+                "messages": request_messages,
                 "tools": self.tool_schemas,
                 "tool_choice": "auto",
                 **build_temperature_param(model_id, self.config.temperature),
@@ -561,7 +655,22 @@ class SwecliAgent(BaseAgent):
             if monitor is None and hasattr(self, "web_state"):
                 monitor = WebInterruptMonitor(self.web_state)
 
-            result = http_client.post_json(payload, task_monitor=monitor)
+            # When streaming, read-only tool calls start executing as soon as the
+            # stream completes them; results are keyed by tool_call id for the loop below
+            early_results: dict[str, dict] = {}
+            on_tool_call = None
+            if self._streaming_enabled():
+                on_tool_call = self._make_early_tool_runner(
+                    early_results, deps, task_monitor, ui_callback
+                )
+
+            result = self._post_completion(
+                http_client,
+                payload,
+                monitor,
+                on_text_delta=self._text_delta_callback(ui_callback),
+                on_tool_call=on_tool_call,
+            )
             if not result.success or result.response is None:
                 error_msg = result.error or "Unknown error"
                 return {
@@ -580,6 +689,7 @@ class SwecliAgent(BaseAgent):
                 }
 
             response_data = response.json()
+            self._add_usage(usage, annotate_cache_usage(response_data.get("usage")))
             choice = response_data["choices"][0]
             message_data = choice["message"]
 
@@ -616,7 +726,7 @@ class SwecliAgent(BaseAgent):
                         can_complete, nudge_msg = self._check_todo_completion()
                         if not can_complete and todo_nudge_count < MAX_TODO_NUDGES:
                             todo_nudge_count += 1
-                            messages.append({"role": "user", "content": nudge_msg})
+                            messages.append(injected_user_message(nudge_msg))
                             continue
 
                         # Accept best-effort completion
@@ -627,19 +737,14 @@ class SwecliAgent(BaseAgent):
                         }
 
                     # Use smart nudge with error-specific guidance
-                    messages.append(
-                        {
-                            "role": "user",
-                            "content": self._get_smart_nudge(last_error_text),
-                        }
-                    )
+                    messages.append(injected_user_message(self._get_smart_nudge(last_error_text)))
                     continue
 
                 # Last tool succeeded (or no previous tool) - check todos before implicit completion
                 can_complete, nudge_msg = self._check_todo_completion()
                 if not can_complete and todo_nudge_count < MAX_TODO_NUDGES:
                     todo_nudge_count += 1
-                    messages.append({"role": "user", "content": nudge_msg})
+                    messages.append(injected_user_message(nudge_msg))
                     continue
 
                 # Return the natural completion content directly without extra LLM calls
@@ -667,7 +772,7 @@ class SwecliAgent(BaseAgent):
                         can_complete, nudge_msg = self._check_todo_completion()
                         if not can_complete and todo_nudge_count < MAX_TODO_NUDGES:
                             todo_nudge_count += 1
-                            messages.append({"role": "user", "content": nudge_msg})
+                            messages.append(injected_user_message(nudge_msg))
                             continue  # Reject task_complete, loop again
 
                     return {
@@ -677,37 +782,12 @@ class SwecliAgent(BaseAgent):
                         "completion_status": status,
                     }
 
-                # Notify UI callback before tool execution
-                if ui_callback and hasattr(ui_callback, "on_tool_call"):
-                    ui_callback.on_tool_call(tool_name, tool_args)
-
-                # Check if this is a subagent (has overridden system prompt)
-                is_subagent = (
-                    hasattr(self, "_subagent_system_prompt")
-                    and self._subagent_system_prompt is not None
-                )
-
-                # Log tool registry type for debugging Docker execution
-                import logging
-
-                _logger = logging.getLogger(__name__)
-                _logger.info(f"SwecliAgent executing tool: {tool_name}")
-                _logger.info(f"  tool_registry type: {type(self.tool_registry).__name__}")
-
-                result = self.tool_registry.execute_tool(
-                    tool_name,
-                    tool_args,
-                    mode_manager=deps.mode_manager,
-                    approval_manager=deps.approval_manager,
-                    undo_manager=deps.undo_manager,
-                    task_monitor=task_monitor,
-                    is_subagent=is_subagent,
-                    ui_callback=ui_callback,
-                )
-
-                # Notify UI callback after tool execution
-                if ui_callback and hasattr(ui_callback, "on_tool_result"):
-                    ui_callback.on_tool_result(tool_name, tool_args, result)
+                if tool_call["id"] in early_results:
+                    result = early_results[tool_call["id"]]
+                else:
+                    result = self._execute_run_sync_tool(
+                        tool_name, tool_args, deps, task_monitor, ui_callback
+                    )
 
                 # Check if tool execution was interrupted (e.g., subagent cancelled via Escape)
                 if result.get("interrupted"):
@@ -738,3 +818,87 @@ class SwecliAgent(BaseAgent):
                         "content": tool_result,
                     }
                 )
+
+    def _execute_run_sync_tool(
+        self,
+        tool_name: str,
+        tool_args: dict[str, Any],
+        deps: Any,
+        task_monitor: Optional[Any],
+        ui_callback: Optional[Any],
+    ) -> dict:
+        """Execute one tool call for ``run_sync`` with UI notifications."""
+        # Notify UI callback before tool execution
+        if ui_callback and hasattr(ui_callback, "on_tool_call"):
+            ui_callback.on_tool_call(tool_name, tool_args)
+
+        # Check if this is a subagent (has overridden system prompt)
+        is_subagent = (
+            hasattr(self, "_subagent_system_prompt")
+            and self._subagent_system_prompt is not None
+        )
+
+        # Log tool registry type for debugging Docker execution
+        import logging
+
+        _logger = logging.getLogger(__name__)
+        _logger.info(f"SwecliAgent executing tool: {tool_name}")
+        _logger.info(f"  tool_registry type: {type(self.tool_registry).__name__}")
+
+        result = self.tool_registry.execute_tool(
+            tool_name,
+            tool_args,
+            mode_manager=deps.mode_manager,
+            approval_manager=deps.approval_manager,
+            undo_manager=deps.undo_manager,
+            task_monitor=task_monitor,
+            is_subagent=is_subagent,
+            ui_callback=ui_callback,
+        )
+
+        # Notify UI callback after tool execution
+        if ui_callback and hasattr(ui_callback, "on_tool_result"):
+            ui_callback.on_tool_result(tool_name, tool_args, result)
+
+        return result
+
+    def _make_early_tool_runner(
+        self,
+        results: dict[str, dict],
+        deps: Any,
+        task_monitor: Optional[Any],
+        ui_callback: Optional[Any],
+    ) -> Any:
+        """Build a stream callback that runs tool calls as soon as they complete.
+
+        Calls run in stream order on the caller's thread while the rest of the
+        response keeps arriving. Only :attr:`EARLY_TOOL_NAMES` run early: a
+        failed stream is never added to the history, so a write or command
+        started here would leave changes the model is never told about. Once
+        any other tool, malformed arguments or an interrupted tool is seen,
+        later calls are left to the regular loop so they keep their order
+        and completion semantics match the non-streaming path.
+        """
+        halted = False
+
+        def run(tool_call: dict) -> None:
+            nonlocal halted
+            if halted:
+                return
+            tool_name = tool_call["function"]["name"]
+            if tool_name not in self.EARLY_TOOL_NAMES:
+                halted = True
+                return
+            try:
+                tool_args = json.loads(tool_call["function"]["arguments"])
+            except json.JSONDecodeError:
+                halted = True
+                return
+            result = self._execute_run_sync_tool(
+                tool_name, tool_args, deps, task_monitor, ui_callback
+            )
+            results[tool_call["id"]] = result
+            if result.get("interrupted"):
+                halted = True
+
+        return run
@@ -1,11 +1,12 @@
 """Factory helpers for composing core runtime components."""
 
 from .agent_factory import AgentFactory, AgentSuite
-from .tool_factory import ToolDependencies, ToolFactory
+from .tool_factory import ToolDependencies, ToolFactory, build_default_tools
 
 __all__ = [
     "AgentFactory",
     "AgentSuite",
     "ToolFactory",
     "ToolDependencies",
+    "build_default_tools",
 ]
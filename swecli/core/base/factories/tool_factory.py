@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any, Union
 
 from swecli.core.context_engineering.tools import ToolRegistry
 
+_IMPLEMENTATIONS = "swecli.core.context_engineering.tools.implementations"
+
 
 @dataclass
 class ToolDependencies:
@@ -48,3 +51,44 @@ class ToolFactory:
             mcp_manager=mcp_manager,
         )
         return registry
+
+
+def build_default_tools(config: Any, working_dir: Path) -> dict[str, Any]:
+    """Create the standard tool set passed to ``RuntimeService.build_suite``.
+
+    Web, VLM and screenshot tools are :class:`LazyTool` proxies, so their
+    modules are only imported when the agent first calls them.
+
+    Args:
+        config: AppConfig for the tools
+        working_dir: Directory the tools operate in
+
+    Returns:
+        Keyword arguments for ``build_suite`` (no ask_user or MCP wiring)
+    """
+    from swecli.core.context_engineering.tools.implementations.bash_tool import BashTool
+    from swecli.core.context_engineering.tools.implementations.edit_tool import EditTool
+    from swecli.core.context_engineering.tools.implementations.file_ops import FileOperations
+    from swecli.core.context_engineering.tools.implementations.notebook_edit_tool import (
+        NotebookEditTool,
+    )
+    from swecli.core.context_engineering.tools.implementations.write_tool import WriteTool
+    from swecli.core.context_engineering.tools.lazy_tool import LazyTool
+
+    return {
+        "file_ops": FileOperations(config, working_dir),
+        "write_tool": WriteTool(config, working_dir),
+        "edit_tool": EditTool(config, working_dir),
+        "bash_tool": BashTool(config, working_dir),
+        "notebook_edit_tool": NotebookEditTool(working_dir),
+        "web_fetch_tool": LazyTool.from_path(
+            f"{_IMPLEMENTATIONS}.web_fetch_tool:WebFetchTool", config, working_dir
+        ),
+        "web_search_tool": LazyTool.from_path(
+            f"{_IMPLEMENTATIONS}.web_search_tool:WebSearchTool", config, working_dir
+        ),
+        "vlm_tool": LazyTool.from_path(f"{_IMPLEMENTATIONS}.vlm_tool:VLMTool", config, working_dir),
+        "web_screenshot_tool": LazyTool.from_path(
+            f"{_IMPLEMENTATIONS}.web_screenshot_tool:WebScreenshotTool", config, working_dir
+        ),
+    }
@@ -8,10 +8,8 @@ This package manages all context-related systems:
 - mcp/: Model Context Protocol integration
 """
 
-from swecli.core.context_engineering.tools import ToolRegistry, ToolExecutionContext
-from swecli.core.context_engineering.history.session_manager import SessionManager
-from swecli.core.context_engineering.history.undo_manager import UndoManager
-from swecli.core.context_engineering.memory.playbook import Playbook
+from importlib import import_module
+from typing import Dict, Tuple
 
 __all__ = [
     "ToolRegistry",
@@ -20,3 +18,21 @@ __all__ = [
     "UndoManager",
     "Playbook",
 ]
+
+# Imported on first access so importing one subpackage doesn't load the rest
+_EXPORTS: Dict[str, Tuple[str, str]] = {
+    "ToolRegistry": ("swecli.core.context_engineering.tools", "ToolRegistry"),
+    "ToolExecutionContext": ("swecli.core.context_engineering.tools", "ToolExecutionContext"),
+    "SessionManager": ("swecli.core.context_engineering.history.session_manager", "SessionManager"),
+    "UndoManager": ("swecli.core.context_engineering.history.undo_manager", "UndoManager"),
+    "Playbook": ("swecli.core.context_engineering.memory.playbook", "Playbook"),
+}
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'swecli.core.context_engineering' has no attribute '{name}'")
+    module_path, attr_name = _EXPORTS[name]
+    attr = getattr(import_module(module_path), attr_name)
+    globals()[name] = attr
+    return attr
@@ -12,7 +12,10 @@ from typing import Any
 
 from swecli.core.agents.components.api.configuration import build_temperature_param
 from swecli.core.agents.prompts.loader import load_prompt
-from swecli.core.context_engineering.retrieval.token_monitor import ContextTokenMonitor
+from swecli.core.context_engineering.retrieval.token_monitor import (
+    ConversationTokenCounter,
+    MessageTokenCache,
+)
 from swecli.models.config import AppConfig
 
 logger = logging.getLogger(__name__)
@@ -28,10 +31,12 @@ class ContextCompactor:
         self,
         config: AppConfig,
         http_client: Any,
+        token_cache: MessageTokenCache | None = None,
     ) -> None:
         self._config = config
         self._http_client = http_client
-        self._token_monitor = ContextTokenMonitor()
+        # Per-message counts are cached; only new messages are tokenized each turn
+        self._token_counter = ConversationTokenCounter(token_cache)
         self._last_token_count = 0
 
         # Resolve actual context window from model registry
@@ -59,6 +64,11 @@ class ContextCompactor:
         self._last_token_count = total
         return total > int(self._max_context * COMPACTION_THRESHOLD)
 
+    @property
+    def token_count(self) -> int:
+        """Tokens counted by the last :meth:`should_compact` call."""
+        return self._last_token_count
+
     @property
     def usage_pct(self) -> float:
         """Context usage as percentage of the model's full context window (0-100+)."""
@@ -110,6 +120,8 @@ class ContextCompactor:
         }
 
         compacted = head + [summary_msg] + tail
+        # Kept messages hit the token cache, so only the summary is tokenized
+        self._last_token_count = self._count_message_tokens(compacted, system_prompt)
 
         logger.info(
             "Compacted %d messages → %d (removed %d, kept %d recent)",
@@ -187,14 +199,4 @@ class ContextCompactor:
         system_prompt: str,
     ) -> int:
         """Estimate total tokens across all messages and system prompt."""
-        total = self._token_monitor.count_tokens(system_prompt)
-        for msg in messages:
-            content = msg.get("content", "")
-            if content:
-                total += self._token_monitor.count_tokens(content)
-            # Count tool call arguments if present
-            for tc in msg.get("tool_calls", []):
-                func = tc.get("function", {})
-                total += self._token_monitor.count_tokens(func.get("name", ""))
-                total += self._token_monitor.count_tokens(func.get("arguments", ""))
-        return total
+        return self._token_counter.count(messages, system_prompt)
@@ -3,12 +3,20 @@
 Manages session state and undo/redo functionality.
 """
 
+from swecli.core.context_engineering.history.session_journal import (
+    LazyMessageList,
+    SessionJournal,
+)
 from swecli.core.context_engineering.history.session_manager import SessionManager
+from swecli.core.context_engineering.history.snapshot_store import SnapshotStore
 from swecli.core.context_engineering.history.topic_detector import TopicDetector
 from swecli.core.context_engineering.history.undo_manager import UndoManager
 
 __all__ = [
+    "LazyMessageList",
+    "SessionJournal",
     "SessionManager",
+    "SnapshotStore",
     "TopicDetector",
     "UndoManager",
 ]
@@ -0,0 +1,502 @@
+"""Append-only session journal with periodic snapshots.
+
+A session is persisted as two files in its project directory:
+
+``{id}.json``
+    A compacted snapshot in the regular ``Session`` JSON format, plus a
+    ``journal_seq`` marker recording the last journal event it includes.
+``{id}.jsonl``
+    Append-only events written since that snapshot: new messages, updates to
+    the most recent message, file-change lists and session state changes.
+
+Saving appends only what changed since the previous save and fsyncs once per
+batch. When the journal grows past a threshold it is folded into a fresh
+snapshot (written atomically) and truncated; the ``journal_seq`` marker makes
+a crash between those two steps harmless, since replay skips events that are
+already part of the snapshot.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from swecli.models.message import ChatMessage
+from swecli.models.session import Session
+
+JOURNAL_SUFFIX = ".jsonl"
+
+# Fold the journal into a new snapshot once it exceeds either limit
+SNAPSHOT_EVERY_EVENTS = 500
+SNAPSHOT_MAX_JOURNAL_BYTES = 8 * 1024 * 1024
+
+# Snapshot layout markers used to stream messages without loading the file
+_MESSAGES_KEY = '\n  "messages": ['
+_SNAPSHOT_SEQ = re.compile(rb'"journal_seq":\s*(\d+)\s*}\s*$')
+_STREAM_CHUNK = 256 * 1024
+
+# Session fields (besides messages and file_changes) carried by "state" events
+_STATE_FIELDS = ("metadata", "playbook", "context_files", "working_directory", "updated_at")
+
+
+class LazyMessageList(list):
+    """List of ``ChatMessage`` that validates raw message dicts on first access.
+
+    Loading a long session only parses JSON; each message is turned into a
+    ``ChatMessage`` when it is indexed, sliced or iterated, and is cached in
+    place afterwards. ``len()`` never materializes anything.
+    """
+
+    def _materialize(self, index: int) -> ChatMessage:
+        item = list.__getitem__(self, index)
+        if isinstance(item, dict):
+            item = ChatMessage.model_validate(item)
+            list.__setitem__(self, index, item)
+        return item
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self._materialize(i) for i in range(*index.indices(len(self)))]
+        return self._materialize(index)
+
+    def __iter__(self) -> Iterator[ChatMessage]:
+        i = 0
+        while i < len(self):
+            yield self._materialize(i)
+            i += 1
+
+    def __reversed__(self) -> Iterator[ChatMessage]:
+        for i in range(len(self) - 1, -1, -1):
+            yield self._materialize(i)
+
+    def __contains__(self, item: object) -> bool:
+        return any(message == item for message in self)
+
+    def __eq__(self, other: object) -> bool:
+        return list(self) == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __add__(self, other):  # type: ignore[override]
+        return list(self) + list(other)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def copy(self) -> list:  # type: ignore[override]
+        return list(self)
+
+    def index(self, value, *args) -> int:  # type: ignore[override]
+        return list(self).index(value, *args)
+
+    def count(self, value) -> int:  # type: ignore[override]
+        return list(self).count(value)
+
+    def pop(self, index: int = -1) -> ChatMessage:  # type: ignore[override]
+        item = self._materialize(index)
+        list.pop(self, index)
+        return item
+
+    def is_materialized(self, index: int) -> bool:
+        """Return True if the message at ``index`` has been validated."""
+        return not isinstance(list.__getitem__(self, index), dict)
+
+    def dump_items(self) -> list[dict[str, Any]]:
+        """JSON-ready dicts for every message, without validating raw ones."""
+        return [
+            item if isinstance(item, dict) else item.model_dump(mode="json")
+            for item in list.__iter__(self)
+        ]
+
+
+def dump_messages(messages: list) -> list[dict[str, Any]]:
+    """Serialize a session's messages, leaving unvalidated lazy items as-is."""
+    if isinstance(messages, LazyMessageList):
+        return messages.dump_items()
+    return [message.model_dump(mode="json") for message in messages]
+
+
+def estimate_total_tokens(session: Session) -> int:
+    """``Session.total_tokens()`` without validating lazily loaded messages."""
+    messages = session.messages
+    if not isinstance(messages, LazyMessageList):
+        return session.total_tokens()
+    total = 0
+    for item in list.__iter__(messages):
+        if not isinstance(item, dict):
+            total += item.token_estimate()
+        elif item.get("tokens"):
+            total += item["tokens"]
+        else:
+            total += len(item.get("content") or "") // 4 + sum(
+                len(str(tc.get("parameters", {}))) // 4 for tc in item.get("tool_calls") or []
+            )
+    return total
+
+
+def _fingerprint(value: Any) -> str:
+    data = json.dumps(value, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _message_fingerprint(message: ChatMessage) -> str:
+    return hashlib.blake2b(message.model_dump_json().encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _state_of(session: Session) -> dict[str, Any]:
+    data = session.model_dump(mode="json", include=set(_STATE_FIELDS))
+    return {name: data.get(name) for name in _STATE_FIELDS}
+
+
+def _write_atomic(path: Path, data: dict[str, Any]) -> None:
+    """Write JSON to ``path`` via a temp file, fsync and rename."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp", prefix=f".{path.stem}-")
+    try:
+        with open(fd, "w") as f:
+            json.dump(data, f, indent=2, default=str)
+            f.flush()
+            os.fsync(f.fileno())
+        Path(tmp_path).replace(path)
+    except Exception:
+        try:
+            Path(tmp_path).unlink(missing_ok=True)
+        except Exception:
+            pass
+        raise
+
+
+@dataclass
+class _JournalState:
+    """What has been persisted for one session object."""
+
+    session: Session
+    seq: int = 0
+    persisted_messages: int = 0
+    last_message: Optional[str] = None
+    file_changes: Optional[str] = None
+    fields: dict[str, str] = field(default_factory=dict)
+    events_since_snapshot: int = 0
+
+
+class SessionJournal:
+    """Persists one session as a snapshot plus an append-only event journal."""
+
+    def __init__(self, snapshot_path: Path, *, fsync: bool = True) -> None:
+        self.snapshot_path = snapshot_path
+        self.journal_path = snapshot_path.with_suffix(JOURNAL_SUFFIX)
+        self._fsync = fsync
+        self._state: Optional[_JournalState] = None
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def save(self, session: Session) -> None:
+        """Persist ``session``, appending only what changed since the last save.
+
+        Falls back to a full snapshot when nothing has been written for this
+        session object yet, when persisted messages were removed, or when the
+        journal has grown past the snapshot thresholds.
+        """
+        state = self._state
+        if state is None or state.session is not session or not self.snapshot_path.exists():
+            self.write_snapshot(session)
+            return
+
+        messages = session.messages
+        if len(messages) < state.persisted_messages:
+            self.write_snapshot(session)
+            return
+
+        events: list[dict[str, Any]] = []
+
+        # The most recent persisted message may have been updated in place
+        if state.persisted_messages:
+            last_index = state.persisted_messages - 1
+            last = messages[last_index]
+            fingerprint = _message_fingerprint(last)
+            if fingerprint != state.last_message:
+                events.append({
+                    "type": "message_update",
+                    "index": last_index,
+                    "data": last.model_dump(mode="json"),
+                })
+                state.last_message = fingerprint
+
+        for index in range(state.persisted_messages, len(messages)):
+            message = messages[index]
+            events.append({"type": "message", "data": message.model_dump(mode="json")})
+            state.last_message = _message_fingerprint(message)
+        state.persisted_messages = len(messages)
+
+        file_changes = [fc.model_dump(mode="json") for fc in session.file_changes]
+        fingerprint = _fingerprint(file_changes)
+        if fingerprint != state.file_changes:
+            events.append({"type": "file_changes", "data": file_changes})
+            state.file_changes = fingerprint
+
+        changed = {}
+        for name, value in _state_of(session).items():
+            fingerprint = _fingerprint(value)
+            if state.fields.get(name) != fingerprint:
+                changed[name] = value
+                state.fields[name] = fingerprint
+        if changed:
+            events.append({"type": "state", "data": changed})
+
+        if not events:
+            return
+
+        self._append(events)
+
+        if (
+            state.events_since_snapshot >= SNAPSHOT_EVERY_EVENTS
+            or self.journal_path.stat().st_size >= SNAPSHOT_MAX_JOURNAL_BYTES
+        ):
+            self.write_snapshot(session)
+
+    def _append(self, events: list[dict[str, Any]]) -> None:
+        """Append a batch of events with a single flush and fsync."""
+        state = self._state
+        assert state is not None
+        lines = []
+        for event in events:
+            state.seq += 1
+            lines.append(json.dumps({"seq": state.seq, **event}, default=str))
+        self._drop_partial_line()
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+            f.flush()
+            if self._fsync:
+                os.fsync(f.fileno())
+        state.events_since_snapshot += len(events)
+
+    def _drop_partial_line(self) -> None:
+        """Cut a torn last line (crash mid-write) so new events start on a fresh line."""
+        try:
+            f = open(self.journal_path, "rb+")
+        except FileNotFoundError:
+            return
+        with f:
+            end = f.seek(0, os.SEEK_END)
+            if end == 0:
+                return
+            f.seek(end - 1)
+            if f.read(1) == b"\n":
+                return
+            # Scan back for the end of the last complete line
+            position = end
+            while position > 0:
+                start = max(0, position - 8192)
+                f.seek(start)
+                newline = f.read(position - start).rfind(b"\n")
+                if newline != -1:
+                    f.truncate(start + newline + 1)
+                    return
+                position = start
+            f.truncate(0)
+
+    def write_snapshot(self, session: Session) -> None:
+        """Write a compacted snapshot of ``session`` and truncate the journal."""
+        seq = self._state.seq if self._state is not None else self._last_seq()
+        data = session.model_dump(mode="json", exclude={"messages"})
+        data["messages"] = dump_messages(session.messages)
+        data["journal_seq"] = seq
+        _write_atomic(self.snapshot_path, data)
+
+        # Events up to ``seq`` are now in the snapshot; a crash before this
+        # truncation is harmless because replay skips them
+        if self.journal_path.exists():
+            with open(self.journal_path, "w"):
+                pass
+
+        self._state = self._state_for(session, seq)
+
+    def _state_for(self, session: Session, seq: int) -> _JournalState:
+        messages = session.messages
+        return _JournalState(
+            session=session,
+            seq=seq,
+            persisted_messages=len(messages),
+            last_message=_message_fingerprint(messages[-1]) if len(messages) else None,
+            file_changes=_fingerprint([fc.model_dump(mode="json") for fc in session.file_changes]),
+            fields={name: _fingerprint(value) for name, value in _state_of(session).items()},
+        )
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _read_events(self, after_seq: int) -> Iterator[dict[str, Any]]:
+        """Yield journal events newer than ``after_seq``.
+
+        Unreadable lines (e.g. torn by a crash mid-write) are skipped.
+        """
+        if not self.journal_path.exists():
+            return
+        with open(self.journal_path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(event, dict) and event.get("seq", 0) > after_seq:
+                    yield event
+
+    def _last_seq(self) -> int:
+        seq = 0
+        for event in self._read_events(0):
+            seq = max(seq, event.get("seq", 0))
+        return seq
+
+    def load_data(self) -> dict[str, Any]:
+        """Return the session data from the snapshot with the journal replayed."""
+        if not self.snapshot_path.exists():
+            raise FileNotFoundError(f"Session file not found: {self.snapshot_path}")
+
+        with open(self.snapshot_path) as f:
+            data = json.load(f)
+
+        seq = data.pop("journal_seq", 0)
+        messages: list = data.setdefault("messages", [])
+        events = 0
+        for event in self._read_events(seq):
+            kind = event.get("type")
+            if kind == "message":
+                messages.append(event["data"])
+            elif kind == "message_update" and 0 <= event.get("index", -1) < len(messages):
+                messages[event["index"]] = event["data"]
+            elif kind == "file_changes":
+                data["file_changes"] = event["data"]
+            elif kind == "state":
+                data.update(event["data"])
+            seq = max(seq, event.get("seq", 0))
+            events += 1
+
+        data["journal_seq"] = seq
+        data["journal_events"] = events
+        return data
+
+    def load(self) -> Session:
+        """Load the session with lazily validated messages."""
+        data = self.load_data()
+        seq = data.pop("journal_seq")
+        events = data.pop("journal_events")
+        raw_messages = data.pop("messages")
+
+        session = Session(**data)
+        session.messages = LazyMessageList(raw_messages)
+
+        self._state = self._state_for(session, seq)
+        self._state.events_since_snapshot = events
+        return session
+
+    def iter_messages(self) -> Iterator[ChatMessage]:
+        """Yield the session's messages one by one, validating each on demand.
+
+        Snapshot messages are decoded from the file one at a time rather than
+        loading the whole snapshot; journal events are applied on the way.
+        """
+        if not self.snapshot_path.exists():
+            raise FileNotFoundError(f"Session file not found: {self.snapshot_path}")
+        seq = self._snapshot_seq()
+        raw_messages = self._stream_snapshot_messages() if seq is not None else None
+        if raw_messages is None:
+            for raw in self.load_data()["messages"]:
+                yield ChatMessage.model_validate(raw)
+            return
+
+        # The journal is bounded by the snapshot thresholds, so it is read up front
+        appended: list[tuple[int, dict[str, Any]]] = []
+        updates: dict[int, tuple[int, dict[str, Any]]] = {}
+        for event in self._read_events(seq):
+            kind = event.get("type")
+            if kind == "message":
+                appended.append((event.get("seq", 0), event["data"]))
+            elif kind == "message_update" and event.get("index", -1) >= 0:
+                updates[event["index"]] = (event.get("seq", 0), event["data"])
+
+        index = 0
+        for raw in raw_messages:
+            update = updates.get(index)
+            yield ChatMessage.model_validate(update[1] if update else raw)
+            index += 1
+        for event_seq, raw in appended:
+            update = updates.get(index)
+            if update and update[0] > event_seq:
+                raw = update[1]
+            yield ChatMessage.model_validate(raw)
+            index += 1
+
+    def _snapshot_seq(self) -> Optional[int]:
+        """Read the snapshot's ``journal_seq`` from the end of the file.
+
+        Returns:
+            The seq, or None if the snapshot was not written by this journal
+        """
+        with open(self.snapshot_path, "rb") as f:
+            end = f.seek(0, os.SEEK_END)
+            f.seek(max(0, end - 256))
+            match = _SNAPSHOT_SEQ.search(f.read())
+        return int(match.group(1)) if match else None
+
+    def _stream_snapshot_messages(self) -> Optional[Iterator[dict[str, Any]]]:
+        """Decode the snapshot's top-level ``messages`` array incrementally.
+
+        Relies on the indented layout written by :meth:`write_snapshot`, where
+        only top-level keys start two spaces into a line.
+
+        Returns:
+            An iterator of raw message dicts, or None if the array wasn't found
+        """
+        f = open(self.snapshot_path, encoding="utf-8")
+        buffer = ""
+        while True:
+            chunk = f.read(_STREAM_CHUNK)
+            buffer += chunk
+            start = buffer.find(_MESSAGES_KEY)
+            if start != -1:
+                buffer = buffer[start + len(_MESSAGES_KEY):]
+                break
+            if not chunk:
+                f.close()
+                return None
+            buffer = buffer[-len(_MESSAGES_KEY):]
+
+        def messages() -> Iterator[dict[str, Any]]:
+            nonlocal buffer
+            decoder = json.JSONDecoder()
+            with f:
+                eof = False
+                while True:
+                    stripped = buffer.lstrip(" \t\r\n,")
+                    if stripped.startswith("]"):
+                        return
+                    try:
+                        item, end = decoder.raw_decode(stripped)
+                    except json.JSONDecodeError:
+                        if eof:
+                            raise
+                        chunk = f.read(_STREAM_CHUNK)
+                        eof = not chunk
+                        buffer = stripped + chunk
+                        continue
+                    buffer = stripped[end:]
+                    yield item
+
+        return messages()
+
+    def delete(self) -> None:
+        """Remove the snapshot and the journal."""
+        for path in (self.snapshot_path, self.journal_path):
+            if path.exists():
+                path.unlink()
+        self._state = None
@@ -3,9 +3,14 @@
 import json
 import tempfile
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Optional, Union
+from typing import Iterable, Iterator, Optional, Union
 
+from swecli.core.context_engineering.history.session_journal import (
+    SessionJournal,
+    estimate_total_tokens,
+)
 from swecli.models.message import ChatMessage
 from swecli.models.session import Session, SessionMetadata
 
@@ -22,6 +27,10 @@ class SessionManager:
     ``list_sessions()`` is O(1) reads instead of O(N) full-file parses. The
     index is self-healing: if it is missing or corrupted, it is transparently
     rebuilt from the individual session ``.json`` files.
+
+    Each session is stored as a ``{id}.json`` snapshot plus an append-only
+    ``{id}.jsonl`` journal (see :class:`SessionJournal`), so saves only write
+    what changed. Loaded sessions validate their messages lazily.
     """
 
     def __init__(
@@ -56,6 +65,7 @@ class SessionManager:
         self.session_dir.mkdir(parents=True, exist_ok=True)
         self.current_session: Optional[Session] = None
         self.turn_count = 0
+        self._journals: dict[Path, SessionJournal] = {}
 
     # ========================================================================
     # Index helpers
@@ -117,7 +127,7 @@ class SessionManager:
             "created": session.created_at.isoformat(),
             "modified": session.updated_at.isoformat(),
             "messageCount": len(session.messages),
-            "totalTokens": session.total_tokens(),
+            "totalTokens": estimate_total_tokens(session),
             "title": session.metadata.get("title"),
             "summary": session.metadata.get("summary"),
             "tags": session.metadata.get("tags", []),
@@ -229,26 +239,28 @@ class SessionManager:
         self.turn_count = 0
         return session
 
+    def _journal_for(self, path: Path) -> SessionJournal:
+        """Return the journal tracking the session stored at ``path``."""
+        journal = self._journals.get(path)
+        if journal is None:
+            journal = SessionJournal(path)
+            self._journals[path] = journal
+        return journal
+
     @staticmethod
     def _load_from_file(path: Path) -> Session:
-        """Load a session from a JSON file.
+        """Load a session from its snapshot file, replaying the journal tail.
 
         Args:
-            path: Path to the session JSON file.
+            path: Path to the session JSON snapshot.
 
         Returns:
-            Loaded Session instance.
+            Loaded Session instance (messages are validated lazily).
 
         Raises:
             FileNotFoundError: If the file doesn't exist.
         """
-        if not path.exists():
-            raise FileNotFoundError(f"Session file not found: {path}")
-
-        with open(path) as f:
-            data = json.load(f)
-
-        return Session(**data)
+        return SessionJournal(path).load()
 
     def load_session(self, session_id: str) -> Session:
         """Load a session from disk.
@@ -268,7 +280,7 @@ class SessionManager:
         # Try local project dir first
         session_file = self.session_dir / f"{session_id}.json"
         if session_file.exists():
-            session = self._load_from_file(session_file)
+            session = self._journal_for(session_file).load()
             self.current_session = session
             self.turn_count = len(session.messages)
             return session
@@ -284,7 +296,7 @@ class SessionManager:
                     continue
                 candidate = project_dir / f"{session_id}.json"
                 if candidate.exists():
-                    session = self._load_from_file(candidate)
+                    session = self._journal_for(candidate).load()
                     self.current_session = session
                     self.turn_count = len(session.messages)
                     return session
@@ -295,7 +307,9 @@ class SessionManager:
         """Save session to disk.
 
         Only saves sessions that have at least one message to avoid
-        cluttering the session list with empty test sessions.
+        cluttering the session list with empty test sessions. New messages
+        and state changes are appended to the session journal with a single
+        fsync; the full snapshot is rewritten only periodically.
 
         After writing the session file, auto-generates a title (if not already
         set) and updates the sessions index.
@@ -315,15 +329,15 @@ class SessionManager:
 
         # Auto-generate title before writing (single write)
         if not session.metadata.get("title"):
-            msg_dicts = [
+            msg_dicts = (
                 {"role": m.role.value, "content": m.content} for m in session.messages
-            ]
+            )
             title = self.generate_title(msg_dicts)
             if title != "Untitled":
                 session.metadata["title"] = title
 
-        with open(session_file, "w") as f:
-            json.dump(session.model_dump(), f, indent=2, default=str)
+        # Appends only the changes since the last save (snapshot when needed)
+        self._journal_for(session_file).save(session)
 
         # Update the sessions index
         self._update_index_entry(session)
@@ -338,6 +352,8 @@ class SessionManager:
         if not self.current_session:
             raise ValueError("No active session")
 
+        if message.tokens is None:
+            message.tokens = self._count_tokens(message)
         self.current_session.add_message(message)
         self.turn_count += 1
 
@@ -345,6 +361,22 @@ class SessionManager:
         if self.turn_count % auto_save_interval == 0:
             self.save_session()
 
+    @staticmethod
+    def _count_tokens(message: ChatMessage) -> Optional[int]:
+        """Count a message's tokens once, via the cache shared with compaction.
+
+        Returns None when no tokenizer is available, leaving
+        ``ChatMessage.token_estimate`` to fall back to its rough estimate.
+        """
+        from swecli.core.context_engineering.retrieval.token_monitor import (
+            get_message_token_cache,
+        )
+
+        try:
+            return get_message_token_cache().count_chat_message(message)
+        except Exception:
+            return None
+
     def list_sessions(self) -> list[SessionMetadata]:
         """List all saved sessions in this project directory.
 
@@ -458,8 +490,8 @@ class SessionManager:
             session_id: Session ID to delete
         """
         session_file = self.session_dir / f"{session_id}.json"
-        if session_file.exists():
-            session_file.unlink()
+        self._journal_for(session_file).delete()
+        self._journals.pop(session_file, None)
 
         # Also remove the debug log if present
         debug_file = self.session_dir / f"{session_id}.debug"
@@ -508,19 +540,53 @@ class SessionManager:
 
         raise FileNotFoundError(f"Session {session_id} not found")
 
+    def iter_messages(
+        self,
+        session_id: Optional[str] = None,
+        *,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> Iterator[ChatMessage]:
+        """Stream a session's messages without materializing the whole history.
+
+        Args:
+            session_id: Session to read (defaults to the current session)
+            offset: Number of leading messages to skip
+            limit: Maximum number of messages to yield
+
+        Yields:
+            Messages in order, each validated only when reached
+        """
+        if session_id is None or (
+            self.current_session and self.current_session.id == session_id
+        ):
+            if not self.current_session:
+                return
+            messages = self.current_session.messages
+            stop = len(messages) if limit is None else min(len(messages), offset + limit)
+            for index in range(offset, stop):
+                yield messages[index]
+            return
+
+        session_file = self.session_dir / f"{session_id}.json"
+        if not session_file.exists():
+            raise FileNotFoundError(f"Session {session_id} not found")
+        stop = None if limit is None else offset + limit
+        yield from islice(SessionJournal(session_file).iter_messages(), offset, stop)
+
     def get_current_session(self) -> Optional[Session]:
         """Get the current active session."""
         return self.current_session
 
     @staticmethod
-    def generate_title(messages: list[dict]) -> str:
+    def generate_title(messages: Iterable[dict]) -> str:
         """Generate a short title from the first user message.
 
         Simple heuristic: extract the first sentence, truncate to 50 chars.
         No LLM call required.
 
         Args:
-            messages: List of message dicts with 'role' and 'content' keys
+            messages: Message dicts with 'role' and 'content' keys
 
         Returns:
             A concise title string (max 50 chars)
@@ -560,19 +626,13 @@ class SessionManager:
         if not session_file.exists():
             return
 
-        with open(session_file) as f:
-            data = json.load(f)
-
-        if "metadata" not in data:
-            data["metadata"] = {}
-        data["metadata"]["title"] = title
-
-        with open(session_file, "w") as f:
-            json.dump(data, f, indent=2, default=str)
+        journal = self._journal_for(session_file)
+        session = journal.load()
+        session.metadata["title"] = title
+        journal.save(session)
 
         # Update the index for the on-disk-only path
         try:
-            session = self._load_from_file(session_file)
             self._update_index_entry(session)
         except Exception:
             pass
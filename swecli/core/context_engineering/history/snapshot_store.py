@@ -0,0 +1,228 @@
+"""Content-addressed store for file snapshots used by undo.
+
+Each file state is stored once under ``objects/<hash[:2]>/<hash[2:]>``
+(SHA-256 of the content, zlib-compressed), so identical states are
+deduplicated across edits and files. Text snapshots use reverse deltas: when
+a newer version of a file is stored, the previous version is re-encoded as a
+line delta against it. The newest version of a file therefore stays whole,
+and stepping back N versions applies N small deltas instead of copying full
+backups.
+
+Only freshly created (full) objects are ever used as a delta base, so
+dependencies always point from older objects to newer ones and can't form a
+cycle.
+"""
+
+from __future__ import annotations
+
+import difflib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Optional
+
+
+class SnapshotStore:
+    """Deduplicating, delta-compressed blob store keyed by content hash."""
+
+    _CACHE_SIZE = 8
+
+    def __init__(self, root: Path):
+        """Initialize the store.
+
+        Args:
+            root: Directory holding the ``objects`` tree (created on first write)
+        """
+        self.root = Path(root)
+        self._objects = self.root / "objects"
+        self._lock = threading.RLock()
+        self._cache: OrderedDict[str, bytes] = OrderedDict()
+
+    @staticmethod
+    def digest(data: bytes) -> str:
+        """Return the content hash used as a blob id."""
+        return hashlib.sha256(data).hexdigest()
+
+    def contains(self, digest: str) -> bool:
+        """Check whether a blob is stored."""
+        return self._path(digest).exists()
+
+    def put(self, data: bytes, previous: Optional[str] = None) -> str:
+        """Store ``data`` and return its hash.
+
+        Args:
+            data: File content
+            previous: Hash of the prior version of the same file; it is
+                re-encoded as a delta against ``data`` when that saves space
+
+        Returns:
+            Content hash of ``data``
+        """
+        digest = self.digest(data)
+        with self._lock:
+            if self.contains(digest):
+                return digest
+            self._write(digest, {}, data)
+            self._remember(digest, data)
+            if previous and previous != digest:
+                self._rebase(previous, digest, data)
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """Return the content for ``digest``.
+
+        Raises:
+            KeyError: If the blob (or a delta base it needs) is missing
+        """
+        with self._lock:
+            chain = []
+            current = digest
+            while current not in self._cache:
+                header, payload = self._read(current)
+                if "base" not in header:
+                    self._remember(current, payload)
+                    break
+                chain.append((current, payload))
+                current = header["base"]
+            data = self._cache[current]
+            for blob_id, delta in reversed(chain):
+                data = self._apply_delta(data, delta)
+                self._remember(blob_id, data)
+            return data
+
+    def collect_garbage(self, live: Iterable[str]) -> int:
+        """Delete blobs not reachable from ``live`` (including delta bases).
+
+        Returns:
+            Number of blobs removed
+        """
+        with self._lock:
+            keep = set()
+            pending = [d for d in live if d]
+            while pending:
+                current = pending.pop()
+                if current in keep:
+                    continue
+                keep.add(current)
+                try:
+                    header, _ = self._read(current)
+                except KeyError:
+                    continue
+                if "base" in header:
+                    pending.append(header["base"])
+
+            removed = 0
+            if not self._objects.exists():
+                return 0
+            for path in self._objects.glob("*/*"):
+                blob_id = path.parent.name + path.name
+                if blob_id not in keep and not path.name.startswith("."):
+                    path.unlink(missing_ok=True)
+                    self._cache.pop(blob_id, None)
+                    removed += 1
+            return removed
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _path(self, digest: str) -> Path:
+        return self._objects / digest[:2] / digest[2:]
+
+    def _write(self, digest: str, header: dict, payload: bytes) -> None:
+        path = self._path(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        blob = zlib.compress(json.dumps(header).encode() + b"\n" + payload)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(blob)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def _read(self, digest: str) -> tuple[dict, bytes]:
+        try:
+            raw = zlib.decompress(self._path(digest).read_bytes())
+        except FileNotFoundError:
+            raise KeyError(digest) from None
+        header, _, payload = raw.partition(b"\n")
+        return json.loads(header), payload
+
+    def _remember(self, digest: str, data: bytes) -> None:
+        self._cache[digest] = data
+        self._cache.move_to_end(digest)
+        while len(self._cache) > self._CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    def _rebase(self, previous: str, base: str, base_data: bytes) -> None:
+        """Re-encode the full blob ``previous`` as a delta against ``base``."""
+        try:
+            header, old_data = self._read(previous)
+        except KeyError:
+            return
+        if "base" in header:
+            return  # Already a delta; keep the existing chain
+        delta = self._make_delta(base_data, old_data)
+        if delta is None:
+            return
+        if len(zlib.compress(delta)) < self._path(previous).stat().st_size:
+            self._write(previous, {"base": base}, delta)
+
+    @staticmethod
+    def _make_delta(base: bytes, target: bytes) -> Optional[bytes]:
+        """Encode ``target`` as line copies from ``base`` plus inserted text."""
+        if b"\0" in base or b"\0" in target:
+            return None  # Binary content: keep whole
+        try:
+            target.decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+        base_lines = base.splitlines(keepends=True)
+        target_lines = target.splitlines(keepends=True)
+
+        # Edits are usually local: match the shared head and tail directly so
+        # SequenceMatcher only sees the changed middle
+        limit = min(len(base_lines), len(target_lines))
+        head = 0
+        while head < limit and base_lines[head] == target_lines[head]:
+            head += 1
+        tail = 0
+        while (
+            tail < limit - head
+            and base_lines[len(base_lines) - 1 - tail] == target_lines[len(target_lines) - 1 - tail]
+        ):
+            tail += 1
+
+        ops: list = [[0, head]] if head else []
+        base_mid = base_lines[head:len(base_lines) - tail]
+        target_mid = target_lines[head:len(target_lines) - tail]
+        matcher = difflib.SequenceMatcher(None, base_mid, target_mid, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                ops.append([head + i1, head + i2])
+            elif j2 > j1:
+                ops.append(b"".join(target_mid[j1:j2]).decode("utf-8"))
+        if tail:
+            ops.append([len(base_lines) - tail, len(base_lines)])
+        return json.dumps(ops, ensure_ascii=False).encode("utf-8")
+
+    @staticmethod
+    def _apply_delta(base: bytes, delta: bytes) -> bytes:
+        base_lines = base.splitlines(keepends=True)
+        parts = []
+        for op in json.loads(delta):
+            if isinstance(op, list):
+                parts.extend(base_lines[op[0]:op[1]])
+            else:
+                parts.append(op.encode("utf-8"))
+        return b"".join(parts)
+
+
+__all__ = ["SnapshotStore"]
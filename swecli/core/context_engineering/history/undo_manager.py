@@ -2,11 +2,19 @@
 
 import json
 import shutil
+import tempfile
+import weakref
 from pathlib import Path
 from typing import Optional
 
+from swecli.core.context_engineering.history.snapshot_store import SnapshotStore
 from swecli.models.operation import Operation, OperationType
 
+_FILE_OPERATIONS = (OperationType.FILE_WRITE, OperationType.FILE_EDIT, OperationType.FILE_DELETE)
+
+# Collect unreferenced snapshots after this many operations leave the history
+_GC_INTERVAL = 25
+
 
 class UndoResult:
     """Result of an undo operation."""
@@ -30,36 +38,134 @@ class UndoResult:
 
 
 class UndoManager:
-    """Manager for undoing operations."""
+    """Manager for undoing operations.
+
+    File states are kept in a :class:`SnapshotStore` (``<session_dir>/snapshots``,
+    or a temporary directory when there is no session directory). Callers
+    snapshot the target with :meth:`capture_state` before modifying it;
+    :meth:`record_operation` then snapshots the result, so each operation
+    references a ``before_blob`` and ``after_blob`` instead of a backup copy.
+    """
 
     def __init__(self, max_history: int = 50, session_dir: Optional[Path] = None):
         """Initialize undo manager.
 
         Args:
             max_history: Maximum number of operations to track
-            session_dir: Directory for persistent operation log (JSONL)
+            session_dir: Directory for persistent operation log (JSONL) and snapshots
         """
         self.max_history = max_history
         self.history: list[Operation] = []
         self._session_dir = session_dir
+        self._snapshots: Optional[SnapshotStore] = None
+        # Resolved path -> hash of the file's most recently snapshotted state
+        self._latest: dict[str, Optional[str]] = {}
+        self._dropped_since_gc = 0
+
+    @property
+    def snapshots(self) -> SnapshotStore:
+        """Snapshot store, created on first use."""
+        if self._snapshots is None:
+            if self._session_dir is not None:
+                root = Path(self._session_dir) / "snapshots"
+            else:
+                root = Path(tempfile.mkdtemp(prefix="swecli-undo-"))
+                weakref.finalize(self, shutil.rmtree, root, True)
+            self._snapshots = SnapshotStore(root)
+        return self._snapshots
+
+    def capture_state(self, operation: Operation, working_dir: Optional[Path] = None) -> None:
+        """Snapshot a file operation's target before it is modified.
+
+        A relative target is resolved against ``working_dir`` (the directory
+        the tool modifying it resolves paths against), not the process cwd.
+        The resolved path is kept as the operation's ``snapshot_path``.
+
+        Args:
+            operation: Pending file write/edit/delete operation
+            working_dir: Directory relative targets are resolved against
+        """
+        if operation.type not in _FILE_OPERATIONS:
+            return
+        path = Path(operation.target)
+        if not path.is_absolute() and working_dir is not None:
+            path = Path(working_dir) / path
+        path = path.resolve()
+        operation.parameters["snapshot_path"] = str(path)
+        try:
+            operation.parameters["before_blob"] = self._snapshot(path)
+        except OSError:
+            operation.parameters.pop("before_blob", None)
+
+    @staticmethod
+    def _snapshot_path(operation: Operation) -> Path:
+        """Absolute path the operation's snapshots were taken of."""
+        return Path(operation.parameters.get("snapshot_path") or operation.target).resolve()
 
     def record_operation(self, operation: Operation) -> None:
         """Record an operation for potential undo.
 
-        Also appends to the persistent JSONL log if session_dir is set.
+        Snapshots the target's new state if its prior state was captured, and
+        appends to the persistent JSONL log if session_dir is set.
 
         Args:
             operation: Operation to record
         """
+        if "before_blob" in operation.parameters:
+            try:
+                operation.parameters["after_blob"] = self._snapshot(self._snapshot_path(operation))
+            except OSError:
+                pass
+
         self.history.append(operation)
 
         # Trim history if needed
         if len(self.history) > self.max_history:
+            self._dropped_since_gc += len(self.history) - self.max_history
             self.history = self.history[-self.max_history :]
+            if self._dropped_since_gc >= _GC_INTERVAL:
+                self.collect_garbage()
 
         # Persist to JSONL
         self._append_to_log(operation)
 
+    def collect_garbage(self) -> int:
+        """Delete snapshots no operation in the history references.
+
+        Returns:
+            Number of snapshot blobs removed
+        """
+        self._dropped_since_gc = 0
+        if self._snapshots is None:
+            return 0
+        live = set()
+        for operation in self.history:
+            live.add(operation.parameters.get("before_blob"))
+            live.add(operation.parameters.get("after_blob"))
+        live.discard(None)
+        self._latest = {key: blob for key, blob in self._latest.items() if blob in live}
+        return self._snapshots.collect_garbage(live)
+
+    def _snapshot(self, path: Path) -> Optional[str]:
+        """Store the current content of absolute ``path``; None if it doesn't exist."""
+        key = str(path)
+        if not path.is_file():
+            self._latest[key] = None
+            return None
+        digest = self.snapshots.put(path.read_bytes(), previous=self._latest.get(key))
+        self._latest[key] = digest
+        return digest
+
+    def _restore_state(self, path: Path, digest: Optional[str]) -> None:
+        """Write snapshot ``digest`` back to absolute ``path`` (None deletes the file)."""
+        if digest is None:
+            path.unlink(missing_ok=True)
+        else:
+            data = self.snapshots.get(digest)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+        self._latest[str(path)] = digest
+
     def _append_to_log(self, operation: Operation) -> None:
         """Append an operation to the persistent JSONL log file.
 
@@ -125,6 +231,84 @@ class UndoManager:
         operation = self.history.pop()
         return self.undo_operation(operation)
 
+    def undo_steps(self, count: int) -> list[UndoResult]:
+        """Undo the last ``count`` operations, newest first.
+
+        Snapshot-backed operations on the same file are collapsed, so each
+        file is written once, directly at its state before the oldest undone
+        operation.
+
+        Args:
+            count: Number of operations to undo
+
+        Returns:
+            UndoResult per undone operation (most recent first)
+        """
+        if count <= 0:
+            return []
+        operations = list(reversed(self.history[-count:]))
+        del self.history[-count:]
+
+        results: list[Optional[UndoResult]] = []
+        targets: dict[str, tuple[Path, Optional[str], list[int]]] = {}
+        for operation in operations:
+            if "before_blob" in operation.parameters:
+                path = self._snapshot_path(operation)
+                indexes = targets.get(str(path), (None, None, []))[2]
+                indexes.append(len(results))
+                targets[str(path)] = (path, operation.parameters["before_blob"], indexes)
+                results.append(None)
+            else:
+                results.append(self.undo_operation(operation))
+
+        for path, digest, indexes in targets.values():
+            error = None
+            try:
+                self._restore_state(path, digest)
+            except Exception as e:
+                error = f"Undo failed: {str(e)}"
+            for index in indexes:
+                results[index] = UndoResult(
+                    success=error is None, operation_id=operations[index].id, error=error
+                )
+        return results
+
+    def restore_to_operation(self, operation_id: str) -> UndoResult:
+        """Restore an operation's target file to its state right after that operation.
+
+        The history is left unchanged.
+
+        Args:
+            operation_id: ID of an operation still in the history
+
+        Returns:
+            UndoResult with details
+        """
+        operation = next((op for op in self.history if op.id == operation_id), None)
+        if operation is None:
+            return UndoResult(
+                success=False,
+                operation_id=operation_id,
+                error="Operation not found in history",
+            )
+        if "after_blob" not in operation.parameters:
+            return UndoResult(
+                success=False,
+                operation_id=operation_id,
+                error="No snapshot recorded for this operation",
+            )
+        try:
+            self._restore_state(
+                self._snapshot_path(operation), operation.parameters["after_blob"]
+            )
+        except Exception as e:
+            return UndoResult(
+                success=False,
+                operation_id=operation_id,
+                error=f"Restore failed: {str(e)}",
+            )
+        return UndoResult(success=True, operation_id=operation_id)
+
     def undo_operation(self, operation: Operation) -> UndoResult:
         """Undo a specific operation.
 
@@ -135,6 +319,11 @@ class UndoManager:
             UndoResult with details
         """
         try:
+            if operation.type in _FILE_OPERATIONS and "before_blob" in operation.parameters:
+                self._restore_state(
+                    self._snapshot_path(operation), operation.parameters["before_blob"]
+                )
+                return UndoResult(success=True, operation_id=operation.id)
             if operation.type == OperationType.FILE_WRITE:
                 return self._undo_file_write(operation)
             elif operation.type == OperationType.FILE_EDIT:
@@ -263,8 +452,9 @@ class UndoManager:
         return list(reversed(self.history[-limit:]))
 
     def clear_history(self) -> None:
-        """Clear all operation history."""
+        """Clear all operation history and the snapshots it referenced."""
         self.history.clear()
+        self.collect_garbage()
 
     def get_history_size(self) -> int:
         """Get number of operations in history."""
@@ -0,0 +1,365 @@
+"""Image preprocessing and history dedup for multimodal requests.
+
+Images are base64-encoded into every request that carries them, so their size
+is paid on each upload:
+
+- :class:`ImagePreprocessor` downsamples an image to the largest size the
+  provider actually uses (larger images are scaled down server-side anyway)
+  and re-encodes it: palette PNG for flat-colour graphics, PNG for images
+  with transparency, JPEG otherwise (photos, most screenshots), or the
+  original bytes when those are already smaller. Results
+  are cached by content hash, so the same file is only processed once.
+- :func:`strip_sent_images` replaces images the model has already been shown
+  in an earlier turn (and repeats within a request) with a short text
+  reference, so payload size stops growing with each screenshot in the
+  history. The result is deterministic, so the request prefix stays
+  cacheable from one iteration to the next.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import io
+import logging
+import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from swecli.core.agents.prompts.injections import INJECTED_MESSAGE_KEY, is_injected_message
+
+logger = logging.getLogger(__name__)
+
+# Formats that can be sent without re-encoding
+_SENDABLE_FORMATS = {
+    "PNG": "image/png",
+    "JPEG": "image/jpeg",
+    "GIF": "image/gif",
+    "WEBP": "image/webp",
+}
+_JPEG_QUALITY = 85
+_MAX_PALETTE_COLORS = 256
+
+
+@dataclass(frozen=True)
+class ImageLimits:
+    """Largest image a provider makes use of."""
+
+    max_edge: int
+    max_short_edge: Optional[int] = None
+    max_pixels: Optional[int] = None
+
+    def scale(self, width: int, height: int) -> float:
+        """Return the factor (at most 1.0) that brings ``width x height`` within limits."""
+        factor = min(1.0, self.max_edge / max(width, height))
+        if self.max_short_edge:
+            factor = min(factor, self.max_short_edge / min(width, height))
+        if self.max_pixels and width * height > self.max_pixels:
+            factor = min(factor, math.sqrt(self.max_pixels / (width * height)))
+        return factor
+
+
+# Anthropic rescales above 1568px on the long edge or ~1.15 megapixels; OpenAI's
+# high-detail mode fits images into 2048x2048, then scales the short side to 768
+PROVIDER_IMAGE_LIMITS = {
+    "anthropic": ImageLimits(1568, max_pixels=1_150_000),
+    "openai": ImageLimits(2048, max_short_edge=768),
+}
+DEFAULT_IMAGE_LIMITS = ImageLimits(1568, max_pixels=1_150_000)
+
+
+@dataclass(frozen=True)
+class PreparedImage:
+    """An image encoded for a request."""
+
+    data: str  # Base64
+    media_type: str
+    digest: str  # SHA-256 of the original bytes
+    width: Optional[int]
+    height: Optional[int]
+    original_size: int  # Bytes before preprocessing
+    size: int  # Bytes after preprocessing (before base64)
+
+    @property
+    def bytes_saved(self) -> int:
+        return max(0, self.original_size - self.size)
+
+    def to_block(self) -> dict[str, Any]:
+        """Return the multimodal content block used in conversation messages."""
+        return {
+            "type": "image",
+            "source": {"type": "base64", "media_type": self.media_type, "data": self.data},
+        }
+
+    def to_data_url(self) -> str:
+        return f"data:{self.media_type};base64,{self.data}"
+
+
+class ImagePreprocessor:
+    """Downsample and re-encode images, caching results by content hash."""
+
+    _shared: dict[str, "ImagePreprocessor"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, limits: ImageLimits = DEFAULT_IMAGE_LIMITS, cache_size: int = 64) -> None:
+        self.limits = limits
+        self._cache_size = cache_size
+        self._cache: OrderedDict[str, PreparedImage] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_provider(cls, provider: Optional[str]) -> "ImagePreprocessor":
+        """Return the shared preprocessor for a provider's image limits."""
+        key = (provider or "").lower()
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(PROVIDER_IMAGE_LIMITS.get(key, DEFAULT_IMAGE_LIMITS))
+            return cls._shared[key]
+
+    def prepare_file(self, path: Path | str) -> PreparedImage:
+        """Prepare an image file.
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        with open(path, "rb") as f:
+            return self.prepare_bytes(f.read())
+
+    def prepare_bytes(self, raw: bytes) -> PreparedImage:
+        """Prepare encoded image bytes (any format Pillow reads).
+
+        Bytes Pillow cannot decode are passed through unchanged.
+        """
+        digest = hashlib.sha256(raw).hexdigest()
+        with self._lock:
+            cached = self._cache.get(digest)
+            if cached is not None:
+                self._cache.move_to_end(digest)
+                return cached
+
+        prepared = self._encode(raw, digest)
+        if prepared.bytes_saved:
+            logger.debug(
+                "Image %s: %d -> %d bytes (%sx%s, %s)",
+                digest[:12],
+                prepared.original_size,
+                prepared.size,
+                prepared.width,
+                prepared.height,
+                prepared.media_type,
+            )
+        with self._lock:
+            self._cache[digest] = prepared
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return prepared
+
+    def _encode(self, raw: bytes, digest: str) -> PreparedImage:
+        def result(data: bytes, media_type: str, size: tuple[int, int] | None) -> PreparedImage:
+            return PreparedImage(
+                data=base64.b64encode(data).decode("ascii"),
+                media_type=media_type,
+                digest=digest,
+                width=size[0] if size else None,
+                height=size[1] if size else None,
+                original_size=len(raw),
+                size=len(data),
+            )
+
+        passthrough = result(raw, sniff_media_type(raw) or "image/png", None)
+        try:
+            from PIL import Image
+        except ImportError:
+            return passthrough
+
+        try:
+            with Image.open(io.BytesIO(raw)) as image:
+                original_format = image.format
+                if getattr(image, "is_animated", False):
+                    media_type = _SENDABLE_FORMATS.get(original_format, "image/gif")
+                    return result(raw, media_type, image.size)
+                image.load()
+                # Judged before resampling, which blends in new colours
+                palette = not _has_alpha(image) and (
+                    image.convert("RGB").getcolors(_MAX_PALETTE_COLORS) is not None
+                )
+                factor = self.limits.scale(*image.size)
+                if factor < 1.0:
+                    target = (
+                        max(1, round(image.width * factor)),
+                        max(1, round(image.height * factor)),
+                    )
+                    resized = image.convert("RGBA" if _has_alpha(image) else "RGB")
+                    resized = resized.resize(target, Image.Resampling.LANCZOS)
+                else:
+                    resized = image.copy()
+        except (OSError, ValueError, Image.DecompressionBombError) as exc:
+            logger.debug("Sending image %s as-is: %s", digest[:12], exc)
+            return passthrough
+
+        encoded, media_type = _reencode(resized, palette)
+        if (
+            factor >= 1.0
+            and original_format in _SENDABLE_FORMATS
+            and len(raw) <= len(encoded)
+        ):
+            return result(raw, _SENDABLE_FORMATS[original_format], resized.size)
+        return result(encoded, media_type, resized.size)
+
+
+def _has_alpha(image: Any) -> bool:
+    return image.mode in ("RGBA", "LA", "PA") or (
+        image.mode == "P" and "transparency" in image.info
+    )
+
+
+def _reencode(image: Any, palette: bool) -> tuple[bytes, str]:
+    """Encode as PNG (transparency, or few colours as in UI graphics) or JPEG."""
+    buffer = io.BytesIO()
+    if _has_alpha(image):
+        image.convert("RGBA").save(buffer, format="PNG", optimize=True)
+        return buffer.getvalue(), "image/png"
+    rgb = image.convert("RGB")
+    if palette:
+        # Palette PNG keeps flat colours and text edges sharp
+        rgb.quantize(_MAX_PALETTE_COLORS).save(buffer, format="PNG", optimize=True)
+        return buffer.getvalue(), "image/png"
+    rgb.save(buffer, format="JPEG", quality=_JPEG_QUALITY, optimize=True)
+    return buffer.getvalue(), "image/jpeg"
+
+
+def sniff_media_type(data: bytes) -> Optional[str]:
+    """Detect an image's media type from its leading bytes."""
+    if data.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if data.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if data.startswith((b"GIF87a", b"GIF89a")):
+        return "image/gif"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    if data.startswith(b"BM"):
+        return "image/bmp"
+    return None
+
+
+def base64_media_type(data: str) -> Optional[str]:
+    """Detect the media type of base64-encoded image data."""
+    try:
+        return sniff_media_type(base64.b64decode(data[:24]))
+    except (binascii.Error, ValueError):
+        return None
+
+
+# ----------------------------------------------------------------------
+# History dedup
+# ----------------------------------------------------------------------
+
+
+@dataclass
+class ImageRequestStats:
+    """Images in one request after :func:`strip_sent_images`."""
+
+    sent: int = 0
+    replaced: int = 0
+    bytes_saved: int = 0  # Base64 characters left out of the request
+
+
+def _image_payload(block: Any) -> Optional[str]:
+    """Return the inline data of an image content block, if it is one."""
+    if not isinstance(block, dict):
+        return None
+    if block.get("type") == "image":
+        source = block.get("source") or {}
+        if source.get("type") == "base64":
+            return source.get("data") or None
+    elif block.get("type") == "image_url":
+        url = (block.get("image_url") or {}).get("url", "")
+        if url.startswith("data:"):
+            return url
+    return None
+
+
+def strip_sent_images(
+    messages: list[dict[str, Any]],
+) -> tuple[list[dict[str, Any]], ImageRequestStats]:
+    """Replace images the model has already seen with text references.
+
+    Images in the current turn (from the newest message the user actually
+    sent on; nudges and signals injected by the agent loop don't start a
+    turn) are sent, except repeats of an image sent later in the request.
+    Images in earlier turns were shown when they were attached, and the
+    model's replies since describe them, so they become
+    ``[Image <digest> ...]`` text blocks. Messages are copied, not modified,
+    and the copies drop the injected-message marker.
+
+    Returns:
+        The messages for the request and what was sent/replaced
+    """
+    stats = ImageRequestStats()
+    current_turn = next(
+        (
+            i
+            for i in range(len(messages) - 1, -1, -1)
+            if messages[i].get("role") == "user" and not is_injected_message(messages[i])
+        ),
+        len(messages),
+    )
+    kept: set[str] = set()
+    result = [
+        {k: v for k, v in message.items() if k != INJECTED_MESSAGE_KEY}
+        if INJECTED_MESSAGE_KEY in message
+        else message
+        for message in messages
+    ]
+    # Newest first, so the latest copy of a repeated image is the one sent
+    for index in range(len(messages) - 1, -1, -1):
+        content = messages[index].get("content")
+        if not isinstance(content, list):
+            continue
+        blocks = list(content)
+        changed = False
+        for position in range(len(blocks) - 1, -1, -1):
+            payload = _image_payload(blocks[position])
+            if payload is None:
+                continue
+            digest = hashlib.sha256(payload.encode("ascii", "ignore")).hexdigest()[:12]
+            if index >= current_turn and digest not in kept:
+                kept.add(digest)
+                stats.sent += 1
+                continue
+            blocks[position] = {
+                "type": "text",
+                "text": f"[Image {digest} omitted: already shown earlier in the conversation]",
+            }
+            stats.replaced += 1
+            stats.bytes_saved += len(payload)
+            changed = True
+        if changed:
+            result[index] = {**result[index], "content": blocks}
+
+    if stats.replaced:
+        logger.debug(
+            "Request images: %d sent, %d replaced by references (%d bytes saved)",
+            stats.sent,
+            stats.replaced,
+            stats.bytes_saved,
+        )
+    return result, stats
+
+
+__all__ = [
+    "DEFAULT_IMAGE_LIMITS",
+    "ImageLimits",
+    "ImagePreprocessor",
+    "ImageRequestStats",
+    "PROVIDER_IMAGE_LIMITS",
+    "PreparedImage",
+    "base64_media_type",
+    "sniff_media_type",
+    "strip_sent_images",
+]
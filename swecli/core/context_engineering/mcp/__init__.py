@@ -1,6 +1,32 @@
 """Model Context Protocol integration for OpenDev."""
 
-from swecli.core.context_engineering.mcp.manager import MCPManager
-from swecli.core.context_engineering.mcp.models import MCPServerConfig, MCPConfig
+from importlib import import_module
+from typing import Dict, Tuple
 
-__all__ = ["MCPManager", "MCPServerConfig", "MCPConfig"]
+__all__ = [
+    "MCPManager",
+    "MCPServerConfig",
+    "MCPConfig",
+    "ToolSchemaCache",
+    "ToolSearchIndex",
+]
+
+# MCPManager pulls in the MCP client libraries; load it on first access only
+_EXPORTS: Dict[str, Tuple[str, str]] = {
+    "MCPManager": ("swecli.core.context_engineering.mcp.manager", "MCPManager"),
+    "MCPServerConfig": ("swecli.core.context_engineering.mcp.models", "MCPServerConfig"),
+    "MCPConfig": ("swecli.core.context_engineering.mcp.models", "MCPConfig"),
+    "ToolSchemaCache": ("swecli.core.context_engineering.mcp.schema_cache", "ToolSchemaCache"),
+    "ToolSearchIndex": ("swecli.core.context_engineering.mcp.tool_index", "ToolSearchIndex"),
+}
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(
+            f"module 'swecli.core.context_engineering.mcp' has no attribute '{name}'"
+        )
+    module_path, attr_name = _EXPORTS[name]
+    attr = getattr(import_module(module_path), attr_name)
+    globals()[name] = attr
+    return attr
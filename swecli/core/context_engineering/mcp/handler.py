@@ -57,7 +57,9 @@ class McpToolHandler:
         server_name = parts[1]
         mcp_tool_name = "__".join(parts[2:])
 
-        if not self._mcp_manager.is_connected(server_name):
+        # Tools offered from the schema cache may still be connecting
+        manager = self._mcp_manager
+        if not (manager.is_connected(server_name) or manager.is_connecting(server_name)):
             return {
                 "success": False,
                 "error": f"MCP server '{server_name}' is not connected",
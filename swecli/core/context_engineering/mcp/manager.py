@@ -2,6 +2,7 @@
 
 import asyncio
 import concurrent.futures
+import logging
 import os
 import threading
 import time
@@ -28,41 +29,73 @@ from swecli.core.context_engineering.mcp.config import (
     prepare_server_config,
 )
 from swecli.core.context_engineering.mcp.models import MCPConfig, MCPServerConfig
+from swecli.core.context_engineering.mcp.schema_cache import ToolSchemaCache
+from swecli.core.context_engineering.mcp.tool_index import ToolSearchIndex
+
+logger = logging.getLogger(__name__)
 
 
 class _SuppressStderr:
-    """Context manager to temporarily suppress stderr output at the file descriptor level."""
+    """Context manager to temporarily suppress stderr output at the file descriptor level.
+
+    Servers connect concurrently, so suppressions may overlap: stderr is
+    redirected when the first one enters and restored when the last one exits.
+    """
+
+    _lock = threading.Lock()
+    _depth = 0
+    _saved_fd = -1
 
     def __enter__(self):
-        # Save the original stderr file descriptor
-        self.old_stderr_fd = os.dup(2)
-        # Open /dev/null
-        self.devnull_fd = os.open(os.devnull, os.O_WRONLY)
-        # Redirect stderr (fd 2) to /dev/null
-        os.dup2(self.devnull_fd, 2)
+        cls = type(self)
+        with cls._lock:
+            if cls._depth == 0:
+                # Save the original stderr file descriptor and redirect it to /dev/null
+                cls._saved_fd = os.dup(2)
+                devnull_fd = os.open(os.devnull, os.O_WRONLY)
+                os.dup2(devnull_fd, 2)
+                os.close(devnull_fd)
+            cls._depth += 1
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        # Restore stderr
-        os.dup2(self.old_stderr_fd, 2)
-        # Close file descriptors
-        os.close(self.old_stderr_fd)
-        os.close(self.devnull_fd)
+        cls = type(self)
+        with cls._lock:
+            cls._depth -= 1
+            if cls._depth == 0:
+                # Restore stderr
+                os.dup2(cls._saved_fd, 2)
+                os.close(cls._saved_fd)
+                cls._saved_fd = -1
         return False
 
 
 class MCPManager:
     """Manages MCP server connections and tool execution."""
 
-    def __init__(self, working_dir: Optional[Path] = None):
+    # Startup connects servers concurrently, a bounded number at a time
+    MAX_CONCURRENT_CONNECTIONS = 8
+    CONNECT_TIMEOUT = 30.0  # Seconds per server during startup
+    CLEANUP_TIMEOUT = 5.0  # Seconds to wait for a client to shut down
+
+    def __init__(
+        self,
+        working_dir: Optional[Path] = None,
+        schema_cache: Optional[ToolSchemaCache] = None,
+    ):
         """Initialize MCP manager.
 
         Args:
             working_dir: Working directory for project-level config
+            schema_cache: Cache of discovered tool schemas (default: global cache dir)
         """
         self.working_dir = working_dir or Path.cwd()
         self.clients: Dict[str, Client] = {}  # server_name -> Client instance
         self.server_tools: Dict[str, List[Dict]] = {}  # server_name -> list of tool schemas
+        self.tool_index = ToolSearchIndex()  # Kept in sync with server_tools
+        self.schema_cache = schema_cache or ToolSchemaCache()
+        self._cached_servers: set[str] = set()  # Tools served from cache, not yet connected
+        self._pending_connections: Dict[str, asyncio.Future] = {}  # Startup connections
         self._config: Optional[MCPConfig] = None
         self._event_loop = None  # Shared event loop for all MCP operations
         self._loop_thread = None  # Background thread running the event loop
@@ -269,7 +302,7 @@ class MCPManager:
             except Exception:
                 # Force remove stale client
                 self.clients.pop(server_name, None)
-                self.server_tools.pop(server_name, None)
+                self._drop_server_tools(server_name)
 
         # Prepare config (expand env vars)
         prepared_config = prepare_server_config(server_config)
@@ -293,21 +326,19 @@ class MCPManager:
 
             return True
 
-        except Exception as e:
+        except (Exception, asyncio.CancelledError) as e:
             # Log the error for debugging intermittent connection failures
-            import logging
-
-            logging.getLogger(__name__).debug(
-                f"MCP connection failed for '{server_name}': {type(e).__name__}: {e}"
-            )
-            # Clean up partial connection
+            logger.debug(f"MCP connection failed for '{server_name}': {type(e).__name__}: {e}")
+            # Clean up partial connection (also when a startup timeout cancels us)
             if client is not None:
                 try:
-                    await client.__aexit__(None, None, None)
+                    await self._close_client(server_name, client)
                 except Exception:
                     pass
             self.clients.pop(server_name, None)
-            self.server_tools.pop(server_name, None)
+            self._drop_server_tools(server_name)
+            if isinstance(e, asyncio.CancelledError):
+                raise
             return False
 
     async def _disconnect_internal(self, server_name: str) -> None:
@@ -317,13 +348,30 @@ class MCPManager:
             try:
                 # Suppress stderr during disconnect to hide MCP server logs
                 with _SuppressStderr():
-                    await client.__aexit__(None, None, None)
+                    await self._close_client(server_name, client)
             except Exception as e:
                 print(f"Error disconnecting from '{server_name}': {e}")
             finally:
                 del self.clients[server_name]
-                if server_name in self.server_tools:
-                    del self.server_tools[server_name]
+                self._drop_server_tools(server_name)
+
+    async def _close_client(self, server_name: str, client: Client) -> None:
+        """Exit a client's context, abandoning it after ``CLEANUP_TIMEOUT`` seconds.
+
+        A server that never finishes shutting down must not hold up startup
+        or disconnects, so the exit runs as its own task, which is cancelled
+        without waiting for it once the deadline passes.
+        """
+        task = asyncio.ensure_future(client.__aexit__(None, None, None))
+        done, _ = await asyncio.wait({task}, timeout=self.CLEANUP_TIMEOUT)
+        if not done:
+            task.cancel()
+            logger.debug(
+                f"MCP client for '{server_name}' did not shut down within "
+                f"{self.CLEANUP_TIMEOUT}s; abandoning it"
+            )
+            return
+        task.result()
 
     async def _disconnect_all_internal(self) -> None:
         """Internal coroutine that disconnects all MCP servers."""
@@ -358,23 +406,107 @@ class MCPManager:
                 }
                 tool_schemas.append(tool_schema)
 
-            self.server_tools[server_name] = tool_schemas
+            self._set_server_tools(server_name, tool_schemas)
+
+            # Revalidate the cached schemas against the live list
+            server_config = self.get_config().mcp_servers.get(server_name)
+            if server_config is not None:
+                self.schema_cache.store(
+                    server_name, server_config, tool_schemas, self._server_version(client)
+                )
 
         except Exception as e:
             print(f"Error discovering tools from '{server_name}': {e}")
-            self.server_tools[server_name] = []
+            self._set_server_tools(server_name, [])
+
+    @staticmethod
+    def _server_version(client: Client) -> Optional[str]:
+        """Return the version the server reported during initialization, if any."""
+        result = getattr(client, "initialize_result", None)
+        info = getattr(result, "serverInfo", None)
+        return getattr(info, "version", None)
+
+    def _set_server_tools(self, server_name: str, tools: List[Dict]) -> None:
+        """Store a server's tool schemas and (re)index them for search_tools."""
+        self.server_tools[server_name] = tools
+        self.tool_index.set_server_tools(server_name, tools)
+        self._cached_servers.discard(server_name)
+
+    def _drop_server_tools(self, server_name: str) -> None:
+        """Forget a server's tool schemas and remove them from the search index."""
+        self.server_tools.pop(server_name, None)
+        self.tool_index.remove_server(server_name)
+        self._cached_servers.discard(server_name)
+
+    def load_cached_tools(self) -> List[str]:
+        """Offer cached tool schemas for auto-start servers that are not connected yet.
+
+        The cached tools are searchable immediately; they are replaced by the
+        live list once the server connects, or dropped if it fails to.
+
+        Returns:
+            Names of servers whose tools were loaded from the cache
+        """
+        loaded = []
+        for server_name, server_config in self.get_config().mcp_servers.items():
+            if not (server_config.enabled and server_config.auto_start):
+                continue
+            if server_name in self.clients or server_name in self.server_tools:
+                continue
+            tools = self.schema_cache.load(server_name, server_config)
+            if tools:
+                self._set_server_tools(server_name, tools)
+                self._cached_servers.add(server_name)
+                loaded.append(server_name)
+        return loaded
+
+    def is_cached(self, server_name: str) -> bool:
+        """Check if a server's tools come from the cache (it is not connected yet)."""
+        return server_name in self._cached_servers
+
+    def is_connecting(self, server_name: str) -> bool:
+        """Check if a startup connection to a server is still in flight."""
+        return server_name in self._pending_connections
 
     async def _connect_enabled_servers_internal(self) -> Dict[str, bool]:
-        """Internal coroutine that connects to all enabled servers."""
+        """Internal coroutine that connects to all enabled servers concurrently.
+
+        At most ``MAX_CONCURRENT_CONNECTIONS`` servers start at once, and each
+        gets ``CONNECT_TIMEOUT`` seconds, so one slow server can't hold up the rest.
+        """
         config = self.get_config()
-        results = {}
+        self.load_cached_tools()
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_CONNECTIONS)
 
-        for server_name, server_config in config.mcp_servers.items():
-            if server_config.enabled and server_config.auto_start:
-                success = await self._connect_internal(server_name)
-                results[server_name] = success
+        async def connect_one(server_name: str) -> bool:
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(
+                        self._connect_internal(server_name), timeout=self.CONNECT_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    logger.debug(
+                        f"MCP connection to '{server_name}' timed out after "
+                        f"{self.CONNECT_TIMEOUT}s"
+                    )
+                    return False
+
+        tasks = {
+            server_name: asyncio.ensure_future(connect_one(server_name))
+            for server_name, server_config in config.mcp_servers.items()
+            if server_config.enabled and server_config.auto_start
+        }
+        self._pending_connections.update(tasks)
+        try:
+            outcomes = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        finally:
+            for server_name, task in tasks.items():
+                if self._pending_connections.get(server_name) is task:
+                    del self._pending_connections[server_name]
 
-        return results
+        return {
+            server_name: outcome is True for server_name, outcome in zip(tasks, outcomes)
+        }
 
     # Synchronous wrappers that use the shared event loop
 
@@ -414,7 +546,10 @@ class MCPManager:
         Returns:
             Dict mapping server names to connection success status
         """
-        return self._run_coroutine_threadsafe(self._connect_enabled_servers_internal())
+        # Bounded by the per-server CONNECT_TIMEOUT plus CLEANUP_TIMEOUT
+        return self._run_coroutine_threadsafe(
+            self._connect_enabled_servers_internal(), timeout=None
+        )
 
     def connect_enabled_servers_background(
         self,
@@ -429,6 +564,8 @@ class MCPManager:
         Returns:
             Future representing the in-flight connection task.
         """
+        # Make cached tool schemas searchable before any server has connected
+        self.load_cached_tools()
         self._ensure_event_loop()
         future = asyncio.run_coroutine_threadsafe(
             self._connect_enabled_servers_internal(),
@@ -545,6 +682,10 @@ class MCPManager:
 
     async def _call_tool_internal(self, server_name: str, tool_name: str, arguments: Dict) -> Dict:
         """Internal coroutine that executes an MCP tool."""
+        pending = self._pending_connections.get(server_name)
+        if server_name not in self.clients and pending is not None:
+            # The tool was offered from the schema cache; wait for the live connection
+            await asyncio.shield(pending)
         if server_name not in self.clients:
             return {
                 "success": False,
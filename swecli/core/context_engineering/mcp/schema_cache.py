@@ -0,0 +1,125 @@
+"""Persisted MCP tool schemas, so tools are searchable before servers connect.
+
+Each server's last discovered tool list is written to
+``~/.opendev/cache/mcp_tools/<key>.json``. The key hashes the server name and
+everything that determines which process (or endpoint) is started: transport,
+command, args, URL and environment. Editing the server's configuration (e.g.
+bumping a pinned package version in ``args``) therefore misses the cache.
+Unpinned servers can still change their tools between launches, so the entry
+also records the server's reported version and is rewritten whenever a live
+connection discovers a different tool list.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from swecli.core.context_engineering.mcp.models import MCPServerConfig
+from swecli.core.paths import get_paths
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored tool schema format changes
+CACHE_FORMAT_VERSION = 1
+
+
+class ToolSchemaCache:
+    """Disk cache of each MCP server's tool schemas."""
+
+    def __init__(self, cache_dir: Optional[Path] = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache entries (default: global cache dir / mcp_tools)
+        """
+        self.cache_dir = cache_dir or get_paths().global_cache_dir / "mcp_tools"
+
+    @staticmethod
+    def key(server_name: str, server_config: MCPServerConfig) -> str:
+        """Return the cache key for a server's launch configuration."""
+        identity = {
+            "format": CACHE_FORMAT_VERSION,
+            "server": server_name,
+            "transport": server_config.transport.lower(),
+            "command": server_config.command,
+            "args": list(server_config.args),
+            "url": server_config.url,
+            # Hashed along with the rest, never stored in clear
+            "env": sorted(server_config.env.items()),
+        }
+        encoded = json.dumps(identity, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()[:32]
+
+    def _path(self, server_name: str, server_config: MCPServerConfig) -> Path:
+        return self.cache_dir / f"{self.key(server_name, server_config)}.json"
+
+    def load(self, server_name: str, server_config: MCPServerConfig) -> Optional[List[Dict]]:
+        """Return the cached tool schemas for a server, or None on a miss."""
+        path = self._path(server_name, server_config)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.debug("Ignoring unreadable MCP tool cache %s: %s", path, exc)
+            return None
+        tools = entry.get("tools")
+        return tools if isinstance(tools, list) else None
+
+    def store(
+        self,
+        server_name: str,
+        server_config: MCPServerConfig,
+        tools: List[Dict[str, Any]],
+        server_version: Optional[str] = None,
+    ) -> bool:
+        """Persist a server's live tool schemas.
+
+        Returns:
+            True if the entry was written, False if it was already current
+            (or could not be written)
+        """
+        path = self._path(server_name, server_config)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            if entry.get("tools") == tools and entry.get("server_version") == server_version:
+                return False
+        except (OSError, ValueError):
+            pass
+
+        entry = {
+            "server": server_name,
+            "server_version": server_version,
+            "saved_at": time.time(),
+            "tools": tools,
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-", suffix=".json")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entry, f)
+                os.replace(tmp, path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        except (OSError, TypeError, ValueError) as exc:
+            logger.debug("Could not write MCP tool cache for '%s': %s", server_name, exc)
+            return False
+        return True
+
+    def invalidate(self, server_name: str, server_config: MCPServerConfig) -> None:
+        """Delete a server's cache entry."""
+        self._path(server_name, server_config).unlink(missing_ok=True)
+
+
+__all__ = ["ToolSchemaCache"]
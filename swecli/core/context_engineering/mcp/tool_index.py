@@ -0,0 +1,247 @@
+"""BM25 search index over MCP tool names and descriptions.
+
+``MCPManager`` keeps one ``ToolSearchIndex`` and updates it per server as
+tools are discovered or servers disconnect, so ``search_tools`` only touches
+the postings of the query's terms instead of re-tokenizing every tool on each
+call. Name matches are weighted above description matches. Query words that
+are not in the vocabulary are expanded through common abbreviations, then
+through vocabulary words they prefix (``auth`` -> ``authenticate``) and
+through simple suffix stripping (``creating`` -> ``create``).
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+import threading
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional
+
+# Common abbreviations that map to vocabulary words
+ABBREVIATIONS = {
+    "repo": "repository",
+    "repos": "repositories",
+    "pr": "pull",
+    "prs": "pull",
+    "db": "database",
+    "dir": "directory",
+    "msg": "message",
+    "config": "configuration",
+}
+
+_STOPWORDS = frozenset(
+    "the and for with from this that into are was were will can has have its you your "
+    "not use used using".split()
+)
+_TOKEN = re.compile(r"[a-z0-9]+")
+_CAMEL = re.compile(r"([a-z0-9])([A-Z])")
+
+_FIELD_WEIGHTS = {"name": 2.0, "description": 1.0}
+_K1 = 1.2
+_B = 0.75
+_EXPANSION_WEIGHT = 0.7
+_MAX_PREFIX_EXPANSIONS = 5
+_SUFFIXES = ("ing", "ed", "es", "s")
+
+
+def tokenize_name(name: str) -> List[str]:
+    """Split a tool name on ``_``, ``-`` and camelCase boundaries."""
+    return [t for t in _TOKEN.findall(_CAMEL.sub(r"\1 \2", name).lower()) if len(t) >= 2]
+
+
+def tokenize_text(text: str) -> List[str]:
+    """Tokenize a description, dropping short words and stopwords."""
+    return [t for t in _TOKEN.findall(text.lower()) if len(t) >= 3 and t not in _STOPWORDS]
+
+
+class ToolSearchIndex:
+    """Inverted index with BM25 ranking, updated incrementally per server."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self._docs: Dict[int, Dict[str, Any]] = {}
+        self._doc_terms: Dict[int, Dict[str, List[str]]] = {}  # For removal
+        self._server_docs: Dict[str, List[int]] = {}
+        self._postings: Dict[str, Dict[str, Dict[int, int]]] = {f: {} for f in _FIELD_WEIGHTS}
+        self._lengths: Dict[str, Dict[int, int]] = {f: {} for f in _FIELD_WEIGHTS}
+        self._total_length: Dict[str, int] = {f: 0 for f in _FIELD_WEIGHTS}
+        self._term_refs: Counter[str] = Counter()  # Postings lists per term across fields
+        self._vocabulary: List[str] = []  # Sorted, for prefix expansion
+
+    @classmethod
+    def from_tools(cls, tools: Iterable[Dict[str, Any]]) -> "ToolSearchIndex":
+        """Build an index over tools not grouped by server."""
+        index = cls()
+        by_server: Dict[str, List[Dict[str, Any]]] = {}
+        for tool in tools:
+            by_server.setdefault(tool.get("mcp_server", ""), []).append(tool)
+        for server, server_tools in by_server.items():
+            index.set_server_tools(server, server_tools)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def set_server_tools(self, server: str, tools: Iterable[Dict[str, Any]]) -> None:
+        """Index a server's tools, replacing any previously indexed for it."""
+        with self._lock:
+            self._remove_server(server)
+            doc_ids = []
+            for tool in tools:
+                doc_id = self._next_id
+                self._next_id += 1
+                self._docs[doc_id] = tool
+                fields = {
+                    "name": tokenize_name(tool.get("name", "")),
+                    "description": tokenize_text(tool.get("description") or ""),
+                }
+                self._doc_terms[doc_id] = {}
+                for field, tokens in fields.items():
+                    self._lengths[field][doc_id] = len(tokens)
+                    self._total_length[field] += len(tokens)
+                    postings = self._postings[field]
+                    counts = Counter(tokens)
+                    for term, count in counts.items():
+                        if term not in postings:
+                            postings[term] = {}
+                            self._add_term(term)
+                        postings[term][doc_id] = count
+                    self._doc_terms[doc_id][field] = list(counts)
+                doc_ids.append(doc_id)
+            self._server_docs[server] = doc_ids
+
+    def remove_server(self, server: str) -> None:
+        """Drop a server's tools from the index."""
+        with self._lock:
+            self._remove_server(server)
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        server: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return tools ranked by BM25 relevance to ``query``.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of results (None = all matches)
+            server: Only return tools from this server
+
+        Returns:
+            Matching tool schemas, best first (ties broken by name)
+        """
+        with self._lock:
+            terms = self._expand_query(query)
+            if not terms:
+                return []
+
+            allowed = set(self._server_docs.get(server, ())) if server else None
+            doc_count = len(self._docs)
+            scores: Dict[int, float] = {}
+            for term, weight in terms.items():
+                for field, field_weight in _FIELD_WEIGHTS.items():
+                    postings = self._postings[field].get(term)
+                    if not postings:
+                        continue
+                    idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                    average = self._total_length[field] / doc_count or 1.0
+                    lengths = self._lengths[field]
+                    for doc_id, tf in postings.items():
+                        if allowed is not None and doc_id not in allowed:
+                            continue
+                        norm = _K1 * (1 - _B + _B * lengths[doc_id] / average)
+                        gain = weight * field_weight * idf * tf * (_K1 + 1) / (tf + norm)
+                        scores[doc_id] = scores.get(doc_id, 0.0) + gain
+
+            def rank(item: tuple[int, float]) -> tuple[float, str]:
+                return (-item[1], self._docs[item[0]].get("name", ""))
+
+            if limit is None:
+                ranked = sorted(scores.items(), key=rank)
+            else:
+                ranked = heapq.nsmallest(limit, scores.items(), key=rank)
+            return [self._docs[doc_id] for doc_id, _ in ranked]
+
+    # ------------------------------------------------------------------
+    # Internals (callers hold the lock)
+    # ------------------------------------------------------------------
+
+    def _remove_server(self, server: str) -> None:
+        for doc_id in self._server_docs.pop(server, ()):
+            del self._docs[doc_id]
+            for field, terms in self._doc_terms.pop(doc_id).items():
+                self._total_length[field] -= self._lengths[field].pop(doc_id)
+                postings = self._postings[field]
+                for term in terms:
+                    del postings[term][doc_id]
+                    if not postings[term]:
+                        del postings[term]
+                        self._drop_term(term)
+
+    def _add_term(self, term: str) -> None:
+        if self._term_refs[term] == 0:
+            insort(self._vocabulary, term)
+        self._term_refs[term] += 1
+
+    def _drop_term(self, term: str) -> None:
+        self._term_refs[term] -= 1
+        if self._term_refs[term] <= 0:
+            del self._term_refs[term]
+            position = bisect_left(self._vocabulary, term)
+            if position < len(self._vocabulary) and self._vocabulary[position] == term:
+                del self._vocabulary[position]
+
+    def _expand_query(self, query: str) -> Dict[str, float]:
+        """Map query words to indexed terms with their weights."""
+        terms: Dict[str, float] = {}
+
+        def add(term: str, weight: float) -> None:
+            terms[term] = max(terms.get(term, 0.0), weight)
+
+        for word in _TOKEN.findall(query.lower()):
+            if len(word) < 2:
+                continue
+            word = word if word in self._term_refs else ABBREVIATIONS.get(word, word)
+            if word in self._term_refs:
+                add(word, 1.0)
+            if len(word) < 3:
+                continue
+            # Vocabulary words that extend the query word ("issue" -> "issues")
+            position = bisect_left(self._vocabulary, word)
+            extensions = 0
+            while (
+                position < len(self._vocabulary)
+                and extensions < _MAX_PREFIX_EXPANSIONS
+                and self._vocabulary[position].startswith(word)
+            ):
+                if self._vocabulary[position] != word:
+                    add(self._vocabulary[position], _EXPANSION_WEIGHT)
+                    extensions += 1
+                position += 1
+            if word in self._term_refs:
+                continue
+            # Inflected forms ("creating" -> "create"), else the longest
+            # vocabulary word the query word extends ("issues" -> "issue")
+            stems = [
+                stem
+                for suffix in _SUFFIXES
+                if word.endswith(suffix) and len(word) - len(suffix) >= 3
+                for stem in (word[: -len(suffix)], word[: -len(suffix)] + "e")
+                if stem in self._term_refs
+            ]
+            if not stems:
+                stems = [
+                    word[:size]
+                    for size in range(len(word) - 1, 2, -1)
+                    if word[:size] in self._term_refs
+                ][:1]
+            for stem in stems:
+                add(stem, _EXPANSION_WEIGHT)
+        return terms
+
+
+__all__ = ["ToolSearchIndex", "tokenize_name", "tokenize_text"]
@@ -5,11 +5,25 @@ Provides codebase indexing, context retrieval, and token monitoring.
 
 from swecli.core.context_engineering.retrieval.indexer import CodebaseIndexer
 from swecli.core.context_engineering.retrieval.retriever import ContextRetriever, EntityExtractor
-from swecli.core.context_engineering.retrieval.token_monitor import ContextTokenMonitor
+from swecli.core.context_engineering.retrieval.token_monitor import (
+    ContextTokenMonitor,
+    ConversationTokenCounter,
+    MessageTokenCache,
+    get_message_token_cache,
+)
+from swecli.core.context_engineering.retrieval.trigram_index import (
+    TrigramIndex,
+    get_trigram_index,
+)
 
 __all__ = [
     "CodebaseIndexer",
     "ContextRetriever",
     "EntityExtractor",
     "ContextTokenMonitor",
+    "ConversationTokenCounter",
+    "MessageTokenCache",
+    "get_message_token_cache",
+    "TrigramIndex",
+    "get_trigram_index",
 ]
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import json
-import subprocess
 from pathlib import Path
 from typing import Dict, List, Optional
 
 from .token_monitor import ContextTokenMonitor
+from .workspace_catalog import get_workspace_catalog, glob_to_regex
+
+# Directories left out of the structure overview
+_STRUCTURE_EXCLUDES = {"node_modules", "__pycache__", ".git", "venv", "build", "dist"}
 
 
 class CodebaseIndexer:
@@ -38,16 +41,8 @@ class CodebaseIndexer:
     def _generate_overview(self) -> str:
         lines = ["## Overview\n"]
         try:
-            result = subprocess.run(
-                ["find", ".", "-type", "f"],
-                capture_output=True,
-                text=True,
-                cwd=self.working_dir,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                file_count = len(result.stdout.strip().split("\n"))
-                lines.append(f"**Total Files:** {file_count}")
+            file_count = len(get_workspace_catalog(self.working_dir).files())
+            lines.append(f"**Total Files:** {file_count}")
         except Exception:
             pass
 
@@ -67,34 +62,41 @@ class CodebaseIndexer:
     def _generate_structure(self) -> str:
         lines = ["## Structure\n", "```"]
         try:
-            result = subprocess.run(
-                [
-                    "tree",
-                    "-L",
-                    "2",
-                    "-I",
-                    "node_modules|__pycache__|.git|venv|build|dist",
-                ],
-                capture_output=True,
-                text=True,
-                cwd=self.working_dir,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                tree_output = result.stdout.strip()
-                if len(tree_output) > 1500:
-                    tree_output = "\n".join(tree_output.split("\n")[:30]) + "\n... (truncated)"
-                lines.append(tree_output)
-            else:
-                lines.append(self._basic_structure())
-        except FileNotFoundError:
-            lines.append(self._basic_structure())
+            tree_output = self._render_tree(max_depth=2)
+            if len(tree_output) > 1500:
+                tree_output = "\n".join(tree_output.split("\n")[:30]) + "\n... (truncated)"
+            lines.append(tree_output)
         except Exception:
             lines.append("(Unable to generate structure)")
 
         lines.append("```")
         return "\n".join(lines)
 
+    def _render_tree(self, max_depth: int) -> str:
+        """Render a ``tree -L``-style listing from the workspace catalog."""
+        catalog = get_workspace_catalog(self.working_dir)
+        lines = ["."]
+        counts = {"dirs": 0, "files": 0}
+
+        def walk(rel_dir: str, prefix: str, depth: int) -> None:
+            children = catalog.children(rel_dir) or {}
+            items = sorted(
+                (name, is_dir)
+                for name, is_dir in children.items()
+                if not name.startswith(".") and name not in _STRUCTURE_EXCLUDES
+            )
+            for i, (name, is_dir) in enumerate(items):
+                is_last = i == len(items) - 1
+                lines.append(f"{prefix}{'└── ' if is_last else '├── '}{name}")
+                counts["dirs" if is_dir else "files"] += 1
+                if is_dir and depth < max_depth:
+                    rel_path = f"{rel_dir}/{name}" if rel_dir else name
+                    walk(rel_path, prefix + ("    " if is_last else "│   "), depth + 1)
+
+        walk("", "", 1)
+        lines.append(f"\n{counts['dirs']} directories, {counts['files']} files")
+        return "\n".join(lines)
+
     def _generate_key_files(self) -> str:
         lines = ["## Key Files\n"]
         key_patterns = {
@@ -185,29 +187,16 @@ class CodebaseIndexer:
         return None
 
     def _find_files(self, patterns: List[str]) -> List[Path]:
+        catalog = get_workspace_catalog(self.working_dir)
         matches: List[Path] = []
         for pattern in patterns:
-            matches.extend(self.working_dir.glob(f"**/{pattern}"))
+            if pattern.endswith("/"):
+                regex = glob_to_regex(f"**/{pattern.rstrip('/')}")
+                matches.extend(self.working_dir / d for d in catalog.dirs() if regex.match(d))
+            else:
+                matches.extend(self.working_dir / f for f in catalog.glob(f"**/{pattern}"))
         return matches
 
-    def _basic_structure(self) -> str:
-        try:
-            result = subprocess.run(
-                ["ls", "-R"],
-                capture_output=True,
-                text=True,
-                cwd=self.working_dir,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                output = result.stdout.strip()
-                if len(output) > 1200:
-                    output = "\n".join(output.split("\n")[:40]) + "\n... (truncated)"
-                return output
-        except Exception:
-            pass
-        return "(Unable to generate structure)"
-
     def _compress_content(self, content: str, max_tokens: int) -> str:
         paragraphs = content.split("\n\n")
         compressed: List[str] = []
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from typing import List
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
 
 import tiktoken
 
@@ -41,3 +45,140 @@ class ContextTokenMonitor:
     def count_messages_total(self, messages: List[ChatMessage]) -> int:
         """Count total tokens across all messages."""
         return sum(self.count_message_tokens(msg) for msg in messages)
+
+
+class MessageTokenCache:
+    """Memoized token counts keyed by content hash.
+
+    Every piece of text is encoded once and remembered, so a message keeps its
+    count when it is re-sent, moved by compaction, or mirrored into the session
+    as a :class:`ChatMessage`. Thread-safe; one instance is shared process-wide
+    via :func:`get_message_token_cache`.
+    """
+
+    def __init__(
+        self,
+        counter: Optional[Callable[[str], int]] = None,
+        max_entries: int = 8192,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            counter: Function counting tokens in a string. Defaults to a lazily
+                created :class:`ContextTokenMonitor`.
+            max_entries: Number of distinct texts to remember (LRU eviction).
+        """
+        self._counter = counter
+        self._counter_error: Optional[Exception] = None
+        self._max_entries = max_entries
+        self._counts: "OrderedDict[bytes, int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.encoded = 0  # Number of texts actually sent through the tokenizer
+
+    def _count_uncached(self, text: str) -> int:
+        if self._counter is None:
+            # Don't retry loading the encoding on every call if it failed once
+            if self._counter_error is not None:
+                raise self._counter_error
+            try:
+                self._counter = ContextTokenMonitor().count_tokens
+            except Exception as exc:
+                self._counter_error = exc
+                raise
+        self.encoded += 1
+        return self._counter(text)
+
+    def count_text(self, text: Any) -> int:
+        """Count tokens in ``text``, encoding each distinct text only once."""
+        if not text:
+            return 0
+        if not isinstance(text, str):
+            text = json.dumps(text, default=str)
+        key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        with self._lock:
+            cached = self._counts.get(key)
+            if cached is not None:
+                self._counts.move_to_end(key)
+                return cached
+        tokens = self._count_uncached(text)
+        with self._lock:
+            self._counts[key] = tokens
+            if len(self._counts) > self._max_entries:
+                self._counts.popitem(last=False)
+        return tokens
+
+    def count_api_message(self, message: Dict[str, Any]) -> int:
+        """Count tokens in an API-format message dict, including tool calls."""
+        total = self.count_text(message.get("content"))
+        for tc in message.get("tool_calls") or []:
+            func = tc.get("function", {})
+            total += self.count_text(func.get("name", ""))
+            total += self.count_text(func.get("arguments", ""))
+        return total
+
+    def count_chat_message(self, message: ChatMessage) -> int:
+        """Count tokens in a session message, including tool calls and results."""
+        total = self.count_text(message.content)
+        for tool_call in message.tool_calls:
+            total += self.count_text(tool_call.name)
+            total += self.count_text(json.dumps(tool_call.parameters, default=str))
+            if tool_call.result:
+                total += self.count_text(str(tool_call.result))
+        return total
+
+
+class ConversationTokenCounter:
+    """Running token total for one evolving list of API messages.
+
+    The prefix of messages unchanged since the previous call (same dict objects
+    holding the same content and tool calls) is reused as a running total; only
+    appended, replaced or shifted messages are looked up again, and those hit
+    the shared per-text cache unless their text is new. Messages removed or
+    replaced (e.g. by compaction) drop out of the total.
+    """
+
+    def __init__(self, cache: Optional[MessageTokenCache] = None) -> None:
+        self.cache = cache or get_message_token_cache()
+        # (message, content, tool_calls, tokens) for the last counted list
+        self._tracked: list[tuple[Dict[str, Any], Any, Any, int]] = []
+        self._tracked_total = 0
+
+    def count(self, messages: List[Dict[str, Any]], system_prompt: str = "") -> int:
+        """Return the total tokens of ``system_prompt`` plus ``messages``."""
+        tracked = self._tracked
+        prefix = 0
+        limit = min(len(tracked), len(messages))
+        while prefix < limit:
+            message, content, tool_calls, _ = tracked[prefix]
+            current = messages[prefix]
+            if (
+                current is not message
+                or current.get("content") is not content
+                or current.get("tool_calls") is not tool_calls
+            ):
+                break
+            prefix += 1
+
+        for _, _, _, tokens in tracked[prefix:]:
+            self._tracked_total -= tokens
+        del tracked[prefix:]
+
+        for message in messages[prefix:]:
+            tokens = self.cache.count_api_message(message)
+            tracked.append((message, message.get("content"), message.get("tool_calls"), tokens))
+            self._tracked_total += tokens
+
+        return self._tracked_total + self.cache.count_text(system_prompt)
+
+
+_shared_cache: Optional[MessageTokenCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_message_token_cache() -> MessageTokenCache:
+    """Return the process-wide cache shared by compaction and session accounting."""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = MessageTokenCache()
+        return _shared_cache
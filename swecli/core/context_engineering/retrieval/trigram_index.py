@@ -0,0 +1,535 @@
+"""Persistent trigram index for literal content search.
+
+The index maps every 3-byte sequence (trigram) of each file's case-folded
+content to the set of files containing it. A literal search intersects the
+posting lists of the pattern's trigrams to get a small candidate set and only
+reads those files to verify matches and collect line numbers, instead of
+scanning the whole tree.
+
+The index is persisted per working directory under the global cache dir and
+refreshed incrementally. The file list comes from the shared
+:class:`WorkspaceCatalog` (which honours ``.gitignore``); hidden files, the
+caller's exclude list and binary files are skipped the same way ripgrep does.
+When the catalog reports which files changed, only those are re-checked;
+otherwise every file is stat-ed (at most every couple of seconds while the
+file list is unchanged) and only those whose mtime or size changed are read,
+and re-indexed if their content hash differs.
+"""
+
+from __future__ import annotations
+
+import atexit
+import fnmatch
+import hashlib
+import logging
+import os
+import pickle
+import re
+import tempfile
+import threading
+import time
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional, Union
+
+from swecli.core.context_engineering.retrieval.workspace_catalog import (
+    WorkspaceCatalog,
+    get_workspace_catalog,
+)
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+
+# Files larger than this are not tokenized; they are always verified directly
+MAX_INDEXED_FILE_BYTES = 4 * 1024 * 1024
+# Give up on trees this large (e.g. a home directory); callers fall back to rg
+MAX_INDEXED_FILES = 200_000
+# Persist at most this often while refreshing; the index is also saved at exit
+SAVE_INTERVAL_SECONDS = 30.0
+# Stat every file at least this often, even when the catalog reports changes
+FULL_REFRESH_SECONDS = 60.0
+# When the catalog cannot report changes (polling backend) and its file list is
+# unchanged, stat every file at most this often between searches
+MIN_FULL_REFRESH_SECONDS = 2.0
+# Fall back to a full refresh when the catalog reports more changes than this
+MAX_INCREMENTAL_CHANGES = 1000
+
+_BINARY_SNIFF_BYTES = 8192
+
+# File kinds stored per entry
+_TEXT = 0
+_LARGE = 1
+_BINARY = 2
+
+_Posting = Union[set, array]
+
+
+@dataclass
+class _FileEntry:
+    """Indexed state of a single file."""
+
+    file_id: int
+    mtime_ns: int
+    size: int
+    digest: bytes
+    kind: int
+    trigrams: bytes = b""  # Sorted, concatenated 3-byte trigrams
+
+
+def content_trigrams(data: bytes) -> set[bytes]:
+    """Return the trigrams of ``data`` after case folding.
+
+    Trigrams never span a newline since grep matches line by line.
+    """
+    folded = data.decode("utf-8", errors="ignore").casefold().encode("utf-8")
+    grams: set[bytes] = set()
+    for line in set(folded.split(b"\n")):
+        grams.update(line[i : i + 3] for i in range(len(line) - 2))
+    return grams
+
+
+def _pack(grams: Iterable[bytes]) -> bytes:
+    return b"".join(sorted(grams))
+
+
+def _unpack(blob: bytes) -> Iterator[bytes]:
+    for i in range(0, len(blob), 3):
+        yield blob[i : i + 3]
+
+
+class TrigramIndex:
+    """On-disk trigram index of one directory tree.
+
+    Thread-safe. ``search`` returns ``None`` whenever the index cannot answer
+    (not built yet, tree too large, pattern shorter than a trigram) so callers
+    can fall back to another search strategy.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        index_path: Optional[Path] = None,
+        excludes: Iterable[str] = (),
+    ) -> None:
+        self.root = Path(root).resolve()
+        self.index_path = index_path
+        self._exclude_names = {e for e in excludes if not e.startswith("*")}
+        self._exclude_globs = [e for e in excludes if e.startswith("*")]
+
+        self._lock = threading.RLock()
+        self._files: dict[str, _FileEntry] = {}
+        self._paths: dict[int, str] = {}
+        self._postings: dict[bytes, _Posting] = {}
+        self._next_id = 0
+
+        self._ready = False
+        self._too_large = False
+        self._builder: Optional[threading.Thread] = None
+        self._dirty = False
+        self._last_save = 0.0
+        self._catalog_generation: Optional[int] = None
+        self._last_full_refresh = 0.0
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def ready(self) -> bool:
+        """True once the index has been loaded or built and can answer queries."""
+        return self._ready and not self._too_large
+
+    @property
+    def file_count(self) -> int:
+        return len(self._files)
+
+    def ensure_ready(self, background: bool = True) -> bool:
+        """Load the persisted index, or start building one.
+
+        Returns True if the index is usable right now. With ``background``,
+        a missing index is built on a daemon thread so the first search is not
+        blocked; otherwise it is built synchronously.
+        """
+        if self._ready:
+            return self.ready
+        with self._lock:
+            if self._ready:
+                return self.ready
+            if self._builder is not None and self._builder.is_alive():
+                return False
+            if self._load():
+                self._ready = True
+                return self.ready
+            if background:
+                self._builder = threading.Thread(
+                    target=self._build, name="trigram-index-build", daemon=True
+                )
+                self._builder.start()
+                return False
+        self._build()
+        return self.ready
+
+    def _build(self) -> None:
+        try:
+            self.refresh()
+            self.save()
+        except Exception:  # noqa: BLE001 - indexing is best effort
+            logger.debug("Failed to build trigram index for %s", self.root, exc_info=True)
+
+    # ------------------------------------------------------------------
+    # Walking and indexing
+    # ------------------------------------------------------------------
+
+    def _excluded(self, name: str) -> bool:
+        if name in self._exclude_names:
+            return True
+        return any(fnmatch.fnmatchcase(name, glob) for glob in self._exclude_globs)
+
+    def _catalog(self) -> WorkspaceCatalog:
+        return get_workspace_catalog(self.root)
+
+    def _searchable(self, rel_path: str) -> bool:
+        # Hidden files and directories are skipped, as ripgrep does
+        return not any(
+            part.startswith(".") or self._excluded(part) for part in rel_path.split("/")
+        )
+
+    def iter_files(self) -> Iterator[str]:
+        """Yield the relative path of every searchable file."""
+        for rel_path in self._catalog().files():
+            if self._searchable(rel_path):
+                yield rel_path
+
+    def refresh(self) -> dict[str, int]:
+        """Bring the index up to date with the file system.
+
+        Returns:
+            Counts of ``indexed``, ``unchanged`` and ``removed`` files.
+        """
+        stats = {"indexed": 0, "unchanged": 0, "removed": 0}
+        catalog = self._catalog()
+        with self._lock:
+            generation = catalog.generation
+            changed = None
+            if (
+                self._catalog_generation is not None
+                and time.monotonic() - self._last_full_refresh < FULL_REFRESH_SECONDS
+            ):
+                changed = catalog.changes_since(self._catalog_generation)
+                if changed is not None and len(changed) > MAX_INCREMENTAL_CHANGES:
+                    changed = None
+
+            if (
+                changed is None
+                and self._ready
+                and generation == self._catalog_generation
+                and time.monotonic() - self._last_full_refresh < MIN_FULL_REFRESH_SECONDS
+            ):
+                return stats
+            if changed is None:
+                if not self._full_refresh(catalog, stats):
+                    return stats
+            else:
+                self._refresh_paths(catalog, changed, stats)
+            self._catalog_generation = generation
+
+            self._ready = True
+            if stats["indexed"] or stats["removed"]:
+                self._dirty = True
+                if self._last_save and time.monotonic() - self._last_save >= SAVE_INTERVAL_SECONDS:
+                    self.save()
+        return stats
+
+    def _full_refresh(self, catalog: WorkspaceCatalog, stats: dict[str, int]) -> bool:
+        seen: set[str] = set()
+        for rel_path in self.iter_files():
+            seen.add(rel_path)
+            if len(seen) > MAX_INDEXED_FILES or catalog.truncated:
+                self._too_large = True
+                self._ready = True
+                return False
+            self._check(rel_path, stats)
+        for rel_path in [p for p in self._files if p not in seen]:
+            self._remove(rel_path)
+            stats["removed"] += 1
+        self._last_full_refresh = time.monotonic()
+        return True
+
+    def _refresh_paths(
+        self, catalog: WorkspaceCatalog, changed: set[str], stats: dict[str, int]
+    ) -> None:
+        """Re-check only the paths the catalog saw change.
+
+        A changed path may be a directory that was created, moved or deleted,
+        so everything below it is re-checked as well.
+        """
+        affected: set[str] = set()
+        for rel_path in changed:
+            prefix = rel_path + "/"
+            affected.add(rel_path)
+            affected.update(catalog.files(under=rel_path))
+            affected.update(p for p in self._files if p.startswith(prefix))
+        for rel_path in affected:
+            if catalog.is_file(rel_path) and self._searchable(rel_path):
+                self._check(rel_path, stats)
+            elif rel_path in self._files:
+                self._remove(rel_path)
+                stats["removed"] += 1
+
+    def _check(self, rel_path: str, stats: dict[str, int]) -> None:
+        try:
+            st = os.stat(self.root / rel_path)
+        except OSError:
+            if rel_path in self._files:
+                self._remove(rel_path)
+                stats["removed"] += 1
+            return
+        self._update(rel_path, st, stats)
+
+    def _update(self, rel_path: str, st: os.stat_result, stats: dict[str, int]) -> None:
+        entry = self._files.get(rel_path)
+        if entry is not None and entry.mtime_ns == st.st_mtime_ns and entry.size == st.st_size:
+            stats["unchanged"] += 1
+            return
+
+        try:
+            with open(self.root / rel_path, "rb") as f:
+                data = f.read(MAX_INDEXED_FILE_BYTES + 1)
+        except OSError:
+            if entry is not None:
+                self._remove(rel_path)
+                stats["removed"] += 1
+            return
+
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        if entry is not None and entry.digest == digest:
+            entry.mtime_ns = st.st_mtime_ns
+            entry.size = st.st_size
+            stats["unchanged"] += 1
+            return
+
+        if entry is not None:
+            self._remove(rel_path)
+
+        if b"\x00" in data[:_BINARY_SNIFF_BYTES]:
+            kind, grams = _BINARY, set()
+        elif len(data) > MAX_INDEXED_FILE_BYTES:
+            kind, grams = _LARGE, set()
+        else:
+            kind, grams = _TEXT, content_trigrams(data)
+
+        file_id = self._next_id
+        self._next_id += 1
+        self._files[rel_path] = _FileEntry(
+            file_id=file_id,
+            mtime_ns=st.st_mtime_ns,
+            size=st.st_size,
+            digest=digest,
+            kind=kind,
+            trigrams=_pack(grams),
+        )
+        self._paths[file_id] = rel_path
+        for gram in grams:
+            self._writable_posting(gram).add(file_id)
+        stats["indexed"] += 1
+
+    def _remove(self, rel_path: str) -> None:
+        entry = self._files.pop(rel_path)
+        self._paths.pop(entry.file_id, None)
+        for gram in _unpack(entry.trigrams):
+            posting = self._writable_posting(gram)
+            posting.discard(entry.file_id)
+            if not posting:
+                del self._postings[gram]
+
+    def _writable_posting(self, gram: bytes) -> set:
+        """Return the posting set for ``gram``, converting a loaded array."""
+        posting = self._postings.get(gram)
+        if posting is None:
+            posting = self._postings[gram] = set()
+        elif not isinstance(posting, set):
+            posting = self._postings[gram] = set(posting)
+        return posting
+
+    # ------------------------------------------------------------------
+    # Querying
+    # ------------------------------------------------------------------
+
+    def candidates(self, pattern: str, under: Optional[str] = None) -> Optional[list[str]]:
+        """Return relative paths of files that may contain ``pattern``.
+
+        The result is a superset of the files that match case-insensitively,
+        and so also of those that match exactly. Returns ``None`` if the
+        pattern has no trigram to filter on.
+        """
+        query = pattern.casefold().encode("utf-8")
+        if len(query) < 3:
+            return None
+        grams = {query[i : i + 3] for i in range(len(query) - 2)}
+
+        with self._lock:
+            postings = []
+            for gram in grams:
+                posting = self._postings.get(gram)
+                if not posting:
+                    postings = []
+                    break
+                postings.append(posting)
+
+            ids: set[int] = set()
+            if postings:
+                postings.sort(key=len)
+                ids = set(postings[0])
+                for posting in postings[1:]:
+                    ids.intersection_update(posting)
+                    if not ids:
+                        break
+
+            paths = [self._paths[file_id] for file_id in ids]
+            # Oversized files are not tokenized, so they are always candidates
+            paths.extend(p for p, e in self._files.items() if e.kind == _LARGE)
+
+        if under:
+            prefix = under.rstrip("/") + "/"
+            paths = [p for p in paths if p == under or p.startswith(prefix)]
+        return sorted(set(paths))
+
+    def search(
+        self,
+        pattern: str,
+        *,
+        case_insensitive: bool = False,
+        under: Optional[str] = None,
+        max_results: int = 50,
+    ) -> Optional[list[dict[str, Any]]]:
+        """Find lines containing the literal ``pattern``.
+
+        Args:
+            pattern: Literal text to search for.
+            case_insensitive: Match regardless of case.
+            under: Optional relative file or directory to restrict results to.
+            max_results: Maximum number of matches.
+
+        Returns:
+            Matches as ``{"file", "line", "content"}`` dicts with absolute file
+            paths, or ``None`` if the index cannot answer this query.
+        """
+        if not self.ready:
+            return None
+        paths = self.candidates(pattern, under)
+        if paths is None:
+            return None
+
+        regex = re.compile(re.escape(pattern), re.IGNORECASE if case_insensitive else 0)
+        matches: list[dict[str, Any]] = []
+        for rel_path in paths:
+            path = self.root / rel_path
+            try:
+                with open(path, "r", encoding="utf-8", errors="ignore") as f:
+                    for line_num, line in enumerate(f, 1):
+                        if regex.search(line):
+                            matches.append({
+                                "file": str(path),
+                                "line": line_num,
+                                "content": line.strip(),
+                            })
+                            if len(matches) >= max_results:
+                                return matches
+            except OSError:
+                continue
+        return matches
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self) -> None:
+        """Write the index to ``index_path`` atomically."""
+        if self.index_path is None or self._too_large:
+            return
+        with self._lock:
+            payload = {
+                "version": INDEX_VERSION,
+                "root": str(self.root),
+                "next_id": self._next_id,
+                "files": {
+                    rel: (e.file_id, e.mtime_ns, e.size, e.digest, e.kind, e.trigrams)
+                    for rel, e in self._files.items()
+                },
+                "postings": {
+                    gram: array("I", sorted(posting)) for gram, posting in self._postings.items()
+                },
+            }
+            self._dirty = False
+            self._last_save = time.monotonic()
+
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.index_path.parent, suffix=".tmp")
+        try:
+            with open(fd, "wb") as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            Path(tmp_path).replace(self.index_path)
+        except Exception:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def save_if_dirty(self) -> None:
+        if self._dirty:
+            try:
+                self.save()
+            except Exception:  # noqa: BLE001
+                logger.debug("Failed to save trigram index for %s", self.root, exc_info=True)
+
+    def _load(self) -> bool:
+        if self.index_path is None or not self.index_path.exists():
+            return False
+        try:
+            with open(self.index_path, "rb") as f:
+                payload = pickle.load(f)
+            if payload.get("version") != INDEX_VERSION or payload.get("root") != str(self.root):
+                return False
+            files = {
+                rel: _FileEntry(*fields) for rel, fields in payload["files"].items()
+            }
+        except Exception:  # noqa: BLE001 - a corrupt cache is simply rebuilt
+            logger.debug("Discarding unreadable trigram index %s", self.index_path, exc_info=True)
+            return False
+
+        self._files = files
+        self._paths = {entry.file_id: rel for rel, entry in files.items()}
+        self._postings = payload["postings"]
+        self._next_id = payload["next_id"]
+        self._last_save = time.monotonic()
+        return True
+
+
+_indexes: dict[Path, TrigramIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def _index_path_for(root: Path) -> Path:
+    from swecli.core.paths import encode_project_path, get_paths
+
+    return get_paths().global_cache_dir / "search_index" / f"{encode_project_path(root)}.idx"
+
+
+def get_trigram_index(root: Path, excludes: Iterable[str] = ()) -> TrigramIndex:
+    """Return the shared index for ``root``, creating it on first use."""
+    resolved = Path(root).resolve()
+    with _indexes_lock:
+        index = _indexes.get(resolved)
+        if index is None:
+            if not _indexes:
+                atexit.register(_save_indexes)
+            index = TrigramIndex(resolved, _index_path_for(resolved), excludes)
+            _indexes[resolved] = index
+        return index
+
+
+def _save_indexes() -> None:
+    with _indexes_lock:
+        indexes = list(_indexes.values())
+    for index in indexes:
+        index.save_if_dirty()
@@ -0,0 +1,736 @@
+"""In-process catalog of the files in a workspace, kept current incrementally.
+
+The catalog walks the workspace once, honouring ``.gitignore`` files and
+pruning VCS metadata directories, and then keeps itself up to date:
+
+* On Linux it registers an inotify watch per directory and applies the queued
+  events whenever it is queried, so lookups never touch the disk.
+* Elsewhere, or when the inotify watch limit is reached, it polls directory
+  mtimes (at most every ``poll_interval`` seconds) and re-lists only the
+  directories whose entries changed.
+
+Glob, autocomplete, the web file picker, the codebase indexer and the grep
+index all query the shared catalog from :func:`get_workspace_catalog` instead
+of walking the tree themselves.
+"""
+
+from __future__ import annotations
+
+import atexit
+import bisect
+import ctypes
+import ctypes.util
+import logging
+import os
+import re
+import struct
+import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+import pathspec
+
+logger = logging.getLogger(__name__)
+
+# Directories that are never catalogued, regardless of .gitignore
+VCS_DIRS = frozenset({".git", ".hg", ".svn", ".bzr", "_darcs", ".fossil"})
+
+# Directories that are never source code; file pickers leave them out of their
+# results. Glob, listing and grep still see them unless .gitignore excludes them.
+ALWAYS_IGNORE_DIRS = VCS_DIRS | frozenset({
+    # OS Generated
+    ".DS_Store", ".Spotlight-V100", ".Trashes", "Thumbs.db", "desktop.ini", "$RECYCLE.BIN",
+    # Python caches
+    "__pycache__", ".pytest_cache", ".mypy_cache", ".pytype", ".pyre",
+    ".hypothesis", ".tox", ".nox", "cython_debug", ".eggs",
+    # Node/JS caches
+    "node_modules", ".npm", ".yarn", ".pnpm-store",
+    ".next", ".nuxt", ".output", ".svelte-kit", ".angular", ".parcel-cache", ".turbo",
+    # IDE/Editor
+    ".idea", ".vscode", ".vs", ".settings",
+    # Java/Kotlin
+    ".gradle",
+    # Elixir
+    "_build", "deps", ".elixir_ls",
+    # iOS
+    "Pods", "DerivedData", "xcuserdata",
+    # Ruby
+    ".bundle",
+    # Virtual Environments
+    ".venv", "venv",
+    # Misc caches
+    ".cache", ".sass-cache", ".eslintcache", ".stylelintcache",
+    ".tmp", ".temp", "tmp", "temp",
+})
+
+# Common build output directories, excluded by callers when a repo has no .gitignore
+LIKELY_EXCLUDE_DIRS = frozenset({
+    "dist", "build", "out", "bin", "obj", "target",
+    "coverage", "htmlcov", "cover", "logs",
+    "vendor", "packages", "bower_components",
+})
+
+POLL_INTERVAL_SECONDS = 1.0
+# Stop cataloguing beyond this many entries (e.g. a home directory)
+MAX_CATALOG_ENTRIES = 2_000_000
+# Content/structure changes remembered for ``changes_since``
+CHANGE_LOG_LIMIT = 50_000
+
+# inotify(7) constants
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+_WATCH_MASK = (
+    _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_ONLYDIR
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class IgnoreRules:
+    """``.gitignore`` rules that apply inside one directory, root first."""
+
+    def __init__(self, chain: tuple[tuple[str, Any], ...] = ()) -> None:
+        self._chain = chain
+
+    def extend(self, base: str, gitignore: Path) -> "IgnoreRules":
+        """Return rules with ``gitignore`` (located in ``base``) appended."""
+        try:
+            with open(gitignore, "r", encoding="utf-8", errors="ignore") as f:
+                lines = [
+                    line.strip()
+                    for line in f
+                    if line.strip() and not line.strip().startswith("#")
+                ]
+        except OSError:
+            return self
+        if not lines:
+            return self
+        spec = pathspec.PathSpec.from_lines(pathspec.patterns.GitWildMatchPattern, lines)
+        return IgnoreRules(self._chain + ((base, spec),))
+
+    def ignored(self, rel_path: str, is_dir: bool) -> bool:
+        """Apply gitignore precedence: the deepest file and last pattern win."""
+        for base, spec in reversed(self._chain):
+            local = rel_path[len(base) + 1 :] if base else rel_path
+            if is_dir:
+                local += "/"
+            decision = None
+            for pattern in spec.patterns:
+                if pattern.include is not None and pattern.match_file(local):
+                    decision = pattern.include
+            if decision is not None:
+                return decision
+        return False
+
+
+def _join(rel_dir: str, name: str) -> str:
+    return f"{rel_dir}/{name}" if rel_dir else name
+
+
+def _parent(rel_path: str) -> tuple[str, str]:
+    head, _, tail = rel_path.rpartition("/")
+    return head, tail
+
+
+def _translate_segment(segment: str) -> str:
+    out, i = [], 0
+    while i < len(segment):
+        ch = segment[i]
+        if ch == "*":
+            out.append("[^/]*")
+        elif ch == "?":
+            out.append("[^/]")
+        elif ch == "[":
+            end = segment.find("]", i + 2 if segment[i + 1 : i + 2] in ("!", "]") else i + 1)
+            if end == -1:
+                out.append(re.escape(ch))
+            else:
+                body = segment[i + 1 : end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = end
+        else:
+            out.append(re.escape(ch))
+        i += 1
+    return "".join(out)
+
+
+def glob_to_regex(pattern: str) -> re.Pattern:
+    """Compile a ``Path.glob`` pattern (with ``**``) into a path regex."""
+    parts = [p for p in pattern.split("/") if p not in ("", ".")]
+    regex = ""
+    for i, part in enumerate(parts):
+        last = i == len(parts) - 1
+        if part == "**":
+            regex += ".*" if last else "(?:.*/)?"
+        else:
+            regex += _translate_segment(part) + ("" if last else "/")
+    return re.compile(regex + r"\Z")
+
+
+class _Inotify:
+    """Minimal ctypes binding for inotify(7)."""
+
+    def __init__(self) -> None:
+        libc_name = ctypes.util.find_library("c")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+    def add_watch(self, path: str) -> int:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), _WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        return wd
+
+    def read_events(self) -> Iterator[tuple[int, int, str]]:
+        """Yield queued ``(wd, mask, name)`` events without blocking."""
+        while True:
+            try:
+                buf = os.read(self.fd, 256 * 1024)
+            except BlockingIOError:
+                return
+            if not buf:
+                return
+            offset = 0
+            while offset < len(buf):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buf, offset)
+                offset += _EVENT_HEADER.size
+                name = os.fsdecode(buf[offset : offset + length].rstrip(b"\0"))
+                offset += length
+                yield wd, mask, name
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def _inotify_supported() -> bool:
+    return sys.platform.startswith("linux") and ctypes.util.find_library("c") is not None
+
+
+class WorkspaceCatalog:
+    """Incrementally maintained listing of a workspace's files and directories.
+
+    Paths are relative to ``root`` and use ``/`` separators. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        prune_dirs: Iterable[str] = VCS_DIRS,
+        watch: bool = True,
+        poll_interval: float = POLL_INTERVAL_SECONDS,
+        max_entries: int = MAX_CATALOG_ENTRIES,
+    ) -> None:
+        self.root = Path(root).resolve()
+        self.prune_dirs = frozenset(prune_dirs)
+        self.poll_interval = poll_interval
+        self.max_entries = max_entries
+
+        self._lock = threading.RLock()
+        self._want_watch = watch
+        self._inotify: Optional[_Inotify] = None
+        self._wd_dirs: dict[int, str] = {}
+
+        # rel_dir -> {name: is_dir}; "" is the root
+        self._tree: dict[str, dict[str, bool]] = {}
+        self._rules: dict[str, IgnoreRules] = {}
+        self._dir_mtimes: dict[str, int] = {}
+        self._entry_count = 0
+        self.truncated = False
+
+        self._built = False
+        self._last_poll = 0.0
+        self._last_refresh_seconds = 0.0
+
+        self._generation = 0
+        self._change_log: deque[tuple[int, str]] = deque(maxlen=CHANGE_LOG_LIMIT)
+        self._log_floor = 0
+
+        # Sorted (files, dirs); single-file changes are applied in place
+        self._sorted_cache: Optional[tuple[list[str], list[str]]] = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def backend(self) -> str:
+        """``"inotify"`` or ``"polling"``."""
+        return "inotify" if self._inotify is not None else "polling"
+
+    @property
+    def tracks_content_changes(self) -> bool:
+        """True if ``changes_since`` also reports files modified in place."""
+        return self._inotify is not None
+
+    @property
+    def has_gitignore(self) -> bool:
+        return (self.root / ".gitignore").is_file()
+
+    def _ensure_built(self) -> None:
+        if self._built:
+            return
+        if self._want_watch and _inotify_supported():
+            try:
+                self._inotify = _Inotify()
+            except OSError:
+                logger.debug("inotify unavailable, polling %s", self.root, exc_info=True)
+                self._inotify = None
+        self._full_scan()
+        self._built = True
+
+    def _full_scan(self) -> None:
+        started = time.perf_counter()
+        self._tree.clear()
+        self._rules.clear()
+        self._dir_mtimes.clear()
+        self._wd_dirs.clear()
+        self._entry_count = 0
+        self.truncated = False
+        if self.root.is_dir():
+            self._scan("", IgnoreRules())
+        self._last_poll = time.monotonic()
+        self._last_refresh_seconds = time.perf_counter() - started
+        self._bump_structure()
+        # Consumers cannot reconstruct changes across a full rescan
+        self._log_floor = self._generation
+
+    def close(self) -> None:
+        """Stop watching the file system."""
+        with self._lock:
+            if self._inotify is not None:
+                self._inotify.close()
+                self._inotify = None
+
+    def sync(self) -> None:
+        """Apply pending file-system changes to the catalog."""
+        with self._lock:
+            if not self._built:
+                self._ensure_built()
+                return
+            started = time.perf_counter()
+            if self._inotify is not None:
+                changed = self._drain_events()
+            elif time.monotonic() - self._last_poll >= self.poll_interval:
+                changed = self._poll()
+                self._last_poll = time.monotonic()
+            else:
+                return
+            if changed:
+                self._last_refresh_seconds = time.perf_counter() - started
+
+    # ------------------------------------------------------------------
+    # Scanning
+    # ------------------------------------------------------------------
+
+    def _skip(self, name: str, rel_path: str, is_dir: bool, rules: IgnoreRules) -> bool:
+        return name in self.prune_dirs or rules.ignored(rel_path, is_dir)
+
+    def _scan(self, rel_dir: str, parent_rules: IgnoreRules) -> None:
+        """Catalogue ``rel_dir`` and everything below it."""
+        stack = [(rel_dir, parent_rules)]
+        while stack:
+            current, rules = stack.pop()
+            abs_dir = self.root / current if current else self.root
+            gitignore = abs_dir / ".gitignore"
+            if gitignore.is_file():
+                rules = rules.extend(current, gitignore)
+            self._rules[current] = rules
+            self._watch(current)
+            try:
+                self._dir_mtimes[current] = os.stat(abs_dir).st_mtime_ns
+                entries = list(os.scandir(abs_dir))
+            except OSError:
+                self._tree[current] = {}
+                continue
+
+            children: dict[str, bool] = {}
+            for entry in entries:
+                if self._entry_count >= self.max_entries:
+                    self.truncated = True
+                    break
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                rel_path = _join(current, entry.name)
+                if self._skip(entry.name, rel_path, is_dir, rules):
+                    continue
+                children[entry.name] = is_dir
+                self._entry_count += 1
+                if is_dir:
+                    stack.append((rel_path, rules))
+            self._tree[current] = children
+
+    def _watch(self, rel_dir: str) -> None:
+        if self._inotify is None:
+            return
+        try:
+            wd = self._inotify.add_watch(str(self.root / rel_dir) if rel_dir else str(self.root))
+        except OSError as exc:
+            # Most likely fs.inotify.max_user_watches; degrade to polling
+            logger.debug("inotify watch failed for %s (%s); polling instead", rel_dir, exc)
+            self._inotify.close()
+            self._inotify = None
+            self._wd_dirs.clear()
+            return
+        self._wd_dirs[wd] = rel_dir
+
+    def _drop_dir(self, rel_dir: str) -> None:
+        """Forget ``rel_dir`` and its subtree."""
+        stack = [rel_dir]
+        while stack:
+            current = stack.pop()
+            children = self._tree.pop(current, None) or {}
+            self._rules.pop(current, None)
+            self._dir_mtimes.pop(current, None)
+            self._entry_count -= len(children)
+            stack.extend(_join(current, name) for name, is_dir in children.items() if is_dir)
+
+    def _add_entry(self, rel_dir: str, name: str, is_dir: bool) -> None:
+        children = self._tree.get(rel_dir)
+        if children is None:
+            return
+        rel_path = _join(rel_dir, name)
+        rules = self._rules.get(rel_dir, IgnoreRules())
+        if self._skip(name, rel_path, is_dir, rules):
+            return
+        if name in children:
+            if not is_dir and not children[name]:
+                self._record(rel_path)
+                return
+            self._remove_entry(rel_dir, name)
+        children[name] = is_dir
+        self._entry_count += 1
+        if is_dir:
+            self._scan(rel_path, rules)
+        self._record(rel_path)
+        self._update_sorted(rel_path, is_dir, add=True)
+
+    def _remove_entry(self, rel_dir: str, name: str) -> None:
+        children = self._tree.get(rel_dir)
+        if children is None or name not in children:
+            return
+        rel_path = _join(rel_dir, name)
+        is_dir = children.pop(name)
+        if is_dir:
+            self._drop_dir(rel_path)
+        self._entry_count -= 1
+        self._record(rel_path)
+        self._update_sorted(rel_path, is_dir, add=False)
+
+    def _rescan_subtree(self, rel_dir: str) -> None:
+        """Re-catalogue a directory whose ignore rules changed."""
+        if rel_dir not in self._tree:
+            return
+        parent_rules = IgnoreRules()
+        if rel_dir:
+            parent_rules = self._rules.get(_parent(rel_dir)[0], IgnoreRules())
+        self._drop_dir(rel_dir)
+        self._scan(rel_dir, parent_rules)
+        self._bump_structure()
+        self._log_floor = self._generation
+
+    def _record(self, rel_path: str) -> None:
+        self._generation += 1
+        if len(self._change_log) == self._change_log.maxlen:
+            self._log_floor = self._change_log[0][0]
+        self._change_log.append((self._generation, rel_path))
+
+    def _update_sorted(self, rel_path: str, is_dir: bool, add: bool) -> None:
+        """Keep the sorted listing current for a single added or removed file."""
+        if self._sorted_cache is None:
+            return
+        if is_dir:
+            # A whole subtree changed; rebuild lazily
+            self._sorted_cache = None
+            return
+        files = self._sorted_cache[0]
+        index = bisect.bisect_left(files, rel_path)
+        present = index < len(files) and files[index] == rel_path
+        if add and not present:
+            files.insert(index, rel_path)
+        elif not add and present:
+            del files[index]
+
+    def _bump_structure(self) -> None:
+        self._generation += 1
+        self._sorted_cache = None
+
+    # ------------------------------------------------------------------
+    # Change sources
+    # ------------------------------------------------------------------
+
+    def _drain_events(self) -> bool:
+        assert self._inotify is not None
+        changed = False
+        for wd, mask, name in self._inotify.read_events():
+            changed = True
+            if mask & _IN_Q_OVERFLOW:
+                self._full_scan()
+                continue
+            if mask & _IN_IGNORED:
+                self._wd_dirs.pop(wd, None)
+                continue
+            rel_dir = self._wd_dirs.get(wd)
+            if rel_dir is None or rel_dir not in self._tree or not name:
+                continue
+            is_dir = bool(mask & _IN_ISDIR)
+            if name == ".gitignore" and mask & (
+                _IN_CREATE | _IN_CLOSE_WRITE | _IN_DELETE | _IN_MOVED_FROM | _IN_MOVED_TO
+            ):
+                self._rescan_subtree(rel_dir)
+                continue
+            if mask & (_IN_CREATE | _IN_MOVED_TO):
+                self._add_entry(rel_dir, name, is_dir)
+            elif mask & (_IN_DELETE | _IN_MOVED_FROM):
+                self._remove_entry(rel_dir, name)
+            elif mask & (_IN_CLOSE_WRITE | _IN_MODIFY):
+                if name in self._tree[rel_dir]:
+                    self._record(_join(rel_dir, name))
+            if self._inotify is None:
+                # A watch failed while applying events; polling takes over
+                break
+        return changed
+
+    def _poll(self) -> bool:
+        """Re-list directories whose mtime changed since the last poll."""
+        changed = False
+        for rel_dir in list(self._dir_mtimes):
+            if rel_dir not in self._tree:
+                continue
+            abs_dir = self.root / rel_dir if rel_dir else self.root
+            try:
+                mtime = os.stat(abs_dir).st_mtime_ns
+            except OSError:
+                continue  # Removed; the parent's listing drops it
+            if mtime == self._dir_mtimes.get(rel_dir):
+                continue
+            self._dir_mtimes[rel_dir] = mtime
+            changed = True
+            try:
+                listing = {
+                    entry.name: entry.is_dir(follow_symlinks=False)
+                    for entry in os.scandir(abs_dir)
+                }
+            except OSError:
+                continue
+            children = self._tree[rel_dir]
+            if (".gitignore" in listing) != (".gitignore" in children):
+                self._rescan_subtree(rel_dir)
+                continue
+            for name in [n for n in children if n not in listing or listing[n] != children[n]]:
+                self._remove_entry(rel_dir, name)
+            for name, is_dir in listing.items():
+                if name not in children:
+                    self._add_entry(rel_dir, name, is_dir)
+        return changed
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @property
+    def generation(self) -> int:
+        """Counter that increases with every change the catalog observes."""
+        self.sync()
+        return self._generation
+
+    def changes_since(self, generation: int) -> Optional[set[str]]:
+        """Return paths created, deleted or written since ``generation``.
+
+        Returns ``None`` when the catalog cannot tell (polling backend, change
+        log overflow or a rescan in between); callers should then re-check
+        everything.
+        """
+        self.sync()
+        with self._lock:
+            if not self.tracks_content_changes or generation < self._log_floor:
+                return None
+            return {path for gen, path in self._change_log if gen > generation}
+
+    def _sorted(self) -> tuple[list[str], list[str]]:
+        if self._sorted_cache is None:
+            files, dirs = [], []
+            for rel_dir, children in self._tree.items():
+                for name, is_dir in children.items():
+                    (dirs if is_dir else files).append(_join(rel_dir, name))
+            files.sort()
+            dirs.sort()
+            self._sorted_cache = (files, dirs)
+        return self._sorted_cache
+
+    @staticmethod
+    def _under(paths: list[str], under: str) -> list[str]:
+        if not under:
+            return list(paths)
+        prefix = under.rstrip("/") + "/"
+        start = bisect.bisect_left(paths, prefix)
+        end = bisect.bisect_left(paths, prefix[:-1] + "0")  # "0" sorts right after "/"
+        return paths[start:end]
+
+    def files(self, under: str = "") -> list[str]:
+        """Sorted relative paths of all files, optionally below ``under``."""
+        self.sync()
+        with self._lock:
+            return self._under(self._sorted()[0], under)
+
+    def dirs(self, under: str = "") -> list[str]:
+        """Sorted relative paths of all directories, optionally below ``under``."""
+        self.sync()
+        with self._lock:
+            return self._under(self._sorted()[1], under)
+
+    def children(self, rel_dir: str = "") -> Optional[dict[str, bool]]:
+        """Return ``{name: is_dir}`` for a catalogued directory, else ``None``."""
+        self.sync()
+        with self._lock:
+            children = self._tree.get(rel_dir.strip("/"))
+            return dict(children) if children is not None else None
+
+    def is_file(self, rel_path: str) -> bool:
+        """True if ``rel_path`` is a catalogued file."""
+        self.sync()
+        with self._lock:
+            rel_dir, name = _parent(rel_path)
+            return self._tree.get(rel_dir, {}).get(name) is False
+
+    def relative(self, path: Path) -> Optional[str]:
+        """Return ``path`` relative to the root if it lies inside the workspace."""
+        try:
+            rel = Path(path).resolve().relative_to(self.root).as_posix()
+        except (ValueError, OSError):
+            return None
+        return "" if rel == "." else rel
+
+    def covers(self, rel_path: str) -> bool:
+        """True if ``rel_path`` is the root or a catalogued file or directory."""
+        self.sync()
+        with self._lock:
+            if not rel_path:
+                return True
+            if rel_path in self._tree:
+                return True
+            rel_dir, name = _parent(rel_path)
+            return name in self._tree.get(rel_dir, {})
+
+    def glob(self, pattern: str, under: str = "") -> list[str]:
+        """Files matching a ``Path.glob`` pattern relative to ``under``."""
+        # Narrow the candidate range by the pattern's literal leading directories
+        parts = [p for p in pattern.split("/") if p not in ("", ".")]
+        while len(parts) > 1 and not any(ch in parts[0] for ch in "*?["):
+            under = _join(under.rstrip("/"), parts.pop(0))
+        regex = glob_to_regex("/".join(parts))
+        prefix = under.rstrip("/") + "/" if under else ""
+        return [p for p in self.files(under) if regex.match(p[len(prefix) :])]
+
+    def find(
+        self,
+        query: str,
+        limit: int = 50,
+        *,
+        include_dirs: bool = False,
+        exclude_dirs: Iterable[str] = (),
+        fuzzy: bool = False,
+    ) -> list[str]:
+        """Look up paths by case-insensitive substring (and optionally fuzzy) match.
+
+        Results are ranked shortest path first. With ``fuzzy``, paths whose
+        characters contain the query as a subsequence fill any remaining
+        slots after the substring matches.
+        """
+        self.sync()
+        with self._lock:
+            files, dirs = self._sorted()
+            candidates = files + dirs if include_dirs else files
+        excluded = set(exclude_dirs)
+        if excluded:
+            dir_set = set(dirs) if include_dirs else set()
+            candidates = [
+                p
+                for p in candidates
+                if not excluded.intersection(p.split("/") if p in dir_set else p.split("/")[:-1])
+            ]
+
+        needle = query.lower()
+        exact = [p for p in candidates if needle in p.lower()]
+        exact.sort(key=lambda p: (len(p), p))
+        if not fuzzy or len(exact) >= limit or not needle:
+            return exact[:limit]
+
+        seen = set(exact)
+        subsequence = re.compile(".*?".join(re.escape(ch) for ch in needle))
+        extra = [
+            p for p in candidates if p not in seen and subsequence.search(p.lower())
+        ]
+        extra.sort(key=lambda p: (len(p), p))
+        return (exact + extra)[:limit]
+
+    def stats(self) -> dict[str, Any]:
+        """Size, backend and refresh latency of the catalog."""
+        self.sync()
+        with self._lock:
+            files, dirs = self._sorted()
+            return {
+                "root": str(self.root),
+                "backend": self.backend,
+                "files": len(files),
+                "dirs": len(dirs),
+                "watches": len(self._wd_dirs),
+                "truncated": self.truncated,
+                "last_refresh_ms": self._last_refresh_seconds * 1000,
+                "memory_bytes": self._memory_estimate(),
+            }
+
+    def _memory_estimate(self) -> int:
+        size = sys.getsizeof(self._tree) + sys.getsizeof(self._dir_mtimes)
+        for rel_dir, children in self._tree.items():
+            size += sys.getsizeof(rel_dir) + sys.getsizeof(children)
+            size += sum(sys.getsizeof(name) for name in children)
+        if self._sorted_cache is not None:
+            for paths in self._sorted_cache:
+                size += sys.getsizeof(paths) + sum(sys.getsizeof(p) for p in paths)
+        return size
+
+
+_catalogs: dict[Path, WorkspaceCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_workspace_catalog(root: Path) -> WorkspaceCatalog:
+    """Return the shared catalog for ``root``, creating it on first use."""
+    resolved = Path(root).resolve()
+    with _catalogs_lock:
+        catalog = _catalogs.get(resolved)
+        if catalog is None:
+            if not _catalogs:
+                atexit.register(close_workspace_catalogs)
+            catalog = WorkspaceCatalog(resolved)
+            _catalogs[resolved] = catalog
+        return catalog
+
+
+def close_workspace_catalogs() -> None:
+    """Close and forget all shared catalogs."""
+    with _catalogs_lock:
+        catalogs = list(_catalogs.values())
+        _catalogs.clear()
+    for catalog in catalogs:
+        catalog.close()
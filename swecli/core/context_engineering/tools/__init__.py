@@ -7,33 +7,8 @@ This package contains:
 - context.py: ToolExecutionContext for passing dependencies to handlers
 """
 
-from .context import ToolExecutionContext
-from .registry import ToolRegistry
-
-# Re-export implementations for convenience
-from .implementations import (
-    BaseTool,
-    BashTool,
-    Diff,
-    DiffPreview,
-    EditTool,
-    FileOperations,
-    OpenBrowserTool,
-    VLMTool,
-    WebFetchTool,
-    WebScreenshotTool,
-    WriteTool,
-)
-
-# Re-export handlers for convenience
-from .handlers import (
-    FileToolHandler,
-    ProcessToolHandler,
-    ScreenshotToolHandler,
-    TodoHandler,
-    TodoItem,
-    WebToolHandler,
-)
+from importlib import import_module
+from typing import Dict, Tuple
 
 __all__ = [
     # Core
@@ -59,3 +34,36 @@ __all__ = [
     "TodoItem",
     "WebToolHandler",
 ]
+
+# Re-exports are resolved on first access so that importing a single tool
+# module doesn't load the registry and every handler
+_EXPORTS: Dict[str, Tuple[str, str]] = {
+    "ToolExecutionContext": (".context", "ToolExecutionContext"),
+    "ToolRegistry": (".registry", "ToolRegistry"),
+    "BaseTool": (".implementations", "BaseTool"),
+    "BashTool": (".implementations", "BashTool"),
+    "Diff": (".implementations", "Diff"),
+    "DiffPreview": (".implementations", "DiffPreview"),
+    "EditTool": (".implementations", "EditTool"),
+    "FileOperations": (".implementations", "FileOperations"),
+    "OpenBrowserTool": (".implementations", "OpenBrowserTool"),
+    "VLMTool": (".implementations", "VLMTool"),
+    "WebFetchTool": (".implementations", "WebFetchTool"),
+    "WebScreenshotTool": (".implementations", "WebScreenshotTool"),
+    "WriteTool": (".implementations", "WriteTool"),
+    "FileToolHandler": (".handlers", "FileToolHandler"),
+    "ProcessToolHandler": (".handlers", "ProcessToolHandler"),
+    "ScreenshotToolHandler": (".handlers", "ScreenshotToolHandler"),
+    "TodoHandler": (".handlers", "TodoHandler"),
+    "TodoItem": (".handlers", "TodoItem"),
+    "WebToolHandler": (".handlers", "WebToolHandler"),
+}
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    module_path, attr_name = _EXPORTS[name]
+    attr = getattr(import_module(module_path, __name__), attr_name)
+    globals()[name] = attr
+    return attr
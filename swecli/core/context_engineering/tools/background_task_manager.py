@@ -1,8 +1,8 @@
 """Background task management service.
 
 Manages long-running background processes with:
-- File-based output storage (/tmp/swe-cli/<path>/tasks/<id>.output)
-- PTY-based output streaming
+- Rotating, size-capped output storage (/tmp/swe-cli/<path>/tasks/<id>.output)
+- PTY output from every task multiplexed by a single selector thread
 - Status tracking and listeners for UI updates
 """
 
@@ -10,15 +10,21 @@ from __future__ import annotations
 
 import os
 import select
+import selectors
 import signal
 import threading
-import time
 import uuid
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum, auto
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from swecli.core.context_engineering.tools.task_output_store import (
+    DEFAULT_MAX_SEGMENTS,
+    DEFAULT_SEGMENT_BYTES,
+    TaskOutputStore,
+)
 
 
 class TaskStatus(Enum):
@@ -44,6 +50,7 @@ class BackgroundTask:
     completed_at: Optional[datetime] = None
     exit_code: Optional[int] = None
     error_message: Optional[str] = None
+    output: Optional[TaskOutputStore] = None
 
     @property
     def runtime_seconds(self) -> float:
@@ -57,21 +64,178 @@ class BackgroundTask:
         return self.status == TaskStatus.RUNNING
 
 
+class _OutputPump:
+    """Single thread that copies output from every task's PTY into its store.
+
+    Replaces one polling thread per task: all PTY master fds are registered
+    with one selector, plus a self-pipe used to wake the loop when tasks are
+    added or removed.
+    """
+
+    _READ_SIZE = 64 * 1024
+    _POLL_SECONDS = 0.5
+
+    def __init__(self, on_finished: Callable[[BackgroundTask], None]) -> None:
+        self._on_finished = on_finished
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._wake_r = self._wake_w = -1
+        self._tasks: Dict[int, BackgroundTask] = {}
+        self._pending: List[Tuple[str, BackgroundTask]] = []
+        self._lock = threading.Lock()
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, task: BackgroundTask) -> None:
+        """Start streaming a task's PTY output."""
+        self._request("add", task)
+
+    def remove(self, task: BackgroundTask) -> None:
+        """Stop streaming a task (e.g. before killing it)."""
+        self._request("remove", task)
+
+    def stop(self) -> None:
+        """Stop the pump thread."""
+        with self._lock:
+            if self._stopped:
+                return
+            self._stopped = True
+            self._wake()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+
+    def _request(self, action: str, task: BackgroundTask) -> None:
+        with self._lock:
+            if self._stopped:
+                return
+            self._pending.append((action, task))
+            if self._thread is None:
+                # Created on first use so idle managers hold no fds or threads
+                self._selector = selectors.DefaultSelector()
+                self._wake_r, self._wake_w = os.pipe()
+                os.set_blocking(self._wake_r, False)
+                self._selector.register(self._wake_r, selectors.EVENT_READ)
+                self._thread = threading.Thread(
+                    target=self._run, name="swecli-task-output", daemon=True
+                )
+                self._thread.start()
+            self._wake()
+
+    def _wake(self) -> None:
+        if self._wake_w < 0:
+            return
+        try:
+            os.write(self._wake_w, b"x")
+        except OSError:
+            pass
+
+    def _run(self) -> None:
+        try:
+            while True:
+                with self._lock:
+                    if self._stopped:
+                        break
+                    pending, self._pending = self._pending, []
+                for action, task in pending:
+                    if action == "add":
+                        self._register(task)
+                    else:
+                        self._finish(task, notify=False)
+
+                for key, _ in self._selector.select(self._POLL_SECONDS):
+                    if key.fd == self._wake_r:
+                        self._drain_wakeups()
+                        continue
+                    task = self._tasks.get(key.fd)
+                    if task is not None and not self._read(task):
+                        self._finish(task)
+
+                # A child that left the PTY open (e.g. via a grandchild) never
+                # hits EOF, so also finish tasks whose process has exited
+                for task in list(self._tasks.values()):
+                    if task.process is not None and task.process.poll() is not None:
+                        while self._read(task, wait=0.05):
+                            pass
+                        self._finish(task)
+        finally:
+            for task in list(self._tasks.values()):
+                self._finish(task, notify=False)
+            with self._lock:
+                self._stopped = True
+                wake_r, wake_w = self._wake_r, self._wake_w
+                self._wake_r = self._wake_w = -1
+            self._selector.close()
+            os.close(wake_r)
+            os.close(wake_w)
+
+    def _register(self, task: BackgroundTask) -> None:
+        fd = task.pty_master_fd
+        if fd is None or fd in self._tasks:
+            return
+        try:
+            self._selector.register(fd, selectors.EVENT_READ)
+        except (ValueError, OSError):
+            self._on_finished(task)  # FD already closed or invalid
+            return
+        self._tasks[fd] = task
+
+    def _read(self, task: BackgroundTask, wait: Optional[float] = None) -> bool:
+        """Move available output into the task's store; False on EOF or error."""
+        fd = task.pty_master_fd
+        try:
+            if wait is not None and not select.select([fd], [], [], wait)[0]:
+                return False
+            data = os.read(fd, self._READ_SIZE)
+        except (OSError, ValueError, TypeError):
+            return False
+        if not data:
+            return False
+        task.output.append(data)
+        return True
+
+    def _finish(self, task: BackgroundTask, notify: bool = True) -> None:
+        fd = task.pty_master_fd
+        if self._tasks.pop(fd, None) is None:
+            task.output.close()
+            return
+        try:
+            self._selector.unregister(fd)
+        except (KeyError, ValueError, OSError):
+            pass
+        task.output.close()
+        if notify:
+            self._on_finished(task)
+
+    def _drain_wakeups(self) -> None:
+        try:
+            while os.read(self._wake_r, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+
 class BackgroundTaskManager:
     """Manages background tasks with file-based output storage."""
 
-    def __init__(self, working_dir: Path):
+    def __init__(
+        self,
+        working_dir: Path,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        max_segments: int = DEFAULT_MAX_SEGMENTS,
+    ):
         """Initialize task manager.
 
         Args:
             working_dir: Working directory for path hashing
+            segment_bytes: Size at which a task's output file is rotated
+            max_segments: Output segments kept per task (older output is dropped)
         """
         self.working_dir = working_dir
         self._tasks: Dict[str, BackgroundTask] = {}
         self._lock = threading.RLock()
-        self._output_threads: Dict[str, threading.Thread] = {}
         self._listeners: List[Callable[[str, TaskStatus], None]] = []
-        self._stop_events: Dict[str, threading.Event] = {}
+        self._segment_bytes = segment_bytes
+        self._max_segments = max_segments
+        self._pump = _OutputPump(self._update_task_status)
 
         # Create output directory
         self._output_dir = self._get_output_dir()
@@ -121,89 +285,30 @@ class BackgroundTaskManager:
             output_file=output_file,
             process=process,
             pty_master_fd=pty_master_fd,
+            output=TaskOutputStore(
+                output_file,
+                segment_bytes=self._segment_bytes,
+                max_segments=self._max_segments,
+            ),
         )
 
         with self._lock:
             self._tasks[task_id] = task
 
-        # Write initial output to file
         if initial_output:
-            with open(output_file, "w") as f:
-                f.write(initial_output)
+            task.output.append(initial_output.encode("utf-8"))
 
-        # Start output streaming thread if we have a PTY
+        # Hand the PTY to the shared output pump
         if pty_master_fd is not None:
-            self._start_output_streaming(task)
+            self._pump.add(task)
+        else:
+            task.output.close()
 
         # Notify listeners
         self._notify_listeners(task_id, TaskStatus.RUNNING)
 
         return task
 
-    def _start_output_streaming(self, task: BackgroundTask) -> None:
-        """Start background thread to stream output from PTY to file.
-
-        Args:
-            task: The background task
-        """
-        stop_event = threading.Event()
-        self._stop_events[task.task_id] = stop_event
-
-        def stream_output():
-            """Stream output from PTY to file."""
-            if task.pty_master_fd is None:
-                return
-
-            buffer = ""
-            try:
-                with open(task.output_file, "a") as f:
-                    while not stop_event.is_set():
-                        # Check if there's data ready to read (non-blocking)
-                        try:
-                            ready, _, _ = select.select([task.pty_master_fd], [], [], 0.5)
-                        except (ValueError, OSError):
-                            # FD closed or invalid
-                            break
-
-                        if ready:
-                            try:
-                                data = os.read(task.pty_master_fd, 4096)
-                                if data:
-                                    text = data.decode("utf-8", errors="replace")
-                                    f.write(text)
-                                    f.flush()
-                                else:
-                                    # EOF - process likely died
-                                    break
-                            except OSError:
-                                # Read error - process likely died
-                                break
-
-                        # Check if process is still running
-                        if task.process and task.process.poll() is not None:
-                            # Process exited, read any remaining output
-                            try:
-                                while True:
-                                    ready, _, _ = select.select([task.pty_master_fd], [], [], 0.1)
-                                    if not ready:
-                                        break
-                                    data = os.read(task.pty_master_fd, 4096)
-                                    if not data:
-                                        break
-                                    f.write(data.decode("utf-8", errors="replace"))
-                                    f.flush()
-                            except (OSError, ValueError):
-                                pass
-                            break
-
-            finally:
-                # Update task status when streaming ends
-                self._update_task_status(task)
-
-        thread = threading.Thread(target=stream_output, daemon=True)
-        thread.start()
-        self._output_threads[task.task_id] = thread
-
     def _update_task_status(self, task: BackgroundTask) -> None:
         """Update task status based on process state.
 
@@ -297,8 +402,7 @@ class BackgroundTaskManager:
 
         try:
             # Stop output streaming
-            if task_id in self._stop_events:
-                self._stop_events[task_id].set()
+            self._pump.remove(task)
 
             # Send signal
             task.process.send_signal(sig)
@@ -323,34 +427,57 @@ class BackgroundTaskManager:
         except Exception:
             return False
 
-    def read_output(self, task_id: str, tail_lines: int = 100) -> str:
-        """Read output from task's output file.
+    def read_output(self, task_id: str, tail_lines: int = 100, skip_lines: int = 0) -> str:
+        """Read output from the task's output store.
+
+        Tail reads come from the in-memory ring buffer when possible and
+        otherwise seek backwards through the output segments.
 
         Args:
             task_id: The task ID
-            tail_lines: Number of lines to return (0 = all)
+            tail_lines: Number of lines to return (0 = all retained output)
+            skip_lines: Lines to skip back from the end (for paging backwards)
 
         Returns:
             Output string or empty string if not found
         """
         task = self.get_task(task_id)
-        if not task or not task.output_file.exists():
+        if not task or task.output is None:
             return ""
 
         try:
-            with open(task.output_file, "r") as f:
-                content = f.read()
-
             if tail_lines > 0:
-                lines = content.splitlines()
-                if len(lines) > tail_lines:
-                    return "\n".join(lines[-tail_lines:])
-                return content
-            return content
-
-        except Exception:
+                return "\n".join(task.output.tail(tail_lines, skip=skip_lines))
+            return task.output.read_all()
+        except OSError:
             return ""
 
+    def grep_output(
+        self,
+        task_id: str,
+        pattern: str,
+        max_matches: int = 100,
+        ignore_case: bool = False,
+    ) -> List[Tuple[int, str]]:
+        """Search a task's output for a regex.
+
+        Args:
+            task_id: The task ID
+            pattern: Regular expression to search for
+            max_matches: Return at most this many (the most recent) matches
+            ignore_case: Match case-insensitively
+
+        Returns:
+            List of (line_number, line) tuples, oldest first
+
+        Raises:
+            re.error: If ``pattern`` is not a valid regular expression
+        """
+        task = self.get_task(task_id)
+        if not task or task.output is None:
+            return []
+        return task.output.grep(pattern, max_matches=max_matches, ignore_case=ignore_case)
+
     def add_listener(self, callback: Callable[[str, TaskStatus], None]) -> None:
         """Add status change listener.
 
@@ -389,6 +516,4 @@ class BackgroundTaskManager:
                 if task.is_running:
                     self.kill_task(task_id)
 
-                # Stop streaming threads
-                if task_id in self._stop_events:
-                    self._stop_events[task_id].set()
+        self._pump.stop()
@@ -47,6 +47,11 @@ class FileToolHandler:
                 "output": None,
             }
 
+        if context.undo_manager:
+            context.undo_manager.capture_state(
+                operation, getattr(self._write_tool, "working_dir", None)
+            )
+
         write_result = self._write_tool.write_file(
             file_path,
             approved_content,
@@ -123,6 +128,11 @@ class FileToolHandler:
                 "output": None,
             }
 
+        if context.undo_manager:
+            context.undo_manager.capture_state(
+                operation, getattr(self._edit_tool, "working_dir", None)
+            )
+
         edit_result = self._edit_tool.edit_file(
             file_path,
             old_content,
@@ -7,13 +7,31 @@ discover MCP tools on-demand rather than loading all schemas upfront.
 from __future__ import annotations
 
 import logging
-from typing import Any, TYPE_CHECKING
+from typing import Any, Optional, TYPE_CHECKING
+
+from swecli.core.context_engineering.mcp.tool_index import ToolSearchIndex
 
 if TYPE_CHECKING:
     from swecli.core.context_engineering.mcp.manager import MCPManager
 
 logger = logging.getLogger(__name__)
 
+# Results returned for a query when the caller doesn't pass a limit
+_DEFAULT_LIMIT = 10
+# Larger limits are clamped to this
+_MAX_LIMIT = 100
+
+
+def _coerce_limit(value: Any) -> Optional[int]:
+    """Return ``value`` as a limit in ``1.._MAX_LIMIT``, or None if it isn't a positive number."""
+    try:
+        limit = int(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    if limit < 1:
+        return None
+    return min(limit, _MAX_LIMIT)
+
 
 class SearchToolsHandler:
     """Handler for searching and discovering MCP tools.
@@ -54,107 +72,12 @@ class SearchToolsHandler:
         """
         self._on_discover = callback
 
-    def _score_and_match_tools(
-        self, query: str, tools: list[dict[str, Any]]
-    ) -> list[dict[str, Any]]:
-        """Score tools using DYNAMIC vocabulary from actual tool data.
-
-        This approach extracts keywords from actual tool names/descriptions,
-        then filters query words to only those that exist in the vocabulary.
-        Words like "java", "python", "500", "stars" naturally get filtered out
-        because they don't appear in any tool name or description.
-
-        Args:
-            query: Search query string
-            tools: List of tool definitions to search
-
-        Returns:
-            List of matched tools, sorted by relevance score
-        """
-        # Step 1: Build vocabulary from actual tool names/descriptions
-        # This is the source of truth - no hardcoding!
-        tool_vocabulary: set[str] = set()
-
-        for tool in tools:
-            name = tool.get("name", "").lower()
-            desc = (tool.get("description") or "").lower()
-
-            # Extract words from tool names (split on _ and -)
-            for word in name.replace("_", " ").replace("-", " ").split():
-                if len(word) >= 2:  # Skip single chars
-                    tool_vocabulary.add(word)
-
-            # Extract words from descriptions
-            for word in desc.split():
-                word = word.strip(".,;:()[]\"'")
-                if len(word) >= 3:  # Skip short words from descriptions
-                    tool_vocabulary.add(word)
-
-        # Common abbreviations that map to vocabulary words
-        abbreviations = {
-            "repo": "repository",
-            "repos": "repositories",
-            "pr": "pull",
-            "prs": "pull",
-        }
-
-        # Step 2: Filter query to only words that exist in tool vocabulary
-        query_lower = query.lower()
-        # Remove common data query syntax before tokenizing
-        query_clean = query_lower.replace(":", " ").replace(">=", " ").replace("<=", " ")
-        query_words = query_clean.replace("-", " ").replace("_", " ").split()
-
-        relevant_words: list[str] = []
-        for word in query_words:
-            word = word.strip(".,;:()[]\"'")
-            if not word or len(word) < 2:
-                continue
-
-            # Check if word is in vocabulary
-            if word in tool_vocabulary:
-                relevant_words.append(word)
-            # Check abbreviation expansion
-            elif word in abbreviations and abbreviations[word] in tool_vocabulary:
-                relevant_words.append(abbreviations[word])
-            # Check partial match (prefix matching)
-            else:
-                for vocab_word in tool_vocabulary:
-                    if vocab_word.startswith(word) and len(word) >= 3:
-                        relevant_words.append(vocab_word)
-                        break
-                    if word.startswith(vocab_word) and len(vocab_word) >= 3:
-                        relevant_words.append(vocab_word)
-                        break
-
-        # If no relevant words found, return empty (no matches)
-        if not relevant_words:
-            logger.debug(f"No vocabulary matches for query: {query}")
-            return []
-
-        logger.debug(f"Query '{query}' -> relevant words: {relevant_words}")
-
-        # Step 3: Score tools based on relevant words only
-        scored_tools: list[tuple[int, dict[str, Any]]] = []
-
-        for tool in tools:
-            name = tool.get("name", "").lower()
-            desc = (tool.get("description") or "").lower()
-            name_normalized = name.replace("_", " ").replace("-", " ")
-
-            score = 0
-            for word in relevant_words:
-                if word in name_normalized:
-                    score += 2  # Higher score for name match
-                elif word in desc:
-                    score += 1  # Lower score for description match
-
-            if score > 0:
-                scored_tools.append((score, tool))
-
-        # Sort by score (highest first), then by name for stability
-        scored_tools.sort(key=lambda x: (-x[0], x[1].get("name", "")))
-
-        return [tool for _, tool in scored_tools]
+    def _search_index(self) -> "ToolSearchIndex":
+        """Return the manager's incrementally maintained index (or build one)."""
+        index = getattr(self._mcp_manager, "tool_index", None)
+        if isinstance(index, ToolSearchIndex):
+            return index
+        return ToolSearchIndex.from_tools(self._mcp_manager.get_all_tools())
 
     def search_tools(
         self, arguments: dict[str, Any], context: Any = None
@@ -166,6 +89,7 @@ class SearchToolsHandler:
                 - query: Search query (matches names and descriptions)
                 - detail_level: 'names', 'brief', or 'full'
                 - server: Optional server name filter
+                - limit: Maximum number of results (default 10, at most 100; all for '*')
             context: Tool execution context
 
         Returns:
@@ -210,12 +134,16 @@ class SearchToolsHandler:
                 "count": 0,
             }
 
-        # Filter tools by query using score-based matching
+        limit = _coerce_limit(arguments.get("limit"))
+
+        # Rank tools by BM25 relevance over the pre-built index
         if query and query != "*":
-            matched_tools = self._score_and_match_tools(query, all_tools)
+            matched_tools = self._search_index().search(
+                query, limit=limit or _DEFAULT_LIMIT, server=server_filter
+            )
         else:
             # Return all tools if query is empty or '*'
-            matched_tools = all_tools
+            matched_tools = all_tools[:limit] if limit else all_tools
 
         if not matched_tools:
             return {
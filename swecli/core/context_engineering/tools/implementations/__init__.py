@@ -1,18 +1,7 @@
 """Tool implementations for OpenDev."""
 
-from swecli.core.context_engineering.tools.implementations.base import BaseTool
-from swecli.core.context_engineering.tools.implementations.bash_tool import BashTool
-from swecli.core.context_engineering.tools.implementations.diff_preview import Diff, DiffPreview
-from swecli.core.context_engineering.tools.implementations.edit_tool import EditTool
-from swecli.core.context_engineering.tools.implementations.file_ops import FileOperations
-from swecli.core.context_engineering.tools.implementations.open_browser_tool import OpenBrowserTool
-from swecli.core.context_engineering.tools.implementations.vlm_tool import VLMTool
-from swecli.core.context_engineering.tools.implementations.web_fetch_tool import WebFetchTool
-from swecli.core.context_engineering.tools.implementations.web_screenshot_tool import (
-    WebScreenshotTool,
-)
-from swecli.core.context_engineering.tools.implementations.write_tool import WriteTool
-from swecli.core.context_engineering.tools.implementations.batch_tool import BatchTool
+from importlib import import_module
+from typing import Dict, Tuple
 
 __all__ = [
     "BaseTool",
@@ -28,3 +17,29 @@ __all__ = [
     "WebScreenshotTool",
     "WriteTool",
 ]
+
+# Imported on first access: importing one tool (e.g. bash_tool) should not load
+# the web and VLM tools and their HTTP/browser dependencies
+_EXPORTS: Dict[str, Tuple[str, str]] = {
+    "BaseTool": (".base", "BaseTool"),
+    "BashTool": (".bash_tool", "BashTool"),
+    "BatchTool": (".batch_tool", "BatchTool"),
+    "Diff": (".diff_preview", "Diff"),
+    "DiffPreview": (".diff_preview", "DiffPreview"),
+    "EditTool": (".edit_tool", "EditTool"),
+    "FileOperations": (".file_ops", "FileOperations"),
+    "OpenBrowserTool": (".open_browser_tool", "OpenBrowserTool"),
+    "VLMTool": (".vlm_tool", "VLMTool"),
+    "WebFetchTool": (".web_fetch_tool", "WebFetchTool"),
+    "WebScreenshotTool": (".web_screenshot_tool", "WebScreenshotTool"),
+    "WriteTool": (".write_tool", "WriteTool"),
+}
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    module_path, attr_name = _EXPORTS[name]
+    attr = getattr(import_module(module_path, __name__), attr_name)
+    globals()[name] = attr
+    return attr
@@ -0,0 +1,159 @@
+"""Locate ``old_content`` for search-and-replace edits.
+
+Exact substring matches are tried first. When the model's ``old_content``
+differs from the file only in indentation, trailing whitespace, line endings
+or blank lines, the fallback matches it line by line on stripped text:
+
+- the file is split once into stripped non-blank lines joined by newlines
+  (:class:`LineIndex`),
+- the target's stripped lines, joined the same way and delimited by
+  newlines, are searched for in that index; every hit is a line-aligned
+  window (anchor) that is mapped back to the original lines.
+
+This is linear in the file size, where the previous per-line scan was
+quadratic on files with many repeated lines. Every match is returned, so
+callers can report ambiguity instead of silently editing the first one.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class ContentMatch:
+    """Result of locating ``old_content`` in a file."""
+
+    found: bool
+    content: str  # Text to replace (the first match, or old_content if not found)
+    spans: list[tuple[int, int]] = field(default_factory=list)  # Character offsets
+    line_numbers: list[int] = field(default_factory=list)  # 1-based start lines
+    exact: bool = True
+
+    @property
+    def ambiguous(self) -> bool:
+        """True when the content matches more than one location."""
+        return len(self.spans) > 1
+
+    def replace(self, original: str, new_content: str, match_all: bool = False) -> str:
+        """Replace the first (or every) matched span of ``original``."""
+        spans = self.spans if match_all else self.spans[:1]
+        parts = []
+        position = 0
+        for start, end in spans:
+            parts.append(original[position:start])
+            parts.append(new_content)
+            position = end
+        parts.append(original[position:])
+        return "".join(parts)
+
+
+class LineIndex:
+    """Normalized non-blank lines of a file, built once per search."""
+
+    def __init__(self, text: str):
+        self.lines = text.split("\n")
+        self._stripped = list(map(str.strip, self.lines))
+        # Blank lines are skipped so blank-line differences don't prevent a match;
+        # "\n"-delimited so every match of a delimited needle is line-aligned
+        self.normalized = "\n" + "\n".join(filter(None, self._stripped)) + "\n"
+        self._rows: list[int] | None = None
+
+    @property
+    def rows(self) -> list[int]:
+        """Original line index of each non-blank line."""
+        if self._rows is None:
+            self._rows = [row for row, line in enumerate(self._stripped) if line]
+        return self._rows
+
+    def find_windows(self, target: list[str]) -> list[int]:
+        """Return start positions (in non-blank lines) of windows equal to ``target``."""
+        if not target:
+            return []
+        needle = "\n" + "\n".join(target) + "\n"
+        starts = []
+        window, counted = 0, 0
+        position = self.normalized.find(needle)
+        while position != -1:
+            window += self.normalized.count("\n", counted, position)
+            counted = position
+            starts.append(window)
+            # Adjacent windows share the delimiting newline
+            position = self.normalized.find(needle, position + len(needle) - 1)
+        return starts
+
+    def line_offsets(self, rows: list[int]) -> list[int]:
+        """Character offsets of the given (ascending) original line indexes."""
+        offsets = []
+        row, offset = 0, 0
+        for target in rows:
+            offset += sum(map(len, self.lines[row:target])) + (target - row)
+            row = target
+            offsets.append(offset)
+        return offsets
+
+
+def _exact_spans(original: str, old_content: str) -> list[tuple[int, int]]:
+    spans = []
+    position = original.find(old_content)
+    while position != -1:
+        spans.append((position, position + len(old_content)))
+        position = original.find(old_content, position + len(old_content))
+    return spans
+
+
+def find_content(original: str, old_content: str) -> ContentMatch:
+    """Find every location of ``old_content`` in ``original``.
+
+    Args:
+        original: The file content
+        old_content: The content to find
+
+    Returns:
+        ContentMatch; ``content`` is the text actually present in the file
+    """
+    if not old_content:
+        return ContentMatch(found=False, content=old_content)
+
+    spans = _exact_spans(original, old_content)
+    if spans:
+        line_numbers = []
+        line, counted = 1, 0
+        for start, _ in spans:
+            line += original.count("\n", counted, start)
+            counted = start
+            line_numbers.append(line)
+        return ContentMatch(
+            found=True, content=old_content, spans=spans, line_numbers=line_numbers
+        )
+
+    normalized = old_content.replace("\r\n", "\n").replace("\r", "\n")
+    target = [line.strip() for line in normalized.split("\n") if line.strip()]
+    index = LineIndex(original)
+    starts = index.find_windows(target)
+    if not starts:
+        return ContentMatch(found=False, content=old_content, exact=False)
+
+    first_rows = [index.rows[start] for start in starts]
+    last_rows = [index.rows[start + len(target) - 1] for start in starts]
+    spans = []
+    for begin, last_row, last_start in zip(
+        index.line_offsets(first_rows), last_rows, index.line_offsets(last_rows)
+    ):
+        end = last_start + len(index.lines[last_row])
+        # Keep the trailing newline if old_content had one
+        if normalized.endswith("\n") and end < len(original):
+            end += 1
+        spans.append((begin, end))
+
+    begin, end = spans[0]
+    return ContentMatch(
+        found=True,
+        content=original[begin:end],
+        spans=spans,
+        line_numbers=[row + 1 for row in first_rows],
+        exact=False,
+    )
+
+
+__all__ = ["ContentMatch", "LineIndex", "find_content"]
@@ -7,6 +7,7 @@ from typing import Optional, TYPE_CHECKING
 from swecli.models.config import AppConfig
 from swecli.models.operation import EditResult, Operation
 from swecli.core.context_engineering.tools.implementations.base import BaseTool
+from swecli.core.context_engineering.tools.implementations.content_matcher import find_content
 from swecli.core.context_engineering.tools.implementations.diff_preview import DiffPreview, Diff
 
 if TYPE_CHECKING:
@@ -26,67 +27,6 @@ class EditTool(BaseTool):
         """Tool description."""
         return "Edit an existing file with search and replace"
 
-    def _find_content(self, original: str, old_content: str) -> tuple[bool, str]:
-        """Find content in file, with fallback to normalized matching.
-
-        When exact match fails, tries to find content by normalizing whitespace
-        (stripping each line, normalizing line endings) and then locating the
-        actual content in the original file.
-
-        Args:
-            original: The original file content
-            old_content: The content to find
-
-        Returns:
-            (found, actual_content) - actual_content is what should be replaced
-        """
-        # Try exact match first (fast path)
-        if old_content in original:
-            return (True, old_content)
-
-        # Normalize: strip each line, normalize line endings
-        def normalize(s: str) -> str:
-            lines = s.replace("\r\n", "\n").replace("\r", "\n").split("\n")
-            return "\n".join(line.strip() for line in lines)
-
-        norm_old = normalize(old_content)
-        norm_original = normalize(original)
-
-        # If normalized content not found, give up
-        if norm_old not in norm_original:
-            return (False, old_content)
-
-        # Find actual content in original by line matching
-        old_lines = [l.strip() for l in old_content.split("\n") if l.strip()]
-        if not old_lines:
-            return (False, old_content)
-
-        original_lines = original.split("\n")
-
-        # Find start line that matches first stripped line
-        for i, line in enumerate(original_lines):
-            if line.strip() == old_lines[0]:
-                # Try to match all subsequent lines
-                matched_lines = []
-                j = 0  # Index into old_lines
-                for k in range(i, min(i + len(old_lines) * 2, len(original_lines))):
-                    if j >= len(old_lines):
-                        break
-                    if original_lines[k].strip() == old_lines[j]:
-                        matched_lines.append(original_lines[k])
-                        j += 1
-
-                if j == len(old_lines):
-                    # Found all lines - reconstruct actual content
-                    actual = "\n".join(matched_lines)
-                    # Check if we need trailing newline
-                    if actual in original:
-                        return (True, actual)
-                    if actual + "\n" in original:
-                        return (True, actual + "\n")
-
-        return (False, old_content)
-
     def __init__(self, config: AppConfig, working_dir: Path):
         """Initialize edit tool.
 
@@ -181,8 +121,8 @@ class EditTool(BaseTool):
                 original = f.read()
 
             # Find old_content with fuzzy matching fallback
-            found, actual_old_content = self._find_content(original, old_content)
-            if not found:
+            match = find_content(original, old_content)
+            if not match.found:
                 error = f"Content not found in file: {old_content[:50]}..."
                 if operation:
                     operation.mark_failed(error)
@@ -195,25 +135,11 @@ class EditTool(BaseTool):
                     operation_id=operation.id if operation else None,
                 )
 
-            # Use the actual content found in file for subsequent operations
-            old_content = actual_old_content
-
             # Check if old_content is unique (if not match_all)
-            count = original.count(old_content)
-            if not match_all and count > 1:
-                # Find line numbers of each occurrence to help LLM provide more context
-                occurrences = []
-                search_pos = 0
-                for _ in range(count):
-                    pos = original.find(old_content, search_pos)
-                    if pos == -1:
-                        break
-                    line_num = original[:pos].count("\n") + 1
-                    occurrences.append(line_num)
-                    search_pos = pos + 1
-
-                locations = ", ".join(f"line {n}" for n in occurrences)
-                error = f"Content appears {count} times at {locations}. Provide more surrounding context in old_content to uniquely identify which occurrence to edit."
+            if not match_all and match.ambiguous:
+                # Report line numbers of each occurrence to help LLM provide more context
+                locations = ", ".join(f"line {n}" for n in match.line_numbers)
+                error = f"Content appears {len(match.spans)} times at {locations}. Provide more surrounding context in old_content to uniquely identify which occurrence to edit."
                 if operation:
                     operation.mark_failed(error)
                 return EditResult(
@@ -225,11 +151,8 @@ class EditTool(BaseTool):
                     operation_id=operation.id if operation else None,
                 )
 
-            # Perform replacement
-            if match_all:
-                modified = original.replace(old_content, new_content)
-            else:
-                modified = original.replace(old_content, new_content, 1)
+            # Perform replacement on the matched spans
+            modified = match.replace(original, new_content, match_all=match_all)
 
             # Calculate diff statistics and textual diff
             diff = Diff(str(path), original, modified)
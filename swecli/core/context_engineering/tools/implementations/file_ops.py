@@ -1,12 +1,18 @@
 """File operation tools for reading, searching, and navigating codebases."""
 
+import logging
 import re
 import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from swecli.models.config import AppConfig
 
+if TYPE_CHECKING:
+    from swecli.core.context_engineering.retrieval.workspace_catalog import WorkspaceCatalog
+
+logger = logging.getLogger(__name__)
+
 # Default directories/patterns to exclude from search
 # Covers 20+ programming languages and ecosystems
 DEFAULT_SEARCH_EXCLUDES = [
@@ -141,6 +147,22 @@ class FileOperations:
         self.config = config
         self.working_dir = working_dir
 
+    def _catalog_scope(self, path: Path) -> Optional[tuple["WorkspaceCatalog", str]]:
+        """Return the workspace catalog and ``path`` relative to its root.
+
+        Returns None when ``path`` is outside the working directory or not
+        catalogued (e.g. gitignored), in which case callers walk the disk.
+        """
+        from swecli.core.context_engineering.retrieval.workspace_catalog import (
+            get_workspace_catalog,
+        )
+
+        catalog = get_workspace_catalog(self.working_dir)
+        rel = catalog.relative(path)
+        if rel is None or not catalog.covers(rel):
+            return None
+        return catalog, rel
+
     def _is_excluded_path(self, file_path: str) -> bool:
         """Check if path contains any excluded directory or matches excluded patterns."""
         path_obj = Path(file_path)
@@ -262,6 +284,25 @@ class FileOperations:
         """
         matches = []
         search_root = base_path or self.working_dir
+
+        # Answer from the workspace catalog, which leaves out gitignored files,
+        # whenever it covers the pattern's literal leading path. A pattern that
+        # names an ignored path outright (e.g. "logs/run.log") walks the disk.
+        scope = None if Path(pattern).is_absolute() else self._catalog_scope(search_root)
+        if scope is not None:
+            catalog, rel = scope
+            literal = []
+            for part in pattern.split("/"):
+                if any(ch in part for ch in "*?["):
+                    break
+                literal.append(part)
+            literal_rel = catalog.relative(search_root.joinpath(*literal))
+            if literal_rel is not None and catalog.covers(literal_rel):
+                return [
+                    self._format_display_path(self.working_dir / rel_path)
+                    for rel_path in catalog.glob(pattern, under=rel)[:max_results]
+                ]
+
         try:
             iterator = search_root.glob(pattern)
         except NotImplementedError:
@@ -307,6 +348,10 @@ class FileOperations:
         Returns:
             List of matches with file, line number, and content
         """
+        indexed = self._indexed_grep(pattern, path, max_results, case_insensitive, context_lines)
+        if indexed is not None:
+            return indexed
+
         matches = []
 
         try:
@@ -368,6 +413,54 @@ class FileOperations:
 
         return matches
 
+    def _indexed_grep(
+        self, pattern: str, search_path: Optional[str],
+        max_results: int, case_insensitive: bool, context_lines: int = 0
+    ) -> Optional[list[dict[str, any]]]:
+        """Answer a search from the trigram index, or return None to fall back.
+
+        The index covers the working directory only; searches outside it, glob
+        paths, patterns shorter than three bytes and searches that ask for
+        context lines go to ripgrep instead.
+        """
+        if getattr(self.config, "enable_search_index", False) is not True:
+            return None
+        if context_lines > 0:
+            return None
+
+        from swecli.core.context_engineering.retrieval.trigram_index import get_trigram_index
+
+        root = self.working_dir.resolve()
+        under = None
+        if search_path not in (None, ".", "./"):
+            target = Path(search_path)
+            if not target.is_absolute():
+                target = root / target
+            target = target.resolve()
+            if not target.exists():
+                return None
+            try:
+                under = target.relative_to(root).as_posix()
+            except ValueError:
+                return None
+            if under == ".":
+                under = None
+
+        index = get_trigram_index(root, DEFAULT_SEARCH_EXCLUDES)
+        try:
+            if not index.ensure_ready():
+                return None
+            index.refresh()
+            return index.search(
+                pattern,
+                case_insensitive=case_insensitive,
+                under=under,
+                max_results=max_results,
+            )
+        except Exception:  # noqa: BLE001 - fall back to ripgrep
+            logger.debug("Trigram index search failed", exc_info=True)
+            return None
+
     def _python_grep(
         self, pattern: str, search_path: Optional[str],
         max_results: int, case_insensitive: bool
@@ -410,7 +503,17 @@ class FileOperations:
                     search_root = self.working_dir
                     glob_pattern = search_path
 
-        for path in search_root.glob(glob_pattern):
+        candidates = None
+        scope = self._catalog_scope(search_root)
+        if scope is not None:
+            catalog, rel = scope
+            found = catalog.glob(glob_pattern, under=rel)
+            if found:
+                candidates = [catalog.root / rel_path for rel_path in found]
+        if candidates is None:
+            candidates = search_root.glob(glob_pattern)
+
+        for path in candidates:
             if not path.is_file():
                 continue
 
@@ -463,12 +566,12 @@ class FileOperations:
 
         lines = []
         try:
-            items = sorted(path.iterdir(), key=lambda p: (not p.is_dir(), p.name))
+            items = self._list_entries(path)
             # Filter out common ignore patterns
             items = [
-                item for item in items
+                (name, is_dir) for name, is_dir in items
                 if not any(
-                    pattern in item.name
+                    pattern in name
                     for pattern in [
                         "__pycache__",
                         ".git",
@@ -479,16 +582,16 @@ class FileOperations:
                 )
             ]
 
-            for i, item in enumerate(items):
+            for i, (name, is_dir) in enumerate(items):
                 is_last = i == len(items) - 1
                 current_prefix = "└── " if is_last else "├── "
                 next_prefix = "    " if is_last else "│   "
 
-                lines.append(f"{prefix}{current_prefix}{item.name}")
+                lines.append(f"{prefix}{current_prefix}{name}")
 
-                if item.is_dir():
+                if is_dir:
                     subtree = self._build_tree(
-                        item,
+                        path / name,
                         prefix + next_prefix,
                         max_depth,
                         current_depth + 1,
@@ -501,6 +604,14 @@ class FileOperations:
 
         return "\n".join(lines)
 
+    def _list_entries(self, path: Path) -> list[tuple[str, bool]]:
+        """Return ``(name, is_dir)`` for a directory's entries, directories first."""
+        scope = self._catalog_scope(path)
+        children = scope[0].children(scope[1]) if scope is not None else None
+        if children is None:
+            children = {item.name: item.is_dir() for item in path.iterdir()}
+        return sorted(children.items(), key=lambda item: (not item[1], item[0]))
+
     def _resolve_path(self, path: str) -> Path:
         """Resolve a path relative to working directory.
 
@@ -0,0 +1,335 @@
+"""Convert static HTML to markdown for the web fetch fast path.
+
+A small converter on top of :mod:`html.parser`, so plain pages can be read
+without starting a browser. It keeps what matters for reading documentation
+(headings, paragraphs, links, lists, code blocks, tables, emphasis), drops
+scripts, styles and page chrome (``nav``, ``footer``, ``aside``), and collects
+the page's links for deep crawls. It also records enough about the page to
+tell when the HTML is only a shell for a JavaScript app
+(:attr:`HtmlDocument.needs_javascript`), in which case the caller renders it
+in a browser instead.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Optional
+from urllib.parse import urldefrag, urljoin, urlsplit
+
+# Pages with less visible text than this and any script are treated as JS apps
+MIN_STATIC_TEXT = 250
+
+_SKIP_TAGS = {
+    "script", "style", "template", "svg", "canvas", "noscript", "head",
+    "nav", "footer", "aside", "iframe", "object", "select", "button",
+}
+# Left out of the markdown, but their links are still followed by deep crawls
+_CHROME_TAGS = {"nav", "footer", "aside"}
+_BLOCK_TAGS = {
+    "p", "div", "section", "article", "main", "header", "figure", "figcaption",
+    "dl", "dt", "dd", "address", "details", "summary", "form", "fieldset",
+}
+_HEADINGS = {"h1": 1, "h2": 2, "h3": 3, "h4": 4, "h5": 5, "h6": 6}
+_EMPHASIS = {"strong": "**", "b": "**", "em": "*", "i": "*"}
+_LANGUAGE_CLASS = re.compile(r"(?:language|lang)-([\w+#-]+)")
+_NOSCRIPT_JS = re.compile(r"javascript", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass
+class HtmlDocument:
+    """Markdown rendering of an HTML page."""
+
+    markdown: str
+    title: Optional[str] = None
+    links: list[tuple[str, str]] = field(default_factory=list)  # (absolute URL, text)
+    text_length: int = 0  # Visible characters, excluding markup
+    script_count: int = 0
+    noscript_javascript: bool = False  # A <noscript> asks for JavaScript
+
+    @property
+    def needs_javascript(self) -> bool:
+        """Whether the page looks like a client-rendered app with no static content."""
+        if self.text_length >= MIN_STATIC_TEXT:
+            return False
+        return self.script_count > 0 or self.noscript_javascript
+
+
+class _MarkdownParser(HTMLParser):
+    def __init__(self, base_url: str) -> None:
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.title: Optional[str] = None
+        self.links: list[tuple[str, str]] = []
+        self.text_length = 0
+        self.script_count = 0
+        self.noscript_javascript = False
+
+        self._buffers: list[list[str]] = [[]]
+        self._skip: list[str] = []  # Open skipped elements
+        self._in_title = False
+        self._in_noscript = False
+        self._pre = 0
+        self._pre_language: Optional[str] = None
+        self._href: list[Optional[str]] = []
+        self._lists: list[list] = []  # [ordered, next number]
+        self._tables: list[list[list[str]]] = []
+        self._row: list[str] = []
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+
+    @property
+    def _out(self) -> list[str]:
+        return self._buffers[-1]
+
+    def _tail(self) -> str:
+        for chunk in reversed(self._out):
+            if chunk:
+                return chunk[-1]
+        return "\n"
+
+    def _write(self, text: str) -> None:
+        if text:
+            self._out.append(text)
+
+    def _newline(self) -> None:
+        if self._tail() != "\n":
+            self._write("\n")
+
+    def _block(self) -> None:
+        self._newline()
+        if not self._out or "".join(self._out[-2:])[-2:] != "\n\n":
+            self._write("\n")
+
+    def _push(self) -> None:
+        self._buffers.append([])
+
+    def _pop(self) -> str:
+        return "".join(self._buffers.pop())
+
+    # ------------------------------------------------------------------
+    # Parser callbacks
+    # ------------------------------------------------------------------
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        attributes = {name: value or "" for name, value in attrs}
+        if tag == "title":
+            self._in_title = True
+            self.title = ""
+        elif tag == "script":
+            self.script_count += 1
+        elif tag == "noscript":
+            self._in_noscript = True
+        elif tag == "base" and attributes.get("href"):
+            self.base_url = urljoin(self.base_url, attributes["href"])
+
+        if self._skip:
+            if tag in _SKIP_TAGS:
+                self._skip.append(tag)
+            elif tag == "a" and _CHROME_TAGS.issuperset(self._skip):
+                url = self._resolve(attributes.get("href"))
+                if url:
+                    self.links.append((url, ""))
+            return
+        if tag in _SKIP_TAGS:
+            self._skip.append(tag)
+            return
+
+        if tag in _HEADINGS:
+            self._block()
+            self._write("#" * _HEADINGS[tag] + " ")
+        elif tag in _BLOCK_TAGS:
+            self._block()
+        elif tag == "br":
+            self._write("\n")
+        elif tag == "hr":
+            self._block()
+            self._write("---")
+            self._block()
+        elif tag == "pre":
+            self._block()
+            self._pre += 1
+            self._pre_language = self._language(attributes)
+            self._push()
+        elif tag == "code":
+            if self._pre:
+                self._pre_language = self._pre_language or self._language(attributes)
+            else:
+                self._write("`")
+        elif tag in _EMPHASIS:
+            self._write(_EMPHASIS[tag])
+        elif tag == "a":
+            self._href.append(attributes.get("href"))
+            self._push()
+        elif tag == "img":
+            alt = _WHITESPACE.sub(" ", attributes.get("alt", "")).strip()
+            src = attributes.get("src")
+            if alt and src:
+                self._write(f"![{alt}]({urljoin(self.base_url, src)})")
+        elif tag in ("ul", "ol"):
+            if self._lists:
+                self._newline()
+            else:
+                self._block()
+            self._lists.append([tag == "ol", 1])
+        elif tag == "li":
+            self._newline()
+            indent = "  " * max(0, len(self._lists) - 1)
+            if self._lists and self._lists[-1][0]:
+                marker = f"{self._lists[-1][1]}. "
+                self._lists[-1][1] += 1
+            else:
+                marker = "- "
+            self._write(indent + marker)
+        elif tag == "blockquote":
+            self._block()
+            self._push()
+        elif tag == "table":
+            self._block()
+            self._tables.append([])
+        elif tag == "tr":
+            self._row = []
+        elif tag in ("td", "th"):
+            self._push()
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        self.handle_starttag(tag, attrs)
+        if tag not in ("br", "hr", "img", "base"):
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "title":
+            self._in_title = False
+        elif tag == "noscript":
+            self._in_noscript = False
+
+        if self._skip:
+            if self._skip[-1] == tag:
+                self._skip.pop()
+            return
+
+        if tag in _HEADINGS or tag in _BLOCK_TAGS:
+            self._block()
+        elif tag == "pre" and self._pre:
+            self._pre -= 1
+            body = self._pop().strip("\n")
+            self._write(f"```{self._pre_language or ''}\n{body}\n```")
+            self._pre_language = None
+            self._block()
+        elif tag == "code" and not self._pre:
+            self._write("`")
+        elif tag in _EMPHASIS:
+            self._write(_EMPHASIS[tag])
+        elif tag == "a" and self._href:
+            text = _WHITESPACE.sub(" ", self._pop()).strip()
+            href = self._href.pop()
+            url = self._resolve(href)
+            if url:
+                self.links.append((url, text))
+            if url and text:
+                self._write(f"[{text}]({url})")
+            else:
+                self._write(text)
+        elif tag in ("ul", "ol") and self._lists:
+            self._lists.pop()
+            if self._lists:
+                self._newline()
+            else:
+                self._block()
+        elif tag == "li":
+            self._newline()
+        elif tag == "blockquote" and len(self._buffers) > 1:
+            quoted = self._pop().strip()
+            self._write("\n".join(f"> {line}".rstrip() for line in quoted.splitlines()))
+            self._block()
+        elif tag in ("td", "th") and len(self._buffers) > 1:
+            cell = _WHITESPACE.sub(" ", self._pop()).strip().replace("|", "\\|")
+            self._row.append(cell)
+        elif tag == "tr" and self._tables:
+            if self._row:
+                self._tables[-1].append(self._row)
+            self._row = []
+        elif tag == "table" and self._tables:
+            self._write(self._render_table(self._tables.pop()))
+            self._block()
+
+    def handle_data(self, data: str) -> None:
+        if self._in_title:
+            self.title += data
+        if self._in_noscript and _NOSCRIPT_JS.search(data):
+            self.noscript_javascript = True
+        if self._skip:
+            return
+        if self._pre:
+            self._write(data)
+            self.text_length += len(data.strip())
+            return
+        text = _WHITESPACE.sub(" ", data)
+        if self._tail() in "\n " and text.startswith(" "):
+            text = text[1:]
+        self._write(text)
+        self.text_length += len(text.strip())
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _language(attributes: dict[str, str]) -> Optional[str]:
+        match = _LANGUAGE_CLASS.search(attributes.get("class", ""))
+        return match.group(1) if match else None
+
+    def _resolve(self, href: Optional[str]) -> Optional[str]:
+        if not href or href.startswith(("#", "javascript:", "mailto:", "tel:")):
+            return None
+        url = urldefrag(urljoin(self.base_url, href.strip()))[0]
+        return url if urlsplit(url).scheme in ("http", "https") else None
+
+    @staticmethod
+    def _render_table(rows: list[list[str]]) -> str:
+        if not rows:
+            return ""
+        width = max(len(row) for row in rows)
+        lines = [
+            "| " + " | ".join(row + [""] * (width - len(row))) + " |" for row in rows
+        ]
+        lines.insert(1, "| " + " | ".join(["---"] * width) + " |")
+        return "\n".join(lines)
+
+    def markdown(self) -> str:
+        while len(self._buffers) > 1:  # Unclosed <a>, <pre>, cells...
+            self._write(self._pop())
+        text = "".join(self._out)
+        lines = [line.rstrip() for line in text.splitlines()]
+        return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+
+
+def html_to_markdown(html: str, base_url: str = "") -> HtmlDocument:
+    """Convert an HTML page to markdown.
+
+    Args:
+        html: Page source
+        base_url: URL the page was fetched from, for resolving relative links
+
+    Returns:
+        The markdown, title, absolute links and JavaScript-detection signals
+    """
+    parser = _MarkdownParser(base_url)
+    parser.feed(html)
+    parser.close()
+    title = _WHITESPACE.sub(" ", parser.title).strip() if parser.title else None
+    return HtmlDocument(
+        markdown=parser.markdown(),
+        title=title or None,
+        links=parser.links,
+        text_length=parser.text_length,
+        script_count=parser.script_count,
+        noscript_javascript=parser.noscript_javascript,
+    )
+
+
+__all__ = ["HtmlDocument", "MIN_STATIC_TEXT", "html_to_markdown"]
@@ -1,12 +1,145 @@
-"""Tool for extracting text from PDF files, particularly academic papers."""
+"""Tool for extracting text from PDF files, particularly academic papers.
+
+Page text is cached on disk page by page, keyed by the file's SHA-256
+(``~/.opendev/cache/pdf_text/<hash>.json``). A page-range or section request
+only extracts the pages it returns, and reading the same document again costs
+no extraction at all. When many pages are missing they are extracted in
+chunks on a process pool. The section index (the PDF outline, or headings
+detected in the page text) is built on the first section request and cached
+with the pages.
+"""
 
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
 import re
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
 from pathlib import Path
 from typing import Any, Optional
 
 from swecli.core.context_engineering.tools.implementations.base import BaseTool
+from swecli.core.paths import get_paths
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cached page text or index format changes
+CACHE_FORMAT_VERSION = 1
+
+# Common section headers in academic papers
+_SECTION_PATTERNS = [
+    r"^(?:(\d+\.?\s*)?)(Abstract)\s*$",
+    r"^(?:(\d+\.?\s*)?)(Introduction)\s*$",
+    r"^(?:(\d+\.?\s*)?)(Related\s+Work)\s*$",
+    r"^(?:(\d+\.?\s*)?)(Background)\s*$",
+    r"^(?:(\d+\.?\s*)?)(Methodology|Method|Methods)\s*$",
+    r"^(?:(\d+\.?\s*)?)(Approach)\s*$",
+    r"^(?:(\d+\.?\s*)?)(Model|Architecture)\s*$",
+    r"^(?:(\d+\.?\s*)?)(Experiments?)\s*$",
+    r"^(?:(\d+\.?\s*)?)(Results?)\s*$",
+    r"^(?:(\d+\.?\s*)?)(Discussion)\s*$",
+    r"^(?:(\d+\.?\s*)?)(Conclusion|Conclusions)\s*$",
+    r"^(?:(\d+\.?\s*)?)(References|Bibliography)\s*$",
+    r"^(?:(\d+\.?\s*)?)(Appendix|Appendices)\s*$",
+]
+_SECTION_HEADER = re.compile("|".join(f"(?:{p})" for p in _SECTION_PATTERNS), re.IGNORECASE)
+# "4.2 Training Details": at most four levels of one- or two-digit numbers
+_NUMBERED_HEADING = re.compile(r"^(\d{1,2}(?:\.\d{1,2}){0,3})\.?\s+([A-Z][^.]{1,80})$")
+
+
+def _extract_pages(path: str, backend: str, page_numbers: list[int]) -> list[str]:
+    """Extract the text of the given (0-based) pages; runs in pool workers too."""
+    if backend == "pdfplumber":
+        import pdfplumber
+
+        with pdfplumber.open(path) as pdf:
+            return [pdf.pages[number].extract_text() or "" for number in page_numbers]
+
+    from pypdf import PdfReader
+
+    reader = PdfReader(path)
+    return [reader.pages[number].extract_text() or "" for number in page_numbers]
+
+
+def _pool_context() -> Any:
+    # Forking a process that runs UI and network threads can deadlock the child
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def parse_page_spec(spec: str, page_count: int) -> list[int]:
+    """Parse a page spec such as ``"3"``, ``"2-5"``, ``"1,4-6"`` or ``"10-"``.
+
+    Returns:
+        Sorted 0-based page numbers
+
+    Raises:
+        ValueError: If the spec is malformed or outside the document
+    """
+    numbers: set[int] = set()
+    for part in spec.replace(" ", "").split(","):
+        match = re.fullmatch(r"(\d+)(?:(-)(\d*))?", part)
+        if not match:
+            raise ValueError(f"Invalid page range '{part}' (use e.g. 3, 2-5 or 10-)")
+        first = int(match.group(1))
+        last = int(match.group(3)) if match.group(3) else (page_count if match.group(2) else first)
+        if first < 1 or last > page_count or first > last:
+            raise ValueError(f"Page range '{part}' is outside pages 1-{page_count}")
+        numbers.update(range(first - 1, last))
+    return sorted(numbers)
+
+
+def _format_page_spec(numbers: list[int]) -> str:
+    """Inverse of :func:`parse_page_spec` (1-based, compact)."""
+    ranges: list[str] = []
+    start = previous = None
+    for number in [*numbers, None]:
+        if number is not None and previous is not None and number == previous + 1:
+            previous = number
+            continue
+        if start is not None:
+            ranges.append(str(start + 1) if start == previous else f"{start + 1}-{previous + 1}")
+        start = previous = number
+    return ",".join(ranges)
+
+
+def _detect_headings(pages: list[str]) -> list[dict[str, Any]]:
+    """Find numbered and common academic headings in page text."""
+    headings = []
+    for page_number, text in enumerate(pages, start=1):
+        for line in (text or "").split("\n"):
+            line = line.strip()
+            numbered = _NUMBERED_HEADING.match(line)
+            if numbered:
+                level = numbered.group(1).count(".") + 1
+                headings.append({"title": line, "level": level, "page": page_number})
+            elif _SECTION_HEADER.match(line):
+                headings.append({"title": line, "level": 1, "page": page_number})
+    return headings
+
+
+def _find_section(index: list[dict[str, Any]], query: str) -> Optional[int]:
+    """Return the position in ``index`` of the section matching ``query``."""
+    wanted = re.sub(r"^section\s+", "", query.strip(), flags=re.IGNORECASE).lower()
+    titles = [entry["title"].strip().lower() for entry in index]
+    if re.fullmatch(r"\d+(?:\.\d+)*\.?", wanted):
+        number = wanted.rstrip(".")
+        for position, title in enumerate(titles):
+            if re.match(rf"{re.escape(number)}\.?(?:\s|$)", title):
+                return position
+        return None
+    bare = [re.sub(r"^[\d.]+\s*", "", title) for title in titles]
+    for candidates in (bare, titles):
+        if wanted in candidates:
+            return candidates.index(wanted)
+    return next((position for position, title in enumerate(titles) if wanted in title), None)
 
 
 class PDFTool(BaseTool):
@@ -16,8 +149,18 @@ class PDFTool(BaseTool):
     - Multi-column layouts
     - Section detection
     - Reference extraction
+    - Page ranges and section lookup ("section 4.2")
     """
 
+    # Extract on a process pool when at least this many pages are missing
+    PARALLEL_MIN_PAGES = 32
+    PAGES_PER_CHUNK = 16
+    MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+    # (path, mtime_ns, size) -> SHA-256, so unchanged files aren't re-hashed
+    _digests: dict[tuple[str, int, int], str] = {}
+    _digests_lock = threading.Lock()
+
     @property
     def name(self) -> str:
         """Tool name."""
@@ -28,26 +171,39 @@ class PDFTool(BaseTool):
         """Tool description."""
         return "Extract text content from a PDF file (academic papers)"
 
-    def __init__(self, working_dir: Optional[Path] = None):
+    def __init__(self, working_dir: Optional[Path] = None, cache_dir: Optional[Path] = None):
         """Initialize PDF tool.
 
         Args:
             working_dir: Working directory for resolving relative paths
+            cache_dir: Directory for extracted page text (default: global cache dir / pdf_text)
         """
         self.working_dir = working_dir or Path.cwd()
-
-    def extract_text(self, file_path: str) -> dict[str, Any]:
+        self.cache_dir = cache_dir or get_paths().global_cache_dir / "pdf_text"
+
+    def extract_text(
+        self,
+        file_path: str,
+        pages: Optional[str] = None,
+        section: Optional[str] = None,
+    ) -> dict[str, Any]:
         """Extract text content from a PDF file.
 
         Args:
             file_path: Path to the PDF file (absolute or relative to working_dir)
+            pages: Optional page range to return, e.g. "3", "2-5", "1,4-6" or "10-"
+            section: Optional section to return, by number ("4.2") or title
+                ("Related Work"); takes precedence over ``pages``
 
         Returns:
             Dict with:
                 - success: bool
-                - content: str (full extracted text)
+                - content: str (extracted text of the requested pages)
                 - sections: list[dict] (detected sections with titles and content)
                 - metadata: dict (title, authors, etc. if detected)
+                - page_count: int (pages in the whole document)
+                - pages: str (returned pages, when a range or section was requested)
+                - section: str (matched section title, when requested)
                 - error: str (if success is False)
         """
         try:
@@ -57,49 +213,108 @@ class PDFTool(BaseTool):
                 path = self.working_dir / path
 
             if not path.exists():
-                return {
-                    "success": False,
-                    "error": f"PDF file not found: {path}",
-                    "content": "",
-                    "sections": [],
-                    "metadata": {},
-                }
+                return self._error(f"PDF file not found: {path}")
 
             if not path.suffix.lower() == ".pdf":
-                return {
-                    "success": False,
-                    "error": f"File is not a PDF: {path}",
-                    "content": "",
-                    "sections": [],
-                    "metadata": {},
-                }
+                return self._error(f"File is not a PDF: {path}")
 
             # Try pypdf first, fall back to pdfplumber
             try:
-                return self._extract_with_pypdf(path)
+                entry = self._load_entry(path)
             except ImportError:
-                try:
-                    return self._extract_with_pdfplumber(path)
-                except ImportError:
-                    return {
-                        "success": False,
-                        "error": "No PDF library available. Install pypdf or pdfplumber.",
-                        "content": "",
-                        "sections": [],
-                        "metadata": {},
-                    }
+                return self._error("No PDF library available. Install pypdf or pdfplumber.")
+
+            page_count = entry["page_count"]
+            result: dict[str, Any] = {}
+            if section:
+                index = self._section_index(path, entry)
+                position = _find_section(index, section)
+                if position is None:
+                    available = ", ".join(item["title"] for item in index[:30]) or "none detected"
+                    return self._error(f"Section '{section}' not found. Sections: {available}")
+                wanted = self._section_pages(index, position, page_count)
+                result["section"] = index[position]["title"]
+            elif pages:
+                wanted = parse_page_spec(pages, page_count)
+            else:
+                wanted = list(range(page_count))
+
+            self._ensure_pages(path, entry, wanted)
+            content = "\n\n".join(
+                f"--- Page {number + 1} ---\n{entry['pages'][number]}"
+                for number in wanted
+                if entry["pages"][number]
+            )
+            if section or pages:
+                result["pages"] = _format_page_spec(wanted)
 
-        except Exception as e:
             return {
-                "success": False,
-                "error": f"Failed to extract PDF: {str(e)}",
-                "content": "",
-                "sections": [],
-                "metadata": {},
+                "success": True,
+                "content": content,
+                "sections": self._detect_sections(content),
+                "metadata": entry["metadata"],
+                "page_count": page_count,
+                **result,
             }
 
-    def _extract_with_pypdf(self, path: Path) -> dict[str, Any]:
-        """Extract text using pypdf library."""
+        except Exception as e:
+            return self._error(f"Failed to extract PDF: {str(e)}")
+
+    @staticmethod
+    def _error(message: str) -> dict[str, Any]:
+        return {
+            "success": False,
+            "error": message,
+            "content": "",
+            "sections": [],
+            "metadata": {},
+        }
+
+    # ------------------------------------------------------------------
+    # Page cache
+    # ------------------------------------------------------------------
+
+    def _file_digest(self, path: Path) -> str:
+        stat = path.stat()
+        key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        with self._digests_lock:
+            digest = self._digests.get(key)
+        if digest is None:
+            sha = hashlib.sha256()
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1024 * 1024), b""):
+                    sha.update(block)
+            digest = sha.hexdigest()
+            with self._digests_lock:
+                self._digests[key] = digest
+        return digest
+
+    def _load_entry(self, path: Path) -> dict[str, Any]:
+        """Return the cache entry for a PDF, creating it (without page text) on a miss."""
+        digest = self._file_digest(path)
+        cache_path = self.cache_dir / f"{digest}.json"
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            if entry.get("format") == CACHE_FORMAT_VERSION:
+                return entry
+        except (OSError, ValueError):
+            pass
+
+        entry = {"format": CACHE_FORMAT_VERSION, "digest": digest, **self._read_document(path)}
+        entry["pages"] = [None] * entry["page_count"]
+        entry["headings"] = None
+        return entry
+
+    def _read_document(self, path: Path) -> dict[str, Any]:
+        """Read page count, metadata and outline (no page text)."""
+        try:
+            return self._read_with_pypdf(path)
+        except ImportError:
+            return self._read_with_pdfplumber(path)
+
+    def _read_with_pypdf(self, path: Path) -> dict[str, Any]:
+        """Read document info using pypdf."""
         from pypdf import PdfReader
 
         reader = PdfReader(str(path))
@@ -114,30 +329,34 @@ class PDFTool(BaseTool):
                 "creator": reader.metadata.get("/Creator", ""),
             }
             # Clean up empty values
-            metadata = {k: v for k, v in metadata.items() if v}
+            metadata = {k: str(v) for k, v in metadata.items() if v}
 
-        # Extract text from all pages
-        full_text = []
-        for page_num, page in enumerate(reader.pages):
-            page_text = page.extract_text()
-            if page_text:
-                full_text.append(f"--- Page {page_num + 1} ---\n{page_text}")
+        outline: list[dict[str, Any]] = []
 
-        content = "\n\n".join(full_text)
+        def walk(items: list, level: int) -> None:
+            for item in items:
+                if isinstance(item, list):
+                    walk(item, level + 1)
+                    continue
+                page = reader.get_destination_page_number(item)
+                if page is not None and page >= 0:
+                    outline.append({"title": str(item.title), "level": level, "page": page + 1})
 
-        # Detect sections
-        sections = self._detect_sections(content)
+        try:
+            walk(reader.outline, 1)
+        except Exception as exc:  # Malformed outlines are common; fall back to headings
+            logger.debug("Ignoring unreadable outline in %s: %s", path, exc)
+            outline = []
 
         return {
-            "success": True,
-            "content": content,
-            "sections": sections,
-            "metadata": metadata,
+            "backend": "pypdf",
             "page_count": len(reader.pages),
+            "metadata": metadata,
+            "outline": outline,
         }
 
-    def _extract_with_pdfplumber(self, path: Path) -> dict[str, Any]:
-        """Extract text using pdfplumber library (better for complex layouts)."""
+    def _read_with_pdfplumber(self, path: Path) -> dict[str, Any]:
+        """Read document info using pdfplumber (better for complex layouts)."""
         import pdfplumber
 
         with pdfplumber.open(str(path)) as pdf:
@@ -150,28 +369,83 @@ class PDFTool(BaseTool):
                     "subject": pdf.metadata.get("Subject", ""),
                     "creator": pdf.metadata.get("Creator", ""),
                 }
-                metadata = {k: v for k, v in metadata.items() if v}
-
-            # Extract text from all pages
-            full_text = []
-            for page_num, page in enumerate(pdf.pages):
-                page_text = page.extract_text()
-                if page_text:
-                    full_text.append(f"--- Page {page_num + 1} ---\n{page_text}")
-
-            content = "\n\n".join(full_text)
-
-            # Detect sections
-            sections = self._detect_sections(content)
+                metadata = {k: str(v) for k, v in metadata.items() if v}
 
             return {
-                "success": True,
-                "content": content,
-                "sections": sections,
-                "metadata": metadata,
+                "backend": "pdfplumber",
                 "page_count": len(pdf.pages),
+                "metadata": metadata,
+                "outline": [],
             }
 
+    def _ensure_pages(self, path: Path, entry: dict[str, Any], wanted: list[int]) -> None:
+        """Extract any of the ``wanted`` pages not yet cached, then save the entry."""
+        missing = [number for number in wanted if entry["pages"][number] is None]
+        if not missing:
+            return
+
+        chunks = [
+            missing[i : i + self.PAGES_PER_CHUNK]
+            for i in range(0, len(missing), self.PAGES_PER_CHUNK)
+        ]
+        workers = min(self.MAX_WORKERS, len(chunks))
+        texts: Optional[list[str]] = None
+        if len(missing) >= self.PARALLEL_MIN_PAGES and workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as pool:
+                    results = pool.map(
+                        _extract_pages, repeat(str(path)), repeat(entry["backend"]), chunks
+                    )
+                    texts = [text for chunk in results for text in chunk]
+            except (OSError, BrokenProcessPool) as exc:  # e.g. no semaphores in a sandbox
+                logger.debug("PDF process pool unavailable, extracting serially: %s", exc)
+        if texts is None:
+            texts = _extract_pages(str(path), entry["backend"], missing)
+
+        for number, text in zip(missing, texts):
+            entry["pages"][number] = text
+        self._save_entry(entry)
+
+    def _save_entry(self, entry: dict[str, Any]) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-", suffix=".json")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entry, f)
+                os.replace(tmp, self.cache_dir / f"{entry['digest']}.json")
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        except (OSError, TypeError, ValueError) as exc:
+            logger.debug("Could not write PDF text cache: %s", exc)
+
+    # ------------------------------------------------------------------
+    # Sections
+    # ------------------------------------------------------------------
+
+    def _section_index(self, path: Path, entry: dict[str, Any]) -> list[dict[str, Any]]:
+        """Return the outline, else headings detected in the text (built once, then cached)."""
+        if entry["outline"]:
+            return entry["outline"]
+        if entry["headings"] is None:
+            self._ensure_pages(path, entry, list(range(entry["page_count"])))
+            entry["headings"] = _detect_headings(entry["pages"])
+            self._save_entry(entry)
+        return entry["headings"]
+
+    @staticmethod
+    def _section_pages(index: list[dict[str, Any]], position: int, page_count: int) -> list[int]:
+        """0-based pages from a section's start up to where the next peer section starts."""
+        start = index[position]
+        end = page_count
+        for item in index[position + 1 :]:
+            if item["level"] <= start["level"]:
+                # That section may begin mid-page, so its first page is included
+                end = max(item["page"], start["page"])
+                break
+        return list(range(start["page"] - 1, end))
+
     def _detect_sections(self, content: str) -> list[dict[str, Any]]:
         """Detect common academic paper sections.
 
@@ -181,51 +455,24 @@ class PDFTool(BaseTool):
         Returns:
             List of detected sections with title and content
         """
-        # Common section patterns in academic papers
-        section_patterns = [
-            r"^(?:(\d+\.?\s*)?)(Abstract)\s*$",
-            r"^(?:(\d+\.?\s*)?)(Introduction)\s*$",
-            r"^(?:(\d+\.?\s*)?)(Related\s+Work)\s*$",
-            r"^(?:(\d+\.?\s*)?)(Background)\s*$",
-            r"^(?:(\d+\.?\s*)?)(Methodology|Method|Methods)\s*$",
-            r"^(?:(\d+\.?\s*)?)(Approach)\s*$",
-            r"^(?:(\d+\.?\s*)?)(Model|Architecture)\s*$",
-            r"^(?:(\d+\.?\s*)?)(Experiments?)\s*$",
-            r"^(?:(\d+\.?\s*)?)(Results?)\s*$",
-            r"^(?:(\d+\.?\s*)?)(Discussion)\s*$",
-            r"^(?:(\d+\.?\s*)?)(Conclusion|Conclusions)\s*$",
-            r"^(?:(\d+\.?\s*)?)(References|Bibliography)\s*$",
-            r"^(?:(\d+\.?\s*)?)(Appendix|Appendices)\s*$",
-        ]
-
-        # Combined pattern
-        combined_pattern = "|".join(f"({p})" for p in section_patterns)
-
         sections = []
-        lines = content.split("\n")
         current_section = None
-        current_content = []
+        current_content: list[str] = []
 
-        for line in lines:
+        for line in content.split("\n"):
             # Check if this line is a section header
-            is_header = False
-            for pattern in section_patterns:
-                match = re.match(pattern, line.strip(), re.IGNORECASE)
-                if match:
-                    # Save previous section
-                    if current_section:
-                        sections.append({
-                            "title": current_section,
-                            "content": "\n".join(current_content).strip(),
-                        })
-
-                    # Start new section
-                    current_section = line.strip()
-                    current_content = []
-                    is_header = True
-                    break
-
-            if not is_header and current_section:
+            if _SECTION_HEADER.match(line.strip()):
+                # Save previous section
+                if current_section:
+                    sections.append({
+                        "title": current_section,
+                        "content": "\n".join(current_content).strip(),
+                    })
+
+                # Start new section
+                current_section = line.strip()
+                current_content = []
+            elif current_section:
                 current_content.append(line)
 
         # Add last section
@@ -240,4 +487,6 @@ class PDFTool(BaseTool):
     def execute(self, **kwargs) -> dict[str, Any]:
         """Execute the tool (BaseTool interface)."""
         file_path = kwargs.get("file_path", "")
-        return self.extract_text(file_path)
+        return self.extract_text(
+            file_path, pages=kwargs.get("pages"), section=kwargs.get("section")
+        )
@@ -1,7 +1,6 @@
 """Vision Language Model tool for analyzing images."""
 
 import os
-import base64
 import requests
 from pathlib import Path
 from typing import Optional, Dict, Any
@@ -9,6 +8,7 @@ from typing import Optional, Dict, Any
 from swecli.models.config import AppConfig
 from swecli.config import get_model_registry
 from swecli.core.agents.components import build_max_tokens_param
+from swecli.core.context_engineering.images import ImagePreprocessor, base64_media_type
 
 
 class VLMTool:
@@ -37,6 +37,10 @@ class VLMTool:
     def encode_image(self, image_path: str) -> Optional[str]:
         """Encode an image file to base64.
 
+        The image is downsampled to the VLM provider's useful resolution and
+        re-encoded when that makes it smaller (see ``ImagePreprocessor``), so
+        the data may not be in the file's original format.
+
         Args:
             image_path: Path to the image file (absolute or relative to working_dir)
 
@@ -49,12 +53,11 @@ class VLMTool:
             if not path.is_absolute():
                 path = self.working_dir / path
 
-            # Read and encode the image
-            with open(path, "rb") as image_file:
-                return base64.b64encode(image_file.read()).decode("utf-8")
+            preprocessor = ImagePreprocessor.for_provider(self.config.model_vlm_provider)
+            return preprocessor.prepare_file(path).data
         except FileNotFoundError:
             return None
-        except Exception as e:
+        except Exception:
             return None
 
     def analyze_image(
@@ -136,10 +139,10 @@ class VLMTool:
                     "error": f"Failed to read image file: {image_path}",
                     "content": None,
                 }
-            # Detect image type from extension
+            # Detect image type from the data, else from the extension
             path = Path(image_path)
             ext = path.suffix.lower()
-            mime_type = {
+            mime_type = base64_media_type(base64_image) or {
                 ".jpg": "image/jpeg",
                 ".jpeg": "image/jpeg",
                 ".png": "image/png",
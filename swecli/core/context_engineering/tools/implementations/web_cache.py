@@ -0,0 +1,223 @@
+"""On-disk HTTP response cache for the web fetch tool.
+
+Text responses are stored one JSON file per URL under
+``~/.opendev/cache/web/<key>.json`` with their ``ETag`` and ``Last-Modified``
+validators. An entry is served without a request while it is fresh (the
+response's ``Cache-Control: max-age``, else a default TTL); after that it is
+revalidated with a conditional GET, and a ``304 Not Modified`` renews it
+without downloading the body again. ``no-store`` responses are never written.
+The directory is kept under a size budget by evicting the least recently used
+entries.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Mapping, Optional
+
+from swecli.core.paths import get_paths
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored entry format changes
+CACHE_FORMAT_VERSION = 1
+
+DEFAULT_TTL = 15 * 60.0  # Seconds a response without max-age is served as-is
+MAX_TTL = 24 * 60 * 60.0
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+_MAX_AGE = re.compile(r"(?:^|,)\s*(?:s-)?max-age\s*=\s*\"?(\d+)", re.IGNORECASE)
+
+
+@dataclass
+class CachedResponse:
+    """A cached text response."""
+
+    url: str  # Final URL after redirects
+    status_code: int
+    content_type: str
+    body: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    stored_at: float = 0.0
+    max_age: float = DEFAULT_TTL
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return (now or time.time()) - self.stored_at < self.max_age
+
+    def validators(self) -> dict[str, str]:
+        """Headers for a conditional request revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def freshness(headers: Mapping[str, str], default_ttl: float = DEFAULT_TTL) -> Optional[float]:
+    """Return how long a response may be served without revalidation.
+
+    Returns:
+        Seconds, or None if the response must not be stored
+    """
+    cache_control = headers.get("cache-control", "")
+    directives = cache_control.lower()
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0.0
+    match = _MAX_AGE.search(cache_control)
+    if match:
+        return min(float(match.group(1)), MAX_TTL)
+    return default_ttl
+
+
+class HttpCache:
+    """Size-bounded disk cache of text responses, keyed by request URL."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl: float = DEFAULT_TTL,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache entries (default: global cache dir / web)
+            ttl: Freshness lifetime for responses without ``max-age``
+            max_bytes: Total size of the entries kept on disk
+        """
+        self.cache_dir = cache_dir or get_paths().global_cache_dir / "web"
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._size: Optional[int] = None  # Bytes on disk, scanned on first write
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+
+    def _path(self, url: str) -> Path:
+        return self.cache_dir / f"{self.key(url)}.json"
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Return the entry for ``url`` (fresh or stale), or None on a miss."""
+        path = self._path(url)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.debug("Ignoring unreadable web cache entry %s: %s", path, exc)
+            return None
+        if data.pop("format", None) != CACHE_FORMAT_VERSION or data.pop("request_url", None) != url:
+            return None
+        try:
+            entry = CachedResponse(**data)
+        except TypeError:
+            return None
+        try:
+            os.utime(path)  # Recency for LRU eviction
+        except OSError:
+            pass
+        return entry
+
+    def put(self, request_url: str, entry: CachedResponse) -> bool:
+        """Store (or renew) the entry for ``request_url``.
+
+        Returns:
+            True if the entry was written
+        """
+        data: dict[str, Any] = {
+            "format": CACHE_FORMAT_VERSION,
+            "request_url": request_url,
+            **asdict(entry),
+        }
+        path = self._path(request_url)
+        try:
+            encoded = json.dumps(data).encode("utf-8")
+        except (TypeError, ValueError) as exc:
+            logger.debug("Could not encode web cache entry for %s: %s", request_url, exc)
+            return False
+        if len(encoded) > self.max_bytes:
+            return False
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            try:
+                previous = path.stat().st_size
+            except FileNotFoundError:
+                previous = 0
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-", suffix=".json")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(encoded)
+                os.replace(tmp, path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        except OSError as exc:
+            logger.debug("Could not write web cache entry for %s: %s", request_url, exc)
+            return False
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(encoded) - previous
+            if self._size > self.max_bytes:
+                self._evict(keep=path)
+        return True
+
+    def invalidate(self, url: str) -> None:
+        self._path(url).unlink(missing_ok=True)
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        try:
+            paths = list(self.cache_dir.glob("*.json"))
+        except OSError:
+            return entries
+        for path in paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _scan_size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self, keep: Path) -> None:
+        """Delete least recently used entries until the cache fits its budget."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            evicted += 1
+        self._size = total
+        logger.debug("Web cache: evicted %d entries, %d bytes remain", evicted, total)
+
+
+__all__ = ["CachedResponse", "DEFAULT_TTL", "HttpCache", "freshness"]
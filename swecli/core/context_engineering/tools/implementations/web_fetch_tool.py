@@ -1,32 +1,193 @@
-"""Web fetching tool for retrieving content from URLs using Crawl4AI."""
+"""Web fetching tool for retrieving content from URLs.
+
+Pages are fetched in tiers. A plain GET on a pooled ``httpx`` client comes
+first: text, JSON and other non-HTML responses are returned as-is, and HTML is
+converted to markdown (:mod:`.html_markdown`). Only pages that need JavaScript
+to show their content, or that turn away plain HTTP clients, are rendered in
+Crawl4AI's headless browser, whose startup otherwise dominates the latency of
+a documentation lookup. Static responses are kept in an ETag/Last-Modified
+aware disk cache (:mod:`.web_cache`).
+
+Deep crawls fetch each depth level concurrently over HTTP, with a cap on
+simultaneous requests per host, and fall back to Crawl4AI's deep crawl when
+the start page needs a browser (and for ``dfs``, whose order is inherently
+sequential). All fetches run on one long-lived event loop, so the connection
+pool stays warm between calls.
+"""
 
 from __future__ import annotations
 
 import asyncio
+import fnmatch
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional, Sequence, TYPE_CHECKING
+from typing import Any, Coroutine, Optional, Sequence
+from urllib.parse import urlsplit
 
-# Lazy import crawl4ai to avoid Pydantic deprecation warnings at startup
-# These imports are done inside methods that use them
-if TYPE_CHECKING:
-    from crawl4ai import AsyncWebCrawler, BrowserConfig, CacheMode, CrawlerRunConfig
+import httpx
 
+from swecli.core.context_engineering.tools.implementations.html_markdown import html_to_markdown
+from swecli.core.context_engineering.tools.implementations.web_cache import (
+    CachedResponse,
+    HttpCache,
+    freshness,
+)
 from swecli.models.config import AppConfig
 
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "OpenDev/1.0 (AI Assistant Tool)"
+_ACCEPT = "text/html,application/xhtml+xml,text/plain;q=0.9,application/json;q=0.9,*/*;q=0.8"
+
+# Skip file downloads that cause navigation errors
+_FILE_EXTENSIONS = (
+    ".zip", ".pdf", ".exe", ".dmg", ".tar.gz", ".rar", ".mp4", ".avi", ".mov", ".iso", ".pkg",
+)
+# Non-text/* content types returned as text
+_TEXT_TYPES = (
+    "application/json", "application/ld+json", "application/xml", "application/javascript",
+    "application/x-javascript", "application/yaml", "application/x-yaml", "application/toml",
+    "application/x-sh", "application/x-ndjson", "application/xhtml+xml", "application/rss+xml",
+    "application/atom+xml",
+)
+# Statuses typical of bot walls, which a real browser often gets past
+_BROWSER_STATUSES = {403, 429, 503}
+_CRAWL_STRATEGIES = {"bfs", "dfs", "best_first", "best"}
+
+
+def _media_type(content_type: str) -> str:
+    return content_type.split(";", 1)[0].strip().lower()
+
+
+def _is_text(content_type: str) -> bool:
+    media_type = _media_type(content_type)
+    return (
+        not media_type
+        or media_type.startswith("text/")
+        or media_type in _TEXT_TYPES
+        or media_type.endswith(("+json", "+xml"))
+    )
+
+
+def _is_html(entry: CachedResponse) -> bool:
+    media_type = _media_type(entry.content_type)
+    if media_type in ("text/html", "application/xhtml+xml"):
+        return True
+    start = entry.body.lstrip()[:15].lower()
+    return not media_type and start.startswith(("<!doctype html", "<html"))
+
+
+def _host_matches(host: str, domains: Sequence[str]) -> bool:
+    """Whether ``host`` is one of ``domains`` or a subdomain of one."""
+    for domain in domains:
+        domain = domain.lower().lstrip(".")
+        if host == domain or host.endswith("." + domain):
+            return True
+    return False
+
+
+class _EventLoopThread:
+    """Event loop on a daemon thread that runs every fetch.
+
+    One long-lived loop lets the pooled ``httpx.AsyncClient`` keep its
+    connections between tool calls, and works whether or not the calling
+    thread is already running a loop of its own.
+    """
+
+    MAX_CONNECTIONS = 32
+    MAX_KEEPALIVE_CONNECTIONS = 16
+
+    def __init__(self) -> None:
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._lock = threading.Lock()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="web-fetch-loop", daemon=True
+                ).start()
+                self._loop = loop
+            return self._loop
+
+    def run(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """Run ``coro`` on the loop and wait for its result.
+
+        Raises:
+            KeyboardInterrupt: If interrupted while waiting (the fetch is cancelled)
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self._get_loop())
+        try:
+            return future.result()
+        except KeyboardInterrupt:
+            future.cancel()
+            raise
+
+    def client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client (call from coroutines on this loop only)."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                follow_redirects=True,
+                headers={"User-Agent": USER_AGENT, "Accept": _ACCEPT},
+                limits=httpx.Limits(
+                    max_connections=self.MAX_CONNECTIONS,
+                    max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+                ),
+            )
+        return self._client
+
+
+_runner = _EventLoopThread()
+
+
+@dataclass
+class _Fetched:
+    """Outcome of a static GET."""
+
+    response: Optional[CachedResponse] = None  # None for errors
+    status_code: Optional[int] = None
+    cached: bool = False  # Served from the cache (fresh, or revalidated with a 304)
+    error: Optional[str] = None
+
+
+@dataclass
+class _StaticPage:
+    """A page from a static deep crawl, shaped like a Crawl4AI result."""
+
+    url: str
+    markdown: str
+    html: str
+    metadata: dict[str, Any] = field(default_factory=dict)
+    links: list[str] = field(default_factory=list)
+    needs_javascript: bool = False
+    success: bool = True
+
 
 class WebFetchTool:
-    """Tool for fetching web content using Crawl4AI."""
+    """Tool for fetching web content over HTTP, rendering with Crawl4AI when needed."""
+
+    # Simultaneous requests to one host during a static deep crawl
+    MAX_CONNECTIONS_PER_HOST = 4
+    # Larger responses are cut off (and not cached)
+    MAX_BODY_BYTES = 10 * 1024 * 1024
 
-    def __init__(self, config: AppConfig, working_dir: Path):
+    def __init__(self, config: AppConfig, working_dir: Path, cache_dir: Optional[Path] = None):
         """Initialize web fetch tool.
 
         Args:
             config: Application configuration
             working_dir: Working directory (not used but kept for consistency)
+            cache_dir: Directory for cached responses (default: global cache dir / web)
         """
         self.config = config
         self.working_dir = working_dir
         self.timeout = 30000  # 30 second timeout for page load
+        self.cache = HttpCache(cache_dir)
 
     def fetch_url(
         self,
@@ -43,7 +204,7 @@ class WebFetchTool:
         url_patterns: Optional[Sequence[str]] = None,
         stream: bool = False,
     ) -> dict[str, any]:
-        """Fetch content from a URL using Crawl4AI.
+        """Fetch content from a URL.
 
         Args:
             url: URL to fetch
@@ -62,29 +223,29 @@ class WebFetchTool:
         Returns:
             Dictionary with success, content, and optional error
         """
-        # Run async fetch in sync context
         try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-        return loop.run_until_complete(
-            self._fetch_url_async(
-                url=url,
-                extract_text=extract_text,
-                max_length=max_length,
-                deep_crawl=deep_crawl,
-                crawl_strategy=crawl_strategy,
-                max_depth=max_depth,
-                include_external=include_external,
-                max_pages=max_pages,
-                allowed_domains=allowed_domains,
-                blocked_domains=blocked_domains,
-                url_patterns=url_patterns,
-                stream=stream,
+            return _runner.run(
+                self._fetch_url_async(
+                    url=url,
+                    extract_text=extract_text,
+                    max_length=max_length,
+                    deep_crawl=deep_crawl,
+                    crawl_strategy=crawl_strategy,
+                    max_depth=max_depth,
+                    include_external=include_external,
+                    max_pages=max_pages,
+                    allowed_domains=allowed_domains,
+                    blocked_domains=blocked_domains,
+                    url_patterns=url_patterns,
+                    stream=stream,
+                )
             )
-        )
+        except KeyboardInterrupt:
+            return {
+                "success": False,
+                "error": "Request cancelled by user",
+                "content": None,
+            }
 
     async def _fetch_url_async(
         self,
@@ -103,172 +264,87 @@ class WebFetchTool:
     ) -> dict[str, any]:
         """Async implementation of URL fetching.
 
-        Args:
-            url: URL to fetch
-            extract_text: If True, return markdown format. If False, return raw HTML
-            max_length: Maximum content length (None for no limit)
-            deep_crawl: If True, follow links using a deep crawl strategy
-            crawl_strategy: One of bfs, dfs, best_first (best_first default)
-            max_depth: Maximum depth to traverse when deep crawling
-            include_external: Allow following external domains
-            max_pages: Optional cap on total crawled pages
-            allowed_domains: Optional list of domains to keep during deep crawl
-            blocked_domains: Optional list of domains to skip during deep crawl
-            url_patterns: Optional glob patterns to include
-            stream: If True (and deep_crawl), stream results as they are discovered
+        Tries the static HTTP tier first and escalates to the browser when it
+        cannot serve the page. Arguments are as for :meth:`fetch_url`.
 
         Returns:
             Dictionary with success, content, and optional error
         """
-        try:
-            # Lazy import crawl4ai to avoid Pydantic deprecation warnings at startup
-            from crawl4ai import AsyncWebCrawler, BrowserConfig, CacheMode, CrawlerRunConfig
-            from crawl4ai.deep_crawling import BFSDeepCrawlStrategy, DFSDeepCrawlStrategy, BestFirstCrawlingStrategy
-            from crawl4ai.deep_crawling.filters import FilterChain, DomainFilter, URLPatternFilter
-
-            # Validate URL format
-            if not url.startswith(("http://", "https://")):
-                return {
-                    "success": False,
-                    "error": f"Invalid URL: must start with http:// or https://",
-                    "content": None,
-                }
+        # Validate URL format
+        if not url.startswith(("http://", "https://")):
+            return {
+                "success": False,
+                "error": "Invalid URL: must start with http:// or https://",
+                "content": None,
+            }
 
-            # Skip file downloads that cause navigation errors
-            file_extensions = ('.zip', '.pdf', '.exe', '.dmg', '.tar.gz', '.rar', '.mp4', '.avi', '.mov', '.iso', '.pkg')
-            if any(url.lower().endswith(ext) for ext in file_extensions):
-                return {
-                    "success": False,
-                    "error": f"File downloads are not supported: {url}",
-                    "content": None,
-                }
+        if any(url.lower().endswith(ext) for ext in _FILE_EXTENSIONS):
+            return {
+                "success": False,
+                "error": f"File downloads are not supported: {url}",
+                "content": None,
+            }
 
-            if deep_crawl and max_depth < 1:
-                return {
-                    "success": False,
-                    "error": "max_depth must be greater than 0 when deep_crawl is enabled",
-                    "content": None,
-                }
+        if deep_crawl and max_depth < 1:
+            return {
+                "success": False,
+                "error": "max_depth must be greater than 0 when deep_crawl is enabled",
+                "content": None,
+            }
 
-            if deep_crawl and max_pages is not None and max_pages < 1:
-                return {
-                    "success": False,
-                    "error": "max_pages must be greater than 0 when specified",
-                    "content": None,
-                }
+        if deep_crawl and max_pages is not None and max_pages < 1:
+            return {
+                "success": False,
+                "error": "max_pages must be greater than 0 when specified",
+                "content": None,
+            }
 
-            filter_chain = None
-            deep_strategy = None
-            stream_mode = stream if deep_crawl else False
+        strategy = (crawl_strategy or "best_first").lower()
+        if deep_crawl and strategy not in _CRAWL_STRATEGIES:
+            return {
+                "success": False,
+                "error": (
+                    f"Unsupported crawl_strategy '{crawl_strategy}'. Use bfs, dfs, or best_first."
+                ),
+                "content": None,
+            }
 
-            if deep_crawl:
-                filter_chain = self._build_filter_chain(
-                    allowed_domains, blocked_domains, url_patterns,
-                    FilterChain=FilterChain, DomainFilter=DomainFilter, URLPatternFilter=URLPatternFilter,
-                )
-                deep_strategy = self._build_deep_strategy(
-                    strategy=crawl_strategy,
+        try:
+            if not deep_crawl:
+                result = await self._fetch_static(url, extract_text, max_length)
+            elif strategy != "dfs":
+                result = await self._crawl_static(
+                    url,
+                    extract_text=extract_text,
+                    max_length=max_length,
                     max_depth=max_depth,
                     include_external=include_external,
                     max_pages=max_pages,
-                    filter_chain=filter_chain,
-                    BFSDeepCrawlStrategy=BFSDeepCrawlStrategy,
-                    DFSDeepCrawlStrategy=DFSDeepCrawlStrategy,
-                    BestFirstCrawlingStrategy=BestFirstCrawlingStrategy,
+                    allowed_domains=allowed_domains,
+                    blocked_domains=blocked_domains,
+                    url_patterns=url_patterns,
                 )
             else:
-                filter_chain = None
+                result = None
+            if result is not None:
+                return result
 
-            # Configure browser
-            browser_config = BrowserConfig(
-                headless=True,
-                verbose=False,
-                user_agent="OpenDev/1.0 (AI Assistant Tool; Crawl4AI)",
-            )
-
-            # Configure crawler
-            run_config = CrawlerRunConfig(
-                cache_mode=CacheMode.BYPASS,
-                word_count_threshold=10,
-                exclude_external_links=False,
-                remove_overlay_elements=True,
-                process_iframes=False,
-                page_timeout=self.timeout,
-                deep_crawl_strategy=deep_strategy,
-                stream=stream_mode,
+            logger.debug("Rendering %s in the browser", url)
+            return await self._fetch_with_browser(
+                url=url,
+                extract_text=extract_text,
+                max_length=max_length,
+                deep_crawl=deep_crawl,
+                crawl_strategy=crawl_strategy,
+                max_depth=max_depth,
+                include_external=include_external,
+                max_pages=max_pages,
+                allowed_domains=allowed_domains,
+                blocked_domains=blocked_domains,
+                url_patterns=url_patterns,
+                stream=stream,
             )
-
-            # Fetch URL
-            async with AsyncWebCrawler(config=browser_config) as crawler:
-                if stream_mode:
-                    page_results = []
-                    async for streamed_result in crawler.arun(url=url, config=run_config):
-                        page_results.append(streamed_result)
-                else:
-                    result = await crawler.arun(url=url, config=run_config)
-                    page_results = result if isinstance(result, list) else [result]
-
-                if deep_crawl:
-                    successful_pages = [
-                        page for page in page_results if getattr(page, "success", True)
-                    ]
-                    if not successful_pages:
-                        return {
-                            "success": False,
-                            "error": "Deep crawl completed but returned no successful pages",
-                            "content": None,
-                        }
-
-                    content, page_metadata = self._format_deep_crawl_results(successful_pages, extract_text)
-                    if max_length and len(content) > max_length:
-                        content = (
-                            content[:max_length]
-                            + f"\n\n... (truncated, total length: {len(content)} characters)"
-                        )
-
-                    return {
-                        "success": True,
-                        "content": content,
-                        "error": None,
-                        "url": url,
-                        "status_code": 200,
-                        "content_type": "text/markdown" if extract_text else "text/html",
-                        "pages": page_metadata,
-                        "page_count": len(successful_pages),
-                    }
-
-                result = page_results[0]
-
-                if not result.success:
-                    error_msg = (
-                        result.error_message if hasattr(result, "error_message") else "Unknown error"
-                    )
-                    return {
-                        "success": False,
-                        "error": error_msg,
-                        "content": None,
-                    }
-
-                content = result.markdown if extract_text else result.html
-
-                if max_length and len(content) > max_length:
-                    content = (
-                        content[:max_length]
-                        + f"\n\n... (truncated, total length: {len(content)} characters)"
-                    )
-
-                return {
-                    "success": True,
-                    "content": content,
-                    "error": None,
-                    "url": result.url,  # Final URL after redirects
-                    "status_code": 200,  # Crawl4AI doesn't expose status codes directly
-                    "content_type": "text/markdown" if extract_text else "text/html",
-                    "links": result.links if hasattr(result, "links") else {},
-                    "media": result.media if hasattr(result, "media") else {},
-                }
-
-        except asyncio.TimeoutError:
+        except (asyncio.TimeoutError, httpx.TimeoutException):
             return {
                 "success": False,
                 "error": f"Request timeout after {self.timeout / 1000} seconds",
@@ -303,6 +379,399 @@ class WebFetchTool:
                 "content": None,
             }
 
+    @staticmethod
+    def _truncate(content: str, max_length: Optional[int]) -> str:
+        if max_length and len(content) > max_length:
+            return (
+                content[:max_length]
+                + f"\n\n... (truncated, total length: {len(content)} characters)"
+            )
+        return content
+
+    # ------------------------------------------------------------------
+    # Static tier
+    # ------------------------------------------------------------------
+
+    async def _load(self, url: str) -> _Fetched:
+        """GET ``url`` through the HTTP cache.
+
+        Raises:
+            httpx.HTTPError: On transport errors
+        """
+        entry = self.cache.get(url)
+        if entry is not None and entry.is_fresh():
+            return _Fetched(entry, entry.status_code, cached=True)
+
+        headers = entry.validators() if entry is not None else {}
+        timeout = httpx.Timeout(self.timeout / 1000, connect=10.0)
+        client = _runner.client()
+        async with client.stream("GET", url, headers=headers, timeout=timeout) as response:
+            ttl = freshness(response.headers, self.cache.ttl)
+            if response.status_code == 304 and entry is not None:
+                entry.stored_at = time.time()
+                entry.max_age = ttl or 0.0
+                entry.etag = response.headers.get("etag", entry.etag)
+                entry.last_modified = response.headers.get("last-modified", entry.last_modified)
+                self.cache.put(url, entry)
+                return _Fetched(entry, entry.status_code, cached=True)
+
+            content_type = response.headers.get("content-type", "")
+            if response.status_code >= 400:
+                return _Fetched(status_code=response.status_code)
+            if not _is_text(content_type):
+                return _Fetched(
+                    status_code=response.status_code,
+                    error=f"Unsupported content type '{_media_type(content_type)}': {url}",
+                )
+
+            chunks: list[bytes] = []
+            size = 0
+            async for chunk in response.aiter_bytes():
+                chunks.append(chunk)
+                size += len(chunk)
+                if size > self.MAX_BODY_BYTES:
+                    ttl = None
+                    break
+            body = b"".join(chunks)[: self.MAX_BODY_BYTES]
+            entry = CachedResponse(
+                url=str(response.url),
+                status_code=response.status_code,
+                content_type=content_type,
+                body=body.decode(response.encoding or "utf-8", errors="replace"),
+                etag=response.headers.get("etag"),
+                last_modified=response.headers.get("last-modified"),
+                stored_at=time.time(),
+                max_age=ttl or 0.0,
+            )
+        if ttl is not None and response.status_code == 200:
+            self.cache.put(url, entry)
+        return _Fetched(entry, response.status_code)
+
+    async def _fetch_static(
+        self, url: str, extract_text: bool, max_length: Optional[int]
+    ) -> Optional[dict[str, Any]]:
+        """Fetch a page without a browser.
+
+        Returns:
+            The tool result, or None if the page needs the browser
+        """
+        try:
+            fetched = await self._load(url)
+        except httpx.TimeoutException:
+            return {
+                "success": False,
+                "error": f"Request timeout after {self.timeout / 1000} seconds",
+                "content": None,
+            }
+        except httpx.HTTPError as exc:
+            return {
+                "success": False,
+                "error": f"Failed to fetch URL: {exc}",
+                "content": None,
+            }
+
+        if fetched.error:
+            return {"success": False, "error": fetched.error, "content": None}
+        entry = fetched.response
+        if entry is None:
+            if fetched.status_code in _BROWSER_STATUSES:
+                logger.debug("HTTP %s for %s, retrying in the browser", fetched.status_code, url)
+                return None
+            return {
+                "success": False,
+                "error": f"HTTP {fetched.status_code} fetching {url}",
+                "content": None,
+            }
+
+        links: dict[str, list[dict[str, str]]] = {}
+        if _is_html(entry):
+            document = html_to_markdown(entry.body, entry.url)
+            if document.needs_javascript:
+                logger.debug("%s needs JavaScript (%d chars of text)", url, document.text_length)
+                return None
+            content = document.markdown if extract_text else entry.body
+            content_type = "text/markdown" if extract_text else "text/html"
+            host = urlsplit(entry.url).hostname or ""
+            for link, text in document.links:
+                group = "internal" if urlsplit(link).hostname == host else "external"
+                links.setdefault(group, []).append({"href": link, "text": text})
+        else:
+            content = entry.body
+            content_type = _media_type(entry.content_type) or "text/plain"
+
+        return {
+            "success": True,
+            "content": self._truncate(content, max_length),
+            "error": None,
+            "url": entry.url,  # Final URL after redirects
+            "status_code": entry.status_code,
+            "content_type": content_type,
+            "links": links,
+            "media": {},
+            "cached": fetched.cached,
+        }
+
+    async def _crawl_static(
+        self,
+        url: str,
+        *,
+        extract_text: bool,
+        max_length: Optional[int],
+        max_depth: int,
+        include_external: bool,
+        max_pages: Optional[int],
+        allowed_domains: Optional[Sequence[str]],
+        blocked_domains: Optional[Sequence[str]],
+        url_patterns: Optional[Sequence[str]],
+    ) -> Optional[dict[str, Any]]:
+        """Deep crawl over HTTP, breadth first, one depth level at a time.
+
+        Pages of a level are fetched concurrently, at most
+        :attr:`MAX_CONNECTIONS_PER_HOST` at once per host. Later pages that
+        need JavaScript keep their static content.
+
+        Returns:
+            The tool result, or None if the start page needs the browser
+        """
+        if max_pages is not None and max_pages < 1:
+            # Nothing could be fetched, not even the start page
+            return {
+                "success": False,
+                "error": "max_pages must be greater than 0 when specified",
+                "content": None,
+            }
+
+        root_host = (urlsplit(url).hostname or "").lower()
+        semaphores: dict[str, asyncio.Semaphore] = {}
+
+        async def fetch(page_url: str, depth: int) -> Optional[_StaticPage]:
+            host = urlsplit(page_url).hostname or ""
+            semaphore = semaphores.setdefault(
+                host, asyncio.Semaphore(self.MAX_CONNECTIONS_PER_HOST)
+            )
+            async with semaphore:
+                try:
+                    fetched = await self._load(page_url)
+                except httpx.HTTPError as exc:
+                    logger.debug("Deep crawl: failed to fetch %s: %s", page_url, exc)
+                    return None
+            entry = fetched.response
+            if entry is None:
+                reason = fetched.error or fetched.status_code
+                logger.debug("Deep crawl: skipping %s (%s)", page_url, reason)
+                return None
+            if not _is_html(entry):
+                return _StaticPage(entry.url, entry.body, entry.body, {"depth": depth})
+            document = html_to_markdown(entry.body, entry.url)
+            return _StaticPage(
+                entry.url,
+                document.markdown,
+                entry.body,
+                {"depth": depth},
+                links=[link for link, _ in document.links],
+                needs_javascript=document.needs_javascript,
+            )
+
+        pages: list[_StaticPage] = []
+        seen = {url}
+        frontier = [url]
+        for depth in range(max_depth + 1):
+            next_frontier: list[str] = []
+            while frontier:
+                # Pages that fail don't count against max_pages: refill from the frontier
+                if max_pages is None:
+                    batch, frontier = frontier, []
+                elif len(pages) < max_pages:
+                    size = max_pages - len(pages)
+                    batch, frontier = frontier[:size], frontier[size:]
+                else:
+                    break
+                results = await asyncio.gather(*(fetch(page_url, depth) for page_url in batch))
+                if depth == 0 and (results[0] is None or results[0].needs_javascript):
+                    return None
+                for page in results:
+                    if page is None:
+                        continue
+                    pages.append(page)
+                    seen.add(page.url)
+                    if depth == max_depth:
+                        continue
+                    for link in page.links:
+                        if link not in seen and self._should_follow(
+                            link,
+                            root_host,
+                            include_external=include_external,
+                            allowed_domains=allowed_domains,
+                            blocked_domains=blocked_domains,
+                            url_patterns=url_patterns,
+                        ):
+                            seen.add(link)
+                            next_frontier.append(link)
+            frontier = next_frontier
+
+        logger.debug("Static deep crawl of %s: %d pages", url, len(pages))
+        content, page_metadata = self._format_deep_crawl_results(pages, extract_text)
+        return {
+            "success": True,
+            "content": self._truncate(content, max_length),
+            "error": None,
+            "url": url,
+            "status_code": 200,
+            "content_type": "text/markdown" if extract_text else "text/html",
+            "pages": page_metadata,
+            "page_count": len(pages),
+        }
+
+    @staticmethod
+    def _should_follow(
+        link: str,
+        root_host: str,
+        *,
+        include_external: bool,
+        allowed_domains: Optional[Sequence[str]],
+        blocked_domains: Optional[Sequence[str]],
+        url_patterns: Optional[Sequence[str]],
+    ) -> bool:
+        host = (urlsplit(link).hostname or "").lower()
+        if any(link.lower().endswith(ext) for ext in _FILE_EXTENSIONS):
+            return False
+        if not include_external and not _host_matches(host, [root_host]):
+            return False
+        if allowed_domains and not _host_matches(host, allowed_domains):
+            return False
+        if blocked_domains and _host_matches(host, blocked_domains):
+            return False
+        if url_patterns and not any(fnmatch.fnmatch(link, pattern) for pattern in url_patterns):
+            return False
+        return True
+
+    # ------------------------------------------------------------------
+    # Browser tier
+    # ------------------------------------------------------------------
+
+    async def _fetch_with_browser(
+        self,
+        url: str,
+        extract_text: bool,
+        max_length: Optional[int],
+        deep_crawl: bool,
+        crawl_strategy: str,
+        max_depth: int,
+        include_external: bool,
+        max_pages: Optional[int],
+        allowed_domains: Optional[Sequence[str]],
+        blocked_domains: Optional[Sequence[str]],
+        url_patterns: Optional[Sequence[str]],
+        stream: bool,
+    ) -> dict[str, any]:
+        """Render the page (or deep crawl) in Crawl4AI's headless browser."""
+        # Lazy import crawl4ai to avoid Pydantic deprecation warnings at startup
+        from crawl4ai import AsyncWebCrawler, BrowserConfig, CacheMode, CrawlerRunConfig
+        from crawl4ai.deep_crawling import BFSDeepCrawlStrategy, DFSDeepCrawlStrategy, BestFirstCrawlingStrategy
+        from crawl4ai.deep_crawling.filters import FilterChain, DomainFilter, URLPatternFilter
+
+        filter_chain = None
+        deep_strategy = None
+        stream_mode = stream if deep_crawl else False
+
+        if deep_crawl:
+            filter_chain = self._build_filter_chain(
+                allowed_domains, blocked_domains, url_patterns,
+                FilterChain=FilterChain, DomainFilter=DomainFilter, URLPatternFilter=URLPatternFilter,
+            )
+            deep_strategy = self._build_deep_strategy(
+                strategy=crawl_strategy,
+                max_depth=max_depth,
+                include_external=include_external,
+                max_pages=max_pages,
+                filter_chain=filter_chain,
+                BFSDeepCrawlStrategy=BFSDeepCrawlStrategy,
+                DFSDeepCrawlStrategy=DFSDeepCrawlStrategy,
+                BestFirstCrawlingStrategy=BestFirstCrawlingStrategy,
+            )
+        else:
+            filter_chain = None
+
+        # Configure browser
+        browser_config = BrowserConfig(
+            headless=True,
+            verbose=False,
+            user_agent="OpenDev/1.0 (AI Assistant Tool; Crawl4AI)",
+        )
+
+        # Configure crawler
+        run_config = CrawlerRunConfig(
+            cache_mode=CacheMode.BYPASS,
+            word_count_threshold=10,
+            exclude_external_links=False,
+            remove_overlay_elements=True,
+            process_iframes=False,
+            page_timeout=self.timeout,
+            deep_crawl_strategy=deep_strategy,
+            stream=stream_mode,
+        )
+
+        # Fetch URL
+        async with AsyncWebCrawler(config=browser_config) as crawler:
+            if stream_mode:
+                page_results = []
+                async for streamed_result in crawler.arun(url=url, config=run_config):
+                    page_results.append(streamed_result)
+            else:
+                result = await crawler.arun(url=url, config=run_config)
+                page_results = result if isinstance(result, list) else [result]
+
+            if deep_crawl:
+                successful_pages = [
+                    page for page in page_results if getattr(page, "success", True)
+                ]
+                if not successful_pages:
+                    return {
+                        "success": False,
+                        "error": "Deep crawl completed but returned no successful pages",
+                        "content": None,
+                    }
+
+                content, page_metadata = self._format_deep_crawl_results(successful_pages, extract_text)
+                content = self._truncate(content, max_length)
+
+                return {
+                    "success": True,
+                    "content": content,
+                    "error": None,
+                    "url": url,
+                    "status_code": 200,
+                    "content_type": "text/markdown" if extract_text else "text/html",
+                    "pages": page_metadata,
+                    "page_count": len(successful_pages),
+                }
+
+            result = page_results[0]
+
+            if not result.success:
+                error_msg = (
+                    result.error_message if hasattr(result, "error_message") else "Unknown error"
+                )
+                return {
+                    "success": False,
+                    "error": error_msg,
+                    "content": None,
+                }
+
+            content = self._truncate(result.markdown if extract_text else result.html, max_length)
+
+            return {
+                "success": True,
+                "content": content,
+                "error": None,
+                "url": result.url,  # Final URL after redirects
+                "status_code": 200,  # Crawl4AI doesn't expose status codes directly
+                "content_type": "text/markdown" if extract_text else "text/html",
+                "links": result.links if hasattr(result, "links") else {},
+                "media": result.media if hasattr(result, "media") else {},
+            }
+
+
     def _build_filter_chain(
         self,
         allowed_domains: Optional[Sequence[str]],
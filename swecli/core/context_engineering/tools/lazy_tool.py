@@ -0,0 +1,75 @@
+"""Deferred construction of tools with heavy dependencies.
+
+Web, PDF, VLM and LSP tools import HTTP clients, browser automation or
+language server bindings at module load. ``LazyTool`` stands in for such a
+tool in the ``ToolRegistry`` and only imports and builds it the first time one
+of its attributes is used, so sessions that never call those tools (and
+commands like ``swecli --version``) don't pay for the imports.
+"""
+
+from __future__ import annotations
+
+import threading
+from importlib import import_module
+from typing import Any, Callable
+
+
+class LazyTool:
+    """Proxy that builds the wrapped tool on first attribute access."""
+
+    def __init__(self, factory: Callable[[], Any], name: str = "") -> None:
+        """Initialize the proxy.
+
+        Args:
+            factory: Zero-argument callable returning the tool instance
+            name: Display name for repr/debugging
+        """
+        self._lazy_factory = factory
+        self._lazy_name = name or getattr(factory, "__name__", "tool")
+        self._lazy_instance: Any = None
+        self._lazy_lock = threading.Lock()
+
+    @classmethod
+    def from_path(cls, target: str, *args: Any, **kwargs: Any) -> "LazyTool":
+        """Create a proxy for ``module:ClassName`` built with ``args``/``kwargs``.
+
+        The module is not imported until the tool is first used.
+        """
+        module_path, _, class_name = target.partition(":")
+
+        def factory() -> Any:
+            return getattr(import_module(module_path), class_name)(*args, **kwargs)
+
+        return cls(factory, class_name)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._lazy_instance is not None
+
+    def resolve(self) -> Any:
+        """Return the wrapped tool, building it if needed (thread-safe)."""
+        instance = self._lazy_instance
+        if instance is None:
+            with self._lazy_lock:
+                if self._lazy_instance is None:
+                    self._lazy_instance = self._lazy_factory()
+                instance = self._lazy_instance
+        return instance
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes the proxy itself doesn't have
+        if name.startswith("_lazy_"):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<LazyTool {self._lazy_name} ({state})>"
+
+
+def resolve_tool(tool: Any) -> Any:
+    """Return the real tool behind ``tool`` if it is a ``LazyTool``."""
+    return tool.resolve() if isinstance(tool, LazyTool) else tool
+
+
+__all__ = ["LazyTool", "resolve_tool"]
@@ -12,6 +12,8 @@ from .wrapper import (
     get_lsp_wrapper,
     shutdown_lsp_wrapper,
     get_language_from_path,
+    detect_workspace_languages,
+    prewarm_lsp_servers,
 )
 from .ls_config import Language
 from .ls import SolidLanguageServer
@@ -30,6 +32,8 @@ __all__ = [
     "get_lsp_wrapper",
     "shutdown_lsp_wrapper",
     "get_language_from_path",
+    "detect_workspace_languages",
+    "prewarm_lsp_servers",
     # Language enum
     "Language",
     # SolidLanguageServer
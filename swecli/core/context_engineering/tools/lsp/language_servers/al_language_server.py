@@ -7,6 +7,7 @@ import platform
 import stat
 import time
 import zipfile
+from collections.abc import Callable
 from pathlib import Path
 
 import requests
@@ -668,7 +669,12 @@ class ALLanguageServer(SolidLanguageServer):
         return super().is_ignored_dirname(dirname) or dirname in al_ignore_dirs
 
     @override
-    def request_full_symbol_tree(self, within_relative_path: str | None = None) -> list[UnifiedSymbolInformation]:
+    def request_full_symbol_tree(
+        self,
+        within_relative_path: str | None = None,
+        pipelined: bool = True,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> list[UnifiedSymbolInformation]:
         """
         Override to handle AL's requirement of opening files before requesting symbols.
 
@@ -685,7 +691,8 @@ class ALLanguageServer(SolidLanguageServer):
 
         Args:
             within_relative_path: Restrict search to this file or directory path
-            include_body: Whether to include symbol body content
+            pipelined: Ignored; AL files are always opened and requested one at a time
+            progress_callback: Called with (processed_files, total_files) as files are processed
 
         Returns:
             Full symbol tree with all AL symbols from opened files organized by directory
@@ -740,7 +747,9 @@ class ALLanguageServer(SolidLanguageServer):
         all_file_symbols: list[UnifiedSymbolInformation] = []
 
         file_symbol: UnifiedSymbolInformation
-        for file_path, relative_path in al_files:
+        for file_index, (file_path, relative_path) in enumerate(al_files):
+            if progress_callback is not None:
+                progress_callback(file_index, len(al_files))
             try:
                 # Use our overridden request_document_symbols which handles opening
                 log.debug(f"AL: Getting symbols for {relative_path}")
@@ -780,6 +789,9 @@ class ALLanguageServer(SolidLanguageServer):
             except Exception as e:
                 log.warning(f"AL: Failed to get symbols for {relative_path}: {e}")
 
+        if progress_callback is not None:
+            progress_callback(len(al_files), len(al_files))
+
         if all_file_symbols:
             log.debug(f"AL: Returning symbols from {len(all_file_symbols)} files")
 
@@ -8,13 +8,13 @@ import shutil
 import subprocess
 import threading
 from abc import ABC, abstractmethod
-from collections import defaultdict
-from collections.abc import Hashable, Iterator
-from contextlib import contextmanager
+from collections import defaultdict, deque
+from collections.abc import Callable, Hashable, Iterator, MutableMapping
+from contextlib import ExitStack, contextmanager
 from copy import copy
 from pathlib import Path, PurePath
 from time import sleep
-from typing import Self, Union, cast
+from typing import Any, Self, Union, cast
 
 import pathspec
 
@@ -22,7 +22,7 @@ from swecli.core.context_engineering.tools.lsp.util.compat import getstate, load
 from swecli.core.context_engineering.tools.lsp import ls_types
 from swecli.core.context_engineering.tools.lsp.ls_config import Language, LanguageServerConfig
 from swecli.core.context_engineering.tools.lsp.ls_exceptions import SolidLSPException
-from swecli.core.context_engineering.tools.lsp.ls_handler import SolidLanguageServerHandler
+from swecli.core.context_engineering.tools.lsp.ls_handler import Request, SolidLanguageServerHandler
 from swecli.core.context_engineering.tools.lsp.ls_types import UnifiedSymbolInformation
 from swecli.core.context_engineering.tools.lsp.ls_utils import FileUtils, PathUtils, TextUtils
 from swecli.core.context_engineering.tools.lsp.lsp_protocol_handler import lsp_types
@@ -42,7 +42,7 @@ from swecli.core.context_engineering.tools.lsp.lsp_protocol_handler.server impor
     StringDict,
 )
 from swecli.core.context_engineering.tools.lsp.settings import SolidLSPSettings
-from swecli.core.context_engineering.tools.lsp.util.cache import load_cache, save_cache
+from swecli.core.context_engineering.tools.lsp.util.cache import SymbolCacheStore, load_cache
 
 GenericDocumentSymbol = Union[LSPTypes.DocumentSymbol, LSPTypes.SymbolInformation, ls_types.UnifiedSymbolInformation]
 log = logging.getLogger(__name__)
@@ -88,6 +88,32 @@ class LSPFileBuffer:
         return self.contents.split("\n")
 
 
+def _cached_content_hash(cache: MutableMapping[str, tuple[str, Any]], relative_file_path: str) -> str | None:
+    """Returns the content hash of a symbol cache entry, without loading the cached symbols if possible"""
+    if isinstance(cache, SymbolCacheStore):
+        return cache.get_content_hash(relative_file_path)
+    entry = cache.get(relative_file_path)
+    return entry[0] if entry is not None else None
+
+
+@dataclasses.dataclass
+class _SymbolTreeDirectory:
+    """A directory listed for the full symbol tree, holding its non-ignored entries in listing order"""
+
+    abs_path: str
+    rel_path: str
+    entries: list[Union["_SymbolTreeDirectory", tuple[str, str]]] = dataclasses.field(default_factory=list)
+    """subdirectories and (absolute_path, relative_path) tuples of files"""
+
+    def iter_file_paths(self) -> Iterator[str]:
+        """Yields the relative paths of all files in this directory and its subdirectories"""
+        for entry in self.entries:
+            if isinstance(entry, _SymbolTreeDirectory):
+                yield from entry.iter_file_paths()
+            else:
+                yield entry[1]
+
+
 class DocumentSymbols:
     # IMPORTANT: Instances of this class are persisted in the high-level document symbol cache
 
@@ -142,10 +168,17 @@ class SolidLanguageServer(ABC):
     If the result of a language server changes in a way that affects the raw document symbols,
     the LS-specific version should be incremented instead.
     """
-    RAW_DOCUMENT_SYMBOL_CACHE_FILENAME = "raw_document_symbols.pkl"
+    RAW_DOCUMENT_SYMBOL_CACHE_FILENAME = "raw_document_symbols.db"
+    RAW_DOCUMENT_SYMBOL_CACHE_FILENAME_LEGACY_PICKLE = "raw_document_symbols.pkl"
     RAW_DOCUMENT_SYMBOL_CACHE_FILENAME_LEGACY_FALLBACK = "document_symbols_cache_v23-06-25.pkl"
     DOCUMENT_SYMBOL_CACHE_VERSION = 3
-    DOCUMENT_SYMBOL_CACHE_FILENAME = "document_symbols.pkl"
+    DOCUMENT_SYMBOL_CACHE_FILENAME = "document_symbols.db"
+    DOCUMENT_SYMBOL_CACHE_FILENAME_LEGACY_PICKLE = "document_symbols.pkl"
+    FULL_SYMBOL_TREE_MAX_IN_FLIGHT = 8
+    """
+    maximum number of documentSymbol requests kept in flight while building the full symbol tree in pipelined mode.
+    Subclasses for language servers that process requests strictly sequentially may lower this to 1.
+    """
 
     # To be overridden and extended by subclasses
     def is_ignored_dirname(self, dirname: str) -> bool:
@@ -278,14 +311,12 @@ class SolidLanguageServer(ABC):
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         # * raw document symbols cache
         self._ls_specific_raw_document_symbols_cache_version = cache_version_raw_document_symbols
-        self._raw_document_symbols_cache: dict[str, tuple[str, list[DocumentSymbol] | list[SymbolInformation] | None]] = {}
-        """maps relative file paths to a tuple of (file_content_hash, raw_root_symbols)"""
-        self._raw_document_symbols_cache_is_modified: bool = False
+        self._raw_document_symbols_cache: MutableMapping[str, tuple[str, list[DocumentSymbol] | list[SymbolInformation] | None]] = {}
+        """maps relative file paths to a tuple of (file_content_hash, raw_root_symbols); entries are loaded lazily"""
         self._load_raw_document_symbols_cache()
         # * high-level document symbols cache
-        self._document_symbols_cache: dict[str, tuple[str, DocumentSymbols]] = {}
-        """maps relative file paths to a tuple of (file_content_hash, document_symbols)"""
-        self._document_symbols_cache_is_modified: bool = False
+        self._document_symbols_cache: MutableMapping[str, tuple[str, DocumentSymbols]] = {}
+        """maps relative file paths to a tuple of (file_content_hash, document_symbols); entries are loaded lazily"""
         self._load_document_symbols_cache()
 
         self.server_started = False
@@ -954,7 +985,6 @@ class SolidLanguageServer(ABC):
 
             # update cache
             self._raw_document_symbols_cache[cache_key] = (fd.content_hash, response)
-            self._raw_document_symbols_cache_is_modified = True
 
             return response
 
@@ -1080,11 +1110,15 @@ class SolidLanguageServer(ABC):
             # update cache
             log.debug("Updating cached document symbols for %s", relative_file_path)
             self._document_symbols_cache[cache_key] = (file_data.content_hash, document_symbols)
-            self._document_symbols_cache_is_modified = True
 
             return document_symbols
 
-    def request_full_symbol_tree(self, within_relative_path: str | None = None) -> list[ls_types.UnifiedSymbolInformation]:
+    def request_full_symbol_tree(
+        self,
+        within_relative_path: str | None = None,
+        pipelined: bool = True,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> list[ls_types.UnifiedSymbolInformation]:
         """
         Will go through all files in the project or within a relative path and build a tree of symbols.
         Note: this may be slow the first time it is called, especially if `within_relative_path` is not used to restrict the search.
@@ -1099,6 +1133,11 @@ class SolidLanguageServer(ABC):
         :param within_relative_path: pass a relative path to only consider symbols within this path.
             If a file is passed, only the symbols within this file will be considered.
             If a directory is passed, all files within this directory will be considered.
+        :param pipelined: whether to list the tree once and keep up to `FULL_SYMBOL_TREE_MAX_IN_FLIGHT`
+            documentSymbol requests in flight for files whose symbols are not cached yet, before assembling the tree.
+            If False, directories are processed recursively and files are requested one at a time.
+        :param progress_callback: called with (processed_files, total_files) while document symbols are obtained
+            (pipelined mode only).
         :return: A list of root symbols representing the top-level packages/modules in the project.
         """
         if within_relative_path is not None:
@@ -1113,12 +1152,18 @@ class SolidLanguageServer(ABC):
                     root_nodes = self.request_document_symbols(within_relative_path).root_symbols
                     return root_nodes
 
+        # Start from the root or the specified directory
+        start_rel_path = within_relative_path or "."
+        if pipelined:
+            return self._request_full_symbol_tree_pipelined(start_rel_path, progress_callback)
+
         # Helper function to recursively process directories
         def process_directory(rel_dir_path: str) -> list[ls_types.UnifiedSymbolInformation]:
             abs_dir_path = self.repository_root_path if rel_dir_path == "." else os.path.join(self.repository_root_path, rel_dir_path)
             abs_dir_path = os.path.realpath(abs_dir_path)
+            rel_dir_path = str(Path(abs_dir_path).relative_to(self.repository_root_path))
 
-            if self.is_ignored_path(str(Path(abs_dir_path).relative_to(self.repository_root_path))):
+            if self.is_ignored_path(rel_dir_path):
                 log.debug("Skipping directory: %s (because it should be ignored)", rel_dir_path)
                 return []
 
@@ -1129,17 +1174,7 @@ class SolidLanguageServer(ABC):
                 return []
 
             # Create package symbol for directory
-            package_symbol = ls_types.UnifiedSymbolInformation(  # type: ignore
-                name=os.path.basename(abs_dir_path),
-                kind=ls_types.SymbolKind.Package,
-                location=ls_types.Location(
-                    uri=str(pathlib.Path(abs_dir_path).as_uri()),
-                    range={"start": {"line": 0, "character": 0}, "end": {"line": 0, "character": 0}},
-                    absolutePath=str(abs_dir_path),
-                    relativePath=str(Path(abs_dir_path).resolve().relative_to(self.repository_root_path)),
-                ),
-                children=[],
-            )
+            package_symbol = self._create_package_symbol(abs_dir_path, rel_dir_path)
             result.append(package_symbol)
 
             for contained_dir_or_file_name in contained_dir_or_file_names:
@@ -1172,53 +1207,253 @@ class SolidLanguageServer(ABC):
 
                 elif os.path.isfile(contained_dir_or_file_abs_path):
                     with self._open_file_context(contained_dir_or_file_rel_path) as file_data:
-                        document_symbols = self.request_document_symbols(contained_dir_or_file_rel_path, file_data)
-                        file_root_nodes = document_symbols.root_symbols
-
-                        # Create file symbol, link with children
-                        file_range = self._get_range_from_file_content(file_data.contents)
-                        file_symbol = ls_types.UnifiedSymbolInformation(  # type: ignore
-                            name=os.path.splitext(contained_dir_or_file_name)[0],
-                            kind=ls_types.SymbolKind.File,
-                            range=file_range,
-                            selectionRange=file_range,
-                            location=ls_types.Location(
-                                uri=str(pathlib.Path(contained_dir_or_file_abs_path).as_uri()),
-                                range=file_range,
-                                absolutePath=str(contained_dir_or_file_abs_path),
-                                relativePath=str(Path(contained_dir_or_file_abs_path).resolve().relative_to(self.repository_root_path)),
-                            ),
-                            children=file_root_nodes,
-                            parent=package_symbol,
+                        file_symbol = self._create_file_symbol(
+                            contained_dir_or_file_abs_path, contained_dir_or_file_rel_path, file_data, package_symbol
                         )
-                        for child in file_root_nodes:
-                            child["parent"] = file_symbol
 
                     # Link file symbol with package
                     package_symbol["children"].append(file_symbol)
 
-                    # TODO: Not sure if this is actually still needed given recent changes to relative path handling
-                    def fix_relative_path(nodes: list[ls_types.UnifiedSymbolInformation]) -> None:
-                        for node in nodes:
-                            if "location" in node and "relativePath" in node["location"]:
-                                path = Path(node["location"]["relativePath"])  # type: ignore
-                                if path.is_absolute():
-                                    try:
-                                        path = path.relative_to(self.repository_root_path)
-                                        node["location"]["relativePath"] = str(path)
-                                    except Exception:
-                                        pass
-                            if "children" in node:
-                                fix_relative_path(node["children"])
-
-                    fix_relative_path(file_root_nodes)
-
             return result
 
-        # Start from the root or the specified directory
-        start_rel_path = within_relative_path or "."
         return process_directory(start_rel_path)
 
+    def _create_package_symbol(self, abs_dir_path: str, rel_dir_path: str) -> ls_types.UnifiedSymbolInformation:
+        """
+        Creates the symbol of kind Package representing a directory in the full symbol tree.
+        """
+        return ls_types.UnifiedSymbolInformation(  # type: ignore
+            name=os.path.basename(abs_dir_path),
+            kind=ls_types.SymbolKind.Package,
+            location=ls_types.Location(
+                uri=str(pathlib.Path(abs_dir_path).as_uri()),
+                range={"start": {"line": 0, "character": 0}, "end": {"line": 0, "character": 0}},
+                absolutePath=str(abs_dir_path),
+                relativePath=rel_dir_path,
+            ),
+            children=[],
+        )
+
+    def _create_file_symbol(
+        self,
+        abs_file_path: str,
+        rel_file_path: str,
+        file_data: LSPFileBuffer,
+        package_symbol: ls_types.UnifiedSymbolInformation,
+    ) -> ls_types.UnifiedSymbolInformation:
+        """
+        Creates the symbol of kind File representing a file in the full symbol tree, with the file's
+        document symbols as children.
+        """
+        document_symbols = self.request_document_symbols(rel_file_path, file_data)
+        file_root_nodes = document_symbols.root_symbols
+
+        # Create file symbol, link with children
+        file_range = self._get_range_from_file_content(file_data.contents)
+        file_symbol = ls_types.UnifiedSymbolInformation(  # type: ignore
+            name=os.path.splitext(os.path.basename(abs_file_path))[0],
+            kind=ls_types.SymbolKind.File,
+            range=file_range,
+            selectionRange=file_range,
+            location=ls_types.Location(
+                uri=str(pathlib.Path(abs_file_path).as_uri()),
+                range=file_range,
+                absolutePath=str(abs_file_path),
+                relativePath=rel_file_path,
+            ),
+            children=file_root_nodes,
+            parent=package_symbol,
+        )
+        for child in file_root_nodes:
+            child["parent"] = file_symbol
+
+        # TODO: Not sure if this is actually still needed given recent changes to relative path handling
+        def fix_relative_path(nodes: list[ls_types.UnifiedSymbolInformation]) -> None:
+            for node in nodes:
+                if "location" in node and "relativePath" in node["location"]:
+                    path = Path(node["location"]["relativePath"])  # type: ignore
+                    if path.is_absolute():
+                        try:
+                            path = path.relative_to(self.repository_root_path)
+                            node["location"]["relativePath"] = str(path)
+                        except Exception:
+                            pass
+                if "children" in node:
+                    fix_relative_path(node["children"])
+
+        fix_relative_path(file_root_nodes)
+        return file_symbol
+
+    def _list_symbol_tree_directory(self, rel_dir_path: str) -> _SymbolTreeDirectory | None:
+        """
+        Lists the non-ignored directories and files below the given directory, reading each directory only once.
+        Only the start directory and symlinks are resolved; all other paths are derived from their parent's path.
+
+        :param rel_dir_path: the relative path of the directory ("." for the repository root).
+        :return: the listing, or None if the directory itself is ignored.
+        """
+        abs_dir_path = self.repository_root_path if rel_dir_path == "." else os.path.join(self.repository_root_path, rel_dir_path)
+        abs_dir_path = os.path.realpath(abs_dir_path)
+        rel_dir_path = str(Path(abs_dir_path).relative_to(self.repository_root_path))
+
+        if self.is_ignored_path(rel_dir_path):
+            log.debug("Skipping directory: %s (because it should be ignored)", rel_dir_path)
+            return None
+
+        def list_directory(directory: _SymbolTreeDirectory) -> None:
+            try:
+                entries = list(os.scandir(directory.abs_path))
+            except OSError:
+                return
+
+            for entry in entries:
+                abs_path = entry.path
+                rel_path = entry.name if directory.rel_path == "." else os.path.join(directory.rel_path, entry.name)
+                try:
+                    if entry.is_symlink():
+                        abs_path = os.path.realpath(abs_path)
+                        rel_path = str(Path(abs_path).relative_to(self.repository_root_path))
+                    is_dir = entry.is_dir()
+                    is_file = not is_dir and entry.is_file()
+                except ValueError as e:
+                    # Typically happens for symlinks pointing outside the repository root
+                    log.warning(
+                        "Skipping path %s; likely outside of the repository root %s [cause: %s]",
+                        entry.path,
+                        self.repository_root_path,
+                        e,
+                    )
+                    continue
+                except OSError:
+                    continue
+
+                if not (is_dir or is_file):
+                    continue
+                if self.is_ignored_path(rel_path):
+                    log.debug("Skipping item: %s (because it should be ignored)", rel_path)
+                    continue
+
+                if is_dir:
+                    subdirectory = _SymbolTreeDirectory(abs_path=abs_path, rel_path=rel_path)
+                    list_directory(subdirectory)
+                    directory.entries.append(subdirectory)
+                else:
+                    directory.entries.append((abs_path, rel_path))
+
+        root_directory = _SymbolTreeDirectory(abs_path=abs_dir_path, rel_path=rel_dir_path)
+        list_directory(root_directory)
+        return root_directory
+
+    def _has_cached_document_symbols(self, relative_file_path: str, content_hash: str) -> bool:
+        """
+        :return: whether the document symbols of the given file content can be obtained without querying the language server.
+        """
+        if _cached_content_hash(self._document_symbols_cache, relative_file_path) == content_hash:
+            return True
+        if _cached_content_hash(self._raw_document_symbols_cache, relative_file_path) != content_hash:
+            return False
+        raw_entry = self._raw_document_symbols_cache.get(relative_file_path)
+        # a cached None response is not treated as a cache hit by _request_document_symbols
+        return raw_entry is not None and raw_entry[0] == content_hash and raw_entry[1] is not None
+
+    def _prefetch_raw_document_symbols(
+        self, relative_file_paths: list[str], progress_callback: Callable[[int, int], None] | None
+    ) -> dict[str, LSPFileBuffer]:
+        """
+        Reads the given files and fills the raw document symbols cache for all files whose content is not cached yet,
+        keeping up to `FULL_SYMBOL_TREE_MAX_IN_FLIGHT` documentSymbol requests in flight at the same time.
+
+        :return: a mapping from relative path to a buffer holding the file's contents. The buffers are not registered
+            as open files with the language server.
+        """
+        total = len(relative_file_paths)
+        processed = 0
+        requested = 0
+        buffers: dict[str, LSPFileBuffer] = {}
+        in_flight: deque[tuple[str, Request, ExitStack]] = deque()
+        max_in_flight = max(1, self.FULL_SYMBOL_TREE_MAX_IN_FLIGHT)
+
+        def report_progress() -> None:
+            if progress_callback is not None:
+                progress_callback(processed, total)
+
+        def complete_oldest_request() -> None:
+            nonlocal processed
+            relative_file_path, request, open_file_stack = in_flight.popleft()
+            with open_file_stack:
+                response = self.server.wait_for_response(request)
+            self._raw_document_symbols_cache[relative_file_path] = (buffers[relative_file_path].content_hash, response)
+            processed += 1
+            report_progress()
+
+        report_progress()
+        try:
+            for relative_file_path in relative_file_paths:
+                absolute_file_path = str(PurePath(self.repository_root_path, relative_file_path))
+                uri = pathlib.Path(absolute_file_path).as_uri()
+                file_buffer = self.open_file_buffers.get(uri)
+                if file_buffer is None:
+                    contents = FileUtils.read_file(absolute_file_path, self._encoding)
+                    file_buffer = LSPFileBuffer(uri, contents, 0, self.language_id, 0)
+                buffers[relative_file_path] = file_buffer
+
+                if self._has_cached_document_symbols(relative_file_path, file_buffer.content_hash):
+                    processed += 1
+                    report_progress()
+                    continue
+
+                log.debug(f"Requesting document symbols for {relative_file_path} from the Language Server")
+                open_file_stack = ExitStack()
+                open_file_stack.enter_context(self.open_file(relative_file_path))
+                request = self.server.send_request_nowait("textDocument/documentSymbol", {"textDocument": {"uri": uri}})
+                in_flight.append((relative_file_path, request, open_file_stack))
+                requested += 1
+                if len(in_flight) >= max_in_flight:
+                    complete_oldest_request()
+
+            while in_flight:
+                complete_oldest_request()
+        finally:
+            for _, _, open_file_stack in in_flight:
+                open_file_stack.close()
+
+        log.info("Obtained document symbols for %d files (%d requested from the language server)", total, requested)
+        return buffers
+
+    def _request_full_symbol_tree_pipelined(
+        self, rel_dir_path: str, progress_callback: Callable[[int, int], None] | None
+    ) -> list[ls_types.UnifiedSymbolInformation]:
+        """
+        Builds the full symbol tree in three phases: the tree is listed once, the document symbols of all files
+        are obtained (from the caches or via concurrent requests), and the package and file symbols are assembled.
+        """
+        root_directory = self._list_symbol_tree_directory(rel_dir_path)
+        if root_directory is None:
+            return []
+
+        buffers = self._prefetch_raw_document_symbols(list(root_directory.iter_file_paths()), progress_callback)
+
+        def assemble(directory: _SymbolTreeDirectory) -> ls_types.UnifiedSymbolInformation:
+            package_symbol = self._create_package_symbol(directory.abs_path, directory.rel_path)
+            for entry in directory.entries:
+                if isinstance(entry, _SymbolTreeDirectory):
+                    child_symbol = assemble(entry)
+                    child_symbol["parent"] = package_symbol
+                    package_symbol["children"].append(child_symbol)
+                else:
+                    abs_file_path, rel_file_path = entry
+                    file_buffer = buffers[rel_file_path]
+                    if self._has_cached_document_symbols(rel_file_path, file_buffer.content_hash):
+                        file_symbol = self._create_file_symbol(abs_file_path, rel_file_path, file_buffer, package_symbol)
+                    else:
+                        # the language server could not provide symbols ahead of time; query it with the file opened
+                        with self._open_file_context(rel_file_path) as file_data:
+                            file_symbol = self._create_file_symbol(abs_file_path, rel_file_path, file_data, package_symbol)
+                    package_symbol["children"].append(file_symbol)
+            return package_symbol
+
+        return [assemble(root_directory)]
+
     @staticmethod
     def _get_range_from_file_content(file_content: str) -> ls_types.Range:
         """
@@ -1668,105 +1903,100 @@ class SolidLanguageServer(ABC):
         return defining_symbol
 
     def _save_raw_document_symbols_cache(self) -> None:
-        cache_file = self.cache_dir / self.RAW_DOCUMENT_SYMBOL_CACHE_FILENAME
-
-        if not self._raw_document_symbols_cache_is_modified:
-            log.debug("No changes to raw document symbols cache, skipping save")
-            return
-
-        log.info("Saving updated raw document symbols cache to %s", cache_file)
-        try:
-            save_cache(str(cache_file), self._raw_document_symbols_cache_version(), self._raw_document_symbols_cache)
-            self._raw_document_symbols_cache_is_modified = False
-        except Exception as e:
-            log.error(
-                "Failed to save raw document symbols cache to %s: %s. Note: this may have resulted in a corrupted cache file.",
-                cache_file,
-                e,
-            )
+        self._flush_symbol_cache(self._raw_document_symbols_cache, "raw document symbols")
 
     def _raw_document_symbols_cache_version(self) -> tuple[int, Hashable]:
         return (self.RAW_DOCUMENT_SYMBOLS_CACHE_VERSION, self._ls_specific_raw_document_symbols_cache_version)
 
     def _load_raw_document_symbols_cache(self) -> None:
         cache_file = self.cache_dir / self.RAW_DOCUMENT_SYMBOL_CACHE_FILENAME
+        store = self._open_symbol_cache(cache_file, self._raw_document_symbols_cache_version())
+        if store is None:
+            return
+        self._raw_document_symbols_cache = store
+        store.start_evicting_missing(self.repository_root_path, "raw document symbols")
 
-        if not cache_file.exists():
-            # check for legacy cache to load to migrate
-            legacy_cache_file = self.cache_dir / self.RAW_DOCUMENT_SYMBOL_CACHE_FILENAME_LEGACY_FALLBACK
-            if legacy_cache_file.exists():
-                try:
-                    legacy_cache: dict[
-                        str, tuple[str, tuple[list[ls_types.UnifiedSymbolInformation], list[ls_types.UnifiedSymbolInformation]]]
-                    ] = load_pickle(legacy_cache_file)
-                    log.info("Migrating legacy document symbols cache with %d entries", len(legacy_cache))
-                    num_symbols_migrated = 0
-                    migrated_cache = {}
-                    for cache_key, (file_hash, (all_symbols, root_symbols)) in legacy_cache.items():
-                        if cache_key.endswith("-True"):  # include_body=True
-                            new_cache_key = cache_key[:-5]
-                            migrated_cache[new_cache_key] = (file_hash, root_symbols)
-                            num_symbols_migrated += len(all_symbols)
-                    log.info("Migrated %d document symbols from legacy cache", num_symbols_migrated)
-                    self._raw_document_symbols_cache = migrated_cache  # type: ignore
-                    self._raw_document_symbols_cache_is_modified = True
-                    self._save_raw_document_symbols_cache()
-                    legacy_cache_file.unlink()
-                    return
-                except Exception as e:
-                    log.error("Error during cache migration: %s", e)
-                    return
-
-        # load existing cache (if any)
-        if cache_file.exists():
-            log.info("Loading document symbols cache from %s", cache_file)
+        # check for legacy caches to migrate
+        legacy_pickle_file = self.cache_dir / self.RAW_DOCUMENT_SYMBOL_CACHE_FILENAME_LEGACY_PICKLE
+        if legacy_pickle_file.exists():
+            self._migrate_pickled_symbol_cache(store, legacy_pickle_file, self._raw_document_symbols_cache_version())
+            return
+
+        legacy_cache_file = self.cache_dir / self.RAW_DOCUMENT_SYMBOL_CACHE_FILENAME_LEGACY_FALLBACK
+        if legacy_cache_file.exists():
             try:
-                saved_cache = load_cache(str(cache_file), self._raw_document_symbols_cache_version())
-                if saved_cache is not None:
-                    self._raw_document_symbols_cache = saved_cache
-                    log.info(f"Loaded {len(self._raw_document_symbols_cache)} entries from raw document symbols cache.")
+                legacy_cache: dict[
+                    str, tuple[str, tuple[list[ls_types.UnifiedSymbolInformation], list[ls_types.UnifiedSymbolInformation]]]
+                ] = load_pickle(legacy_cache_file)
+                log.info("Migrating legacy document symbols cache with %d entries", len(legacy_cache))
+                num_symbols_migrated = 0
+                for cache_key, (file_hash, (all_symbols, root_symbols)) in legacy_cache.items():
+                    if cache_key.endswith("-True"):  # include_body=True
+                        new_cache_key = cache_key[:-5]
+                        store[new_cache_key] = (file_hash, root_symbols)  # type: ignore
+                        num_symbols_migrated += len(all_symbols)
+                log.info("Migrated %d document symbols from legacy cache", num_symbols_migrated)
+                self._save_raw_document_symbols_cache()
+                legacy_cache_file.unlink()
             except Exception as e:
-                # cache can become corrupt, so just skip loading it
-                log.warning(
-                    "Failed to load raw document symbols cache from %s (%s); Ignoring cache.",
-                    cache_file,
-                    e,
-                )
+                log.error("Error during cache migration: %s", e)
 
     def _save_document_symbols_cache(self) -> None:
-        cache_file = self.cache_dir / self.DOCUMENT_SYMBOL_CACHE_FILENAME
+        self._flush_symbol_cache(self._document_symbols_cache, "document symbols")
 
-        if not self._document_symbols_cache_is_modified:
-            log.debug("No changes to document symbols cache, skipping save")
+    def _load_document_symbols_cache(self) -> None:
+        cache_file = self.cache_dir / self.DOCUMENT_SYMBOL_CACHE_FILENAME
+        store = self._open_symbol_cache(cache_file, self.DOCUMENT_SYMBOL_CACHE_VERSION)
+        if store is None:
             return
+        self._document_symbols_cache = store
+        store.start_evicting_missing(self.repository_root_path, "document symbols")
+
+        legacy_pickle_file = self.cache_dir / self.DOCUMENT_SYMBOL_CACHE_FILENAME_LEGACY_PICKLE
+        if legacy_pickle_file.exists():
+            self._migrate_pickled_symbol_cache(store, legacy_pickle_file, self.DOCUMENT_SYMBOL_CACHE_VERSION)
 
-        log.info("Saving updated document symbols cache to %s", cache_file)
+    @staticmethod
+    def _open_symbol_cache(cache_file: Path, version: Hashable) -> SymbolCacheStore | None:
         try:
-            save_cache(str(cache_file), self.DOCUMENT_SYMBOL_CACHE_VERSION, self._document_symbols_cache)
-            self._document_symbols_cache_is_modified = False
+            store = SymbolCacheStore(str(cache_file), version)
+            log.info("Opened symbol cache at %s", cache_file)
+            return store
         except Exception as e:
-            log.error(
-                "Failed to save document symbols cache to %s: %s. Note: this may have resulted in a corrupted cache file.",
-                cache_file,
-                e,
-            )
-
-    def _load_document_symbols_cache(self) -> None:
-        cache_file = self.cache_dir / self.DOCUMENT_SYMBOL_CACHE_FILENAME
-        if cache_file.exists():
-            log.info("Loading document symbols cache from %s", cache_file)
+            # cache can become corrupt, so just skip loading it
+            log.warning("Failed to open symbol cache at %s (%s); Ignoring cache.", cache_file, e)
             try:
-                saved_cache = load_cache(str(cache_file), self.DOCUMENT_SYMBOL_CACHE_VERSION)
-                if saved_cache is not None:
-                    self._document_symbols_cache = saved_cache
-                    log.info(f"Loaded {len(self._document_symbols_cache)} entries from document symbols cache.")
-            except Exception as e:
-                # cache can become corrupt, so just skip loading it
-                log.warning(
-                    "Failed to load document symbols cache from %s (%s); Ignoring cache.",
-                    cache_file,
-                    e,
-                )
+                cache_file.unlink()
+            except OSError:
+                pass
+            return None
+
+    @staticmethod
+    def _migrate_pickled_symbol_cache(store: SymbolCacheStore, legacy_pickle_file: Path, version: Hashable) -> None:
+        """
+        Imports the entries of a cache file written by previous versions, which pickled the whole cache into a single file.
+        """
+        try:
+            saved_cache = load_cache(str(legacy_pickle_file), version)
+            if saved_cache is not None:
+                store.update(saved_cache)
+                store.flush()
+                log.info("Migrated %d entries from %s", len(saved_cache), legacy_pickle_file)
+            legacy_pickle_file.unlink()
+        except Exception as e:
+            log.warning("Failed to migrate symbol cache from %s (%s); Ignoring cache.", legacy_pickle_file, e)
+
+    def _flush_symbol_cache(self, cache: MutableMapping[str, tuple[str, Any]], description: str) -> None:
+        if not isinstance(cache, SymbolCacheStore):
+            return
+        try:
+            if not cache.is_modified:
+                log.debug("No changes to %s cache, skipping save", description)
+                return
+            num_written = cache.flush()
+            log.info("Saved %d changed entries to %s cache at %s", num_written, description, cache.path)
+        except Exception as e:
+            log.error("Failed to save %s cache to %s: %s", description, cache.path, e)
 
     def save_cache(self) -> None:
         self._save_raw_document_symbols_cache()
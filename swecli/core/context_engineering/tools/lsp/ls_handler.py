@@ -71,6 +71,10 @@ class Request(ToStringMixin):
     def _tostring_includes(self) -> list[str]:
         return ["_request_id", "_status", "_method"]
 
+    @property
+    def method(self) -> str:
+        return self._method
+
     def on_result(self, params: PayloadLike) -> None:
         self._status = "completed"
         self._result_queue.put(Request.Result(payload=params))
@@ -461,6 +465,14 @@ class SolidLanguageServerHandler:
         """
         Send request to the server, register the request id, and wait for the response
         """
+        request = self.send_request_nowait(method, params)
+        return self.wait_for_response(request, params)
+
+    def send_request_nowait(self, method: str, params: dict | None = None) -> Request:
+        """
+        Send request to the server and register the request id without waiting for the response.
+        Use `wait_for_response` to obtain the result; this allows several requests to be in flight at once.
+        """
         with self._request_id_lock:
             request_id = self.request_id
             self.request_id += 1
@@ -472,7 +484,13 @@ class SolidLanguageServerHandler:
             self._pending_requests[request_id] = request
 
         self._send_payload(make_request(method, request_id, params))
+        return request
 
+    def wait_for_response(self, request: Request, params: dict | None = None) -> PayloadLike:
+        """
+        Wait for the response to a request sent with `send_request_nowait`
+        """
+        method = request.method
         self._log(f"Waiting for response to request {method} with params:\n{params}")
         result = request.get_result(timeout=self._request_timeout)
         log.debug("Completed: %s", request)
@@ -1,4 +1,9 @@
 import logging
+import os
+import pickle
+import sqlite3
+import threading
+from collections.abc import Iterator, MutableMapping
 from typing import Any, Optional
 
 from swecli.core.context_engineering.tools.lsp.util.compat import dump_pickle, load_pickle
@@ -21,3 +26,196 @@ def load_cache(path: str, version: Any) -> Optional[Any]:
 def save_cache(path: str, version: Any, obj: Any) -> None:
     data = {"__cache_version": version, "obj": obj}
     dump_pickle(data, path)
+
+
+class SymbolCacheStore(MutableMapping[str, tuple[str, Any]]):
+    """
+    Persistent mapping from relative file paths to (content_hash, value) tuples, stored in SQLite with one row per file.
+
+    Values are unpickled lazily when a path is first accessed, so opening the store costs the same regardless of its size.
+    Changes are kept in memory and `flush` writes back only the rows that were set or deleted since the last flush.
+    The database file is memory-mapped, so reads of hot pages do not go through the read() syscall.
+    If the stored version differs from the given version, all entries are discarded.
+    """
+
+    MMAP_SIZE = 256 * 1024 * 1024
+    EVICT_BATCH_SIZE = 500
+    EVICT_BATCH_PAUSE_SECONDS = 0.001
+
+    def __init__(self, path: str, version: Any) -> None:
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute(f"PRAGMA mmap_size = {self.MMAP_SIZE}")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS entries (path TEXT PRIMARY KEY, content_hash TEXT NOT NULL, value BLOB NOT NULL)")
+        self._check_version(repr(version))
+
+        self._loaded: dict[str, tuple[str, Any]] = {}
+        """entries that were read or set since the store was opened"""
+        self._dirty: set[str] = set()
+        self._deleted: set[str] = set()
+        self._closed = threading.Event()
+        self._evictor: threading.Thread | None = None
+
+    def _check_version(self, version: str) -> None:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row is not None and row[0] == version:
+            return
+        if row is not None:
+            log.info("Cache is outdated (expected version %s, got %s). Clearing cache at %s", version, row[0], self.path)
+        with self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.execute("DELETE FROM entries")
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (version,))
+
+    @property
+    def is_modified(self) -> bool:
+        """Whether there are changes that have not been flushed yet"""
+        return bool(self._dirty or self._deleted)
+
+    def get_content_hash(self, path: str) -> str | None:
+        """
+        :return: the content hash stored for the given path (without unpickling its value), or None if there is no entry.
+        """
+        with self._lock:
+            if path in self._loaded:
+                return self._loaded[path][0]
+            if path in self._deleted:
+                return None
+            row = self._conn.execute("SELECT content_hash FROM entries WHERE path = ?", (path,)).fetchone()
+            return row[0] if row is not None else None
+
+    def __getitem__(self, path: str) -> tuple[str, Any]:
+        with self._lock:
+            entry = self._loaded.get(path)
+            if entry is not None:
+                return entry
+            if path in self._deleted:
+                raise KeyError(path)
+            row = self._conn.execute("SELECT content_hash, value FROM entries WHERE path = ?", (path,)).fetchone()
+            if row is None:
+                raise KeyError(path)
+            try:
+                entry = (row[0], pickle.loads(row[1]))
+            except Exception as e:
+                # a corrupt entry is treated as missing and removed on the next flush
+                log.warning("Failed to load cache entry for %s from %s (%s); ignoring it.", path, self.path, e)
+                self._deleted.add(path)
+                raise KeyError(path) from e
+            self._loaded[path] = entry
+            return entry
+
+    def __setitem__(self, path: str, entry: tuple[str, Any]) -> None:
+        with self._lock:
+            self._loaded[path] = entry
+            self._dirty.add(path)
+            self._deleted.discard(path)
+
+    def __delitem__(self, path: str) -> None:
+        with self._lock:
+            if path not in self:
+                raise KeyError(path)
+            self._loaded.pop(path, None)
+            self._dirty.discard(path)
+            self._deleted.add(path)
+
+    def __contains__(self, path: object) -> bool:
+        if not isinstance(path, str):
+            return False
+        with self._lock:
+            return path in self._loaded or self.get_content_hash(path) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            stored = [row[0] for row in self._conn.execute("SELECT path FROM entries")]
+            paths = (set(stored) | set(self._loaded)) - self._deleted
+        return iter(sorted(paths))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def flush(self) -> int:
+        """
+        Writes all changes since the last flush to disk in a single transaction.
+
+        :return: the number of rows written or deleted.
+        """
+        with self._lock:
+            if not self.is_modified:
+                return 0
+            rows = [
+                (path, self._loaded[path][0], pickle.dumps(self._loaded[path][1], protocol=pickle.HIGHEST_PROTOCOL))
+                for path in self._dirty
+            ]
+            with self._conn:
+                self._conn.execute("BEGIN")
+                self._conn.executemany("INSERT OR REPLACE INTO entries (path, content_hash, value) VALUES (?, ?, ?)", rows)
+                self._conn.executemany("DELETE FROM entries WHERE path = ?", [(path,) for path in self._deleted])
+            num_changes = len(self._dirty) + len(self._deleted)
+            self._dirty.clear()
+            self._deleted.clear()
+            return num_changes
+
+    def evict_missing(self, root_path: str) -> int:
+        """
+        Removes the entries of files that no longer exist below the given root directory.
+
+        This stats every cached file. The stored paths are listed through a separate connection and the lock is only
+        held to remove the missing entries, so lookups are not blocked meanwhile. Entries set while the files are
+        checked are kept.
+
+        :return: the number of evicted entries.
+        """
+        conn = sqlite3.connect(self.path)
+        try:
+            paths = [row[0] for row in conn.execute("SELECT path FROM entries")]
+        finally:
+            conn.close()
+        missing = []
+        for i, path in enumerate(paths):
+            # Pausing between batches lets other threads (e.g. lookups) take the GIL
+            if i % self.EVICT_BATCH_SIZE == 0 and i and self._closed.wait(self.EVICT_BATCH_PAUSE_SECONDS):
+                break
+            if not os.path.isfile(os.path.join(root_path, path)):
+                missing.append(path)
+        with self._lock:
+            if self._closed.is_set():
+                return 0
+            evicted = [path for path in missing if path not in self._dirty and path not in self._deleted]
+            for path in evicted:
+                self._loaded.pop(path, None)
+            self._deleted.update(evicted)
+            return len(evicted)
+
+    def start_evicting_missing(self, root_path: str, description: str) -> threading.Thread:
+        """
+        Runs `evict_missing` on a background thread, so that opening the store does not wait for every cached
+        file to be stat-ed. The evicted entries are removed from disk by the next flush.
+        """
+
+        def evict() -> None:
+            try:
+                num_evicted = self.evict_missing(root_path)
+                if num_evicted:
+                    log.info("Evicted %d entries of deleted files from the %s cache", num_evicted, description)
+            except Exception as e:
+                log.warning("Failed to evict deleted files from the %s cache (%s)", description, e)
+
+        self._evictor = threading.Thread(target=evict, name="symbol-cache-evict", daemon=True)
+        self._evictor.start()
+        return self._evictor
+
+    def wait_for_eviction(self, timeout: float | None = None) -> None:
+        """Waits for a background eviction started by `start_evicting_missing` to finish."""
+        if self._evictor is not None:
+            self._evictor.join(timeout)
+
+    def close(self) -> None:
+        self._closed.set()
+        self.wait_for_eviction()
+        with self._lock:
+            self._conn.close()
@@ -8,12 +8,16 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Any
 
 from swecli.core.context_engineering.tools.lsp import ls_types
 from swecli.core.context_engineering.tools.lsp.ls import SolidLanguageServer
-from swecli.core.context_engineering.tools.lsp.ls_config import Language
+from swecli.core.context_engineering.tools.lsp.ls_config import Language, LanguageServerConfig
 from swecli.core.context_engineering.tools.lsp.settings import SolidLSPSettings
 
 from .symbol import Symbol, SymbolKind
@@ -88,27 +92,74 @@ def get_language_from_path(file_path: str | Path) -> Language | None:
     return _EXTENSION_TO_LANGUAGE.get(ext)
 
 
+# Languages that are never booted ahead of time; their servers start on first use
+_NO_PREWARM_LANGUAGES = frozenset({Language.MARKDOWN, Language.YAML})
+
+# Pooled servers are keyed by the resolved workspace root they run in and their language
+_PoolKey = tuple[Path, Language]
+
+
+def detect_workspace_languages(workspace_root: str | Path, min_files: int = 1) -> list[Language]:
+    """Detect the languages used in a workspace from its file extensions.
+
+    Args:
+        workspace_root: Root directory of the workspace
+        min_files: Minimum number of files for a language to be reported
+
+    Returns:
+        Languages ordered by number of files, most common first
+    """
+    from swecli.core.context_engineering.retrieval.workspace_catalog import get_workspace_catalog
+
+    counts: Counter[Language] = Counter()
+    for rel_path in get_workspace_catalog(Path(workspace_root)).files():
+        language = _EXTENSION_TO_LANGUAGE.get(os.path.splitext(rel_path)[1].lower())
+        if language is not None:
+            counts[language] += 1
+    return [language for language, count in counts.most_common() if count >= min_files]
+
+
 class LSPServerWrapper:
     """Wrapper adapting solidlsp to our symbol tools API.
 
     This class manages SolidLanguageServer instances and provides
     methods that match our existing SymbolRetriever interface.
+
+    Servers are pooled per (workspace root, language). Each server boots on a background
+    thread (at most ``max_concurrent_boots`` at a time) behind a future, so
+    callers that arrive while a server is booting wait for it instead of
+    starting a second one. Servers unused for ``idle_ttl`` seconds are
+    stopped. Changing ``workspace_root`` leaves running servers alone; files
+    under a root that already has a server keep using it, and servers for a
+    root that is no longer used age out through the idle TTL.
     """
 
     def __init__(
         self,
         workspace_root: str | Path | None = None,
         settings: SolidLSPSettings | None = None,
+        max_concurrent_boots: int = 2,
+        idle_ttl: float | None = 900.0,
     ) -> None:
         """Initialize the wrapper.
 
         Args:
             workspace_root: Root directory of the workspace
             settings: Optional solidlsp settings
+            max_concurrent_boots: Maximum number of servers booting at the same time
+            idle_ttl: Seconds after which an unused server is stopped (None or 0 keeps servers running)
         """
         self._workspace_root = Path(workspace_root) if workspace_root else Path.cwd()
         self._settings = settings or SolidLSPSettings()
-        self._servers: dict[Language, SolidLanguageServer] = {}
+        self.max_concurrent_boots = max(1, max_concurrent_boots)
+        self.idle_ttl = idle_ttl
+        self._servers: dict[_PoolKey, Future[SolidLanguageServer | None]] = {}
+        self._last_used: dict[_PoolKey, float] = {}
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._reaper: threading.Thread | None = None
+        self._closed = threading.Event()
+        self._stats = {"hits": 0, "waits": 0, "misses": 0}
 
     @property
     def workspace_root(self) -> Path:
@@ -120,34 +171,193 @@ class LSPServerWrapper:
         """Set the workspace root directory."""
         self._workspace_root = Path(value)
 
-    def get_server(self, language: Language) -> SolidLanguageServer | None:
+    @property
+    def stats(self) -> dict[str, int]:
+        """Counts of server lookups that found a ready server (hits), waited
+        for a booting one (waits) or had to boot one (misses)."""
+        with self._lock:
+            return dict(self._stats)
+
+    def _pool_key(self, language: Language, root: Path | None = None) -> _PoolKey:
+        return (Path(root or self._workspace_root).resolve(), language)
+
+    def _root_for_file(self, path: Path, language: Language) -> Path:
+        """Pick the root whose server should handle ``path``.
+
+        Prefers the outermost pooled root containing the file, so a lookup in a
+        subdirectory reuses the project's server instead of booting another one.
+        """
+        with self._lock:
+            roots = [
+                root
+                for root, pooled_language in self._servers
+                if pooled_language == language and path.is_relative_to(root)
+            ]
+        if roots:
+            return min(roots, key=lambda root: len(root.parts))
+        return self._workspace_root.resolve()
+
+    def _boot_server(self, key: _PoolKey) -> SolidLanguageServer | None:
+        """Create and start a language server; runs on the boot executor."""
+        root, language = key
+        started = time.perf_counter()
+        try:
+            server = SolidLanguageServer.create(
+                LanguageServerConfig(code_language=language),
+                str(root),
+                solidlsp_settings=self._settings,
+            )
+            server.start()
+        except Exception as e:
+            logger.warning(f"Failed to create {language.name} server: {e}")
+            return None
+        elapsed = time.perf_counter() - started
+        if self._closed.is_set():
+            server.stop()
+            return None
+        logger.debug(f"Booted {language.name} language server in {elapsed:.2f}s")
+        return server
+
+    def _submit_boot(self, key: _PoolKey) -> Future[SolidLanguageServer | None]:
+        """Start booting a server for ``key``; the caller holds ``_lock``."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrent_boots, thread_name_prefix="lsp-boot"
+            )
+        future = self._executor.submit(self._boot_server, key)
+        self._servers[key] = future
+        self._last_used[key] = time.monotonic()
+        self._ensure_reaper()
+        return future
+
+    def get_server(self, language: Language, root: Path | None = None) -> SolidLanguageServer | None:
         """Get or create a language server for the specified language.
 
+        If the server is still booting, waits for it to become ready.
+
         Args:
             language: Language enum
+            root: Workspace root the server runs in (defaults to ``workspace_root``)
 
         Returns:
             SolidLanguageServer instance or None if creation fails
         """
-        if language in self._servers:
-            server = self._servers[language]
-            if server.is_running():
-                return server
-            # Server died, remove it
-            del self._servers[language]
+        key = self._pool_key(language, root)
+        with self._lock:
+            future = self._servers.get(key)
+            if future is not None and future.done():
+                server = None if future.cancelled() else future.result()
+                if server is not None and server.is_running():
+                    self._stats["hits"] += 1
+                    self._last_used[key] = time.monotonic()
+                    logger.debug(f"LSP pool hit for {language.name} ({self._stats})")
+                    return server
+                # Server died or failed to boot; boot a new one
+                future = None
+            if future is None:
+                self._stats["misses"] += 1
+                logger.debug(f"LSP pool miss for {language.name}, booting ({self._stats})")
+                future = self._submit_boot(key)
+            else:
+                self._stats["waits"] += 1
+                logger.debug(f"Waiting for {language.name} language server to boot ({self._stats})")
+
+        waited = time.perf_counter()
+        try:
+            server = future.result()
+        except CancelledError:
+            # The wrapper was shut down while the server was booting
+            return None
+        with self._lock:
+            self._last_used[key] = time.monotonic()
+        logger.debug(f"{language.name} language server ready after {time.perf_counter() - waited:.2f}s")
+        return server
 
+    def prewarm(self, languages: list[Language] | None = None, max_languages: int | None = None) -> list[Language]:
+        """Boot servers in the background before the first tool call needs them.
+
+        Args:
+            languages: Languages to boot; detected from the workspace if None
+            max_languages: Boot at most this many languages (most files first)
+
+        Returns:
+            The languages whose servers were submitted for booting
+        """
+        if languages is None:
+            languages = [
+                language
+                for language in detect_workspace_languages(self._workspace_root)
+                if language not in _NO_PREWARM_LANGUAGES
+            ]
+        if max_languages is not None:
+            languages = languages[:max_languages]
+
+        submitted = []
+        with self._lock:
+            for language in languages:
+                key = self._pool_key(language)
+                if key not in self._servers:
+                    self._submit_boot(key)
+                    submitted.append(language)
+        if submitted:
+            logger.debug(f"Pre-warming language servers: {', '.join(lang.name for lang in submitted)}")
+        return submitted
+
+    def _ensure_reaper(self) -> None:
+        """Start the idle-server reaper thread; the caller holds ``_lock``."""
+        if not self.idle_ttl or self._reaper is not None:
+            return
+        self._reaper = threading.Thread(target=self._reap_idle_servers, name="lsp-reaper", daemon=True)
+        self._reaper.start()
+
+    def _reap_idle_servers(self) -> None:
+        while not self._closed.wait(timeout=min(60.0, max(1.0, (self.idle_ttl or 60.0) / 4))):
+            self.stop_idle_servers()
+
+    def stop_idle_servers(self) -> list[Language]:
+        """Stop servers that have not been used for longer than ``idle_ttl``.
+
+        Returns:
+            The languages whose servers were stopped
+        """
+        if not self.idle_ttl:
+            return []
+        now = time.monotonic()
+        idle = []
+        with self._lock:
+            for key, future in list(self._servers.items()):
+                if future.done() and now - self._last_used.get(key, now) > self.idle_ttl:
+                    idle.append((key, self._servers.pop(key)))
+                    self._last_used.pop(key, None)
+        for (root, language), future in idle:
+            logger.debug(f"Stopping {language.name} language server for {root} after {self.idle_ttl:.0f}s idle")
+            self._stop_server(language, future)
+        return [language for (_, language), _ in idle]
+
+    @staticmethod
+    def _stop_server(language: Language, future: Future[SolidLanguageServer | None]) -> None:
+        if not future.done() or future.cancelled():
+            return
+        server = future.result()
+        if server is None:
+            return
         try:
-            server = SolidLanguageServer.create(
-                language=language,
-                repository_root_path=str(self._workspace_root),
-                settings=self._settings,
-            )
-            server.start()
-            self._servers[language] = server
-            return server
+            server.save_cache()
+            server.stop()
         except Exception as e:
-            logger.warning(f"Failed to create {language.name} server: {e}")
-            return None
+            logger.warning(f"Failed to stop {language} server: {e}")
+
+    def _stop_servers(self) -> None:
+        """Stop all pooled servers, waiting for any that are still booting."""
+        with self._lock:
+            servers = list(self._servers.items())
+            self._servers.clear()
+            self._last_used.clear()
+        for (_, language), future in servers:
+            if not future.cancel():
+                # Already booting; wait for it so the process can be stopped
+                wait([future])
+            self._stop_server(language, future)
 
     def get_server_for_file(self, file_path: str | Path) -> SolidLanguageServer | None:
         """Get a language server for the specified file.
@@ -158,11 +368,16 @@ class LSPServerWrapper:
         Returns:
             SolidLanguageServer instance or None
         """
-        language = get_language_from_path(file_path)
+        return self._server_for_file(Path(file_path).resolve())[0]
+
+    def _server_for_file(self, path: Path) -> tuple[SolidLanguageServer | None, Path]:
+        """Get the server for an absolute ``path`` together with the root it runs in."""
+        language = get_language_from_path(path)
         if language is None:
-            logger.debug(f"No language server for {file_path}")
-            return None
-        return self.get_server(language)
+            logger.debug(f"No language server for {path}")
+            return None, self._workspace_root
+        root = self._root_for_file(path, language)
+        return self.get_server(language, root), root
 
     def get_document_symbols(self, file_path: str | Path) -> list[Symbol]:
         """Get all symbols in a document.
@@ -174,13 +389,13 @@ class LSPServerWrapper:
             List of Symbol objects
         """
         path = Path(file_path).resolve()
-        server = self.get_server_for_file(path)
+        server, root = self._server_for_file(path)
         if server is None:
             return []
 
-        # Get relative path from workspace root
+        # Get relative path from the server's root
         try:
-            relative_path = path.relative_to(self._workspace_root)
+            relative_path = path.relative_to(root)
         except ValueError:
             relative_path = path
 
@@ -208,12 +423,12 @@ class LSPServerWrapper:
             List of reference locations
         """
         path = Path(file_path).resolve()
-        server = self.get_server_for_file(path)
+        server, root = self._server_for_file(path)
         if server is None:
             return []
 
         try:
-            relative_path = path.relative_to(self._workspace_root)
+            relative_path = path.relative_to(root)
         except ValueError:
             relative_path = path
 
@@ -250,12 +465,12 @@ class LSPServerWrapper:
             List of definition locations
         """
         path = Path(file_path).resolve()
-        server = self.get_server_for_file(path)
+        server, root = self._server_for_file(path)
         if server is None:
             return []
 
         try:
-            relative_path = path.relative_to(self._workspace_root)
+            relative_path = path.relative_to(root)
         except ValueError:
             relative_path = path
 
@@ -292,12 +507,12 @@ class LSPServerWrapper:
             Dict mapping file paths to text edits, or None if failed
         """
         path = Path(file_path).resolve()
-        server = self.get_server_for_file(path)
+        server, root = self._server_for_file(path)
         if server is None:
             return None
 
         try:
-            relative_path = path.relative_to(self._workspace_root)
+            relative_path = path.relative_to(root)
         except ValueError:
             relative_path = path
 
@@ -339,12 +554,18 @@ class LSPServerWrapper:
 
     def shutdown(self) -> None:
         """Shutdown all running language servers."""
-        for language, server in list(self._servers.items()):
-            try:
-                server.stop()
-            except Exception as e:
-                logger.warning(f"Failed to stop {language} server: {e}")
-            del self._servers[language]
+        self._closed.set()
+        self._stop_servers()
+        with self._lock:
+            executor, self._executor = self._executor, None
+            reaper, self._reaper = self._reaper, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if reaper is not None:
+            reaper.join(timeout=1.0)
+        # The wrapper can be used again; servers boot on demand
+        self._closed.clear()
+        logger.debug(f"LSP pool stats at shutdown: {self.stats}")
 
     def _convert_unified_symbols(
         self,
@@ -469,3 +690,34 @@ def shutdown_lsp_wrapper() -> None:
     if _wrapper is not None:
         _wrapper.shutdown()
         _wrapper = None
+
+
+def prewarm_lsp_servers(
+    workspace_root: str | Path,
+    max_languages: int = 3,
+    max_concurrent_boots: int = 2,
+    idle_ttl: float | None = 900.0,
+) -> list[Language]:
+    """Configure the global LSP wrapper and boot servers for the workspace's languages.
+
+    Returns immediately; servers boot in the background.
+
+    Args:
+        workspace_root: Root directory of the workspace
+        max_languages: Boot servers for at most this many languages
+        max_concurrent_boots: Maximum number of servers booting at the same time
+        idle_ttl: Seconds after which an unused server is stopped
+
+    Returns:
+        The languages whose servers were submitted for booting
+    """
+    wrapper = get_lsp_wrapper(workspace_root)
+    wrapper.max_concurrent_boots = max(1, max_concurrent_boots)
+    wrapper.idle_ttl = idle_ttl
+    if max_languages <= 0:
+        return []
+    try:
+        return wrapper.prewarm(max_languages=max_languages)
+    except Exception as e:
+        logger.warning(f"Failed to pre-warm language servers: {e}")
+        return []
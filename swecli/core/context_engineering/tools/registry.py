@@ -25,18 +25,22 @@ if TYPE_CHECKING:
     from swecli.core.skills import SkillLoader
 
 logger = logging.getLogger(__name__)
-from swecli.core.context_engineering.tools.implementations.pdf_tool import PDFTool
 from swecli.core.context_engineering.tools.implementations.task_complete_tool import (
     TaskCompleteTool,
 )
-from swecli.core.context_engineering.tools.symbol_tools import (
-    handle_find_symbol,
-    handle_find_referencing_symbols,
-    handle_insert_before_symbol,
-    handle_insert_after_symbol,
-    handle_replace_symbol_body,
-    handle_rename_symbol,
-)
+from swecli.core.context_engineering.tools.lazy_tool import LazyTool
+
+
+def _symbol_tool(handler_name: str) -> Any:
+    """Handler that imports the LSP-backed symbol tools on first call."""
+
+    def handler(args: dict[str, Any]) -> dict[str, Any]:
+        from swecli.core.context_engineering.tools import symbol_tools
+
+        return getattr(symbol_tools, handler_name)(args)
+
+    return handler
+
 
 _PLAN_READ_ONLY_TOOLS = {
     "read_file",
@@ -65,7 +69,12 @@ _PLAN_READ_ONLY_TOOLS = {
 
 
 class ToolRegistry:
-    """Dispatches tool invocations to dedicated handlers."""
+    """Dispatches tool invocations to dedicated handlers.
+
+    Tools with heavy dependencies (web, PDF, VLM) may be passed as
+    :class:`LazyTool` proxies, and the LSP symbol tools are imported on their
+    first call, so building a registry doesn't import them.
+    """
 
     def __init__(
         self,
@@ -104,7 +113,9 @@ class ToolRegistry:
         self._screenshot_handler = ScreenshotToolHandler()
         self.todo_handler = TodoHandler()
         self.thinking_handler = ThinkingHandler()
-        self._pdf_tool = PDFTool()
+        self._pdf_tool = LazyTool.from_path(
+            "swecli.core.context_engineering.tools.implementations.pdf_tool:PDFTool"
+        )
         self._task_complete_tool = TaskCompleteTool()
         self._subagent_manager: Union[Any, None] = None
         self._skill_loader: Union["SkillLoader", None] = None
@@ -144,12 +155,12 @@ class ToolRegistry:
             "complete_todo": self._complete_todo,
             "list_todos": lambda args, ctx=None: self.todo_handler.list_todos(),
             # Symbol tools (LSP-based)
-            "find_symbol": lambda args: handle_find_symbol(args),
-            "find_referencing_symbols": lambda args: handle_find_referencing_symbols(args),
-            "insert_before_symbol": lambda args: handle_insert_before_symbol(args),
-            "insert_after_symbol": lambda args: handle_insert_after_symbol(args),
-            "replace_symbol_body": lambda args: handle_replace_symbol_body(args),
-            "rename_symbol": lambda args: handle_rename_symbol(args),
+            "find_symbol": _symbol_tool("handle_find_symbol"),
+            "find_referencing_symbols": _symbol_tool("handle_find_referencing_symbols"),
+            "insert_before_symbol": _symbol_tool("handle_insert_before_symbol"),
+            "insert_after_symbol": _symbol_tool("handle_insert_after_symbol"),
+            "replace_symbol_body": _symbol_tool("handle_replace_symbol_body"),
+            "rename_symbol": _symbol_tool("handle_rename_symbol"),
             # Subagent spawning tool
             "spawn_subagent": self._execute_spawn_subagent,
             # Get output from background subagent
@@ -558,7 +569,7 @@ class ToolRegistry:
         """Execute the read_pdf tool to extract text from a PDF file.
 
         Args:
-            arguments: Dict with 'file_path' key
+            arguments: Dict with 'file_path' and optional 'pages' / 'section' keys
 
         Returns:
             Result with extracted text content and metadata
@@ -571,7 +582,11 @@ class ToolRegistry:
                 "output": None,
             }
 
-        result = self._pdf_tool.extract_text(file_path)
+        result = self._pdf_tool.extract_text(
+            file_path,
+            pages=arguments.get("pages"),
+            section=arguments.get("section"),
+        )
 
         if result.get("success"):
             # Format output for display
@@ -587,6 +602,10 @@ class ToolRegistry:
                 if metadata.get("author"):
                     output_parts.append(f"Author: {metadata['author']}")
             output_parts.append(f"Pages: {page_count}")
+            if result.get("section"):
+                output_parts.append(f"Section: {result['section']}")
+            if result.get("pages"):
+                output_parts.append(f"Showing pages: {result['pages']}")
             if sections:
                 output_parts.append(f"Detected sections: {len(sections)}")
                 section_titles = [s.get("title", "") for s in sections[:10]]
@@ -0,0 +1,247 @@
+"""Size-capped, tail-seekable output storage for background tasks.
+
+Output is appended to ``<id>.output`` and rotated logrotate-style into
+``<id>.output.1``, ``<id>.output.2``, ... (higher is older) once a segment
+reaches ``segment_bytes``; the oldest segment is deleted beyond
+``max_segments``. The most recent lines are also kept in an in-memory ring
+buffer, so the common "show me the last 100 lines" request never touches
+disk, and larger tail/range reads seek backwards from the end of the newest
+segment instead of reading the whole log.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from collections import deque
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+DEFAULT_SEGMENT_BYTES = 8 * 1024 * 1024
+DEFAULT_MAX_SEGMENTS = 8
+DEFAULT_RING_LINES = 2000
+
+_READ_BLOCK = 64 * 1024
+
+
+def _decode_line(raw: bytes) -> str:
+    """Decode one stored line, dropping the PTY's trailing carriage return."""
+    return raw.rstrip(b"\r").decode("utf-8", errors="replace")
+
+
+class TaskOutputStore:
+    """Append-only output log for one task, rotated into capped segments."""
+
+    def __init__(
+        self,
+        path: Path,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        max_segments: int = DEFAULT_MAX_SEGMENTS,
+        ring_lines: int = DEFAULT_RING_LINES,
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            path: Path of the newest segment (rotated segments get a numeric suffix)
+            segment_bytes: Rotate once the newest segment reaches this size
+            max_segments: Number of segments kept on disk, including the newest
+            ring_lines: Number of recent complete lines kept in memory
+        """
+        self.path = path
+        self.segment_bytes = max(1, segment_bytes)
+        self.max_segments = max(1, max_segments)
+        self.dropped_bytes = 0
+
+        self._lock = threading.Lock()
+        self._file: Optional[BinaryIO] = None
+        self._segment_size = 0
+        self._dirty = False
+        self._ring: deque[str] = deque(maxlen=max(0, ring_lines))
+        self._lines_seen = 0
+        self._partial = b""
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def append(self, data: bytes) -> None:
+        """Append raw output bytes.
+
+        Writes are not flushed per chunk; readers flush pending data first.
+        """
+        if not data:
+            return
+        with self._lock:
+            self._update_ring(data)
+            view = memoryview(data)
+            while view:
+                if self._file is None:
+                    self._open_segment()
+                elif self._segment_size >= self.segment_bytes:
+                    self._rotate()
+                room = self.segment_bytes - self._segment_size
+                chunk = view[:room]
+                self._file.write(chunk)
+                self._segment_size += len(chunk)
+                view = view[len(chunk):]
+            self._dirty = True
+
+    def close(self) -> None:
+        """Flush and close the newest segment (it can still be read)."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                self._dirty = False
+
+    def _update_ring(self, data: bytes) -> None:
+        pieces = (self._partial + data).split(b"\n")
+        self._partial = pieces.pop()
+        self._lines_seen += len(pieces)
+        if self._ring.maxlen:
+            for raw in pieces[-self._ring.maxlen:]:
+                self._ring.append(_decode_line(raw))
+
+    def _open_segment(self) -> None:
+        self._file = open(self.path, "ab")
+        self._segment_size = self._file.tell()
+
+    def _rotate(self) -> None:
+        self._file.close()
+        self._file = None
+        oldest = self._segment_path(self.max_segments - 1)
+        if self.max_segments == 1:
+            self.dropped_bytes += self._segment_size
+            self.path.unlink(missing_ok=True)
+        else:
+            if oldest.exists():
+                self.dropped_bytes += oldest.stat().st_size
+                oldest.unlink()
+            for index in range(self.max_segments - 2, -1, -1):
+                source = self._segment_path(index)
+                if source.exists():
+                    os.replace(source, self._segment_path(index + 1))
+        self._open_segment()
+
+    def _segment_path(self, index: int) -> Path:
+        return self.path if index == 0 else self.path.with_name(f"{self.path.name}.{index}")
+
+    def segment_paths(self) -> List[Path]:
+        """Return existing segment files, newest first."""
+        paths = []
+        for index in range(self.max_segments):
+            segment = self._segment_path(index)
+            if segment.exists():
+                paths.append(segment)
+        return paths
+
+    def _flush(self) -> None:
+        if self._dirty and self._file is not None:
+            self._file.flush()
+            self._dirty = False
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def tail(self, lines: int = 100, skip: int = 0) -> List[str]:
+        """Return ``lines`` lines ending ``skip`` lines before the end of the output.
+
+        ``skip`` pages backwards through the log: ``tail(100, skip=100)``
+        returns the 100 lines before the last 100. A trailing partial line
+        (no newline yet) counts as the last line.
+        """
+        if lines <= 0:
+            return []
+        with self._lock:
+            needed = lines + skip
+            recent = list(self._ring)
+            if self._partial:
+                recent.append(_decode_line(self._partial))
+            if needed <= len(recent) or self._lines_seen <= len(self._ring):
+                end = len(recent) - skip
+                return recent[max(0, end - lines):max(0, end)]
+            self._flush()
+            all_lines = self._read_tail_lines(needed)
+        end = len(all_lines) - skip
+        return all_lines[max(0, end - lines):max(0, end)]
+
+    def read_all(self) -> str:
+        """Return all retained output (every segment still on disk)."""
+        with self._lock:
+            self._flush()
+            chunks = [segment.read_bytes() for segment in reversed(self.segment_paths())]
+        return b"".join(chunks).decode("utf-8", errors="replace")
+
+    def grep(
+        self,
+        pattern: str,
+        max_matches: int = 100,
+        ignore_case: bool = False,
+    ) -> List[Tuple[int, str]]:
+        """Return the last ``max_matches`` lines matching a regex.
+
+        Line numbers are 1-based within the retained output (rotated-out
+        segments are not counted).
+
+        Raises:
+            re.error: If ``pattern`` is not a valid regular expression
+        """
+        regex = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+        matches: deque[Tuple[int, str]] = deque(maxlen=max(1, max_matches))
+        with self._lock:
+            self._flush()
+            segments = list(reversed(self.segment_paths()))
+        for number, line in enumerate(self._iter_lines(segments), start=1):
+            if regex.search(line):
+                matches.append((number, line))
+        return list(matches)
+
+    def _read_tail_lines(self, needed: int) -> List[str]:
+        """Read backwards across segments until ``needed`` lines are covered."""
+        blocks: List[bytes] = []
+        newlines = 0
+        ends_with_newline: Optional[bool] = None
+        for segment in self.segment_paths():
+            with open(segment, "rb") as handle:
+                position = handle.seek(0, os.SEEK_END)
+                while position > 0 and newlines <= needed:
+                    size = min(_READ_BLOCK, position)
+                    position -= size
+                    handle.seek(position)
+                    block = handle.read(size)
+                    if ends_with_newline is None:
+                        ends_with_newline = block.endswith(b"\n")
+                    newlines += block.count(b"\n")
+                    blocks.append(block)
+            if newlines > needed:
+                break
+        data = b"".join(reversed(blocks))
+        if ends_with_newline:
+            data = data[:-1]
+        return [_decode_line(raw) for raw in data.split(b"\n")] if data else []
+
+    @staticmethod
+    def _iter_lines(segments: List[Path]) -> Iterator[str]:
+        """Stream lines across segments (oldest first) without loading them whole."""
+        carry = b""
+        for segment in segments:
+            try:
+                handle = open(segment, "rb")
+            except FileNotFoundError:
+                continue  # Rotated away while we were reading
+            with handle:
+                while True:
+                    block = handle.read(_READ_BLOCK)
+                    if not block:
+                        break
+                    pieces = (carry + block).split(b"\n")
+                    carry = pieces.pop()
+                    for raw in pieces:
+                        yield _decode_line(raw)
+        if carry:
+            yield _decode_line(carry)
+
+
+__all__ = ["TaskOutputStore"]
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
+from typing import Callable
 
 from .exceptions import SessionDoesNotExistError, SessionExistsError
 from .models import (
@@ -34,7 +35,8 @@ class LocalRuntime:
     """Local runtime that manages bash sessions and file operations.
 
     This runs inside the Docker container and provides the actual
-    execution capabilities.
+    execution capabilities. Sessions don't block the event loop, so commands
+    in different sessions run concurrently.
     """
 
     def __init__(self):
@@ -70,17 +72,27 @@ class LocalRuntime:
             startup_timeout=request.startup_timeout,
         )
 
-        response = await session.start()
+        # Register before starting so a concurrent create can't race this one
         self._sessions[session_name] = session
+        try:
+            response = await session.start()
+        except BaseException:
+            self._sessions.pop(session_name, None)
+            raise
 
         logger.info(f"Created session '{session_name}'")
         return response
 
-    async def run_in_session(self, action: BashAction) -> BashObservation:
+    async def run_in_session(
+        self,
+        action: BashAction,
+        on_output: Callable[[str], None] | None = None,
+    ) -> BashObservation:
         """Execute a command in an existing session.
 
         Args:
             action: The bash action to execute
+            on_output: Optional callback receiving output as it arrives
 
         Returns:
             BashObservation with output and exit code
@@ -90,6 +102,11 @@ class LocalRuntime:
         """
         session_name = action.session
 
+        session = self._sessions.get(session_name)
+        if session is not None and session.exited:
+            # A previous command ended the shell (e.g. ``exit``)
+            await self.close_session(CloseSessionRequest(session=session_name))
+
         if session_name not in self._sessions:
             # Auto-create default session if it doesn't exist
             if session_name == "default":
@@ -98,7 +115,7 @@ class LocalRuntime:
                 raise SessionDoesNotExistError(session_name)
 
         session = self._sessions[session_name]
-        return await session.run(action)
+        return await session.run(action, on_output=on_output)
 
     async def close_session(self, request: CloseSessionRequest) -> CloseSessionResponse:
         """Close a bash session.
@@ -6,9 +6,10 @@ running inside the Docker container.
 
 from __future__ import annotations
 
+import json
 import logging
 import time
-from typing import Any
+from typing import Any, Callable
 
 import httpx
 
@@ -107,38 +108,45 @@ class RemoteRuntime:
             # Application-level exception transfer
             try:
                 transfer = ExceptionTransfer.model_validate(response.json())
-                exc_class = EXCEPTION_MAP.get(transfer.class_name, DockerException)
-
-                # Try to reconstruct the exception
-                if exc_class == NonZeroExitCodeError:
-                    raise NonZeroExitCodeError(
-                        exit_code=transfer.extra.get("exit_code", -1),
-                        command=transfer.extra.get("command", ""),
-                        output=transfer.extra.get("output", ""),
-                    )
-                elif exc_class == CommandTimeoutError:
-                    raise CommandTimeoutError(
-                        timeout=transfer.extra.get("timeout", 0),
-                        command=transfer.extra.get("command", ""),
-                    )
-                elif exc_class == SessionNotInitializedError:
-                    raise SessionNotInitializedError(transfer.extra.get("session", "default"))
-                elif exc_class == SessionExistsError:
-                    raise SessionExistsError(transfer.extra.get("session", "default"))
-                elif exc_class == SessionDoesNotExistError:
-                    raise SessionDoesNotExistError(transfer.extra.get("session", "default"))
-                else:
-                    raise DockerException(transfer.message)
-            except DockerException:
-                raise
             except Exception:
                 raise DockerException(f"Error from server: {response.text}")
+            self._raise_transfer(transfer)
 
         elif response.status_code == 401:
             raise DockerException("Authentication failed - invalid API key")
         elif response.status_code >= 400:
             raise DockerException(f"HTTP error {response.status_code}: {response.text}")
 
+    @staticmethod
+    def _raise_transfer(transfer: ExceptionTransfer) -> None:
+        """Re-raise an exception serialized by the server.
+
+        Raises:
+            DockerException: The reconstructed exception
+        """
+        exc_class = EXCEPTION_MAP.get(transfer.class_name, DockerException)
+
+        # Try to reconstruct the exception
+        if exc_class == NonZeroExitCodeError:
+            raise NonZeroExitCodeError(
+                exit_code=transfer.extra.get("exit_code", -1),
+                command=transfer.extra.get("command", ""),
+                output=transfer.extra.get("output", ""),
+            )
+        elif exc_class == CommandTimeoutError:
+            raise CommandTimeoutError(
+                timeout=transfer.extra.get("timeout", 0),
+                command=transfer.extra.get("command", ""),
+            )
+        elif exc_class == SessionNotInitializedError:
+            raise SessionNotInitializedError(transfer.extra.get("session", "default"))
+        elif exc_class == SessionExistsError:
+            raise SessionExistsError(transfer.extra.get("session", "default"))
+        elif exc_class == SessionDoesNotExistError:
+            raise SessionDoesNotExistError(transfer.extra.get("session", "default"))
+        else:
+            raise DockerException(transfer.message)
+
     async def _post(self, endpoint: str, data: dict[str, Any] | None = None) -> dict[str, Any]:
         """Make a POST request to the server.
 
@@ -232,6 +240,45 @@ class RemoteRuntime:
         finally:
             client.timeout = old_timeout
 
+    async def run_in_session_stream(
+        self,
+        action: BashAction,
+        on_output: Callable[[str], None],
+    ) -> BashObservation:
+        """Execute a command, passing output to ``on_output`` as it arrives.
+
+        Args:
+            action: The bash action to execute
+            on_output: Callback receiving output chunks (complete lines)
+
+        Returns:
+            BashObservation with the full output and exit code
+        """
+        client = await self._ensure_client()
+        timeout = httpx.Timeout(self.timeout, read=action.timeout + 30)  # Add buffer
+        try:
+            async with client.stream(
+                "POST", "/run_in_session_stream", json=action.model_dump(), timeout=timeout
+            ) as response:
+                if response.status_code >= 400:
+                    await response.aread()
+                    self._handle_error_response(response)
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    event = json.loads(line)
+                    if "output" in event:
+                        on_output(event["output"])
+                    elif "observation" in event:
+                        return BashObservation.model_validate(event["observation"])
+                    elif "exception" in event:
+                        self._raise_transfer(ExceptionTransfer.model_validate(event["exception"]))
+        except httpx.ConnectError as e:
+            raise ConnectionError(self.host, self.port, str(e))
+        except httpx.TimeoutException:
+            raise CommandTimeoutError(action.timeout, action.command)
+        raise DockerException("Output stream ended without a result")
+
     async def close_session(self, request: CloseSessionRequest) -> CloseSessionResponse:
         """Close a bash session."""
         data = await self._post("close_session", request.model_dump())
@@ -10,13 +10,15 @@ Usage (inside container):
 from __future__ import annotations
 
 import argparse
+import asyncio
+import json
 import logging
 import sys
 import traceback
-from typing import Any
+from typing import Any, AsyncIterator
 
 from fastapi import Depends, FastAPI, Header, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from .exceptions import DockerException
 from .local_runtime import LocalRuntime
@@ -40,6 +42,22 @@ __all__ = ["create_app", "run_server"]
 logger = logging.getLogger(__name__)
 
 
+def _exception_transfer(exc: Exception) -> ExceptionTransfer:
+    """Serialize an exception, including the attributes needed to rebuild it."""
+    extra = {
+        key: value
+        for key, value in vars(exc).items()
+        if isinstance(value, (str, int, float, bool)) or value is None
+    }
+    return ExceptionTransfer(
+        message=str(exc),
+        class_name=exc.__class__.__name__,
+        module=exc.__class__.__module__,
+        traceback="".join(traceback.format_exception(exc)),
+        extra=extra,
+    )
+
+
 def create_app(auth_token: str | None = None) -> FastAPI:
     """Create the FastAPI application.
 
@@ -68,30 +86,18 @@ def create_app(auth_token: str | None = None) -> FastAPI:
     @app.exception_handler(DockerException)
     async def docker_exception_handler(request: Request, exc: DockerException) -> JSONResponse:
         """Convert DockerException to JSON response with status 511."""
-        transfer = ExceptionTransfer(
-            message=str(exc),
-            class_name=exc.__class__.__name__,
-            module=exc.__class__.__module__,
-            traceback=traceback.format_exc(),
-        )
         return JSONResponse(
             status_code=511,  # Network Authentication Required (used for app-level errors)
-            content=transfer.model_dump(),
+            content=_exception_transfer(exc).model_dump(),
         )
 
     # General exception handler
     @app.exception_handler(Exception)
     async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
         """Convert general exceptions to JSON response."""
-        transfer = ExceptionTransfer(
-            message=str(exc),
-            class_name=exc.__class__.__name__,
-            module=exc.__class__.__module__,
-            traceback=traceback.format_exc(),
-        )
         return JSONResponse(
             status_code=500,
-            content=transfer.model_dump(),
+            content=_exception_transfer(exc).model_dump(),
         )
 
     # Helper to get runtime
@@ -128,6 +134,41 @@ def create_app(auth_token: str | None = None) -> FastAPI:
         """Execute a command in an existing session."""
         return await runtime.run_in_session(action)
 
+    @app.post("/run_in_session_stream")
+    async def run_in_session_stream(
+        action: BashAction,
+        _: None = Depends(verify_auth),
+        runtime: LocalRuntime = Depends(get_runtime),
+    ) -> StreamingResponse:
+        """Execute a command, streaming output as newline-delimited JSON.
+
+        Emits ``{"output": ...}`` events while the command runs, then one
+        ``{"observation": ...}`` or ``{"exception": ...}`` event.
+        """
+        events: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+
+        async def execute() -> None:
+            try:
+                observation = await runtime.run_in_session(
+                    action, on_output=lambda chunk: events.put_nowait({"output": chunk})
+                )
+                events.put_nowait({"observation": observation.model_dump()})
+            except Exception as exc:
+                events.put_nowait({"exception": _exception_transfer(exc).model_dump()})
+            finally:
+                events.put_nowait(None)
+
+        # Runs to completion even if the client disconnects, keeping the
+        # session in a known state
+        task = asyncio.create_task(execute())
+
+        async def body() -> AsyncIterator[str]:
+            while (event := await events.get()) is not None:
+                yield json.dumps(event) + "\n"
+            await task
+
+        return StreamingResponse(body(), media_type="application/x-ndjson")
+
     @app.post("/close_session", response_model=CloseSessionResponse)
     async def close_session(
         request: CloseSessionRequest,
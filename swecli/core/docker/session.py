@@ -1,67 +1,83 @@
-"""BashSession for interactive shell management using pexpect.
+"""BashSession for interactive shell management over a pseudo-terminal.
 
-Based on SWE-ReX BashSession implementation.
+Based on SWE-ReX BashSession implementation. The shell runs on a PTY whose
+master end is read without blocking through the running asyncio loop, so a
+long command never stalls other sessions or server requests.
+
+Each command is sent as a single ``eval $'...'`` line, and the prompt (PS1)
+carries the exit status plus a per-command sequence number. The prompt that
+ends a command therefore also reports its exit code: one round trip per
+command, with no ``bash -n`` syntax-check process and no follow-up
+``echo $?`` (syntax errors are reported by ``eval`` itself, with status 2).
 """
 
 from __future__ import annotations
 
+import asyncio
+import codecs
+import fcntl
 import logging
 import os
 import re
+import secrets
+import select
 import subprocess
+import termios
 import time
-from typing import TYPE_CHECKING
-
-import pexpect
+from typing import Callable
 
 from .exceptions import (
-    BashSyntaxError,
     CommandTimeoutError,
-    NoExitCodeError,
     NonZeroExitCodeError,
     SessionNotInitializedError,
 )
-from .models import BashAction, BashObservation, CreateSessionRequest, CreateSessionResponse
-
-if TYPE_CHECKING:
-    pass
+from .models import BashAction, BashObservation, CreateSessionResponse
 
 __all__ = ["BashSession"]
 
 logger = logging.getLogger(__name__)
 
+_ANSI_ESCAPE = re.compile(r"\x1B[@-_][0-?]*[ -/]*[@-~]")
+_READ_SIZE = 64 * 1024
+
 
 def _strip_control_chars(s: str) -> str:
     """Remove ANSI control characters from string."""
-    ansi_escape = re.compile(r"\x1B[@-_][0-?]*[ -/]*[@-~]")
-    return ansi_escape.sub("", s).replace("\r\n", "\n")
+    return _ANSI_ESCAPE.sub("", s).replace("\r\n", "\n")
 
 
-def _check_bash_syntax(command: str) -> None:
-    """Check if a bash command has valid syntax.
+def _quote_ansi_c(command: str) -> str:
+    """Quote ``command`` as a single-line bash ``$'...'`` string.
 
-    Raises:
-        BashSyntaxError: If the command has syntax errors.
+    Newlines and other control characters are escaped, so the terminal
+    driver never sees (and acts on) a line break, ^C or ^D inside a command.
     """
-    unique_eof = "OPENDEV_SYNTAX_CHECK_EOF"
-    cmd = f"/usr/bin/env bash -n << '{unique_eof}'\n{command}\n{unique_eof}"
-    result = subprocess.run(cmd, shell=True, capture_output=True)
-    if result.returncode == 0:
-        return
-    stderr = result.stderr.decode(errors="backslashreplace")
-    raise BashSyntaxError(command, stderr)
+    parts = []
+    for char in command:
+        if char in "\\'":
+            parts.append("\\" + char)
+        elif (char < " " and char != "\t") or char == "\x7f":
+            parts.append(f"\\x{ord(char):02x}")
+        else:
+            parts.append(char)
+    return "$'" + "".join(parts) + "'"
+
+
+def _make_controlling_tty() -> None:
+    """Child-side setup: make the PTY (already on fd 0) the controlling terminal."""
+    fcntl.ioctl(0, termios.TIOCSCTTY, 0)
 
 
 class BashSession:
-    """Interactive bash session using pexpect.
+    """Interactive bash session on a pseudo-terminal.
 
     This manages a single REPL-like bash shell that we can send commands to
-    and receive output from.
+    and receive output from. Sessions are independent, so a runtime can run
+    commands in several of them concurrently; commands within one session
+    run one at a time.
     """
 
-    _UNIQUE_STRING = "OPENDEV_UNIQUE_29234"
-    _EXIT_CODE_PREFIX = "EXITCODE_START_"
-    _EXIT_CODE_SUFFIX = "_EXITCODE_END"
+    _SEQ_VAR = "__OPENDEV_SEQ"
 
     def __init__(
         self,
@@ -76,26 +92,43 @@ class BashSession:
         """
         self.name = name
         self.startup_timeout = startup_timeout
-        self._ps1 = "OPENDEV_PS1_PROMPT> "
-        self._shell: pexpect.spawn | None = None
-
-    @property
-    def shell(self) -> pexpect.spawn:
-        """Get the pexpect shell, raising if not initialized."""
-        if self._shell is None:
-            raise SessionNotInitializedError(self.name)
-        return self._shell
+        # Random per session, so command output can't forge the prompt
+        self._marker = f"__OPENDEV_{secrets.token_hex(6)}_"
+        self._ps1 = f"{self._marker}$?_${{{self._SEQ_VAR}}}__"
+        self._any_prompt = re.compile(re.escape(self._marker) + r"\d+_\d*__")
+        self._process: subprocess.Popen | None = None
+        self._fd = -1
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="backslashreplace")
+        self._buffer = ""
+        self._eof = False
+        self._seq = 0
+        self._lock = asyncio.Lock()
 
     @property
     def is_alive(self) -> bool:
         """Check if the shell is alive."""
-        return self._shell is not None and self._shell.isalive()
+        return self._process is not None and self._process.poll() is None
+
+    @property
+    def exited(self) -> bool:
+        """Check if the session was started and its shell has since exited."""
+        return self._process is not None and self._process.poll() is not None
 
     async def start(self) -> CreateSessionResponse:
         """Start the bash session.
 
-        Spawns a bash shell, sets up custom PS1, and waits for prompt.
+        Spawns bash on a PTY and waits until it has applied the session setup.
+        Commands submitted meanwhile wait for startup to finish.
         """
+        async with self._lock:
+            output = await self._start()
+        return CreateSessionResponse(
+            success=True,
+            session=self.name,
+            message=output,
+        )
+
+    async def _start(self) -> str:
         # Set up environment with custom PS1
         env = os.environ.copy()
         env.update({
@@ -103,48 +136,58 @@ class BashSession:
             "PS2": "",
             "PS0": "",
             "TERM": "dumb",  # Disable fancy terminal features
+            "PAGER": "cat",  # Disable paging
+            "GIT_PAGER": "cat",
         })
 
-        # Spawn bash
-        self._shell = pexpect.spawn(
-            "/usr/bin/env bash --norc --noprofile",
-            encoding="utf-8",
-            codec_errors="backslashreplace",
-            echo=False,
-            env=env,
-        )
-
-        # Small delay for shell startup
-        time.sleep(0.2)
-
-        # Reset PS1/PS2/PS0 inside shell (in case env vars didn't take)
-        reset_cmds = [
-            f"export PS1='{self._ps1}'",
-            "export PS2=''",
-            "export PS0=''",
-            "export PAGER=cat",  # Disable paging
-            "export GIT_PAGER=cat",
-        ]
-        self.shell.sendline(" ; ".join(reset_cmds))
-
+        master, slave = os.openpty()
         try:
-            self.shell.expect(self._ps1, timeout=self.startup_timeout)
-        except pexpect.TIMEOUT as e:
+            # No echo, no line editing or line-length limit, no CRLF translation;
+            # ISIG stays on so ^C still interrupts the foreground job
+            attrs = termios.tcgetattr(slave)
+            attrs[1] &= ~termios.ONLCR
+            attrs[3] &= ~(termios.ECHO | termios.ICANON)
+            attrs[6][termios.VMIN] = 1
+            attrs[6][termios.VTIME] = 0
+            termios.tcsetattr(slave, termios.TCSANOW, attrs)
+
+            self._process = subprocess.Popen(
+                ["/usr/bin/env", "bash", "--norc", "--noprofile", "--noediting"],
+                stdin=slave,
+                stdout=slave,
+                stderr=slave,
+                env=env,
+                start_new_session=True,
+                preexec_fn=_make_controlling_tty,
+            )
+        except BaseException:
+            os.close(master)
+            raise
+        finally:
+            os.close(slave)
+        os.set_blocking(master, False)
+        self._fd = master
+
+        # Re-apply the prompt in case the environment didn't take, and turn off
+        # history expansion so "!" in commands is passed through untouched
+        setup = f"export PS1='{self._ps1}' PS2='' PS0=''; set +H"
+        try:
+            output, _ = await self._execute(setup, self.startup_timeout, None)
+        except CommandTimeoutError as e:
             raise CommandTimeoutError(self.startup_timeout, "session startup") from e
+        return output
 
-        output = _strip_control_chars(self.shell.before or "")
-
-        return CreateSessionResponse(
-            success=True,
-            session=self.name,
-            message=output,
-        )
-
-    async def run(self, action: BashAction) -> BashObservation:
+    async def run(
+        self,
+        action: BashAction,
+        on_output: Callable[[str], None] | None = None,
+    ) -> BashObservation:
         """Execute a command in the session.
 
         Args:
             action: The bash action to execute
+            on_output: Optional callback receiving output as it arrives, in
+                complete lines (the final partial line comes last)
 
         Returns:
             BashObservation with output and exit code
@@ -154,35 +197,27 @@ class BashSession:
             CommandTimeoutError: If command times out
             NonZeroExitCodeError: If check="raise" and exit code != 0
         """
-        if self._shell is None:
-            raise SessionNotInitializedError(self.name)
-
-        # Optionally check syntax first (can be slow, so skip for simple commands)
-        if "\n" in action.command or ";" in action.command:
+        async with self._lock:
+            if self._process is None:
+                raise SessionNotInitializedError(self.name)
+            output, exit_code = await self._execute(action.command, action.timeout, on_output)
+
+        if exit_code is None:
+            # The command ended the shell (e.g. ``exit``)
+            self._close_fd()
             try:
-                _check_bash_syntax(action.command)
-            except BashSyntaxError:
-                # Log but don't fail - let bash report the error
-                logger.debug(f"Bash syntax check failed for: {action.command[:50]}...")
-
-        # Send the command
-        self.shell.sendline(action.command)
-
-        # Wait for PS1 prompt
-        try:
-            self.shell.expect(self._ps1, timeout=action.timeout)
-        except pexpect.TIMEOUT as e:
-            raise CommandTimeoutError(action.timeout, action.command) from e
-
-        output = _strip_control_chars(self.shell.before or "")
-
-        # Get exit code if check is not "ignore"
-        exit_code: int | None = None
-        if action.check != "ignore":
-            exit_code = await self._get_exit_code()
-
-        # Clean up output
-        output = output.strip()
+                code = self._process.wait(timeout=1.0)
+            except subprocess.TimeoutExpired:
+                code = None
+            return BashObservation(
+                output=output,
+                exit_code=code if action.check != "ignore" else None,
+                failure_reason=f"Shell exited with code {code}",
+            )
+
+        # Only report the exit code if check is not "ignore"
+        if action.check == "ignore":
+            exit_code = None
 
         # Check for errors if requested
         if action.check == "raise" and exit_code is not None and exit_code != 0:
@@ -194,65 +229,151 @@ class BashSession:
             failure_reason=None if exit_code == 0 else f"Exit code {exit_code}",
         )
 
-    async def _get_exit_code(self) -> int | None:
-        """Extract the exit code from the last command."""
-        try:
-            self.shell.sendline(f"echo {self._EXIT_CODE_PREFIX}$?{self._EXIT_CODE_SUFFIX}")
-            self.shell.expect(self._EXIT_CODE_SUFFIX, timeout=2.0)
-
-            output = _strip_control_chars(self.shell.before or "")
-            match = re.search(f"{self._EXIT_CODE_PREFIX}(\\d+)", output)
-
-            if not match:
-                logger.warning(f"Could not extract exit code from: {output[:100]}")
-                return None
-
-            exit_code = int(match.group(1))
+    async def _execute(
+        self,
+        command: str,
+        timeout: float,
+        on_output: Callable[[str], None] | None,
+    ) -> tuple[str, int | None]:
+        """Send one command and read up to its prompt (caller holds the lock).
 
-            # Consume the following PS1
+        Returns:
+            Cleaned output and exit code (None if the shell exited)
+        """
+        if self._fd < 0:
+            raise SessionNotInitializedError(self.name)
+        self._seq += 1
+        prompt = re.compile(re.escape(self._marker) + rf"(\d+)_{self._seq}__")
+        line = f"{self._SEQ_VAR}={self._seq}; eval {_quote_ansi_c(command)}\n"
+        self._write(line.encode("utf-8"))
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        wakeup = asyncio.Event()
+        loop.add_reader(self._fd, self._on_readable, wakeup)
+        scanned = 0  # Buffer prefix already searched for the prompt
+        emitted = 0  # Buffer prefix already passed to on_output
+        try:
+            while True:
+                # Step back so a prompt split across reads is still found
+                match = prompt.search(self._buffer, max(0, scanned - len(self._ps1) - 24))
+                if match or self._eof:
+                    end = match.start() if match else len(self._buffer)
+                    text = self._buffer[:end]
+                    self._buffer = self._buffer[match.end():] if match else ""
+                    if on_output and end > emitted:
+                        on_output(self._clean(text[emitted:]))
+                    exit_code = int(match.group(1)) if match else None
+                    return self._clean(text).strip(), exit_code
+
+                scanned = len(self._buffer)
+                if on_output:
+                    newline = self._buffer.rfind("\n", emitted)
+                    if newline >= emitted:
+                        on_output(self._clean(self._buffer[emitted:newline + 1]))
+                        emitted = newline + 1
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise CommandTimeoutError(timeout, command)
+                wakeup.clear()
+                try:
+                    await asyncio.wait_for(wakeup.wait(), remaining)
+                except asyncio.TimeoutError:
+                    raise CommandTimeoutError(timeout, command) from None
+        finally:
+            if self._fd >= 0:
+                loop.remove_reader(self._fd)
+
+    def _on_readable(self, wakeup: asyncio.Event) -> None:
+        """Event-loop reader callback: drain the PTY into the buffer."""
+        self._drain()
+        if self._eof:
+            asyncio.get_running_loop().remove_reader(self._fd)
+        wakeup.set()
+
+    def _drain(self) -> None:
+        """Read everything currently available from the PTY without blocking."""
+        while True:
+            try:
+                data = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                return
+            except OSError:
+                data = b""  # EIO: the shell closed the terminal
+            if not data:
+                self._eof = True
+                self._buffer += self._decoder.decode(b"", final=True)
+                return
+            self._buffer += self._decoder.decode(data)
+
+    def _write(self, data: bytes) -> None:
+        """Write to the PTY, waiting for room if the terminal buffer is full."""
+        view = memoryview(data)
+        while view:
             try:
-                self.shell.expect(self._ps1, timeout=0.5)
-            except pexpect.TIMEOUT:
-                pass  # OK if no PS1
+                written = os.write(self._fd, view)
+            except BlockingIOError:
+                select.select([], [self._fd], [], 1.0)
+                continue
+            view = view[written:]
 
-            return exit_code
+    def _clean(self, text: str) -> str:
+        # Prompts left over from an earlier timed-out or interrupted command
+        return self._any_prompt.sub("", _strip_control_chars(text))
 
-        except pexpect.TIMEOUT:
-            logger.warning("Timeout while getting exit code")
-            return None
-        except Exception as e:
-            logger.warning(f"Error getting exit code: {e}")
-            return None
+    def _close_fd(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
 
     async def close(self) -> None:
         """Close the bash session."""
-        if self._shell is not None:
+        if self._process is None:
+            return
+        try:
+            if self._fd >= 0 and self.is_alive:
+                self._write(b"exit\n")
+                deadline = time.monotonic() + 2.0
+                while self.is_alive and time.monotonic() < deadline:
+                    await asyncio.sleep(0.02)
+        except Exception:
+            pass  # Ignore errors during cleanup
+        finally:
+            if self.is_alive:
+                self._process.kill()
             try:
-                self._shell.sendline("exit")
-                self._shell.expect(pexpect.EOF, timeout=2.0)
+                self._process.wait(timeout=2.0)
             except Exception:
-                pass  # Ignore errors during cleanup
-            finally:
-                try:
-                    self._shell.close(force=True)
-                except Exception:
-                    pass
-                self._shell = None
+                pass
+            self._close_fd()
+            self._process = None
 
     def interrupt(self) -> str:
         """Send interrupt signal (Ctrl+C) to the session.
 
+        If a command is running, its ``run`` call returns once the shell is
+        back at the prompt (with exit code 130).
+
         Returns:
-            Any output captured after the interrupt
+            Any output captured after the interrupt when the session was idle
         """
-        if self._shell is None:
+        if self._fd < 0:
             return ""
 
-        self._shell.sendintr()
-        time.sleep(0.2)
-
-        try:
-            self._shell.expect(self._ps1, timeout=2.0)
-            return _strip_control_chars(self.shell.before or "")
-        except pexpect.TIMEOUT:
-            return ""
+        self._write(b"\x03")
+        if self._lock.locked():
+            return ""  # The running command's reader collects the output
+
+        deadline = time.monotonic() + 2.0
+        while not self._any_prompt.search(self._buffer) and not self._eof:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return ""
+            select.select([self._fd], [], [], remaining)
+            self._drain()
+        match = self._any_prompt.search(self._buffer)
+        end = match.start() if match else len(self._buffer)
+        output = self._clean(self._buffer[:end])
+        self._buffer = self._buffer[match.end():] if match else ""
+        return output
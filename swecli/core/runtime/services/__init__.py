@@ -1,8 +1,13 @@
 """Service layer for OpenDev core."""
 
+from .batch_runner import BatchRunner, BatchSummary, BatchTask, load_manifest
 from .runtime_service import RuntimeService, RuntimeSuite
 
 __all__ = [
+    "BatchRunner",
+    "BatchSummary",
+    "BatchTask",
     "RuntimeService",
     "RuntimeSuite",
+    "load_manifest",
 ]
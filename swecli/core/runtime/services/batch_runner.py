@@ -0,0 +1,457 @@
+"""Headless batch execution of prompts from a JSONL manifest.
+
+Each manifest line describes one task::
+
+    {"id": "fix-1", "prompt": "...", "working_dir": "repo", "model": "...",
+     "limits": {"max_iterations": 20, "timeout_seconds": 600, "max_tokens": 4096}}
+
+Only ``prompt`` is required. Tasks run concurrently on a worker pool; every
+finished task appends one JSON line (content, status, token usage, timings)
+to the results file, so a batch that was interrupted can be resumed by
+skipping the tasks that already have a successful result.
+
+Loaded configuration and the environment snapshot used for system prompts
+are shared by all tasks with the same working directory. Tools, agents and
+approval state are built per task since they hold per-run state.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+from rich.console import Console
+
+from swecli.core.runtime.approval.manager import (
+    ApprovalChoice,
+    ApprovalManager,
+    ApprovalResult,
+)
+from swecli.core.runtime.config import ConfigManager
+from swecli.core.runtime.monitoring.task_monitor import TaskMonitor
+from swecli.models.config import AppConfig
+
+logger = logging.getLogger(__name__)
+
+_LIMIT_KEYS = ("max_iterations", "timeout_seconds", "max_tokens")
+
+
+@dataclass
+class BatchTask:
+    """One prompt to run headlessly."""
+
+    id: str
+    prompt: str
+    working_dir: Path
+    model: Optional[str] = None
+    max_iterations: Optional[int] = None
+    timeout_seconds: Optional[float] = None
+    max_tokens: Optional[int] = None
+
+
+@dataclass
+class BatchSummary:
+    """Outcome of a batch run."""
+
+    total: int = 0
+    skipped: int = 0  # Already successful in the results file (resume)
+    succeeded: int = 0
+    failed: int = 0
+    usage: dict[str, int] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+
+
+def load_manifest(path: Path, default_working_dir: Optional[Path] = None) -> list[BatchTask]:
+    """Parse a JSONL manifest into tasks.
+
+    Blank lines and lines starting with ``#`` are ignored. Tasks without an
+    ``id`` are identified by their line number. Relative working directories
+    are resolved against the manifest's directory.
+
+    Args:
+        path: Manifest file
+        default_working_dir: Working directory for tasks that don't set one
+            (defaults to the manifest's directory)
+
+    Returns:
+        Tasks in manifest order
+
+    Raises:
+        ValueError: If a line is not a valid task or an id is repeated
+    """
+    base_dir = path.resolve().parent
+    default_dir = (default_working_dir or base_dir).resolve()
+    tasks: list[BatchTask] = []
+    seen: set[str] = set()
+
+    for line_no, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"{path}:{line_no}: invalid JSON ({exc.msg})") from exc
+        if not isinstance(entry, dict) or not isinstance(entry.get("prompt"), str):
+            raise ValueError(f"{path}:{line_no}: each task needs a string 'prompt'")
+
+        task_id = str(entry.get("id", line_no))
+        if task_id in seen:
+            raise ValueError(f"{path}:{line_no}: duplicate task id '{task_id}'")
+        seen.add(task_id)
+
+        limits = entry.get("limits") or {}
+        if not isinstance(limits, dict) or set(limits) - set(_LIMIT_KEYS):
+            raise ValueError(
+                f"{path}:{line_no}: 'limits' may only contain {', '.join(_LIMIT_KEYS)}"
+            )
+
+        working_dir = entry.get("working_dir")
+        tasks.append(
+            BatchTask(
+                id=task_id,
+                prompt=entry["prompt"],
+                working_dir=(base_dir / working_dir).resolve() if working_dir else default_dir,
+                model=entry.get("model"),
+                max_iterations=limits.get("max_iterations"),
+                timeout_seconds=limits.get("timeout_seconds"),
+                max_tokens=limits.get("max_tokens"),
+            )
+        )
+    return tasks
+
+
+def load_completed_task_ids(output_path: Path) -> set[str]:
+    """Return ids of tasks with a successful result in ``output_path``.
+
+    A truncated last line (from a run that was killed mid-write) is ignored.
+    """
+    if not output_path.exists():
+        return set()
+    completed: set[str] = set()
+    with open(output_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(record, dict) and record.get("status") == "success":
+                completed.add(str(record.get("id")))
+    return completed
+
+
+class HeadlessApprovalManager(ApprovalManager):
+    """Approval manager that never prompts.
+
+    Operations are approved when ``auto_approve`` is set and denied otherwise,
+    since there is no one to ask while tasks run in the background.
+    """
+
+    def __init__(self, auto_approve: bool) -> None:
+        super().__init__(Console(quiet=True))
+        self.auto_approve_remaining = auto_approve
+
+    def request_approval(self, operation: Any, preview: str, **kwargs: Any) -> ApprovalResult:
+        if self.auto_approve_remaining:
+            return ApprovalResult(True, ApprovalChoice.APPROVE)
+        return ApprovalResult(False, ApprovalChoice.DENY)
+
+    def reset_auto_approve(self) -> None:
+        pass  # Fixed for the whole task
+
+
+class _DeadlineMonitor(TaskMonitor):
+    """Task monitor that requests an interrupt once a deadline has passed."""
+
+    def __init__(self, timeout_seconds: Optional[float]) -> None:
+        super().__init__()
+        self.deadline = time.monotonic() + timeout_seconds if timeout_seconds else None
+
+    def timed_out(self) -> bool:
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def should_interrupt(self) -> bool:
+        return self.timed_out() or super().should_interrupt()
+
+
+class _TaskConfigManager(ConfigManager):
+    """Config manager pinned to an already loaded (per-task) config."""
+
+    def __init__(self, working_dir: Path, config: AppConfig, source: ConfigManager) -> None:
+        super().__init__(working_dir)
+        self._config = config
+        self._source = source
+
+    def load_config(self) -> AppConfig:
+        return self._config
+
+    def load_context_files(self) -> list[str]:
+        return self._source.load_context_files()
+
+
+class BatchRunner:
+    """Runs manifest tasks on a worker pool and records results as JSONL."""
+
+    def __init__(
+        self,
+        output_path: Path,
+        workers: int = 4,
+        *,
+        auto_approve: bool = False,
+        config_overrides: Optional[dict[str, Any]] = None,
+        on_result: Optional[Callable[[dict], None]] = None,
+    ) -> None:
+        """Initialize the runner.
+
+        Args:
+            output_path: JSONL file that results are appended to
+            workers: Number of tasks run concurrently
+            auto_approve: Approve every operation (otherwise operations that
+                need approval are denied)
+            config_overrides: AppConfig fields applied to every task
+                (e.g. ``model`` or ``api_base_url``)
+            on_result: Called with each result record as it is written
+        """
+        self.output_path = output_path
+        self.workers = max(1, workers)
+        self.auto_approve = auto_approve
+        self.config_overrides = dict(config_overrides or {})
+        self.on_result = on_result
+        self._write_lock = threading.Lock()
+        self._shared_lock = threading.Lock()
+        self._shared: dict[tuple, Future] = {}
+        self._monitors: set[_DeadlineMonitor] = set()
+
+    # ------------------------------------------------------------------
+    # Running
+    # ------------------------------------------------------------------
+
+    def run(self, tasks: Iterable[BatchTask], resume: bool = False) -> BatchSummary:
+        """Run ``tasks`` and append one result line per task.
+
+        Args:
+            tasks: Tasks to run
+            resume: Skip tasks that already have a successful result and keep
+                the existing results; otherwise the results file is replaced
+
+        Returns:
+            Summary of the run
+        """
+        started = time.monotonic()
+        tasks = list(tasks)
+        summary = BatchSummary(total=len(tasks))
+
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        if resume:
+            completed = load_completed_task_ids(self.output_path)
+            pending = [task for task in tasks if task.id not in completed]
+            summary.skipped = len(tasks) - len(pending)
+            self._terminate_partial_line()
+        else:
+            pending = tasks
+            self.output_path.write_text("", encoding="utf-8")
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="batch") as pool:
+            futures = [pool.submit(self.run_task, task, time.monotonic()) for task in pending]
+            try:
+                for future in as_completed(futures):
+                    record = future.result()
+                    if record["status"] == "success":
+                        summary.succeeded += 1
+                    else:
+                        summary.failed += 1
+                    for key, value in record["usage"].items():
+                        summary.usage[key] = summary.usage.get(key, 0) + value
+            except BaseException:
+                # Ctrl+C: drop queued tasks and interrupt the running ones
+                for future in futures:
+                    future.cancel()
+                self.interrupt()
+                raise
+
+        summary.elapsed_seconds = round(time.monotonic() - started, 3)
+        return summary
+
+    def interrupt(self) -> None:
+        """Ask every running task to stop at its next check."""
+        with self._shared_lock:
+            monitors = list(self._monitors)
+        for monitor in monitors:
+            monitor.request_interrupt()
+
+    def run_task(self, task: BatchTask, queued_at: Optional[float] = None) -> dict:
+        """Run one task and write its result record; never raises."""
+        started = time.monotonic()
+        record: dict[str, Any] = {
+            "id": task.id,
+            "status": "error",
+            "model": task.model or self.config_overrides.get("model"),
+            "working_dir": str(task.working_dir),
+            "content": None,
+            "error": None,
+            "usage": {},
+            "tool_calls": 0,
+        }
+        timings = {"queued_seconds": round(started - queued_at, 3) if queued_at else 0.0}
+        try:
+            agent, deps, config = self._build_task(task)
+            record["model"] = config.model
+            timings["setup_seconds"] = round(time.monotonic() - started, 3)
+
+            run_started = time.monotonic()
+            monitor = _DeadlineMonitor(task.timeout_seconds)
+            with self._shared_lock:
+                self._monitors.add(monitor)
+            try:
+                result = agent.run_sync(
+                    task.prompt,
+                    deps,
+                    message_history=[],
+                    max_iterations=task.max_iterations,
+                    task_monitor=monitor,
+                )
+            finally:
+                with self._shared_lock:
+                    self._monitors.discard(monitor)
+            timings["run_seconds"] = round(time.monotonic() - run_started, 3)
+
+            record["usage"] = result.get("usage") or {}
+            record["tool_calls"] = sum(
+                1 for msg in result.get("messages") or [] if msg.get("role") == "tool"
+            )
+            if result.get("success"):
+                record["status"] = "success"
+                record["content"] = result.get("content", "")
+            else:
+                if monitor.timed_out():
+                    record["status"] = "timeout"
+                elif result.get("interrupted"):
+                    record["status"] = "interrupted"
+                else:
+                    record["status"] = "failed"
+                record["error"] = result.get("error") or result.get("content") or "Unknown error"
+        except Exception as exc:  # noqa: BLE001 - one task must not stop the batch
+            logger.debug("Batch task %s raised", task.id, exc_info=True)
+            record["error"] = f"{type(exc).__name__}: {exc}"
+
+        timings["total_seconds"] = round(time.monotonic() - started, 3)
+        record["timings"] = timings
+        self._write_record(record)
+        return record
+
+    # ------------------------------------------------------------------
+    # Task construction
+    # ------------------------------------------------------------------
+
+    def _build_task(self, task: BatchTask) -> tuple[Any, Any, AppConfig]:
+        from swecli.core.base.factories import build_default_tools
+        from swecli.core.context_engineering.history import UndoManager
+        from swecli.core.runtime import ModeManager
+        from swecli.core.runtime.services import RuntimeService
+        from swecli.models.agent_deps import AgentDependencies
+
+        if not task.working_dir.is_dir():
+            raise FileNotFoundError(f"Working directory does not exist: {task.working_dir}")
+
+        source, base_config = self._shared_value(
+            ("config", task.working_dir), lambda: self._load_config(task.working_dir)
+        )
+        overrides = dict(self.config_overrides)
+        if task.model:
+            overrides["model"] = task.model
+        if task.max_tokens:
+            overrides["max_tokens"] = task.max_tokens
+        config = base_config.model_copy(update=overrides)
+        config_manager = _TaskConfigManager(task.working_dir, config, source)
+
+        mode_manager = ModeManager()
+        runtime_service = RuntimeService(config_manager, mode_manager)
+        env_context = self._shared_value(
+            ("environment", task.working_dir), runtime_service.collect_environment
+        )
+        # The snapshot names the model, which may differ between tasks
+        env_context = dataclasses.replace(
+            env_context, model=config.model or "", model_provider=config.model_provider or ""
+        )
+
+        suite = runtime_service.build_suite(
+            **build_default_tools(config, task.working_dir),
+            mcp_manager=None,
+            env_context=env_context,
+        )
+        console = Console(quiet=True)
+        deps = AgentDependencies(
+            mode_manager=mode_manager,
+            approval_manager=HeadlessApprovalManager(self.auto_approve),
+            undo_manager=UndoManager(config.max_undo_history),
+            session_manager=None,
+            working_dir=task.working_dir,
+            console=console,
+            config=config,
+        )
+        return suite.agents.normal, deps, config
+
+    @staticmethod
+    def _load_config(working_dir: Path) -> tuple[ConfigManager, AppConfig]:
+        config_manager = ConfigManager(working_dir)
+        return config_manager, config_manager.load_config()
+
+    def _shared_value(self, key: tuple, factory: Callable[[], Any]) -> Any:
+        """Compute ``factory()`` once per key, even when tasks ask concurrently."""
+        with self._shared_lock:
+            future = self._shared.get(key)
+            owner = future is None
+            if owner:
+                future = self._shared[key] = Future()
+        if owner:
+            try:
+                future.set_result(factory())
+            except Exception as exc:
+                with self._shared_lock:
+                    self._shared.pop(key, None)  # Let a later task retry
+                future.set_exception(exc)
+        return future.result()
+
+    # ------------------------------------------------------------------
+    # Results file
+    # ------------------------------------------------------------------
+
+    def _write_record(self, record: dict) -> None:
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        with self._write_lock:
+            with open(self.output_path, "a", encoding="utf-8") as f:
+                f.write(line)
+            if self.on_result is not None:
+                try:
+                    self.on_result(record)
+                except Exception:
+                    pass  # Progress reporting must not affect the batch
+
+    def _terminate_partial_line(self) -> None:
+        """Make sure new records don't get glued to a truncated last line."""
+        if not self.output_path.exists():
+            return
+        with open(self.output_path, "rb+") as f:
+            f.seek(0, 2)
+            if f.tell() == 0:
+                return
+            f.seek(-1, 2)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+
+
+__all__ = [
+    "BatchRunner",
+    "BatchSummary",
+    "BatchTask",
+    "HeadlessApprovalManager",
+    "load_completed_task_ids",
+    "load_manifest",
+]
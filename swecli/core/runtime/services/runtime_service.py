@@ -71,16 +71,15 @@ class RuntimeService:
         vlm_tool: Union[Any, None] = None,
         web_screenshot_tool: Union[Any, None] = None,
         mcp_manager: Union[Any, None] = None,
+        env_context: Union[Any, None] = None,
     ) -> RuntimeSuite:
-        """Create a runtime suite containing the tool registry and agents."""
-        # Collect environment once at startup
-        from swecli.core.agents.components.prompts.environment import EnvironmentCollector
+        """Create a runtime suite containing the tool registry and agents.
 
-        env_context = EnvironmentCollector(
-            self._config_manager.working_dir,
-            self._config_manager.get_config(),
-            self._config_manager,
-        ).collect()
+        ``env_context`` may be passed to reuse an environment snapshot already
+        collected for the same working directory.
+        """
+        if env_context is None:
+            env_context = self.collect_environment()
 
         tool_factory = ToolFactory(
             ToolDependencies(
@@ -117,6 +116,16 @@ class RuntimeService:
             env_context=env_context,
         )
 
+    def collect_environment(self) -> Any:
+        """Collect the environment snapshot used to build system prompts."""
+        from swecli.core.agents.components.prompts.environment import EnvironmentCollector
+
+        return EnvironmentCollector(
+            self._config_manager.working_dir,
+            self._config_manager.get_config(),
+            self._config_manager,
+        ).collect()
+
     def rebuild_tool_registry(
         self,
         suite: RuntimeSuite,
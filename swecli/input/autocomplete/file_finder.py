@@ -1,9 +1,10 @@
 """File finding functionality for autocomplete."""
 
-import os
 from pathlib import Path
 from typing import List
 
+from swecli.core.context_engineering.retrieval.workspace_catalog import get_workspace_catalog
+
 
 class FileFinder:
     """Handles file discovery for autocomplete."""
@@ -44,47 +45,9 @@ class FileFinder:
         Returns:
             List of matching file paths
         """
-        matches = []
-        query_lower = query.lower()
-
-        try:
-            # Walk through directory
-            for root, dirs, files in os.walk(self.working_dir):
-                # Filter out excluded directories
-                dirs[:] = [d for d in dirs if d not in self.exclude_dirs]
-
-                # Check if we have enough matches
-                if len(matches) >= max_results:
-                    break
-
-                root_path = Path(root)
-
-                # Check files
-                for file in files:
-                    file_path = root_path / file
-
-                    # Get relative path for matching
-                    try:
-                        rel_path = file_path.relative_to(self.working_dir)
-                        rel_path_str = str(rel_path).lower()
-                    except ValueError:
-                        continue
-
-                    # Match against query
-                    if not query_lower or query_lower in rel_path_str:
-                        matches.append(file_path)
-
-                        if len(matches) >= max_results:
-                            break
-
-        except (PermissionError, OSError):
-            # Handle permission errors gracefully
-            pass
-
-        # Sort matches by relevance (shorter paths first, then alphabetically)
-        matches.sort(key=lambda p: (len(str(p)), str(p)))
-
-        return matches[:max_results]
+        catalog = get_workspace_catalog(self.working_dir)
+        matches = catalog.find(query, max_results, exclude_dirs=self.exclude_dirs)
+        return [self.working_dir / rel_path for rel_path in matches]
 
     def format_file_size(self, size: int) -> str:
         """Format file size in human-readable format.
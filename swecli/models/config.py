@@ -99,6 +99,15 @@ class PlaybookConfig(BaseModel):
     cache_file: Optional[str] = None  # Path to embedding cache file (None = session-based default)
 
 
+class LSPConfig(BaseModel):
+    """Language server pooling configuration."""
+
+    prewarm: bool = True  # Boot servers for the workspace's languages at session start
+    max_prewarm_languages: int = Field(default=3, ge=0)
+    max_concurrent_boots: int = Field(default=2, ge=1)
+    idle_ttl_seconds: float = Field(default=900.0, ge=0)  # 0 keeps idle servers running
+
+
 class AppConfig(BaseModel):
     """Application configuration."""
 
@@ -129,6 +138,7 @@ class AppConfig(BaseModel):
     api_base_url: Optional[str] = None
     max_tokens: int = 16384
     temperature: float = 0.6
+    enable_streaming: bool = False  # Stream completions (SSE) for faster first token
 
     # Session settings
     auto_save_interval: int = 5  # Save every N turns
@@ -149,12 +159,14 @@ class AppConfig(BaseModel):
     auto_mode: AutoModeConfig = Field(default_factory=AutoModeConfig)
     operation: OperationConfig = Field(default_factory=OperationConfig)
     max_undo_history: int = 50  # Maximum operations to track for undo
+    enable_search_index: bool = True  # Answer grep from a persistent trigram index
 
     # Session intelligence
     topic_detection: bool = True
 
     # ACE Playbook settings
     playbook: PlaybookConfig = Field(default_factory=PlaybookConfig)
+    lsp: LSPConfig = Field(default_factory=LSPConfig)
 
     # Paths - using APP_DIR_NAME constant for consistency
     opendev_dir: str = f"~/{APP_DIR_NAME}"
@@ -124,7 +124,11 @@ class Session(BaseModel):
         }
 
     def total_tokens(self) -> int:
-        """Calculate total token count."""
+        """Calculate total token count.
+
+        Uses each message's cached ``tokens`` count when set (see
+        ``SessionManager.add_message``), falling back to a rough estimate.
+        """
         return sum(msg.token_estimate() for msg in self.messages)
 
     def get_metadata(self) -> SessionMetadata:
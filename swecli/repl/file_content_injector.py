@@ -516,6 +516,7 @@ class FileContentInjector:
             Tuple of (text_tag, image_block_or_none)
         """
         try:
+            from swecli.core.context_engineering.images import base64_media_type
             from swecli.core.context_engineering.tools.implementations.vlm_tool import VLMTool
 
             vlm = VLMTool(self.config, self.working_dir)
@@ -543,7 +544,8 @@ class FileContentInjector:
                 ".webp": "image/webp",
                 ".bmp": "image/bmp",
             }
-            mime_type = mime_types.get(ext, "image/png")
+            # Preprocessing may have re-encoded the image, so trust the data first
+            mime_type = base64_media_type(base64_data) or mime_types.get(ext, "image/png")
 
             tag = (
                 f'<image path="{ref_str}" type="{mime_type}">\n'
@@ -170,7 +170,7 @@ class LLMCaller:
         self._current_task_monitor = None
 
     def call_llm_with_progress(
-        self, agent, messages, task_monitor, thinking_visible: bool = True
+        self, agent, messages, task_monitor, thinking_visible: bool = True, ui_callback=None
     ) -> tuple:
         """Call LLM with progress display.
 
@@ -179,6 +179,7 @@ class LLMCaller:
             messages: Message history
             task_monitor: Task monitor for tracking
             thinking_visible: If False, exclude think tool from schemas
+            ui_callback: Optional UI callback that receives streamed text deltas
 
         Returns:
             Tuple of (response, latency_ms)
@@ -213,7 +214,10 @@ class LLMCaller:
             started = time.perf_counter()
             try:
                 response = agent.call_llm(
-                    messages, task_monitor=task_monitor, thinking_visible=thinking_visible
+                    messages,
+                    task_monitor=task_monitor,
+                    thinking_visible=thinking_visible,
+                    ui_callback=ui_callback,
                 )
             except Exception as e:
                 logger.error(f"[LLM_CALLER] Exception in agent.call_llm: {type(e).__name__}: {e}")
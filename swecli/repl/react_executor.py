@@ -21,7 +21,8 @@ from swecli.core.runtime.monitoring import TaskMonitor
 from swecli.ui_textual.utils.tool_display import format_tool_call
 from swecli.ui_textual.components.task_progress import TaskProgressDisplay
 from swecli.core.utils.tool_result_summarizer import summarize_tool_result
-from swecli.core.agents.prompts import get_injection
+from swecli.core.agents.components import CONCURRENT_SAFE_TOOLS
+from swecli.core.agents.prompts import get_injection, injected_user_message
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +83,8 @@ class ReactExecutor:
     """Executes ReAct loop (Reasoning → Acting → Observing)."""
 
     READ_OPERATIONS = {"read_file", "list_files", "search"}
+    # Tools without side effects that may run concurrently within one turn
+    CONCURRENT_SAFE_OPERATIONS = CONCURRENT_SAFE_TOOLS
     MAX_NUDGE_ATTEMPTS = 3
 
     def __init__(
@@ -609,24 +612,16 @@ Please provide refined reasoning that addresses these concerns. Keep it concise
             if thinking_trace:
                 # Inject trace as user message for the action phase
                 ctx.messages.append(
-                    {
-                        "role": "user",
-                        "content": get_injection(
-                            "thinking_trace_injection", thinking_trace=thinking_trace
-                        ),
-                    }
+                    injected_user_message(
+                        get_injection("thinking_trace_injection", thinking_trace=thinking_trace)
+                    )
                 )
 
         # STOP SIGNAL: After subagent completion, tell agent to just summarize
         # Skip if continue_after_subagent is True (e.g., /init needs to continue)
         if subagent_just_completed and not ctx.continue_after_subagent:
             _debug_log("[ITERATION] Injecting stop signal after subagent completion")
-            ctx.messages.append(
-                {
-                    "role": "user",
-                    "content": get_injection("subagent_complete_signal"),
-                }
-            )
+            ctx.messages.append(injected_user_message(get_injection("subagent_complete_signal")))
 
         # AUTO-COMPACTION: Compact messages if approaching context limit
         self._maybe_compact(ctx)
@@ -647,7 +642,11 @@ Please provide refined reasoning that addresses these concerns. Keep it concise
             thinking_visible=thinking_visible,
         )
         response, latency_ms = self._llm_caller.call_llm_with_progress(
-            ctx.agent, ctx.messages, task_monitor, thinking_visible=thinking_visible
+            ctx.agent,
+            ctx.messages,
+            task_monitor,
+            thinking_visible=thinking_visible,
+            ui_callback=ctx.ui_callback,
         )
         debug_log(
             "ReactExecutor", f"call_llm_with_progress returned, success={response.get('success')}"
@@ -824,12 +823,7 @@ Please provide refined reasoning that addresses these concerns. Keep it concise
             ctx.messages.append({"role": "assistant", "content": raw_content or content})
             self._display_message(content, ctx.ui_callback)
 
-        ctx.messages.append(
-            {
-                "role": "user",
-                "content": get_injection("failed_tool_nudge"),
-            }
-        )
+        ctx.messages.append(injected_user_message(get_injection("failed_tool_nudge")))
         return LoopAction.CONTINUE
 
     def _process_tool_calls(
@@ -878,15 +872,10 @@ Please provide refined reasoning that addresses these concerns. Keep it concise
             # All spawn_subagent - execute in parallel with special UI handling
             tool_results_by_id, operation_cancelled = self._execute_tools_parallel(tool_calls, ctx)
         else:
-            # Sequential execution for all other tool calls
-            tool_results_by_id = {}
-            operation_cancelled = False
-            for tool_call in tool_calls:
-                result = self._execute_single_tool(tool_call, ctx)
-                tool_results_by_id[tool_call["id"]] = result
-                if result.get("interrupted", False):
-                    operation_cancelled = True
-                    break
+            # Read-only runs execute concurrently, everything else in order
+            tool_results_by_id, operation_cancelled = self._execute_tools_scheduled(
+                tool_calls, ctx
+            )
 
         # Batch add all results after completion (maintains message order)
         for tool_call in tool_calls:
@@ -920,25 +909,42 @@ Please provide refined reasoning that addresses these concerns. Keep it concise
             suppress_separate_response: If True, don't display separate_response immediately.
                 Used in parallel mode to aggregate responses later.
         """
-        tool_name = tool_call["function"]["name"]
-
-        if tool_name == "task_complete":
+        if tool_call["function"]["name"] == "task_complete":
             return {}
 
+        self._notify_tool_call(tool_call, ctx)
+        result = self._run_tool(tool_call, ctx)
+        self._notify_tool_result(tool_call, ctx, result, suppress_separate_response)
+        return result
+
+    def _notify_tool_call(self, tool_call: dict, ctx: IterationContext) -> None:
+        """Tell the UI a tool call is starting."""
+        tool_name = tool_call["function"]["name"]
+
         # Debug
         if ctx.ui_callback and hasattr(ctx.ui_callback, "on_debug"):
             ctx.ui_callback.on_debug(f"Executing tool: {tool_name}", "TOOL")
 
+        # Notify UI call
+        if ctx.ui_callback and hasattr(ctx.ui_callback, "on_tool_call"):
+            ctx.ui_callback.on_tool_call(tool_name, tool_call["function"]["arguments"])
+
+    def _run_tool(
+        self,
+        tool_call: dict,
+        ctx: IterationContext,
+        task_monitor: Optional[TaskMonitor] = None,
+    ) -> dict:
+        """Execute a tool call without UI notifications (safe to call from workers).
+
+        Workers of a concurrent batch pass the batch's shared ``task_monitor``.
+        """
+        tool_name = tool_call["function"]["name"]
         args_str = tool_call["function"]["arguments"]
         _session_debug().log(
             "tool_call_start", "tool", name=tool_name, params_preview=args_str[:200]
         )
 
-        # Notify UI call
-        if ctx.ui_callback and hasattr(ctx.ui_callback, "on_tool_call"):
-            ctx.ui_callback.on_tool_call(tool_name, args_str)
-
-        # Execute
         import time as _time
 
         tool_start = _time.monotonic()
@@ -949,6 +955,7 @@ Please provide refined reasoning that addresses these concerns. Keep it concise
                 ctx.approval_manager,
                 ctx.undo_manager,
                 ui_callback=ctx.ui_callback,
+                task_monitor=task_monitor,
             )
         except Exception as exc:
             import traceback
@@ -972,6 +979,18 @@ Please provide refined reasoning that addresses these concerns. Keep it concise
             success=result.get("success", False),
             result_preview=result_preview,
         )
+        return result
+
+    def _notify_tool_result(
+        self,
+        tool_call: dict,
+        ctx: IterationContext,
+        result: dict,
+        suppress_separate_response: bool = False,
+    ) -> None:
+        """Record the operation summary and tell the UI a tool call finished."""
+        tool_name = tool_call["function"]["name"]
+        args_str = tool_call["function"]["arguments"]
 
         # Store summary
         self._last_operation_summary = format_tool_call(
@@ -987,7 +1006,95 @@ Please provide refined reasoning that addresses these concerns. Keep it concise
         if separate_response and not suppress_separate_response:
             self._display_message(separate_response, ctx.ui_callback)
 
-        return result
+    def _plan_tool_batches(self, tool_calls: list) -> list[list[dict]]:
+        """Split tool calls into ordered batches.
+
+        Consecutive concurrency-safe calls share a batch; every other call
+        (writes, bash, subagents, ...) gets a batch of its own, so side effects
+        happen in the order the model requested, after the reads before them.
+        """
+        batches: list[list[dict]] = []
+        previous_safe = False
+        for tool_call in tool_calls:
+            is_safe = tool_call["function"]["name"] in self.CONCURRENT_SAFE_OPERATIONS
+            if is_safe and previous_safe:
+                batches[-1].append(tool_call)
+            else:
+                batches.append([tool_call])
+            previous_safe = is_safe
+        return batches
+
+    def _execute_tools_scheduled(
+        self, tool_calls: list, ctx: IterationContext
+    ) -> tuple[Dict[str, dict], bool]:
+        """Execute tool calls batch by batch, running read-only batches concurrently.
+
+        Returns:
+            Tuple of (results_by_id dict, operation_cancelled bool). Calls skipped
+            after an interrupt get an interrupted result so history stays complete.
+        """
+        tool_results_by_id: Dict[str, dict] = {}
+        operation_cancelled = False
+
+        for batch in self._plan_tool_batches(tool_calls):
+            if operation_cancelled:
+                for tool_call in batch:
+                    tool_results_by_id[tool_call["id"]] = {
+                        "success": False,
+                        "error": "Interrupted by user",
+                        "interrupted": True,
+                    }
+                continue
+
+            if len(batch) == 1:
+                batch_results = {batch[0]["id"]: self._execute_single_tool(batch[0], ctx)}
+            else:
+                batch_results = self._execute_read_batch(batch, ctx)
+
+            tool_results_by_id.update(batch_results)
+            if any(result.get("interrupted", False) for result in batch_results.values()):
+                operation_cancelled = True
+
+        return tool_results_by_id, operation_cancelled
+
+    def _execute_read_batch(self, batch: list, ctx: IterationContext) -> Dict[str, dict]:
+        """Run read-only tool calls concurrently on a bounded pool.
+
+        Tools run on worker threads, while UI notifications are delivered from
+        this thread in the original call order: each ``on_tool_call`` is
+        followed by its ``on_tool_result`` before the next call is announced.
+
+        The whole batch shares one task monitor (so ESC interrupts every
+        call still running) and one progress display, since Rich allows only
+        one live display at a time.
+        """
+        results: Dict[str, dict] = {}
+        batch_monitor = TaskMonitor()
+        batch_monitor.start(f"Running {len(batch)} read-only tools", initial_tokens=0)
+        if self._tool_executor:
+            self._tool_executor._current_task_monitor = batch_monitor
+        progress = TaskProgressDisplay(self.console, batch_monitor)
+        progress.start()
+        try:
+            with ThreadPoolExecutor(
+                max_workers=min(MAX_CONCURRENT_TOOLS, len(batch))
+            ) as executor:
+                futures = [
+                    executor.submit(self._run_tool, tc, ctx, batch_monitor) for tc in batch
+                ]
+                for tool_call, future in zip(batch, futures):
+                    self._notify_tool_call(tool_call, ctx)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = {"success": False, "error": str(e)}
+                    self._notify_tool_result(tool_call, ctx, result)
+                    results[tool_call["id"]] = result
+        finally:
+            progress.stop()
+            if self._tool_executor:
+                self._tool_executor._current_task_monitor = None
+        return results
 
     def _execute_tools_parallel(
         self, tool_calls: list, ctx: IterationContext
@@ -1244,12 +1351,7 @@ Please provide refined reasoning that addresses these concerns. Keep it concise
         """Check if agent should be nudged to conclude."""
         if consecutive_reads >= 5:
             # Silently nudge the agent
-            messages.append(
-                {
-                    "role": "user",
-                    "content": get_injection("consecutive_reads_nudge"),
-                }
-            )
+            messages.append(injected_user_message(get_injection("consecutive_reads_nudge")))
             return True
         return False
 
@@ -1260,22 +1362,29 @@ Please provide refined reasoning that addresses these concerns. Keep it concise
         approval_manager,
         undo_manager,
         ui_callback=None,
+        task_monitor: Optional[TaskMonitor] = None,
     ) -> dict:
-        """Execute a single tool call."""
+        """Execute a single tool call.
+
+        With ``task_monitor`` (a concurrent batch), the caller owns the monitor
+        and the progress display; otherwise the call gets its own.
+        """
 
         tool_name = tool_call["function"]["name"]
         tool_args = json.loads(tool_call["function"]["arguments"])
         tool_call_id = tool_call["id"]
-        tool_call_display = format_tool_call(tool_name, tool_args)
-
-        tool_monitor = TaskMonitor()
-        tool_monitor.start(tool_call_display, initial_tokens=0)
+        shared_monitor = task_monitor is not None
 
-        if self._tool_executor:
-            self._tool_executor._current_task_monitor = tool_monitor
-
-        progress = TaskProgressDisplay(self.console, tool_monitor)
-        progress.start()
+        if shared_monitor:
+            tool_monitor = task_monitor
+            progress = None
+        else:
+            tool_monitor = TaskMonitor()
+            tool_monitor.start(format_tool_call(tool_name, tool_args), initial_tokens=0)
+            if self._tool_executor:
+                self._tool_executor._current_task_monitor = tool_monitor
+            progress = TaskProgressDisplay(self.console, tool_monitor)
+            progress.start()
 
         try:
             result = tool_registry.execute_tool(
@@ -1291,6 +1400,7 @@ Please provide refined reasoning that addresses these concerns. Keep it concise
             )
             return result
         finally:
-            progress.stop()
-            if self._tool_executor:
-                self._tool_executor._current_task_monitor = None
+            if not shared_monitor:
+                progress.stop()
+                if self._tool_executor:
+                    self._tool_executor._current_task_monitor = None
@@ -108,18 +108,11 @@ class REPL:
 
     def _init_tools(self):
         """Initialize file operation and command tools."""
-        from swecli.core.context_engineering.tools.implementations import (
-            WebFetchTool,
-            OpenBrowserTool,
-            VLMTool,
-            WebScreenshotTool,
-        )
-        from swecli.core.context_engineering.tools.implementations.web_search_tool import (
-            WebSearchTool,
-        )
+        from swecli.core.context_engineering.tools.implementations import OpenBrowserTool
         from swecli.core.context_engineering.tools.implementations.notebook_edit_tool import (
             NotebookEditTool,
         )
+        from swecli.core.context_engineering.tools.lazy_tool import LazyTool
         from swecli.core.context_engineering.tools.implementations.ask_user_tool import AskUserTool
         from swecli.core.context_engineering.mcp.manager import MCPManager
         from swecli.core.context_engineering.tools.background_task_manager import (
@@ -133,13 +126,24 @@ class REPL:
         self.bash_tool = BashTool(
             self.config, self.config_manager.working_dir, task_manager=self.task_manager
         )
-        self.web_fetch_tool = WebFetchTool(self.config, self.config_manager.working_dir)
-        self.web_search_tool = WebSearchTool(self.config, self.config_manager.working_dir)
-        self.notebook_edit_tool = NotebookEditTool(self.config_manager.working_dir)
+        # Web and VLM tools are imported on first use
+        implementations = "swecli.core.context_engineering.tools.implementations"
+        working_dir = self.config_manager.working_dir
+        self.web_fetch_tool = LazyTool.from_path(
+            f"{implementations}.web_fetch_tool:WebFetchTool", self.config, working_dir
+        )
+        self.web_search_tool = LazyTool.from_path(
+            f"{implementations}.web_search_tool:WebSearchTool", self.config, working_dir
+        )
+        self.notebook_edit_tool = NotebookEditTool(working_dir)
         self.ask_user_tool = AskUserTool()  # Uses console fallback
-        self.open_browser_tool = OpenBrowserTool(self.config, self.config_manager.working_dir)
-        self.vlm_tool = VLMTool(self.config, self.config_manager.working_dir)
-        self.web_screenshot_tool = WebScreenshotTool(self.config, self.config_manager.working_dir)
+        self.open_browser_tool = OpenBrowserTool(self.config, working_dir)
+        self.vlm_tool = LazyTool.from_path(
+            f"{implementations}.vlm_tool:VLMTool", self.config, working_dir
+        )
+        self.web_screenshot_tool = LazyTool.from_path(
+            f"{implementations}.web_screenshot_tool:WebScreenshotTool", self.config, working_dir
+        )
         self.mcp_manager = MCPManager(working_dir=self.config_manager.working_dir)
 
     def _init_managers(self):
@@ -423,6 +427,7 @@ class REPL:
 
         # Connect to enabled MCP servers
         self._connect_mcp_servers()
+        self._prewarm_language_servers()
 
         # Project instructions (SWECLI.md) are now included in the system prompt
         # via EnvironmentContext, so no separate injection is needed here.
@@ -608,6 +613,32 @@ class REPL:
         thread = threading.Thread(target=connect_in_background, daemon=True)
         thread.start()
 
+    def _prewarm_language_servers(self) -> None:
+        """Boot language servers for the workspace's languages in the background."""
+        import threading
+
+        lsp_config = getattr(self.config, "lsp", None)
+        if lsp_config is None or not lsp_config.prewarm:
+            return
+
+        def prewarm_in_background():
+            try:
+                from swecli.core.context_engineering.tools.lsp import prewarm_lsp_servers
+
+                prewarm_lsp_servers(
+                    self.config_manager.working_dir,
+                    max_languages=lsp_config.max_prewarm_languages,
+                    max_concurrent_boots=lsp_config.max_concurrent_boots,
+                    idle_ttl=lsp_config.idle_ttl_seconds,
+                )
+            except Exception:
+                # Servers still boot on first use
+                pass
+
+        # Detecting languages scans the workspace, so keep it off the startup path
+        thread = threading.Thread(target=prewarm_in_background, daemon=True)
+        thread.start()
+
     def _cleanup(self) -> None:
         """Cleanup resources."""
         # Disconnect from MCP servers using manager's shared loop
@@ -622,5 +653,13 @@ class REPL:
         if self.session_manager.current_session:
             self.session_manager.save_session()
 
+        # Stop language servers (and persist their symbol caches)
+        try:
+            from swecli.core.context_engineering.tools.lsp import shutdown_lsp_wrapper
+
+            shutdown_lsp_wrapper()
+        except Exception:
+            pass
+
         # No cleanup needed for Pydantic AI agent
         self.console.print(f"\n[{CYAN}]Goodbye![/{CYAN}]")
@@ -30,6 +30,10 @@ class UICallbackProtocol(Protocol):
         """Called when assistant provides a message."""
         ...
 
+    def on_assistant_delta(self, delta: str) -> None:
+        """Called with each text fragment while a response is streaming."""
+        ...
+
     def on_message(self, message: str) -> None:
         """Called to display a general message."""
         ...
@@ -159,6 +163,10 @@ class BaseUICallback:
         """Called when assistant provides a message."""
         pass
 
+    def on_assistant_delta(self, delta: str) -> None:
+        """Called with each text fragment while a response is streaming."""
+        pass
+
     def on_message(self, message: str) -> None:
         """Called to display a general message."""
         pass
@@ -304,6 +312,9 @@ class ForwardingUICallback(BaseUICallback):
     def on_assistant_message(self, content: str) -> None:
         self._forward('on_assistant_message', content)
 
+    def on_assistant_delta(self, delta: str) -> None:
+        self._forward('on_assistant_delta', delta)
+
     def on_message(self, message: str) -> None:
         self._forward('on_message', message)
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -74,6 +75,12 @@ class CommandRouter:
                 await self._handle_tasks(conversation)
             return True
 
+        if cmd == "/task" and len(parts) > 3 and parts[2].lower() == "grep":
+            if conversation is not None:
+                pattern = command.split(None, 3)[3]
+                await self._handle_task_grep(conversation, parts[1], pattern)
+            return True
+
         if cmd == "/task" and len(parts) > 1:
             if conversation is not None:
                 task_id = parts[1]
@@ -100,6 +107,7 @@ class CommandRouter:
         conversation.add_system_message("  /plugins - Manage plugins and marketplaces")
         conversation.add_system_message("  /tasks - List background tasks")
         conversation.add_system_message("  /task <id> - Show task output")
+        conversation.add_system_message("  /task <id> grep <regex> - Search task output")
         conversation.add_system_message("  /kill <id> - Kill a background task")
         conversation.add_system_message("  /quit - Exit application")
         conversation.add_system_message("")
@@ -201,6 +209,29 @@ class CommandRouter:
         else:
             conversation.add_tool_result("(no output yet)")
 
+    async def _handle_task_grep(self, conversation, task_id: str, pattern: str) -> None:
+        """Show lines of a task's output matching a regex."""
+        task_manager = getattr(self.app, "_task_manager", None)
+        conversation.add_tool_call(f"Task Grep ({task_id})", pattern[:30])
+        if task_manager is None:
+            conversation.add_tool_result("No task manager available")
+            return
+
+        if not task_manager.get_task(task_id):
+            conversation.add_error(f"Task '{task_id}' not found")
+            return
+
+        try:
+            matches = task_manager.grep_output(task_id, pattern)
+        except re.error as exc:
+            conversation.add_error(f"Invalid pattern: {exc}")
+            return
+
+        if matches:
+            conversation.add_tool_result("\n".join(f"{n}: {line}" for n, line in matches))
+        else:
+            conversation.add_tool_result("(no matches)")
+
     async def _handle_kill_task(self, conversation, task_id: str) -> None:
         """Kill a background task."""
         task_manager = getattr(self.app, "_task_manager", None)
@@ -4,6 +4,7 @@ from .console_buffer_manager import ConsoleBufferManager
 from .message_history import MessageHistory
 from .tool_summary_manager import ToolSummaryManager
 from .approval_manager import ChatApprovalManager
+from .frame_scheduler import FrameScheduler, FrameStats
 from .spinner_service import SpinnerService, SpinnerType, SpinnerFrame, SpinnerConfig
 from .interrupt_manager import InterruptManager, InterruptState, InterruptContext
 
@@ -12,6 +13,8 @@ __all__ = [
     "MessageHistory",
     "ToolSummaryManager",
     "ChatApprovalManager",
+    "FrameScheduler",
+    "FrameStats",
     "SpinnerService",
     "SpinnerType",
     "SpinnerFrame",
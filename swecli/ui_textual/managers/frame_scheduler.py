@@ -0,0 +1,233 @@
+"""Single-thread frame scheduler shared by all UI animations.
+
+One long-lived daemon thread paces frames at a fixed rate and posts at most
+one frame at a time to the Textual event loop. Each frame runs every
+subscriber whose interval has elapsed, so any number of animated widgets cost
+one cross-thread call per frame instead of a timer thread each.
+
+Frames are dropped, and the frame interval backs off, while the previous
+frame has not been processed yet (the event loop is busy) or while the
+terminal writer's queue is close to full. Subscribers can provide a
+visibility check to be skipped while they are off-screen.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, Optional
+
+if TYPE_CHECKING:
+    from textual.app import App
+
+
+@dataclass
+class FrameStats:
+    """Counters for profiling the frame scheduler."""
+
+    frames: int = 0  # Frames run on the UI thread
+    dropped_frames: int = 0  # Frames skipped because the UI or terminal was saturated
+    skipped_offscreen: int = 0  # Subscriber updates skipped because they were not visible
+    last_frame_ms: float = 0.0
+    max_frame_ms: float = 0.0
+    total_frame_ms: float = 0.0
+    backoff: int = 1  # Current frame interval multiplier
+
+    @property
+    def avg_frame_ms(self) -> float:
+        return self.total_frame_ms / self.frames if self.frames else 0.0
+
+
+@dataclass
+class _Subscriber:
+    callback: Callable[[float], None]
+    interval: float
+    is_visible: Optional[Callable[[], bool]]
+    next_due: float = 0.0
+
+
+class FrameScheduler:
+    """Drives animation callbacks from one thread at a shared frame rate.
+
+    Callbacks always run on the UI thread. The scheduler thread sleeps while
+    there are no subscribers.
+    """
+
+    # Back off once the terminal writer holds this many pending writes
+    # (textual's writer queue holds at most 30)
+    WRITE_QUEUE_HIGH_WATER = 20
+    MAX_BACKOFF = 8
+
+    def __init__(self, app: "App", fps: float = 30.0) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            app: The Textual App whose event loop runs the frames
+            fps: Maximum frame rate
+        """
+        self.app = app
+        self.frame_interval = 1.0 / fps
+        self.stats = FrameStats()
+        self._subscribers: Dict[str, _Subscriber] = {}
+        self._condition = threading.Condition()
+        # Guards ``stats`` and ``_frame_pending``, shared by both threads
+        self._stats_lock = threading.Lock()
+        self._frame_pending = False
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    # ------------------------------------------------------------------
+    # Subscription
+    # ------------------------------------------------------------------
+
+    def subscribe(
+        self,
+        key: str,
+        callback: Callable[[float], None],
+        interval: float = 0.0,
+        is_visible: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        """Run ``callback(now)`` on the UI thread every ``interval`` seconds.
+
+        Subscribing again with the same key replaces the subscription.
+
+        Args:
+            key: Identifies the subscription
+            callback: Called with ``time.monotonic()`` of the frame
+            interval: Minimum seconds between calls (0 = every frame)
+            is_visible: Optional check; the callback is skipped while it returns False
+        """
+        with self._condition:
+            self._subscribers[key] = _Subscriber(callback, interval, is_visible)
+            self._ensure_thread()
+            self._condition.notify()
+
+    def unsubscribe(self, key: str) -> None:
+        """Stop calling the subscription with ``key`` (no-op if unknown)."""
+        with self._condition:
+            self._subscribers.pop(key, None)
+
+    def is_subscribed(self, key: str) -> bool:
+        with self._condition:
+            return key in self._subscribers
+
+    def stop(self) -> None:
+        """Stop the scheduler thread."""
+        with self._condition:
+            self._stopped = True
+            self._subscribers.clear()
+            self._condition.notify()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+        self._thread = None
+
+    # ------------------------------------------------------------------
+    # Scheduler thread
+    # ------------------------------------------------------------------
+
+    def _ensure_thread(self) -> None:
+        """Start the scheduler thread; the caller holds ``_condition``."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped = False
+            self._thread = threading.Thread(target=self._run, name="frame-scheduler", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        next_frame = time.monotonic()
+        while True:
+            with self._condition:
+                while not self._subscribers and not self._stopped:
+                    self._condition.wait()
+                    next_frame = time.monotonic()
+                if self._stopped:
+                    return
+                delay = next_frame - time.monotonic()
+                if delay > 0:
+                    self._condition.wait(timeout=delay)
+                    continue
+
+            saturated = self._writer_saturated()
+            with self._stats_lock:
+                stats = self.stats
+                next_frame = max(next_frame + self.frame_interval * stats.backoff, time.monotonic())
+                if self._frame_pending or saturated:
+                    stats.dropped_frames += 1
+                    stats.backoff = min(stats.backoff * 2, self.MAX_BACKOFF)
+                    continue
+                if stats.backoff > 1:
+                    stats.backoff -= 1
+                self._frame_pending = True
+
+            if not self._post_frame():
+                with self._stats_lock:
+                    self._frame_pending = False
+
+    def _post_frame(self) -> bool:
+        """Queue one frame on the UI event loop without blocking.
+
+        ``App.call_later`` is safe to call from this thread and, unlike
+        ``call_from_thread``, does not wait for the frame to run.
+        """
+        if getattr(self.app, "_loop", None) is None:
+            # No event loop (e.g. headless use): run the frame here
+            self._run_frame()
+            return True
+        try:
+            return bool(self.app.call_later(self._run_frame))
+        except RuntimeError:
+            return False  # Loop closed; the app is shutting down
+
+    def _writer_saturated(self) -> bool:
+        driver = getattr(self.app, "_driver", None)
+        writer = getattr(driver, "_writer_thread", None)
+        queue = getattr(writer, "_queue", None)
+        if queue is None:
+            return False
+        try:
+            return queue.qsize() >= self.WRITE_QUEUE_HIGH_WATER
+        except Exception:
+            return False
+
+    # ------------------------------------------------------------------
+    # UI thread
+    # ------------------------------------------------------------------
+
+    def _run_frame(self) -> None:
+        started = time.monotonic()
+        try:
+            with self._condition:
+                due = [
+                    sub
+                    for sub in self._subscribers.values()
+                    if sub.next_due <= started
+                ]
+                for sub in due:
+                    sub.next_due = started + sub.interval
+            for sub in due:
+                if sub.is_visible is not None:
+                    try:
+                        visible = sub.is_visible()
+                    except Exception:
+                        visible = True
+                    if not visible:
+                        with self._stats_lock:
+                            self.stats.skipped_offscreen += 1
+                        continue
+                try:
+                    sub.callback(started)
+                except Exception:
+                    pass  # Don't let one animation stop the others
+        finally:
+            elapsed_ms = (time.monotonic() - started) * 1000
+            with self._stats_lock:
+                stats = self.stats
+                stats.frames += 1
+                stats.last_frame_ms = elapsed_ms
+                stats.max_frame_ms = max(stats.max_frame_ms, elapsed_ms)
+                stats.total_frame_ms += elapsed_ms
+                self._frame_pending = False
+
+
+__all__ = ["FrameScheduler", "FrameStats"]
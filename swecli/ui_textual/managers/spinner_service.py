@@ -3,11 +3,11 @@
 This module provides a unified SpinnerService that:
 1. Provides facade API (start/update/stop) for ui_callback compatibility
 2. Provides callback API (register) for widgets that manage their own spinners
-3. Owns all timer lifecycle (Textual timer + threading.Timer fallback)
+3. Drives all animations from one shared FrameScheduler thread
 4. Invokes widget callbacks with SpinnerFrame data for rendering
 
-The dual-timer pattern ensures animations work even when Textual's event loop
-is blocked during synchronous LLM calls.
+Every active spinner is advanced in the same frame on the UI thread, so any
+number of spinners cost one cross-thread call per frame.
 """
 
 from __future__ import annotations
@@ -21,11 +21,11 @@ from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
 
 from rich.text import Text
 
+from swecli.ui_textual.managers.frame_scheduler import FrameScheduler, FrameStats
 from swecli.ui_textual.style_tokens import GREY, PRIMARY, GREEN_BRIGHT, BLUE_BRIGHT, ERROR, WARNING
 
 if TYPE_CHECKING:
     from textual.app import App
-    from textual.timer import Timer
     from swecli.ui_textual.widgets.conversation_log import ConversationLog
     from swecli.ui_textual.components import TipsManager
 
@@ -98,6 +98,8 @@ class SpinnerInstance:
 
     # Callback for rendering updates
     render_callback: Optional[Callable[["SpinnerFrame"], None]] = None
+    # Rendering is skipped while this returns False (e.g. widget hidden)
+    is_visible: Optional[Callable[[], bool]] = None
 
     # Stop handling
     stop_requested: bool = False
@@ -139,13 +141,14 @@ class SpinnerService:
     - UI updates dispatched via call_from_thread when needed
 
     Timer Architecture:
-    - Single animation loop with GCD-based tick interval (60ms)
+    - One FrameScheduler thread paces frames (30fps) for all spinners
     - Each spinner tracks when its next frame is due
-    - Dual-timer pattern: Textual timer (when loop is free) + threading.Timer (fallback)
+    - Spinners whose line or widget is off-screen advance without rendering
+    - Frames are dropped while the UI is saturated (see frame_stats)
     """
 
-    # Tick interval - GCD of all spinner intervals for smooth animation
-    _TICK_INTERVAL_MS = 60  # ~16fps base rate, divides evenly into 120, 300, 150
+    _FRAMES_PER_SECOND = 30
+    _SCHEDULER_KEY = "spinner-service"
 
     def __init__(self, app: "App") -> None:
         """Initialize the SpinnerService.
@@ -159,9 +162,8 @@ class SpinnerService:
         # Active spinners by ID
         self._spinners: Dict[str, SpinnerInstance] = {}
 
-        # Timer references
-        self._textual_timer: Optional["Timer"] = None
-        self._thread_timer: Optional[threading.Timer] = None
+        # Shared frame scheduler; other animated widgets can subscribe too
+        self.frame_scheduler = FrameScheduler(app, fps=self._FRAMES_PER_SECOND)
 
         # Animation loop state
         self._running = False
@@ -182,6 +184,11 @@ class SpinnerService:
         # TipsManager for rotating tips below spinners
         self._tips_manager: Optional["TipsManager"] = None
 
+    @property
+    def frame_stats(self) -> FrameStats:
+        """Frame-time and dropped-frame counters for profiling."""
+        return self.frame_scheduler.stats
+
     @property
     def _conversation(self) -> Optional["ConversationLog"]:
         """Get the conversation log widget."""
@@ -238,12 +245,8 @@ class SpinnerService:
 
     def resume_after_resize(self) -> None:
         """Restart animation loop after resize."""
-        with self._lock:
-            if self._spinners and not self._running:
-                self._running = True
-        # Start animation loop outside lock to avoid deadlock
         if self._spinners:
-            self._schedule_tick()
+            self._start_animation_loop()
 
     # =========================================================================
     # FACADE API (for ui_callback compatibility)
@@ -512,6 +515,7 @@ class SpinnerService:
         render_callback: Callable[[SpinnerFrame], None],
         message: Optional[Text | str] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        is_visible: Optional[Callable[[], bool]] = None,
     ) -> str:
         """Register a new spinner and return its ID (CALLBACK API).
 
@@ -523,6 +527,7 @@ class SpinnerService:
             render_callback: Called each frame with SpinnerFrame data
             message: Optional message to display with spinner
             metadata: Optional widget-specific data passed through to callback
+            is_visible: Optional check; frames are not rendered while it returns False
 
         Returns:
             Unique spinner ID for later reference
@@ -545,6 +550,7 @@ class SpinnerService:
             message=msg_text,
             metadata=metadata or {},
             render_callback=render_callback,
+            is_visible=is_visible,
         )
 
         should_start_loop = False
@@ -698,77 +704,22 @@ class SpinnerService:
     def _start_animation_loop(self) -> None:
         """Start the animation loop (called WITHOUT lock held to avoid deadlock)."""
         with self._lock:
-            if self._running:
-                return
             self._running = True
-
-        # Schedule tick OUTSIDE lock to avoid deadlock
-        # (_on_tick also acquires the lock)
-        self._schedule_tick()
+        self.frame_scheduler.subscribe(self._SCHEDULER_KEY, self._on_frame)
 
     def _stop_animation_loop(self) -> None:
         """Stop the animation loop (called with lock held)."""
         self._running = False
+        self.frame_scheduler.unsubscribe(self._SCHEDULER_KEY)
 
-        if self._textual_timer is not None:
-            self._textual_timer.stop()
-            self._textual_timer = None
-
-        if self._thread_timer is not None:
-            self._thread_timer.cancel()
-            self._thread_timer = None
-
-    def _schedule_tick(self) -> None:
-        """Schedule next animation tick using dual-timer pattern."""
-        if not self._running:
-            return
-
-        interval_sec = self._TICK_INTERVAL_MS / 1000
-
-        # Cancel existing timers (thread-safe operations)
-        if self._textual_timer is not None:
-            try:
-                self._textual_timer.stop()
-            except Exception:
-                pass
-        if self._thread_timer is not None:
-            self._thread_timer.cancel()
-            self._thread_timer = None
-
-        # Schedule Textual timer - MUST be done on UI thread
-        def _setup_textual_timer():
-            try:
-                self._textual_timer = self.app.set_timer(interval_sec, self._on_tick)
-            except Exception:
-                pass  # App may be shutting down
-
-        # Dispatch to UI thread (non-blocking)
-        self._run_non_blocking(_setup_textual_timer)
-
-        # Schedule threading.Timer fallback (bypasses blocked event loop)
-        self._thread_timer = threading.Timer(interval_sec, self._on_thread_tick)
-        self._thread_timer.daemon = True
-        self._thread_timer.start()
-
-    def _on_thread_tick(self) -> None:
-        """Fallback tick via threading.Timer when event loop is blocked."""
-        if not self._running:
-            return
-
-        # Use call_from_thread to safely run on UI thread
-        try:
-            self.app.call_from_thread(self._on_tick)
-        except Exception:
-            pass  # App may be shutting down
+    def _on_frame(self, now: float) -> None:
+        """Frame callback from the scheduler (runs on the UI thread)."""
+        self._on_tick(now)
 
-    def _on_tick(self) -> None:
+    def _on_tick(self, now: Optional[float] = None) -> None:
         """Animation tick - advance frames and render as needed."""
-        # Cancel thread timer if this tick came from Textual timer
-        if self._thread_timer is not None:
-            self._thread_timer.cancel()
-            self._thread_timer = None
-
-        now = time.monotonic()
+        if now is None:
+            now = time.monotonic()
 
         with self._lock:
             if not self._running:
@@ -807,10 +758,31 @@ class SpinnerService:
 
         # Render frames (outside lock to avoid deadlock)
         for instance in to_render:
+            if not self._is_visible(instance):
+                self.frame_scheduler.stats.skipped_offscreen += 1
+                continue
             self._render_frame(instance)
 
-        # Schedule next tick
-        self._schedule_tick()
+    def _is_visible(self, instance: SpinnerInstance) -> bool:
+        """Whether a spinner's frame would be seen if rendered now."""
+        if instance.is_visible is not None:
+            try:
+                return bool(instance.is_visible())
+            except Exception:
+                return True
+
+        line_num = self._spinner_lines.get(instance.spinner_id)
+        conversation = self._conversation
+        if line_num is None or conversation is None:
+            return True
+        try:
+            top = int(conversation.scroll_y)
+            height = conversation.scrollable_content_region.height
+        except Exception:
+            return True
+        if height <= 0:
+            return True
+        return top <= line_num < top + height
 
     def _render_frame(self, instance: SpinnerInstance) -> None:
         """Invoke the render callback for a spinner."""
@@ -111,6 +111,10 @@ class NestedUICallback(ForwardingUICallback):
         """Don't forward assistant messages from subagents (they appear as final result)."""
         pass
 
+    def on_assistant_delta(self, delta: str) -> None:
+        """Don't forward streamed text from subagents."""
+        pass
+
     # Override methods that need special nesting behavior:
 
     def on_tool_call(
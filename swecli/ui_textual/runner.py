@@ -770,6 +770,7 @@ Work through each implementation step in order. Mark each todo item as 'in_progr
         """Called when the Textual app is fully mounted and ready."""
         # Schedule MCP auto-connect if enabled
         self.mcp_controller.start_autoconnect_thread(self._loop)
+        self.repl._prewarm_language_servers()
 
         # If auto-connect isn't enabled, show tip
         if not self.mcp_controller._auto_connect_enabled:
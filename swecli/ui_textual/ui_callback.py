@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import sys
+import time
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -16,6 +17,11 @@ from swecli.ui_textual.constants import TOOL_ERROR_SENTINEL
 from swecli.ui_textual.utils.text_utils import summarize_error
 from swecli.models.message import ToolCall
 
+# Minimum seconds between spinner refreshes while a response is streaming
+STREAM_PREVIEW_INTERVAL = 0.1
+# Maximum characters of streamed text shown in the spinner preview
+STREAM_PREVIEW_CHARS = 120
+
 
 class TextualUICallback:
     """Callback for real-time display of agent actions in Textual UI."""
@@ -52,10 +58,14 @@ class TextualUICallback:
         self._in_parallel_agent_group: bool = False
         # Track current single agent ID for completion callback
         self._current_single_agent_id: str | None = None
+        # Text received so far for the response currently streaming
+        self._streaming_text = ""
+        self._last_stream_preview = 0.0
 
     def on_thinking_start(self) -> None:
         """Called when the agent starts thinking."""
         self._current_thinking = True
+        self._streaming_text = ""
 
         # The app's built-in spinner should already be running with our custom message
         # We don't need to start another spinner, just note that thinking has started
@@ -148,12 +158,46 @@ class TextualUICallback:
         self._pending_nested_calls = []
         return calls
 
+    def on_assistant_delta(self, delta: str) -> None:
+        """Called with each text fragment while a response is streaming.
+
+        Shows the latest streamed line in the thinking spinner so output is
+        visible from the first token. The complete message is still rendered
+        by on_assistant_message once the response finishes.
+
+        Args:
+            delta: Newly received text fragment
+        """
+        if not delta:
+            return
+        self._streaming_text += delta
+
+        now = time.monotonic()
+        if now - self._last_stream_preview < STREAM_PREVIEW_INTERVAL:
+            return
+        self._last_stream_preview = now
+
+        # Only refresh a running spinner - never start one from a stream
+        spinner = getattr(self.chat_app, "_spinner", None) if self.chat_app else None
+        if spinner is None or not getattr(spinner, "active", False):
+            return
+
+        lines = self._streaming_text.strip().splitlines()
+        if not lines or not hasattr(self.conversation, "update_spinner"):
+            return
+
+        from rich.text import Text
+
+        preview = Text(lines[-1][-STREAM_PREVIEW_CHARS:], style=GREY)
+        self._run_on_ui_non_blocking(self.conversation.update_spinner, preview)
+
     def on_assistant_message(self, content: str) -> None:
         """Called when assistant provides a message before tool execution.
 
         Args:
             content: The assistant's message/thinking
         """
+        self._streaming_text = ""
         if content and content.strip():
             # Stop spinner before showing assistant message
             # Note: Only call _stop_local_spinner which goes through SpinnerController
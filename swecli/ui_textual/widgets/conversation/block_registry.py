@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
 from typing import Optional
 
 from rich.console import RenderableType
 
 
-@dataclass
 class ContentBlock:
     """Tracks a content block for resize re-rendering.
 
+    Once registered, ``start_line`` is derived from the heights of the blocks
+    before it (see ``BlockRegistry``), so shifting every later block costs
+    O(log n) instead of touching each of them.
+
     Attributes:
         block_id: Unique identifier (uuid)
         source: Original renderable for re-rendering
@@ -19,14 +21,107 @@ class ContentBlock:
         is_locked: Whether block is locked during animation (prevents re-render)
         start_line: First line index in self.lines
         line_count: Number of lines this block occupies
+        rendered_width: Width the block's current lines were rendered at
+            (0 if unknown or only estimated)
     """
 
-    block_id: str
-    source: RenderableType
-    is_wrappable: bool
-    is_locked: bool = False
-    start_line: int = 0
-    line_count: int = 0
+    def __init__(
+        self,
+        block_id: str,
+        source: RenderableType,
+        is_wrappable: bool,
+        is_locked: bool = False,
+        start_line: int = 0,
+        line_count: int = 0,
+        rendered_width: int = 0,
+    ) -> None:
+        self.block_id = block_id
+        self.source = source
+        self.is_wrappable = is_wrappable
+        self.is_locked = is_locked
+        self.rendered_width = rendered_width
+        self._registry: Optional[BlockRegistry] = None
+        self._index = -1
+        self._start_line = start_line
+        self._line_count = line_count
+
+    @property
+    def start_line(self) -> int:
+        if self._registry is not None:
+            return self._registry._start_of(self._index)
+        return self._start_line
+
+    @start_line.setter
+    def start_line(self, value: int) -> None:
+        if self._registry is not None:
+            # Moving a registered block shifts every block after it as well
+            self._registry._shift_from(self._index, value - self.start_line)
+        else:
+            self._start_line = value
+
+    @property
+    def line_count(self) -> int:
+        return self._line_count
+
+    @line_count.setter
+    def line_count(self, value: int) -> None:
+        if self._registry is not None:
+            self._registry._heights.add(self._index, value - self._line_count)
+        self._line_count = value
+
+    @property
+    def end_line(self) -> int:
+        """Line index just past this block."""
+        return self.start_line + self._line_count
+
+    def __repr__(self) -> str:
+        return (
+            f"ContentBlock(block_id={self.block_id!r}, is_wrappable={self.is_wrappable}, "
+            f"is_locked={self.is_locked}, start_line={self.start_line}, line_count={self.line_count})"
+        )
+
+
+class _PrefixSums:
+    """Fenwick tree over a growable list of ints (prefix sums in O(log n))."""
+
+    def __init__(self) -> None:
+        self._values: list[int] = []
+        self._tree: list[int] = [0]  # 1-based
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def append(self, value: int) -> None:
+        self._values.append(value)
+        i = len(self._values)
+        # tree[i] covers (i - lowbit(i), i]
+        self._tree.append(value + self.prefix(i - 1) - self.prefix(i - (i & -i)))
+
+    def add(self, index: int, delta: int) -> None:
+        if not delta:
+            return
+        self._values[index] += delta
+        i = index + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def prefix(self, count: int) -> int:
+        """Sum of the first ``count`` values."""
+        total = 0
+        while count > 0:
+            total += self._tree[count]
+            count -= count & -count
+        return total
+
+    def truncate(self, count: int) -> None:
+        # tree[i] only depends on values[:i], so the prefix stays valid
+        del self._values[count:]
+        del self._tree[count + 1 :]
+
+    def clear(self) -> None:
+        self._values.clear()
+        del self._tree[1:]
 
 
 class BlockRegistry:
@@ -35,19 +130,88 @@ class BlockRegistry:
     This registry maintains a mapping between content blocks and their
     line positions in the RichLog. When the terminal is resized, wrappable
     and unlocked blocks can be re-rendered at the new width.
+
+    Each block's span (the unowned lines before it plus its own lines) is kept
+    in a prefix-sum tree, so a block's start line, a change in its height and
+    the shift of every block after it are all O(log n). Removed blocks leave
+    tombstones that are compacted once they make up half of the registry.
     """
 
     def __init__(self) -> None:
-        self._blocks: list[ContentBlock] = []
+        self._blocks: list[Optional[ContentBlock]] = []  # None = removed
+        self._gaps: list[int] = []  # unowned lines before each block
+        self._heights = _PrefixSums()  # gap + line_count per block
         self._block_map: dict[str, ContentBlock] = {}  # block_id -> block
 
+    # -- prefix-sum internals -------------------------------------------------
+
+    def _start_of(self, index: int) -> int:
+        return self._heights.prefix(index) + self._gaps[index]
+
+    def _shift_from(self, index: int, delta: int) -> None:
+        """Shift the block at ``index`` and every block after it by ``delta``."""
+        if delta and index < len(self._blocks):
+            self._gaps[index] += delta
+            self._heights.add(index, delta)
+
+    def _first_index_at_or_after(self, line: int) -> int:
+        """Index of the first block starting at or after ``line`` (binary search)."""
+        lo, hi = 0, len(self._blocks)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._start_of(mid) < line:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _detach(self, index: int) -> None:
+        block = self._blocks[index]
+        if block is None:
+            return
+        # Freeze the position so the detached block still reports where it was
+        block._start_line = self._start_of(index)
+        block._registry = None
+        block._index = -1
+        self._blocks[index] = None
+        self._block_map.pop(block.block_id, None)
+
+    def _compact(self) -> None:
+        blocks = self._blocks
+        starts = [self._start_of(i) for i in range(len(blocks))]
+        self._blocks, self._gaps = [], []
+        self._heights.clear()
+        end = 0
+        for block, start in zip(blocks, starts):
+            if block is None:
+                continue
+            block._index = len(self._blocks)
+            gap = start - end
+            self._blocks.append(block)
+            self._gaps.append(gap)
+            self._heights.append(gap + block.line_count)
+            end = start + block.line_count
+
+    def _maybe_compact(self) -> None:
+        if len(self._blocks) > 64 and len(self._block_map) * 2 < len(self._blocks):
+            self._compact()
+
+    # -- public API -----------------------------------------------------------
+
     def register(self, block: ContentBlock) -> None:
         """Add a new block at the end.
 
         Args:
             block: ContentBlock to register
         """
+        if block._registry is not None:
+            block._registry._detach(block._index)
+        gap = block._start_line - self._heights.prefix(len(self._heights))
+        block._registry = self
+        block._index = len(self._blocks)
         self._blocks.append(block)
+        self._gaps.append(gap)
+        self._heights.append(gap + block.line_count)
         self._block_map[block.block_id] = block
 
     def get_block(self, block_id: str) -> Optional[ContentBlock]:
@@ -88,12 +252,32 @@ class BlockRegistry:
             after_block: The block after which to adjust indices
             delta: Amount to shift (positive = added lines, negative = removed)
         """
-        found = False
-        for block in self._blocks:
-            if found:
-                block.start_line += delta
-            if block.block_id == after_block.block_id:
-                found = True
+        if after_block._registry is self:
+            self._shift_from(after_block._index + 1, delta)
+
+    def blocks_in_range(self, start: int, end: int) -> list[ContentBlock]:
+        """Get the blocks overlapping lines [start, end).
+
+        Args:
+            start: First line index
+            end: Line index just past the range
+
+        Returns:
+            List of ContentBlocks in order
+        """
+        index = max(0, self._first_index_at_or_after(start) - 1)
+        result = []
+        while index < len(self._blocks):
+            block = self._blocks[index]
+            index += 1
+            if block is None:
+                continue
+            block_start = block.start_line
+            if block_start >= end:
+                break
+            if block_start + max(block.line_count, 1) > start:
+                result.append(block)
+        return result
 
     def remove_blocks_from(self, start_line: int) -> None:
         """Remove blocks that start at or after start_line.
@@ -103,8 +287,12 @@ class BlockRegistry:
         Args:
             start_line: Line index from which to remove blocks
         """
-        self._blocks = [b for b in self._blocks if b.start_line < start_line]
-        self._block_map = {b.block_id: b for b in self._blocks}
+        index = self._first_index_at_or_after(start_line)
+        for i in range(index, len(self._blocks)):
+            self._detach(i)
+        del self._blocks[index:]
+        del self._gaps[index:]
+        self._heights.truncate(index)
 
     def remove_lines_range(self, start: int, count: int) -> None:
         """Remove blocks affected by line deletion and adjust remaining indices.
@@ -117,16 +305,22 @@ class BlockRegistry:
             start: First deleted line index
             count: Number of lines deleted
         """
+        if count <= 0:
+            return
         end = start + count
-        new_blocks = []
-        for b in self._blocks:
-            if start <= b.start_line < end:
-                continue  # Remove blocks in deleted range
-            if b.start_line >= end:
-                b.start_line -= count  # Shift blocks after deleted range
-            new_blocks.append(b)
-        self._blocks = new_blocks
-        self._block_map = {b.block_id: b for b in self._blocks}
+        first = self._first_index_at_or_after(start)
+        last = self._first_index_at_or_after(end)
+        if last < len(self._blocks):
+            # Blocks from `last` on move back by exactly `count` lines, whatever
+            # mix of removed blocks and unowned lines made up the deleted range
+            target_start = self._start_of(last) - count
+        for i in range(first, last):
+            self._detach(i)
+            self._heights.add(i, -self._heights._values[i])
+            self._gaps[i] = 0
+        if last < len(self._blocks):
+            self._shift_from(last, target_start - self._start_of(last))
+        self._maybe_compact()
 
     def get_wrappable_unlocked_blocks(self) -> list[ContentBlock]:
         """Get blocks that should be re-rendered on resize.
@@ -134,7 +328,7 @@ class BlockRegistry:
         Returns:
             List of ContentBlocks that are wrappable and not locked
         """
-        return [b for b in self._blocks if b.is_wrappable and not b.is_locked]
+        return [b for b in self._blocks if b is not None and b.is_wrappable and not b.is_locked]
 
     def get_all_blocks(self) -> list[ContentBlock]:
         """Get all registered blocks in order.
@@ -142,13 +336,17 @@ class BlockRegistry:
         Returns:
             List of all ContentBlocks
         """
-        return self._blocks.copy()
+        return [b for b in self._blocks if b is not None]
 
     def clear(self) -> None:
         """Clear all registered blocks."""
+        for i in range(len(self._blocks)):
+            self._detach(i)
         self._blocks.clear()
+        self._gaps.clear()
+        self._heights.clear()
         self._block_map.clear()
 
     def __len__(self) -> int:
         """Return the number of registered blocks."""
-        return len(self._blocks)
+        return len(self._block_map)
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import time
+from collections import OrderedDict, deque
 from typing import Any, List, Optional, TYPE_CHECKING
 
+from rich.cells import cell_len
 from rich.console import Console, RenderableType
 from rich.text import Text
 from textual.events import MouseDown, MouseMove, MouseScrollDown, MouseScrollUp, MouseUp, Resize
@@ -29,6 +32,14 @@ class ConversationLog(RichLog):
     can_focus = True
     ALLOW_SELECT = True
 
+    # Resize handling: blocks within this many lines of the viewport are
+    # re-rendered immediately; the rest get a hard-wrapped estimate that is
+    # refined in idle time, nearest to the viewport first.
+    RERENDER_VIEWPORT_MARGIN = 100
+    REFINE_BUDGET_SECONDS = 0.008
+    REFINE_INTERVAL_SECONDS = 0.01
+    STRIP_CACHE_MAX_LINES = 50_000
+
     def __init__(self, **kwargs):
         super().__init__(
             **kwargs,
@@ -56,6 +67,12 @@ class ConversationLog(RichLog):
         self._last_render_width: int = 0
         self._resize_timer: Optional[Timer] = None
         self._pending_rerender: bool = False
+        self._refine_timer: Optional[Timer] = None
+        self._refine_queue: deque[str] = deque()  # block ids with estimated strips
+        # Rendered strips by (block_id, width), so resizing back and forth is free
+        self._strip_cache: OrderedDict[tuple[str, int], list[Strip]] = OrderedDict()
+        self._strip_cache_lines = 0
+        self._render_console: Optional[Console] = None
 
     def refresh_line(self, y: int) -> None:
         """Refresh a specific line by invalidating cache and repainting."""
@@ -93,6 +110,7 @@ class ConversationLog(RichLog):
         import uuid
 
         lines_before = len(self.lines)
+        trimmed_before = self._start_line
 
         # Call parent write
         result = super().write(
@@ -105,16 +123,26 @@ class ConversationLog(RichLog):
         )
 
         lines_after = len(self.lines)
+        # RichLog drops lines from the top once max_lines is exceeded
+        trimmed = self._start_line - trimmed_before
+        if trimmed:
+            self._block_registry.remove_lines_range(0, trimmed)
+        added = lines_after - lines_before + trimmed
+        start_line = max(0, lines_after - added)
 
         # Register this write as a content block
+        render_width = self.scrollable_content_region.width if self._size_known else 0
         block = ContentBlock(
             block_id=str(uuid.uuid4()),
             source=content,
             is_wrappable=wrappable,
-            start_line=lines_before,
-            line_count=lines_after - lines_before,
+            start_line=start_line,
+            line_count=lines_after - start_line,
+            rendered_width=render_width if width is None else 0,
         )
         self._block_registry.register(block)
+        if wrappable and block.rendered_width and block.line_count:
+            self._cache_strips(block.block_id, render_width, self.lines[start_line:lines_after])
 
         return result
 
@@ -149,6 +177,7 @@ class ConversationLog(RichLog):
         if self._resize_timer is not None:
             self._resize_timer.stop()
             self._resize_timer = None
+        self._cancel_refinement()
 
     def on_resize(self, event: Resize) -> None:
         """Handle resize by scheduling a coordinated re-render."""
@@ -188,15 +217,18 @@ class ConversationLog(RichLog):
     def _coordinated_rerender(self) -> None:
         """Re-render with proper coordination of ALL dynamic elements.
 
-        Uses clear-and-rebuild approach with:
+        Only blocks near the viewport are rendered at the new width right away:
         1. Pause all animation timers
-        2. Capture current strips for non-wrappable blocks
-        3. Clear and rebuild (preserving non-wrappable, re-rendering wrappable)
-        4. Calculate cumulative delta from wrappable blocks
-        5. Adjust all cached line indices
-        6. Resume animation timers
+        2. Rebuild self.lines block by block: non-wrappable blocks keep their
+           current strips (preserving animation state); wrappable blocks use
+           cached strips for the new width, are rendered if near the viewport,
+           or get a hard-wrapped estimate of their old strips otherwise
+        3. Shift all cached line indices by each block's height change
+        4. Keep the line at the top of the viewport in place
+        5. Resume animation timers and refine estimated blocks in idle time
         """
         self._resize_timer = None
+        self._cancel_refinement()
 
         blocks = self._block_registry.get_all_blocks()
         if not blocks:
@@ -209,107 +241,227 @@ class ConversationLog(RichLog):
             if hasattr(self, "app") and hasattr(self.app, "spinner_service"):
                 self.app.spinner_service.pause_for_resize()
 
-            # 2. Save scroll and capture non-wrappable strips BEFORE clearing
-            was_at_end = self.auto_scroll
-            scroll_offset = self.scroll_y
-
             width = self.scrollable_content_region.width
             if width <= 0:
                 return
-            console = Console(width=width, force_terminal=True, no_color=False)
 
-            # Capture CURRENT strips for non-wrappable blocks (preserves animation state)
-            preserved_strips: dict[str, list[Strip]] = {}
+            was_at_end = self.auto_scroll
+            scroll_offset = int(self.scroll_y)
+            viewport_height = max(1, self.scrollable_content_region.height)
+            if was_at_end:
+                viewport_top = max(0, len(self.lines) - viewport_height)
+            else:
+                viewport_top = scroll_offset
+            margin = self.RERENDER_VIEWPORT_MARGIN
+            near_viewport = {
+                block.block_id
+                for block in self._block_registry.blocks_in_range(
+                    viewport_top - margin, viewport_top + viewport_height + margin
+                )
+            }
+            anchor = None
+            if not was_at_end:
+                top_blocks = self._block_registry.blocks_in_range(scroll_offset, scroll_offset + 1)
+                if top_blocks:
+                    anchor = (top_blocks[0], scroll_offset - top_blocks[0].start_line)
+
+            # 2. Rebuild, tracking each block's height change
+            old_lines = self.lines
+            new_lines: list[Strip] = []
+            shifts: list[tuple[int, int]] = []  # (old end line, delta)
+            estimated: list[tuple[int, str]] = []  # (distance from viewport, block_id)
+            positions: list[tuple[ContentBlock, int, int]] = []
+            prev_end = 0
             for block in blocks:
-                if not block.is_wrappable:
-                    start = block.start_line
-                    end = start + block.line_count
-                    if start < len(self.lines) and end <= len(self.lines):
-                        preserved_strips[block.block_id] = list(self.lines[start:end])
-
-            # 3. Clear display and registry
-            self.lines.clear()
+                start = block.start_line
+                old_end = start + block.line_count
+                # Lines written directly to self.lines (not as blocks) are kept
+                if start > prev_end:
+                    new_lines.extend(old_lines[prev_end:start])
+                current = old_lines[max(start, prev_end) : old_end]
+                prev_end = max(prev_end, old_end)
+
+                strips = current
+                if block.is_wrappable and block.rendered_width != width:
+                    if block.rendered_width and current:
+                        self._cache_strips(block.block_id, block.rendered_width, current)
+                    strips = self._cached_strips(block.block_id, width)
+                    if strips is None and block.block_id in near_viewport:
+                        strips = self._render_block(block, width)
+                    if strips is None:
+                        strips = self._estimate_strips(current, width)
+                        block.rendered_width = 0
+                        distance = min(abs(start - viewport_top), abs(old_end - viewport_top))
+                        estimated.append((distance, block.block_id))
+                    else:
+                        block.rendered_width = width
+
+                positions.append((block, len(new_lines), len(strips)))
+                new_lines.extend(strips)
+                if len(strips) != old_end - start:
+                    shifts.append((old_end, len(strips) - (old_end - start)))
+            new_lines.extend(old_lines[prev_end:])
+
+            self.lines[:] = new_lines
             if hasattr(self, "_line_cache"):
                 self._line_cache.clear()
             self._block_registry.clear()
+            for block, start, count in positions:
+                block.start_line = start
+                block.line_count = count
+                self._block_registry.register(block)
 
-            # 4. Rebuild and track delta
-            cumulative_delta = 0
-            first_affected = len(blocks)  # Will be set to first wrappable block's new start
+            self._widest_line_width = max((strip.cell_length for strip in new_lines), default=0)
+            self._start_line = max(0, min(self._start_line, len(self.lines)))
+            self.virtual_size = Size(self._widest_line_width, len(self.lines))
 
-            for block in blocks:
-                new_start = len(self.lines)
-
-                if block.is_wrappable:
-                    # Track first affected line (where wrappable content starts)
-                    if first_affected > new_start:
-                        first_affected = new_start
-
-                    # Re-render at new width
-                    new_strips = self._render_source_to_strips(block.source, console)
-                    self.lines.extend(new_strips)
-                    new_count = len(new_strips)
-
-                    # Track delta
-                    cumulative_delta += new_count - block.line_count
-                    line_count = new_count
-                else:
-                    # Restore preserved strips (animation state preserved)
-                    original = preserved_strips.get(block.block_id, [])
-                    self.lines.extend(original)
-                    line_count = len(original)
-
-                # Re-register with new indices
-                self._block_registry.register(
-                    ContentBlock(
-                        block_id=block.block_id,
-                        source=block.source,
-                        start_line=new_start,
-                        line_count=line_count,
-                        is_wrappable=block.is_wrappable,
-                        is_locked=block.is_locked,
-                    )
-                )
-
-            # Keep RichLog's virtual size in sync after direct line manipulation.
-            self._recalculate_virtual_size()
-
-            # 5. Adjust all component indices if delta != 0
-            if cumulative_delta != 0:
-                self._spinner_manager.adjust_indices(cumulative_delta, first_affected)
-                self._tool_renderer.adjust_indices(cumulative_delta, first_affected)
-
-                if hasattr(self, "app") and hasattr(self.app, "spinner_service"):
-                    self.app.spinner_service.adjust_indices(cumulative_delta, first_affected)
+            # 3. Adjust all component indices; applying the shifts bottom-up keeps
+            # the indices of earlier blocks in old coordinates for their own shift
+            for old_end, delta in reversed(shifts):
+                self._adjust_tracked_indices(delta, old_end)
 
-                # Adjust own indices
-                if self._approval_start is not None and self._approval_start >= first_affected:
-                    self._approval_start += cumulative_delta
-                if self._ask_user_start is not None and self._ask_user_start >= first_affected:
-                    self._ask_user_start += cumulative_delta
-
-                # Adjust controller indices
-                if hasattr(self, "app"):
-                    for ctrl_attr in ["_model_picker", "_agent_creator", "_skill_creator"]:
-                        ctrl = getattr(self.app, ctrl_attr, None)
-                        if ctrl and hasattr(ctrl, "adjust_indices"):
-                            ctrl.adjust_indices(cumulative_delta, first_affected)
-
-            # 6. Restore scroll
+            # 4. Restore scroll
             if was_at_end:
                 self.scroll_end(animate=False)
+            elif anchor is not None:
+                anchor_block, offset = anchor
+                offset = min(offset, max(0, anchor_block.line_count - 1))
+                self.scroll_y = min(anchor_block.start_line + offset, self.max_scroll_y)
             else:
                 self.scroll_y = min(scroll_offset, self.max_scroll_y)
 
+            estimated.sort()
+            self._refine_queue.extend(block_id for _, block_id in estimated)
+
         finally:
-            # 7. Resume animations
+            # 5. Resume animations
             self._spinner_manager.resume_after_resize()
             self._tool_renderer.resume_after_resize()
             if hasattr(self, "app") and hasattr(self.app, "spinner_service"):
                 self.app.spinner_service.resume_after_resize()
 
+        self._schedule_refinement()
         self.refresh()
 
+    def _adjust_tracked_indices(self, delta: int, first_affected: int) -> None:
+        """Shift every line index held by renderers and controllers."""
+        self._spinner_manager.adjust_indices(delta, first_affected)
+        self._tool_renderer.adjust_indices(delta, first_affected)
+
+        if hasattr(self, "app") and hasattr(self.app, "spinner_service"):
+            self.app.spinner_service.adjust_indices(delta, first_affected)
+
+        # Adjust own indices
+        if self._approval_start is not None and self._approval_start >= first_affected:
+            self._approval_start += delta
+        if self._ask_user_start is not None and self._ask_user_start >= first_affected:
+            self._ask_user_start += delta
+
+        # Adjust controller indices
+        if hasattr(self, "app"):
+            for ctrl_attr in ["_model_picker", "_agent_creator", "_skill_creator"]:
+                ctrl = getattr(self.app, ctrl_attr, None)
+                if ctrl and hasattr(ctrl, "adjust_indices"):
+                    ctrl.adjust_indices(delta, first_affected)
+
+    def _schedule_refinement(self) -> None:
+        if self._refine_queue and self._refine_timer is None:
+            self._refine_timer = self.set_timer(self.REFINE_INTERVAL_SECONDS, self._refine_estimated_blocks)
+
+    def _cancel_refinement(self) -> None:
+        if self._refine_timer is not None:
+            self._refine_timer.stop()
+            self._refine_timer = None
+        self._refine_queue.clear()
+
+    def _refine_estimated_blocks(self) -> None:
+        """Replace estimated strips with real renders, within a small time budget."""
+        self._refine_timer = None
+        width = self.scrollable_content_region.width
+        if width <= 0 or width != self._last_render_width or self._pending_rerender:
+            # A newer resize re-renders everything anyway
+            return
+
+        deadline = time.monotonic() + self.REFINE_BUDGET_SECONDS
+        scroll_shift = 0
+        widest = self._widest_line_width
+        refined = False
+        while self._refine_queue:
+            if refined and time.monotonic() >= deadline:
+                break
+            block = self._block_registry.get_block(self._refine_queue.popleft())
+            if block is None or block.rendered_width == width:
+                continue
+            start, old_count = block.start_line, block.line_count
+            if start < 0 or start + old_count > len(self.lines):
+                continue
+            strips = self._cached_strips(block.block_id, width) or self._render_block(block, width)
+            self.lines[start : start + old_count] = strips
+            block.line_count = len(strips)
+            block.rendered_width = width
+            refined = True
+            widest = max(widest, max((strip.cell_length for strip in strips), default=0))
+            delta = len(strips) - old_count
+            if delta:
+                self._adjust_tracked_indices(delta, start + old_count)
+                if start + old_count <= self.scroll_y:
+                    scroll_shift += delta
+
+        if refined:
+            if hasattr(self, "_line_cache"):
+                self._line_cache.clear()
+            self._widest_line_width = widest
+            self.virtual_size = Size(self._widest_line_width, len(self.lines))
+            if self.auto_scroll:
+                self.scroll_end(animate=False)
+            elif scroll_shift:
+                # Keep the visible content still while blocks above it change height
+                self.scroll_y = max(0, min(self.scroll_y + scroll_shift, self.max_scroll_y))
+            self.refresh()
+        self._schedule_refinement()
+
+    def _render_block(self, block: ContentBlock, width: int) -> list[Strip]:
+        """Render a block's source at ``width`` and cache the strips."""
+        if self._render_console is None or self._render_console.width != width:
+            self._render_console = Console(width=width, force_terminal=True, no_color=False)
+        strips = self._render_source_to_strips(block.source, self._render_console)
+        self._cache_strips(block.block_id, width, strips)
+        return strips
+
+    @staticmethod
+    def _estimate_strips(strips: list[Strip], width: int) -> list[Strip]:
+        """Hard-wrap already rendered strips to ``width``.
+
+        Stands in for a real render off-screen; its height is close to what a
+        re-render produces when narrowing and unchanged when widening.
+        """
+        estimated: list[Strip] = []
+        for strip in strips:
+            visible = cell_len(strip.text.rstrip())
+            if visible <= width:
+                estimated.append(strip)
+                continue
+            for offset in range(0, visible, width):
+                estimated.append(strip.crop(offset, offset + width))
+        return estimated
+
+    def _cached_strips(self, block_id: str, width: int) -> Optional[list[Strip]]:
+        strips = self._strip_cache.get((block_id, width))
+        if strips is not None:
+            self._strip_cache.move_to_end((block_id, width))
+        return strips
+
+    def _cache_strips(self, block_id: str, width: int, strips: list[Strip]) -> None:
+        key = (block_id, width)
+        if key in self._strip_cache:
+            self._strip_cache.move_to_end(key)
+            return
+        self._strip_cache[key] = list(strips)
+        self._strip_cache_lines += len(strips)
+        while self._strip_cache_lines > self.STRIP_CACHE_MAX_LINES and len(self._strip_cache) > 1:
+            _, evicted = self._strip_cache.popitem(last=False)
+            self._strip_cache_lines -= len(evicted)
+
     def _recalculate_virtual_size(self) -> None:
         """Recompute virtual_size after direct edits to self.lines."""
         widths: List[int] = []
@@ -380,10 +532,13 @@ class ConversationLog(RichLog):
         """Clear all content."""
         self._protected_lines.clear()
         self._block_registry.clear()
+        self._strip_cache.clear()
+        self._strip_cache_lines = 0
         self._last_render_width = 0
         if self._resize_timer is not None:
             self._resize_timer.stop()
             self._resize_timer = None
+        self._cancel_refinement()
         return super().clear()
 
     def set_debug_enabled(self, enabled: bool) -> None:
@@ -197,6 +197,7 @@ class TodoPanel(Static):
             spinner_type=SpinnerType.TODO,
             render_callback=self._on_spinner_frame,
             metadata={"active_text": active_text},
+            is_visible=lambda: self.display and not self.is_expanded,
         )
 
     def _stop_spinner(self) -> None:
@@ -177,16 +177,12 @@ class AgentExecutor:
             WriteTool,
             EditTool,
             BashTool,
-            WebFetchTool,
             OpenBrowserTool,
-            WebScreenshotTool,
-        )
-        from swecli.core.context_engineering.tools.implementations.web_search_tool import (
-            WebSearchTool,
         )
         from swecli.core.context_engineering.tools.implementations.notebook_edit_tool import (
             NotebookEditTool,
         )
+        from swecli.core.context_engineering.tools.lazy_tool import LazyTool
         from swecli.core.context_engineering.tools.implementations.ask_user_tool import AskUserTool
         from swecli.web.web_approval_manager import WebApprovalManager
         from swecli.web.web_ask_user_manager import WebAskUserManager
@@ -203,14 +199,22 @@ class AgentExecutor:
         write_tool = WriteTool(config, working_dir)
         edit_tool = EditTool(config, working_dir)
         bash_tool = BashTool(config, working_dir)
-        web_fetch_tool = WebFetchTool(config, working_dir)
-        web_search_tool = WebSearchTool(config, working_dir)
+        # Web tools are imported on first use
+        implementations = "swecli.core.context_engineering.tools.implementations"
+        web_fetch_tool = LazyTool.from_path(
+            f"{implementations}.web_fetch_tool:WebFetchTool", config, working_dir
+        )
+        web_search_tool = LazyTool.from_path(
+            f"{implementations}.web_search_tool:WebSearchTool", config, working_dir
+        )
         notebook_edit_tool = NotebookEditTool(working_dir)
         # Create web-based ask-user manager with session_id
         web_ask_user_manager = WebAskUserManager(ws_manager, loop, session_id=session_id)
         ask_user_tool = AskUserTool(ui_prompt_callback=web_ask_user_manager.prompt_user)
         open_browser_tool = OpenBrowserTool(config, working_dir)
-        web_screenshot_tool = WebScreenshotTool(config, working_dir)
+        web_screenshot_tool = LazyTool.from_path(
+            f"{implementations}.web_screenshot_tool:WebScreenshotTool", config, working_dir
+        )
 
         # Create web-based approval manager with session_id
         web_approval_manager = WebApprovalManager(ws_manager, loop, session_id=session_id)
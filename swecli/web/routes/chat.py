@@ -1,6 +1,6 @@
 """Chat and query API endpoints."""
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
@@ -69,8 +69,15 @@ async def send_query(request: QueryRequest) -> Dict[str, str]:
 
 
 @router.get("/messages")
-async def get_messages() -> List[MessageResponse]:
-    """Get all messages in the current session.
+async def get_messages(offset: int = 0, limit: Optional[int] = None) -> List[MessageResponse]:
+    """Get messages in the current session.
+
+    Messages are streamed from the session and validated one at a time, so
+    paging through a long history never materializes all of it.
+
+    Args:
+        offset: Number of leading messages to skip
+        limit: Maximum number of messages to return (all when omitted)
 
     Returns:
         List of messages
@@ -87,8 +94,7 @@ async def get_messages() -> List[MessageResponse]:
             print("[DEBUG] No current session found")
             return []
 
-        messages = state.get_messages()
-        print(f"[DEBUG] Loaded {len(messages)} messages from session {session.id}")
+        messages = state.session_manager.iter_messages(offset=offset, limit=limit)
 
         return [
             MessageResponse(
@@ -409,109 +409,28 @@ async def list_files(query: str = "") -> Dict[str, Any]:
         if not working_dir.exists() or not working_dir.is_dir():
             return {"files": []}
 
-        # Fallback ignore patterns if no .gitignore exists
-        # Tier 1: Always exclude (obviously generated, never source code)
-        always_exclude = {
-            # Version Control
-            '.git', '.hg', '.svn', '.bzr', '_darcs', '.fossil',
-            # OS Generated
-            '.DS_Store', '.Spotlight-V100', '.Trashes', 'Thumbs.db', 'desktop.ini', '$RECYCLE.BIN',
-            # Python
-            '__pycache__', '.pytest_cache', '.mypy_cache', '.pytype', '.pyre',
-            '.hypothesis', '.tox', '.nox', 'cython_debug', '.eggs',
-            # Node/JS
-            'node_modules', '.npm', '.yarn', '.pnpm-store',
-            '.next', '.nuxt', '.output', '.svelte-kit', '.angular', '.parcel-cache', '.turbo',
-            # IDE/Editor
-            '.idea', '.vscode', '.vs', '.settings',
-            # Java/Kotlin
-            '.gradle',
-            # Elixir
-            '_build', 'deps', '.elixir_ls',
-            # iOS
-            'Pods', 'DerivedData', 'xcuserdata',
-            # Ruby
-            '.bundle',
-            # Virtual Environments
-            '.venv', 'venv',
-            # Misc caches
-            '.cache', '.sass-cache', '.eslintcache', '.tmp', '.temp', 'tmp', 'temp',
-        }
-        # Tier 2: Likely exclude (common build output dirs)
-        likely_exclude = {
-            'dist', 'build', 'out', 'bin', 'obj', 'target',
-            'coverage', 'htmlcov', 'cover', 'logs',
-            'vendor', 'packages', 'bower_components',
-        }
-        fallback_ignore_patterns = always_exclude | likely_exclude
-
-        # Try to load gitignore parser
-        gitignore_parser = None
-        gitignore_path = working_dir / ".gitignore"
-        if gitignore_path.exists():
-            from swecli.ui_textual.autocomplete_internal.gitignore import GitIgnoreParser
-            gitignore_parser = GitIgnoreParser(working_dir)
-
-        def should_skip_dir(dir_path: Path, dir_name: str) -> bool:
-            """Check if a directory should be skipped."""
-            if gitignore_parser:
-                return gitignore_parser.should_skip_dir(dir_path)
-            return dir_name in fallback_ignore_patterns
-
-        def should_skip_file(file_path: Path) -> bool:
-            """Check if a file should be skipped."""
-            if gitignore_parser:
-                return gitignore_parser.is_ignored(file_path)
-            return False
-
-        files = []
-        try:
-            # Use os.walk for more efficient traversal with pruning
-            for root, dirs, filenames in os.walk(working_dir):
-                root_path = Path(root)
-
-                # Modify dirs in-place to skip ignored directories
-                dirs[:] = [d for d in dirs if not should_skip_dir(root_path / d, d)]
-
-                for filename in filenames:
-                    file_path = root_path / filename
-
-                    # Skip ignored files
-                    if should_skip_file(file_path):
-                        continue
-
-                    # Get relative path
-                    try:
-                        rel_path = file_path.relative_to(working_dir)
-                        path_str = str(rel_path)
-
-                        # Filter by query if provided
-                        if query and query.lower() not in path_str.lower():
-                            continue
-
-                        files.append({
-                            'path': path_str,
-                            'name': filename,
-                            'is_file': True
-                        })
-                    except ValueError:
-                        continue
-
-                    # Limit early if we have enough results
-                    if len(files) >= 100:
-                        break
-
-                if len(files) >= 100:
-                    break
-
-        except PermissionError:
-            pass  # Skip directories we can't access
-
-        # Sort files by path
-        files.sort(key=lambda x: x['path'])
-
-        # Limit to 100 results for performance
-        files = files[:100]
+        from swecli.core.context_engineering.retrieval.workspace_catalog import (
+            ALWAYS_IGNORE_DIRS,
+            LIKELY_EXCLUDE_DIRS,
+            get_workspace_catalog,
+        )
+
+        # The shared catalog is kept current by file watching, so no walk here.
+        # Without a .gitignore, common build output dirs are left out too.
+        catalog = get_workspace_catalog(working_dir)
+        exclude_dirs = ALWAYS_IGNORE_DIRS
+        if not catalog.has_gitignore:
+            exclude_dirs = exclude_dirs | LIKELY_EXCLUDE_DIRS
+        matches = catalog.find(query, limit=100, exclude_dirs=exclude_dirs)
+
+        files = [
+            {
+                'path': rel_path,
+                'name': rel_path.rsplit('/', 1)[-1],
+                'is_file': True
+            }
+            for rel_path in sorted(matches)
+        ]
 
         return {"files": files}
 
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Benchmark Docker runtime bash sessions through LocalRuntime (no Docker needed).
+
+Measures per-command latency for simple and multi-line commands, the wall
+time of running the same sleep in several sessions at once (sequential if
+sessions block the event loop), and the time to the first streamed output
+chunk of a slow command. Run from the repository root:
+
+    python tests/manual/benchmark_bash_session.py --commands 200 --sessions 4
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from swecli.core.docker.local_runtime import LocalRuntime  # noqa: E402
+from swecli.core.docker.models import BashAction, CreateSessionRequest  # noqa: E402
+
+MULTI_LINE = "for i in 1 2 3; do\n  echo $i\ndone; true"
+
+
+async def per_command(runtime: LocalRuntime, command: str, count: int) -> float:
+    started = time.perf_counter()
+    for _ in range(count):
+        await runtime.run_in_session(BashAction(command=command))
+    return (time.perf_counter() - started) / count
+
+
+async def concurrent_sleep(runtime: LocalRuntime, sessions: int, seconds: float) -> float:
+    names = [f"s{i}" for i in range(sessions)]
+    for name in names:
+        await runtime.create_session(CreateSessionRequest(session=name))
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(
+            runtime.run_in_session(BashAction(command=f"sleep {seconds}", session=name))
+            for name in names
+        )
+    )
+    return time.perf_counter() - started
+
+
+async def first_chunk(runtime: LocalRuntime) -> float:
+    started = time.perf_counter()
+    seen: list[float] = []
+    await runtime.run_in_session(
+        BashAction(command="echo ready; sleep 0.5"),
+        on_output=lambda chunk: seen.append(time.perf_counter() - started),
+    )
+    return seen[0] if seen else float("nan")
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    runtime = LocalRuntime()
+    try:
+        await runtime.create_session(CreateSessionRequest(session="default"))
+        simple = await per_command(runtime, "true", args.commands)
+        multi = await per_command(runtime, MULTI_LINE, args.commands)
+        parallel = await concurrent_sleep(runtime, args.sessions, args.sleep)
+        print(f"simple command:        {simple * 1000:.2f} ms")
+        print(f"multi-line command:    {multi * 1000:.2f} ms")
+        print(
+            f"{args.sessions} sessions x sleep {args.sleep}s: {parallel:.2f} s wall "
+            f"(sequential would be {args.sessions * args.sleep:.2f} s)"
+        )
+        try:
+            print(f"first streamed chunk:  {await first_chunk(runtime) * 1000:.1f} ms")
+        except TypeError:
+            print("first streamed chunk:  (streaming not supported)")
+    finally:
+        await runtime.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commands", type=int, default=200, help="Commands per latency case")
+    parser.add_argument("--sessions", type=int, default=4, help="Concurrent sessions")
+    parser.add_argument("--sleep", type=float, default=0.5, help="Seconds each session sleeps")
+    asyncio.run(main_async(parser.parse_args()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Benchmark the fuzzy old_content matcher against the previous line scan.
+
+Builds a large ordinary source file and a large repetitive generated file
+(many identical lines), then times locating a block whose indentation differs
+from the file, i.e. an exact-match miss that takes the fuzzy path. The
+previous implementation started a window at every line equal to the first
+target line, which is quadratic on repetitive input. Run from the repository
+root:
+
+    python tests/manual/benchmark_content_matcher.py --lines 200000 --repeat 3
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from swecli.core.context_engineering.tools.implementations.content_matcher import (  # noqa: E402
+    find_content,
+)
+
+
+def legacy_find_content(original: str, old_content: str) -> tuple[bool, str]:
+    """The per-line scan EditTool and DockerToolHandler used before."""
+    if old_content in original:
+        return (True, old_content)
+
+    def normalize(s: str) -> str:
+        lines = s.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+        return "\n".join(line.strip() for line in lines)
+
+    if normalize(old_content) not in normalize(original):
+        return (False, old_content)
+
+    old_lines = [ln.strip() for ln in old_content.split("\n") if ln.strip()]
+    if not old_lines:
+        return (False, old_content)
+    original_lines = original.split("\n")
+    for i, line in enumerate(original_lines):
+        if line.strip() == old_lines[0]:
+            matched_lines = []
+            j = 0
+            for k in range(i, min(i + len(old_lines) * 2, len(original_lines))):
+                if j >= len(old_lines):
+                    break
+                if original_lines[k].strip() == old_lines[j]:
+                    matched_lines.append(original_lines[k])
+                    j += 1
+            if j == len(old_lines):
+                actual = "\n".join(matched_lines)
+                if actual in original:
+                    return (True, actual)
+                if actual + "\n" in original:
+                    return (True, actual + "\n")
+    return (False, old_content)
+
+
+def ordinary_file(lines: int) -> tuple[str, str]:
+    body = [f"    def method_{i}(self):\n        return {i}\n" for i in range(lines // 2)]
+    original = "class Big:\n" + "".join(body)
+    middle = lines // 4
+    target = f"def method_{middle}(self):\nreturn {middle}\ndef method_{middle + 1}(self):\n"
+    return original, target
+
+
+def repetitive_file(lines: int, block: int) -> tuple[str, str]:
+    # Generated tables: the same row repeated, with a unique marker near the end
+    rows = ["        {'value': 0},\n"] * lines
+    rows[-10] = "        {'value': 1},\n"
+    original = "DATA = [\n" + "".join(rows) + "]\n"
+    target = "{'value': 0},\n" * (block - 1) + "{'value': 1},\n"
+    return original, target
+
+
+def time_call(func, original: str, target: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(original, target)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=100_000, help="Lines per generated file")
+    parser.add_argument("--block", type=int, default=20, help="Lines in the repetitive target")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case (best kept)")
+    parser.add_argument("--skip-legacy", action="store_true", help="Only time the new matcher")
+    args = parser.parse_args()
+
+    cases = {
+        "ordinary": ordinary_file(args.lines),
+        "repetitive": repetitive_file(args.lines, args.block),
+    }
+    print(f"{'case':<12}{'legacy':>12}{'indexed':>12}  matches")
+    for name, (original, target) in cases.items():
+        match = find_content(original, target)
+        assert match.found, name
+        indexed = time_call(find_content, original, target, args.repeat)
+        if args.skip_legacy:
+            legacy_text = "-"
+        else:
+            legacy = time_call(legacy_find_content, original, target, args.repeat)
+            legacy_text = f"{legacy:.3f}s"
+        print(f"{name:<12}{legacy_text:>12}{indexed:>11.3f}s  {len(match.spans)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
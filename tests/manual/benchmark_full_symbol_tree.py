@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Benchmark request_full_symbol_tree: pipelined vs serial, cold and warm cache.
+
+Generates a synthetic Python repository and builds the full symbol tree with a
+real language server (pyright by default), once with the serial recursive path
+and once with the pipelined path, each starting from an empty symbol cache.
+A warm run of the pipelined path is timed as well. Run from the repository root:
+
+    python tests/manual/benchmark_full_symbol_tree.py --files 10000 --max-in-flight 16
+"""
+
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from swecli.core.context_engineering.tools.lsp.ls import SolidLanguageServer  # noqa: E402
+from swecli.core.context_engineering.tools.lsp.ls_config import (  # noqa: E402
+    Language,
+    LanguageServerConfig,
+)
+from swecli.core.context_engineering.tools.lsp.settings import SolidLSPSettings  # noqa: E402
+
+FILES_PER_PACKAGE = 100
+
+
+def generate_repo(root: Path, files: int) -> None:
+    """Create ``files`` modules with a class and a few functions each."""
+    for i in range(files):
+        package = root / f"pkg{i // FILES_PER_PACKAGE}"
+        if i % FILES_PER_PACKAGE == 0:
+            package.mkdir(parents=True, exist_ok=True)
+            (package / "__init__.py").write_text("")
+        (package / f"module_{i}.py").write_text(
+            f"class Widget{i}:\n"
+            f"    def render(self) -> str:\n"
+            f"        return 'widget {i}'\n\n"
+            f"def build_{i}(count: int) -> list[Widget{i}]:\n"
+            f"    return [Widget{i}() for _ in range(count)]\n\n"
+            f"def helper_{i}() -> int:\n"
+            f"    return {i}\n"
+        )
+
+
+def _count_files(symbols: list[dict]) -> int:
+    count = 0
+    stack = list(symbols)
+    while stack:
+        symbol = stack.pop()
+        if symbol["kind"] == 2:  # File
+            count += 1
+        else:
+            stack.extend(symbol.get("children", []))
+    return count
+
+
+def run(
+    repo: Path, language: Language, settings: SolidLSPSettings, pipelined: bool, max_in_flight: int, clear_cache: bool
+) -> tuple[float, int]:
+    if clear_cache:
+        shutil.rmtree(repo / settings.project_data_relative_path, ignore_errors=True)
+    ls = SolidLanguageServer.create(LanguageServerConfig(code_language=language), str(repo), solidlsp_settings=settings)
+    ls.FULL_SYMBOL_TREE_MAX_IN_FLIGHT = max_in_flight
+
+    def progress(done: int, total: int) -> None:
+        if total and (done == total or done % 1000 == 0):
+            print(f"\r    {done}/{total} files", end="", flush=True)
+
+    ls.start()
+    try:
+        started = time.perf_counter()
+        tree = ls.request_full_symbol_tree(pipelined=pipelined, progress_callback=progress)
+        elapsed = time.perf_counter() - started
+        ls.save_cache()
+    finally:
+        ls.stop()
+    if pipelined:
+        print()
+    return elapsed, _count_files(tree)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--language", default=Language.PYTHON.value, help="language server to use (default: python/pyright)")
+    parser.add_argument("--max-in-flight", type=int, default=SolidLanguageServer.FULL_SYMBOL_TREE_MAX_IN_FLIGHT)
+    parser.add_argument("--skip-serial", action="store_true", help="only time the pipelined path")
+    parser.add_argument("--repo", type=Path, help="use an existing repository instead of a synthetic one")
+    args = parser.parse_args()
+
+    language = Language(args.language)
+    with tempfile.TemporaryDirectory() as tmp:
+        settings = SolidLSPSettings(solidlsp_dir=str(Path(tmp) / "solidlsp"))
+        repo = args.repo.resolve() if args.repo else Path(tmp, "repo").resolve()
+        if args.repo is None:
+            print(f"Generating {args.files} files ...")
+            generate_repo(repo, args.files)
+
+        results = []
+        if not args.skip_serial:
+            print("serial, cold cache:")
+            results.append(("serial (cold)", *run(repo, language, settings, False, 1, clear_cache=True)))
+        print(f"pipelined ({args.max_in_flight} in flight), cold cache:")
+        results.append(("pipelined (cold)", *run(repo, language, settings, True, args.max_in_flight, clear_cache=True)))
+        print("pipelined, warm cache:")
+        results.append(("pipelined (warm)", *run(repo, language, settings, True, args.max_in_flight, clear_cache=False)))
+
+        print(f"\n{'mode':<20}{'files':>10}{'seconds':>12}{'files/s':>12}")
+        for mode, elapsed, files in results:
+            print(f"{mode:<20}{files:>10}{elapsed:>12.2f}{files / elapsed if elapsed else 0:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
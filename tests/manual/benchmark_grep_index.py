@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Benchmark grep_files: trigram index vs ripgrep vs the Python fallback.
+
+Generates a synthetic source tree and times the same literal searches through
+each strategy. Run from the repository root:
+
+    python tests/manual/benchmark_grep_index.py --files 20000
+"""
+
+import argparse
+import random
+import shutil
+import statistics
+import string
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from swecli.core.context_engineering.retrieval.trigram_index import TrigramIndex  # noqa: E402
+from swecli.core.context_engineering.tools.implementations.file_ops import (  # noqa: E402
+    DEFAULT_SEARCH_EXCLUDES,
+    FileOperations,
+)
+from swecli.models.config import AppConfig  # noqa: E402
+
+QUERIES = [
+    ("rare identifier", "frobnicate_widget_7", False),
+    ("common keyword", "return", False),
+    ("case-insensitive", "HTTPCONNECTIONPOOL", True),
+    ("no match", "zz_this_string_does_not_occur_zz", False),
+]
+
+
+def _word(rng: random.Random) -> str:
+    return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 10)))
+
+
+def generate_tree(root: Path, files: int, lines: int, seed: int = 0) -> None:
+    """Create ``files`` Python-like files, plus some excluded directories."""
+    rng = random.Random(seed)
+    for i in range(files):
+        directory = root / f"pkg{i % 50}" / f"mod{i % 7}"
+        directory.mkdir(parents=True, exist_ok=True)
+        body = []
+        for n in range(lines):
+            name = _word(rng)
+            body.append(f"def {name}_{n}(value):\n    return value + {rng.randint(0, 999)}\n")
+        if i % 997 == 0:
+            body.append("def frobnicate_widget_7():\n    return HttpConnectionPool()\n")
+        (directory / f"file_{i}.py").write_text("".join(body))
+
+    noise = root / "node_modules" / "dep"
+    noise.mkdir(parents=True)
+    for i in range(files // 10):
+        (noise / f"dep_{i}.js").write_text("function frobnicate_widget_7() { return 1; }\n" * 20)
+
+
+def _time(fn, repeat: int) -> tuple[float, object]:
+    timings, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def _rg_available() -> bool:
+    return shutil.which("rg") is not None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=5000, help="number of source files")
+    parser.add_argument("--lines", type=int, default=40, help="functions per file")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="grep-bench-") as tmp:
+        root = Path(tmp) / "tree"
+        print(f"Generating {args.files} files x {args.lines} functions in {root} ...")
+        generate_tree(root, args.files, args.lines)
+
+        config = AppConfig(enable_search_index=False)
+        file_ops = FileOperations(config, root)
+        index = TrigramIndex(root, Path(tmp) / "tree.idx", DEFAULT_SEARCH_EXCLUDES)
+
+        start = time.perf_counter()
+        index.ensure_ready(background=False)
+        build = time.perf_counter() - start
+        print(f"Index build (cold): {build:.2f}s for {index.file_count} files")
+
+        start = time.perf_counter()
+        index.refresh()
+        print(f"Index refresh (no changes): {(time.perf_counter() - start) * 1000:.1f}ms")
+
+        reloaded = TrigramIndex(root, index.index_path, DEFAULT_SEARCH_EXCLUDES)
+        start = time.perf_counter()
+        reloaded.ensure_ready(background=False)
+        print(f"Index load from disk: {(time.perf_counter() - start) * 1000:.1f}ms\n")
+
+        header = f"{'query':<18} {'index':>10} {'python':>10} {'rg':>10}  matches"
+        print(header)
+        print("-" * len(header))
+        for label, pattern, ci in QUERIES:
+            def indexed():
+                index.refresh()
+                return index.search(pattern, case_insensitive=ci, max_results=50)
+
+            t_index, found = _time(indexed, args.repeat)
+            t_python, _ = _time(
+                lambda: file_ops._python_grep(pattern, None, 50, ci), args.repeat
+            )
+            if _rg_available():
+                cmd = ["rg", "--json", "-F", pattern] + (["-i"] if ci else [])
+                t_rg, _ = _time(
+                    lambda: subprocess.run(cmd, cwd=root, capture_output=True, timeout=60),
+                    args.repeat,
+                )
+                rg = f"{t_rg * 1000:>8.1f}ms"
+            else:
+                rg = f"{'n/a':>10}"
+            print(
+                f"{label:<18} {t_index * 1000:>8.1f}ms {t_python * 1000:>8.1f}ms {rg}  {len(found)}"
+            )
+
+
+if __name__ == "__main__":
+    main()
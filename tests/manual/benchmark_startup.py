@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Benchmark CLI startup: wall-clock time and import time per entry path.
+
+Each case runs in a fresh interpreter with an empty HOME, several times, and
+reports the median wall-clock time plus the total import time reported by
+``python -X importtime`` (and the heaviest top-level imports with --verbose).
+With --check the script exits non-zero when a case exceeds its budget, so it
+can guard against regressions of the lazy-import startup path. Run from the
+repository root:
+
+    python tests/manual/benchmark_startup.py --runs 5 --check
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Builds everything the -p path needs before its first LLM request
+_PROMPT_SETUP = """
+from pathlib import Path
+from swecli.cli import _run_non_interactive  # noqa: F401
+from swecli.core.base.factories import build_default_tools
+from swecli.core.runtime import ConfigManager, ModeManager
+from swecli.core.runtime.services import RuntimeService
+
+config_manager = ConfigManager(Path.cwd())
+config = config_manager.load_config()
+RuntimeService(config_manager, ModeManager()).build_suite(
+    **build_default_tools(config, Path.cwd()), mcp_manager=None
+)
+"""
+
+# name -> (python arguments, wall-clock budget in seconds)
+CASES = {
+    "--version": (["-m", "swecli", "--version"], 0.5),
+    "--help": (["-m", "swecli", "--help"], 0.5),
+    "config show": (["-m", "swecli", "config", "show"], 1.0),
+    "mcp list": (["-m", "swecli", "mcp", "list"], 2.5),
+    "batch --help": (["-m", "swecli", "batch", "--help"], 0.5),
+    "interactive imports": (["-c", "import swecli.cli, swecli.ui_textual.runner"], 2.0),
+    "prompt setup": (["-c", _PROMPT_SETUP], 3.0),
+}
+
+
+def parse_importtime(stderr: str) -> tuple[float, list[tuple[float, str]]]:
+    """Return total import seconds and the top-level imports with their times."""
+    top_level = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if name.startswith("  "):
+            continue  # Nested import, already counted by its parent
+        top_level.append((int(cumulative) / 1e6, name.strip()))
+    return sum(seconds for seconds, _ in top_level), sorted(top_level, reverse=True)
+
+
+def run_case(
+    args: list[str], runs: int, env: dict[str, str], cwd: Path
+) -> tuple[float, float, list]:
+    """Return (median wall seconds, import seconds, heaviest imports)."""
+    walls = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=cwd, env=env, capture_output=True, check=False)
+        walls.append(time.perf_counter() - started)
+
+    profiled = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    import_seconds, heaviest = parse_importtime(profiled.stderr)
+    return statistics.median(walls), import_seconds, heaviest
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Timed runs per case")
+    parser.add_argument("--case", action="append", choices=sorted(CASES), help="Only run these")
+    parser.add_argument("--check", action="store_true", help="Fail when a budget is exceeded")
+    parser.add_argument("--verbose", action="store_true", help="Show the heaviest imports")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        home = Path(tmp) / "home"
+        workdir = Path(tmp) / "project"
+        home.mkdir()
+        workdir.mkdir()
+        env = {
+            **os.environ,
+            "HOME": str(home),
+            "PYTHONPATH": str(REPO_ROOT),
+            "PYTHONDONTWRITEBYTECODE": "",
+        }
+
+        over_budget = []
+        print(f"{'case':<22}{'wall (median)':>15}{'imports':>10}{'budget':>9}")
+        for name in args.case or CASES:
+            case_args, budget = CASES[name]
+            wall, import_seconds, heaviest = run_case(case_args, args.runs, env, workdir)
+            flag = "" if wall <= budget else "  OVER BUDGET"
+            if flag:
+                over_budget.append(name)
+            print(f"{name:<22}{wall:>14.3f}s{import_seconds:>9.3f}s{budget:>8.1f}s{flag}")
+            if args.verbose:
+                for seconds, module in heaviest[:5]:
+                    print(f"{'':<24}{seconds:>7.3f}s  {module}")
+
+    if args.check and over_budget:
+        print(f"Startup budget exceeded: {', '.join(over_budget)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
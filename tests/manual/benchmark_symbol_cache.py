@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Compare the monolithic pickle symbol cache with the SQLite SymbolCacheStore.
+
+Writes a synthetic raw document symbols cache for ``--files`` files in both
+formats, then measures in fresh subprocesses (so peak RSS is per measurement):
+
+* startup: loading the pickle vs opening the store and reading ``--touched`` entries
+  (``store-startup-evict`` also starts the background eviction of deleted files,
+  with every cached file missing, and ``store-evict`` is that eviction on its own)
+* the cost of persisting a change to a single file
+
+Run from the repository root:
+
+    python tests/manual/benchmark_symbol_cache.py --files 100000
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from swecli.core.context_engineering.tools.lsp.util.cache import (  # noqa: E402
+    SymbolCacheStore,
+    load_cache,
+    save_cache,
+)
+
+VERSION = (1, "benchmark")
+SYMBOLS_PER_FILE = 12
+
+
+def _range(line: int) -> dict:
+    return {"start": {"line": line, "character": 0}, "end": {"line": line + 5, "character": 10}}
+
+
+def synthetic_entry(i: int) -> tuple[str, list[dict]]:
+    """A raw documentSymbol response: one class with methods."""
+    methods = [
+        {"name": f"method_{i}_{m}", "kind": 6, "range": _range(m * 6), "selectionRange": _range(m * 6), "children": []}
+        for m in range(SYMBOLS_PER_FILE - 1)
+    ]
+    cls = {"name": f"Class{i}", "kind": 5, "range": _range(0), "selectionRange": _range(0), "children": methods}
+    return f"{i:032x}", [cls]
+
+
+def _peak_rss_mb() -> float:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def measure(mode: str, directory: str, files: int, touched: int) -> dict:
+    """Runs inside a subprocess; returns seconds and peak RSS for one scenario."""
+    pickle_path = str(Path(directory) / "raw_document_symbols.pkl")
+    db_path = str(Path(directory) / "raw_document_symbols.db")
+    paths = [f"pkg{i // 100}/module_{i}.py" for i in range(files)]
+    baseline_rss = _peak_rss_mb()
+    started = time.perf_counter()
+    if mode == "write":
+        cache = {path: synthetic_entry(i) for i, path in enumerate(paths)}
+        save_cache(pickle_path, VERSION, cache)
+        store = SymbolCacheStore(db_path, VERSION)
+        store.update(cache)
+        store.flush()
+        store.close()
+    elif mode == "pickle-startup":
+        cache = load_cache(pickle_path, VERSION)
+        for path in paths[:touched]:
+            cache.get(path)
+    elif mode == "store-startup":
+        store = SymbolCacheStore(db_path, VERSION)
+        for path in paths[:touched]:
+            store.get(path)
+    elif mode == "store-startup-evict":
+        store = SymbolCacheStore(db_path, VERSION)
+        store.start_evicting_missing(directory, "benchmark")
+        for path in paths[:touched]:
+            store.get(path)
+    elif mode == "store-evict":
+        store = SymbolCacheStore(db_path, VERSION)
+        store.evict_missing(directory)
+    elif mode == "pickle-update":
+        cache = load_cache(pickle_path, VERSION)
+        started = time.perf_counter()
+        cache[paths[0]] = synthetic_entry(-1)
+        save_cache(pickle_path, VERSION, cache)
+    elif mode == "store-update":
+        store = SymbolCacheStore(db_path, VERSION)
+        started = time.perf_counter()
+        store[paths[0]] = synthetic_entry(-1)
+        store.flush()
+    else:
+        raise ValueError(mode)
+    return {"seconds": time.perf_counter() - started, "peak_rss_mb": _peak_rss_mb(), "baseline_rss_mb": baseline_rss}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=50_000)
+    parser.add_argument("--touched", type=int, default=200, help="entries read after startup (files the agent looks at)")
+    parser.add_argument("--measure", nargs=2, metavar=("MODE", "DIR"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(args.measure[0], args.measure[1], args.files, args.touched)))
+        return
+
+    def run(mode: str, directory: str) -> dict:
+        # Each scenario runs in a fresh process so that peak RSS is not inherited
+        output = subprocess.run(
+            [sys.executable, __file__, "--files", str(args.files), "--touched", str(args.touched), "--measure", mode, directory],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        return json.loads(output.strip().splitlines()[-1])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"Writing caches for {args.files} files ...")
+        run("write", tmp)
+        for name in ("raw_document_symbols.pkl", "raw_document_symbols.db"):
+            print(f"  {name}: {(Path(tmp) / name).stat().st_size / 1e6:.1f} MB")
+
+        print(f"\n{'scenario':<18}{'seconds':>10}{'peak RSS MB':>14}{'RSS growth MB':>16}")
+        for mode in (
+            "pickle-startup", "store-startup", "store-startup-evict", "store-evict", "pickle-update", "store-update",
+        ):
+            result = run(mode, tmp)
+            growth = result["peak_rss_mb"] - result["baseline_rss_mb"]
+            print(f"{mode:<18}{result['seconds']:>10.3f}{result['peak_rss_mb']:>14.1f}{growth:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Benchmark search_tools: BM25 index vs the previous per-query scan.
+
+Generates a synthetic catalogue of MCP tools spread over many servers, then
+times a set of queries against the previous scorer (which rebuilt the
+vocabulary and scanned every tool on each call) and against
+``ToolSearchIndex``. Run from the repository root:
+
+    python tests/manual/benchmark_tool_search.py --servers 50 --tools-per-server 100
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from swecli.core.context_engineering.mcp.tool_index import ToolSearchIndex  # noqa: E402
+
+VERBS = ["create", "list", "get", "update", "delete", "search", "sync", "export", "archive"]
+NOUNS = [
+    "issue", "repository", "branch", "commit", "channel", "message", "user", "file",
+    "database", "table", "record", "ticket", "invoice", "deployment", "secret", "metric",
+]
+FILLER = ["the", "given", "project", "account", "workspace", "current", "remote", "all"]
+QUERIES = [
+    "create issue", "list repos", "delete branch", "search messages in channel",
+    "export database table", "update deployment secret", "pr", "sync", "kubernetes",
+]
+
+
+def legacy_search(query: str, tools: list[dict]) -> list[dict]:
+    """The per-query vocabulary rebuild and scan SearchToolsHandler used before."""
+    vocabulary: set[str] = set()
+    for tool in tools:
+        name = tool.get("name", "").lower()
+        desc = (tool.get("description") or "").lower()
+        for word in name.replace("_", " ").replace("-", " ").split():
+            if len(word) >= 2:
+                vocabulary.add(word)
+        for word in desc.split():
+            word = word.strip(".,;:()[]\"'")
+            if len(word) >= 3:
+                vocabulary.add(word)
+    abbreviations = {"repo": "repository", "repos": "repositories", "pr": "pull", "prs": "pull"}
+    relevant: list[str] = []
+    for word in query.lower().replace("-", " ").replace("_", " ").split():
+        if len(word) < 2:
+            continue
+        if word in vocabulary:
+            relevant.append(word)
+        elif word in abbreviations and abbreviations[word] in vocabulary:
+            relevant.append(abbreviations[word])
+        else:
+            for vocab_word in vocabulary:
+                if vocab_word.startswith(word) and len(word) >= 3:
+                    relevant.append(vocab_word)
+                    break
+                if word.startswith(vocab_word) and len(vocab_word) >= 3:
+                    relevant.append(vocab_word)
+                    break
+    if not relevant:
+        return []
+    scored = []
+    for tool in tools:
+        name = tool.get("name", "").lower().replace("_", " ").replace("-", " ")
+        desc = (tool.get("description") or "").lower()
+        score = sum(2 if w in name else 1 if w in desc else 0 for w in relevant)
+        if score:
+            scored.append((score, tool))
+    scored.sort(key=lambda x: (-x[0], x[1].get("name", "")))
+    return [tool for _, tool in scored]
+
+
+def build_catalogue(servers: int, per_server: int, seed: int) -> dict[str, list[dict]]:
+    rng = random.Random(seed)
+    catalogue = {}
+    for s in range(servers):
+        server = f"server{s}"
+        tools = []
+        for t in range(per_server):
+            verb, noun = rng.choice(VERBS), rng.choice(NOUNS)
+            words = [verb.capitalize(), "a", noun] + rng.sample(FILLER + NOUNS, 6)
+            tools.append({
+                "name": f"mcp__{server}__{verb}_{noun}_{t}",
+                "description": " ".join(words) + ".",
+                "mcp_server": server,
+                "mcp_tool_name": f"{verb}_{noun}_{t}",
+            })
+        catalogue[server] = tools
+    return catalogue
+
+
+def per_query(func, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for query in QUERIES:
+            func(query)
+    return (time.perf_counter() - started) / (repeat * len(QUERIES))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--servers", type=int, default=50, help="Number of MCP servers")
+    parser.add_argument("--tools-per-server", type=int, default=100, help="Tools per server")
+    parser.add_argument("--repeat", type=int, default=5, help="Passes over the query set")
+    parser.add_argument("--limit", type=int, default=10, help="Results per query (top-k)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the catalogue")
+    args = parser.parse_args()
+
+    catalogue = build_catalogue(args.servers, args.tools_per_server, args.seed)
+    all_tools = [tool for tools in catalogue.values() for tool in tools]
+
+    started = time.perf_counter()
+    index = ToolSearchIndex()
+    for server, tools in catalogue.items():
+        index.set_server_tools(server, tools)
+    build = time.perf_counter() - started
+
+    started = time.perf_counter()
+    index.set_server_tools("server0", catalogue["server0"])
+    refresh = time.perf_counter() - started
+
+    legacy = per_query(lambda q: legacy_search(q, all_tools)[: args.limit], args.repeat)
+    indexed = per_query(lambda q: index.search(q, limit=args.limit), args.repeat)
+
+    print(f"tools:              {len(all_tools)}")
+    print(f"index build:        {build * 1000:.1f} ms")
+    print(f"server refresh:     {refresh * 1000:.2f} ms")
+    print(f"legacy per query:   {legacy * 1e6:.0f} us")
+    print(f"indexed per query:  {indexed * 1e6:.0f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
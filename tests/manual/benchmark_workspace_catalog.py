@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Measure WorkspaceCatalog memory use and refresh latency on a large tree.
+
+Generates a synthetic workspace (500k files by default) and reports, for both
+the inotify and polling backends: the cold scan time, memory held by the
+catalog, the latency of applying a small batch of changes, and lookup times.
+Run from the repository root:
+
+    python tests/manual/benchmark_workspace_catalog.py --files 500000
+"""
+
+import argparse
+import gc
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from swecli.core.context_engineering.retrieval.workspace_catalog import (  # noqa: E402
+    WorkspaceCatalog,
+)
+
+FILES_PER_DIR = 50
+
+
+def generate_tree(root: Path, files: int) -> None:
+    """Create ``files`` empty files spread over nested directories."""
+    for i in range(files):
+        directory = root / f"pkg{i // (FILES_PER_DIR * 100)}" / f"mod{(i // FILES_PER_DIR) % 100}"
+        if i % FILES_PER_DIR == 0:
+            directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"file_{i}.py").touch()
+    (root / ".gitignore").write_text("*.log\n")
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.1f}ms"
+
+
+def measure(root: Path, watch: bool) -> None:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    catalog = WorkspaceCatalog(root, watch=watch, poll_interval=0)
+    catalog.sync()
+    scan = time.perf_counter() - start
+    files = catalog.files()
+    traced, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stats = catalog.stats()
+    print(f"\n[{stats['backend']}] {stats['files']} files, {stats['dirs']} dirs")
+    print(f"  cold scan:             {scan:.2f}s")
+    print(f"  memory (tracemalloc):  {traced / 1024 / 1024:.1f} MiB")
+    print(f"  memory (estimate):     {stats['memory_bytes'] / 1024 / 1024:.1f} MiB")
+    if stats["watches"]:
+        print(f"  inotify watches:       {stats['watches']}")
+
+    # Apply a small batch of changes and time the next query
+    target = root / files[len(files) // 2]
+    new_files = [target.with_name(f"added_{n}.py") for n in range(10)]
+    for path in new_files:
+        path.touch()
+    start = time.perf_counter()
+    catalog.sync()
+    print(f"  refresh (10 new files): {_ms(time.perf_counter() - start)}")
+    assert all(catalog.is_file(p.relative_to(root).as_posix()) for p in new_files)
+
+    start = time.perf_counter()
+    catalog.sync()
+    print(f"  refresh (no changes):  {_ms(time.perf_counter() - start)}")
+
+    start = time.perf_counter()
+    catalog.files()
+    print(f"  files() after change:  {_ms(time.perf_counter() - start)}")
+
+    for label, fn in (
+        ("find('file_4242')", lambda: catalog.find("file_4242", 20)),
+        ("fuzzy find('md42f9')", lambda: catalog.find("md42f9", 20, fuzzy=True)),
+        ("glob('pkg1/**/*.py')", lambda: catalog.glob("pkg1/**/*.py")),
+        ("files(under='pkg2')", lambda: catalog.files("pkg2")),
+    ):
+        start = time.perf_counter()
+        fn()
+        print(f"  {label:<22} {_ms(time.perf_counter() - start)}")
+
+    for path in new_files:
+        path.unlink()
+    catalog.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=500_000, help="number of files")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="catalog-bench-") as tmp:
+        root = Path(tmp) / "tree"
+        print(f"Generating {args.files} files in {root} ...")
+        start = time.perf_counter()
+        generate_tree(root, args.files)
+        print(f"Generated in {time.perf_counter() - start:.1f}s")
+
+        measure(root, watch=True)
+        measure(root, watch=False)
+
+
+if __name__ == "__main__":
+    main()
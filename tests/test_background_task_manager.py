@@ -0,0 +1,99 @@
+"""Tests for background task output storage and streaming."""
+
+import os
+import pty
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from swecli.core.context_engineering.tools.background_task_manager import (
+    BackgroundTaskManager,
+    TaskStatus,
+)
+from swecli.core.context_engineering.tools.task_output_store import TaskOutputStore
+
+
+def _fill(store: TaskOutputStore, count: int) -> None:
+    for start in range(0, count, 7):
+        chunk = "".join(f"line {i}\r\n" for i in range(start, min(start + 7, count)))
+        store.append(chunk.encode())
+
+
+def test_store_rotates_and_caps_segments(tmp_path: Path) -> None:
+    store = TaskOutputStore(tmp_path / "t.output", segment_bytes=200, max_segments=3, ring_lines=0)
+    _fill(store, 100)
+    store.close()
+
+    assert [p.name for p in store.segment_paths()] == ["t.output", "t.output.1", "t.output.2"]
+    assert all(p.stat().st_size <= 200 for p in store.segment_paths())
+    assert store.dropped_bytes > 0
+    retained = store.read_all()
+    assert retained.endswith("line 99\r\n")
+    assert len(retained.encode()) + store.dropped_bytes == sum(
+        len(f"line {i}\r\n") for i in range(100)
+    )
+
+
+def test_tail_seeks_backwards_across_segments(tmp_path: Path) -> None:
+    disk = TaskOutputStore(tmp_path / "a.output", segment_bytes=64, max_segments=50, ring_lines=0)
+    ring = TaskOutputStore(tmp_path / "b.output", segment_bytes=64, max_segments=50, ring_lines=10)
+    for store in (disk, ring):
+        _fill(store, 200)
+        store.append(b"partial")
+
+    expected = [f"line {i}" for i in range(185, 200)] + ["partial"]
+    assert disk.tail(16) == expected
+    assert ring.tail(16) == expected  # More than the ring holds: falls back to disk
+    assert ring.tail(5) == expected[-5:]
+    assert disk.tail(3, skip=10) == ["line 188", "line 189", "line 190"]
+    assert disk.tail(5000)[0] == "line 0"
+    assert disk.tail(0) == []
+
+
+def test_grep_returns_latest_matches(tmp_path: Path) -> None:
+    store = TaskOutputStore(tmp_path / "t.output", segment_bytes=100)
+    _fill(store, 50)
+    matches = store.grep(r"line 4\d", max_matches=3)
+    assert matches == [(48, "line 47"), (49, "line 48"), (50, "line 49")]
+    assert store.grep("LINE 7$", ignore_case=True) == [(8, "line 7")]
+
+
+def test_manager_streams_pty_output(tmp_path: Path) -> None:
+    manager = BackgroundTaskManager(tmp_path)
+    tasks = []
+    for name in ("one", "two"):
+        master_fd, slave_fd = pty.openpty()
+        script = f"for i in range(300): print('{name}', i)"
+        process = subprocess.Popen(
+            [sys.executable, "-c", script], stdout=slave_fd, stderr=slave_fd, close_fds=True
+        )
+        os.close(slave_fd)
+        tasks.append(
+            manager.register_task(
+                f"{name} server", process.pid, process, master_fd, initial_output="starting\n"
+            )
+        )
+
+    try:
+        deadline = time.monotonic() + 10
+        while any(manager.get_task(t.task_id).is_running for t in tasks):
+            assert time.monotonic() < deadline
+            time.sleep(0.05)
+        deadline = time.monotonic() + 5
+        while not manager.read_output(tasks[1].task_id, tail_lines=1).endswith("two 299"):
+            assert time.monotonic() < deadline
+            time.sleep(0.05)
+
+        first = tasks[0].task_id
+        assert manager.get_task(first).status == TaskStatus.COMPLETED
+        assert manager.read_output(first, tail_lines=2) == "one 298\none 299"
+        assert manager.read_output(first, tail_lines=1, skip_lines=299) == "one 0"
+        assert manager.read_output(first, tail_lines=0).startswith("starting\none 0\r\n")
+        assert manager.grep_output(tasks[1].task_id, r"two 15\d", max_matches=2) == [
+            (160, "two 158"),
+            (161, "two 159"),
+        ]
+        assert manager.read_output("missing") == ""
+    finally:
+        manager.cleanup()
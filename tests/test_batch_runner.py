@@ -0,0 +1,217 @@
+"""Tests for the headless batch runner against a local OpenAI-compatible server."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from swecli.core.agents.components.api import configuration as api_configuration
+from swecli.core.agents.swecli_agent import SwecliAgent
+from swecli.core.runtime.services import BatchRunner, load_manifest
+from swecli.core.runtime.services.batch_runner import load_completed_task_ids
+
+USAGE = {"prompt_tokens": 100, "completion_tokens": 20, "total_tokens": 120}
+
+
+class FakeCompletions:
+    """Chat completions endpoint that answers from the last user message.
+
+    Prompts starting with ``write `` get a ``write_file`` tool call first;
+    prompts starting with ``sleep`` wait (up to a second) for ``release``.
+    """
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.requests: list[dict] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def respond(self, payload: dict) -> dict:
+        with self.lock:
+            self.requests.append(payload)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            messages = payload["messages"]
+            prompt = next(m["content"] for m in messages if m["role"] == "user")
+            if prompt.startswith("sleep"):
+                self.release.wait(1.0)
+            else:
+                time.sleep(0.05)
+            if prompt.startswith("write ") and messages[-1]["role"] == "user":
+                args = {"file_path": prompt.split()[1], "content": "hello\n"}
+                message = {
+                    "role": "assistant",
+                    "content": None,
+                    "tool_calls": [
+                        {
+                            "id": "call_1",
+                            "type": "function",
+                            "function": {"name": "write_file", "arguments": json.dumps(args)},
+                        }
+                    ],
+                }
+            else:
+                message = {"role": "assistant", "content": f"done: {prompt}"}
+            return {"choices": [{"index": 0, "message": message}], "usage": USAGE}
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture()
+def fake_api(monkeypatch, tmp_path: Path):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.setenv("FIREWORKS_API_KEY", "test-key")
+    # Compaction counts tokens with tiktoken, which downloads its encoding
+    monkeypatch.setattr(SwecliAgent, "_maybe_compact", lambda self, messages: messages)
+    completions = FakeCompletions()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.dumps(completions.respond(json.loads(self.rfile.read(length)))).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    completions.base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+    # Send the fireworks provider's requests to the local server
+    resolve_api_config = api_configuration.resolve_api_config
+
+    def resolve_to_fake_api(config):
+        _, headers = resolve_api_config(config)
+        return f"{completions.base_url}/chat/completions", headers
+
+    monkeypatch.setattr(api_configuration, "resolve_api_config", resolve_to_fake_api)
+    yield completions
+    # Let requests abandoned by timed-out tasks finish before stopping
+    completions.release.set()
+    while completions.in_flight:
+        time.sleep(0.01)
+    time.sleep(0.05)
+    server.shutdown()
+    server.server_close()
+
+
+def _write_manifest(path: Path, tasks: list[dict]) -> Path:
+    path.write_text("\n".join(json.dumps(task) for task in tasks) + "\n")
+    return path
+
+
+def _runner(fake_api: FakeCompletions, output: Path, **kwargs) -> BatchRunner:
+    overrides = {"model_provider": "fireworks", "model": "fake-model"}
+    return BatchRunner(output, config_overrides=overrides, **kwargs)
+
+
+def _records(output: Path) -> dict[str, dict]:
+    return {r["id"]: r for r in map(json.loads, output.read_text().splitlines())}
+
+
+def test_load_manifest(tmp_path: Path) -> None:
+    (tmp_path / "repo").mkdir()
+    manifest = tmp_path / "tasks.jsonl"
+    manifest.write_text(
+        '{"id": "a", "prompt": "one", "working_dir": "repo", "model": "m", "limits": {"max_iterations": 3}}\n'
+        "\n# comment\n"
+        '{"prompt": "two"}\n'
+    )
+    first, second = load_manifest(manifest)
+    assert (first.id, first.working_dir, first.model, first.max_iterations) == ("a", tmp_path / "repo", "m", 3)
+    assert (second.id, second.working_dir) == ("4", tmp_path)
+
+    manifest.write_text('{"id": "a", "prompt": "x"}\n{"id": "a", "prompt": "y"}\n')
+    with pytest.raises(ValueError, match="duplicate"):
+        load_manifest(manifest)
+    manifest.write_text('{"prompt": "x", "limits": {"retries": 2}}\n')
+    with pytest.raises(ValueError, match="limits"):
+        load_manifest(manifest)
+
+
+def test_batch_runs_tasks_concurrently_and_records_results(fake_api, tmp_path: Path) -> None:
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+    manifest = _write_manifest(
+        tmp_path / "tasks.jsonl",
+        [
+            {"id": "write", "prompt": "write out.txt", "working_dir": "a"},
+            {"id": "answer", "prompt": "say hi", "working_dir": "b", "model": "other-model"},
+            {"id": "answer-2", "prompt": "say bye", "working_dir": "b"},
+            {"id": "missing", "prompt": "x", "working_dir": "nope"},
+        ],
+    )
+    output = tmp_path / "results.jsonl"
+    summary = _runner(fake_api, output, workers=4, auto_approve=True).run(load_manifest(manifest))
+
+    assert (summary.total, summary.succeeded, summary.failed) == (4, 3, 1)
+    assert summary.usage["total_tokens"] == 4 * USAGE["total_tokens"]
+    assert (tmp_path / "a" / "out.txt").read_text() == "hello\n"
+    assert fake_api.max_in_flight > 1
+
+    records = _records(output)
+    assert records["write"]["status"] == "success"
+    assert records["write"]["tool_calls"] == 1
+    assert records["write"]["usage"] == {
+        "prompt_tokens": 200,
+        "completion_tokens": 40,
+        "total_tokens": 240,
+        "requests": 2,
+    }
+    assert records["answer"]["content"] == "done: say hi"
+    assert records["answer"]["model"] == "other-model"
+    assert {"queued_seconds", "setup_seconds", "run_seconds", "total_seconds"} <= set(records["answer"]["timings"])
+    assert records["missing"]["status"] == "error"
+    assert "does not exist" in records["missing"]["error"]
+    assert {r["model"] for r in fake_api.requests} == {"fake-model", "other-model"}
+
+
+def test_operations_are_denied_without_auto_approve(fake_api, tmp_path: Path) -> None:
+    manifest = _write_manifest(tmp_path / "tasks.jsonl", [{"prompt": "write out.txt"}])
+    output = tmp_path / "results.jsonl"
+    _runner(fake_api, output).run(load_manifest(manifest))
+    assert not (tmp_path / "out.txt").exists()
+
+
+def test_resume_skips_successful_tasks(fake_api, tmp_path: Path) -> None:
+    manifest = _write_manifest(
+        tmp_path / "tasks.jsonl",
+        [{"id": "a", "prompt": "first"}, {"id": "b", "prompt": "second"}, {"id": "c", "prompt": "third"}],
+    )
+    output = tmp_path / "results.jsonl"
+    output.write_text(
+        json.dumps({"id": "a", "status": "success"}) + "\n"
+        + json.dumps({"id": "b", "status": "failed"}) + "\n"
+        + '{"id": "c", "sta'  # killed mid-write
+    )
+    assert load_completed_task_ids(output) == {"a"}
+
+    summary = _runner(fake_api, output).run(load_manifest(manifest), resume=True)
+    assert (summary.skipped, summary.succeeded) == (1, 2)
+    prompts = {next(m["content"] for m in r["messages"] if m["role"] == "user") for r in fake_api.requests}
+    assert prompts == {"second", "third"}
+    assert load_completed_task_ids(output) == {"a", "b", "c"}
+
+
+def test_timeout_limit_interrupts_task(fake_api, tmp_path: Path) -> None:
+    manifest = _write_manifest(
+        tmp_path / "tasks.jsonl", [{"id": "slow", "prompt": "sleep", "limits": {"timeout_seconds": 0.2}}]
+    )
+    output = tmp_path / "results.jsonl"
+    started = time.monotonic()
+    summary = _runner(fake_api, output).run(load_manifest(manifest))
+    assert summary.failed == 1
+    assert _records(output)["slow"]["status"] == "timeout"
+    assert time.monotonic() - started < 1.0
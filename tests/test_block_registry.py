@@ -377,3 +377,85 @@ class TestBlockRegistry:
             is_wrappable=True,
         ))
         assert len(registry) == 2
+
+
+def _registry_with(*spans: tuple[int, int]) -> tuple[BlockRegistry, list[ContentBlock]]:
+    """Register blocks from (start_line, line_count) pairs."""
+    registry = BlockRegistry()
+    blocks = []
+    for i, (start, count) in enumerate(spans):
+        block = ContentBlock(
+            block_id=f"block-{i}",
+            source=Text(f"Block {i}"),
+            is_wrappable=True,
+            start_line=start,
+            line_count=count,
+        )
+        registry.register(block)
+        blocks.append(block)
+    return registry, blocks
+
+
+class TestBlockPositions:
+    """Tests for start lines derived from the prefix sums of block heights."""
+
+    def test_line_count_change_shifts_later_blocks(self):
+        registry, (block1, block2, block3) = _registry_with((0, 2), (2, 3), (5, 1))
+
+        block2.line_count = 6
+
+        assert block1.start_line == 0
+        assert block2.start_line == 2
+        assert block3.start_line == 8
+
+    def test_unowned_lines_between_blocks_are_kept(self):
+        # Two lines written directly to the log between the blocks
+        registry, (block1, block2) = _registry_with((0, 2), (4, 1))
+
+        block1.line_count = 1
+
+        assert block2.start_line == 3
+
+    def test_remove_lines_range_shifts_later_blocks(self):
+        registry, (block1, block2, block3) = _registry_with((0, 2), (2, 1), (3, 4))
+
+        registry.remove_lines_range(2, 1)
+
+        assert registry.get_block("block-1") is None
+        assert len(registry) == 2
+        assert block1.start_line == 0
+        assert block3.start_line == 2
+
+    def test_remove_lines_range_inside_block(self):
+        registry, (block1, block2) = _registry_with((0, 5), (5, 2))
+
+        registry.remove_lines_range(3, 1)
+
+        assert len(registry) == 2
+        assert block2.start_line == 4
+
+    def test_removed_block_keeps_last_position(self):
+        registry, (block1, block2) = _registry_with((0, 2), (2, 3))
+
+        registry.remove_blocks_from(2)
+        block1.line_count = 10
+
+        assert block2.start_line == 2
+
+    def test_blocks_in_range(self):
+        registry, blocks = _registry_with((0, 2), (2, 3), (5, 0), (5, 4))
+
+        assert [b.block_id for b in registry.blocks_in_range(3, 6)] == ["block-1", "block-2", "block-3"]
+        assert [b.block_id for b in registry.blocks_in_range(0, 1)] == ["block-0"]
+        assert registry.blocks_in_range(20, 30) == []
+
+    def test_many_removals_compact_registry(self):
+        registry, blocks = _registry_with(*[(i, 1) for i in range(200)])
+
+        for _ in range(150):
+            registry.remove_lines_range(0, 1)
+
+        assert len(registry) == 50
+        assert len(registry._blocks) < 200
+        assert [b.start_line for b in registry.get_all_blocks()] == list(range(50))
+        assert blocks[-1].start_line == 49
@@ -0,0 +1,114 @@
+"""Tests for the shared keep-alive connection pool."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from swecli.core.agents.components.api.anthropic_adapter import AnthropicAdapter
+from swecli.core.agents.components.api.http_client import AgentHttpClient
+from swecli.core.agents.components.api.transport import (
+    ConnectionPool,
+    close_connection_pools,
+    get_connection_pool,
+    origin_of,
+)
+
+SLOW_DELAY = 1.0
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args) -> None:  # pragma: no cover - silence test output
+        pass
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        if payload.get("slow"):
+            time.sleep(SLOW_DELAY)
+        body = json.dumps({"echo": payload}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class _Monitor:
+    def __init__(self, interrupt_after: float) -> None:
+        self._deadline = time.monotonic() + interrupt_after
+
+    def should_interrupt(self) -> bool:
+        return time.monotonic() >= self._deadline
+
+
+@pytest.fixture()
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1/chat/completions"
+    close_connection_pools()
+    server.shutdown()
+    server.server_close()
+
+
+class TestConnectionPool:
+    """Connection reuse, sharing and cancellation."""
+
+    def test_origin_key(self) -> None:
+        assert origin_of("https://api.example.com/v1/chat") == "https://api.example.com:443"
+        assert origin_of("http://localhost:8080/x") == "http://localhost:8080"
+
+    def test_timeout_tuple_maps_to_connect_and_read(self) -> None:
+        timeout = ConnectionPool._timeout((10, 300))
+        assert timeout.connect == 10
+        assert timeout.read == 300
+
+    def test_clients_share_pool_per_origin(self, server_url: str) -> None:
+        first = AgentHttpClient(server_url, {})
+        second = AgentHttpClient(server_url.replace("/chat/completions", "/other"), {})
+        adapter = AnthropicAdapter("key", api_url=server_url)
+        assert first.pool is second.pool
+        assert adapter._pool is first.pool
+
+    def test_connection_reused_across_requests(self, server_url: str) -> None:
+        client = AgentHttpClient(server_url, {})
+        for i in range(3):
+            result = client.post_json({"n": i})
+            assert result.success
+            assert result.response.json() == {"echo": {"n": i}}
+
+        stats = client.pool.stats
+        assert stats.requests == 3
+        assert stats.connections_opened == 1
+        assert stats.connections_reused == 2
+        assert stats.reuse_ratio == pytest.approx(2 / 3)
+
+    def test_monitored_request_reuses_connection(self, server_url: str) -> None:
+        client = AgentHttpClient(server_url, {})
+        monitor = _Monitor(interrupt_after=60)
+        assert client.post_json({"n": 1}, task_monitor=monitor).success
+        assert client.post_json({"n": 2}, task_monitor=monitor).success
+        assert client.pool.stats.connections_opened == 1
+
+    def test_interrupt_cancels_request_but_keeps_pool(self, server_url: str) -> None:
+        client = AgentHttpClient(server_url, {})
+        assert client.post_json({"warm": True}).success
+
+        started = time.monotonic()
+        result = client.post_json({"slow": True}, task_monitor=_Monitor(interrupt_after=0.1))
+        assert result.interrupted
+        assert time.monotonic() - started < SLOW_DELAY / 2
+        assert client.pool.stats.cancelled == 1
+
+        # The pool is still usable and still the shared one
+        assert get_connection_pool(server_url) is client.pool
+        result = client.post_json({"after": True})
+        assert result.success
+        assert result.response.json() == {"echo": {"after": True}}
@@ -0,0 +1,72 @@
+"""Tests for the shared old_content matcher used by EditTool and DockerToolHandler."""
+
+from pathlib import Path
+
+from swecli.core.context_engineering.tools.implementations.content_matcher import find_content
+from swecli.core.context_engineering.tools.implementations.edit_tool import EditTool
+from swecli.models.config import AppConfig
+
+SOURCE = """class A:
+    def run(self):
+        x = 1
+
+        return x
+
+
+class B:
+    def run(self):
+        x = 1
+
+        return x
+"""
+
+
+def test_exact_match_reports_every_occurrence() -> None:
+    match = find_content(SOURCE, "        x = 1\n")
+    assert match.found and match.exact
+    assert match.ambiguous
+    assert match.line_numbers == [3, 10]
+    assert match.replace(SOURCE, "        x = 2\n").count("x = 2") == 1
+    assert match.replace(SOURCE, "        x = 2\n", match_all=True).count("x = 2") == 2
+
+
+def test_fuzzy_match_ignores_indentation_and_blank_lines() -> None:
+    old = "class B:\ndef run(self):\n  x = 1\nreturn x\n"
+    match = find_content(SOURCE, old)
+    assert match.found and not match.exact and not match.ambiguous
+    assert match.line_numbers == [8]
+    assert match.content == "class B:\n    def run(self):\n        x = 1\n\n        return x\n"
+
+
+def test_fuzzy_match_reports_ambiguity() -> None:
+    match = find_content(SOURCE, "def run(self):\nx = 1")
+    assert match.found and match.ambiguous
+    assert match.line_numbers == [2, 9]
+
+
+def test_not_found() -> None:
+    assert not find_content(SOURCE, "def missing():").found
+    assert not find_content(SOURCE, "").found
+
+
+def test_crlf_file_matches_lf_old_content() -> None:
+    original = "a = 1\r\n    b = 2\r\nc = 3\r\n"
+    match = find_content(original, "a = 1\nb = 2\n")
+    assert match.found
+    assert match.replace(original, "z = 0\n") == "z = 0\nc = 3\r\n"
+
+
+def test_edit_tool_rejects_ambiguous_fuzzy_match(tmp_path: Path) -> None:
+    path = tmp_path / "mod.py"
+    path.write_text(SOURCE)
+    tool = EditTool(AppConfig(), tmp_path)
+
+    result = tool.edit_file(str(path), "def run(self):\n x = 1", "def run(self):\n x = 2")
+    assert not result.success
+    assert "2 times at line 2, line 9" in result.error
+
+    result = tool.edit_file(
+        str(path), "class A:\ndef run(self):\nx = 1", "class A:\n    def run(self):\n        x = 3"
+    )
+    assert result.success
+    assert path.read_text().splitlines()[2] == "        x = 3"
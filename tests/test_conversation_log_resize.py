@@ -0,0 +1,127 @@
+"""Tests for viewport-first re-rendering of ConversationLog on resize."""
+
+import asyncio
+
+from rich.console import Console
+from rich.text import Text
+from textual.app import App, ComposeResult
+
+from swecli.ui_textual.widgets.conversation_log import ConversationLog
+
+PARAGRAPH = "lorem ipsum dolor sit amet consectetur adipiscing elit " * 4
+
+
+class LogApp(App):
+    def compose(self) -> ComposeResult:
+        yield ConversationLog()
+
+
+def _plain(log: ConversationLog) -> list[str]:
+    return [strip.text.rstrip() for strip in log.lines]
+
+
+def _full_render(log: ConversationLog, width: int) -> list[str]:
+    """What re-rendering every block at ``width`` produces."""
+    lines = []
+    for block in log._block_registry.get_all_blocks():
+        strips = log._render_source_to_strips(block.source, Console(width=width, force_terminal=True))
+        lines.extend(strip.text.rstrip() for strip in strips)
+    return lines
+
+
+async def _settle(pilot, log: ConversationLog) -> None:
+    """Wait for the debounced re-render and all idle refinement."""
+    await pilot.pause(0.1)
+    for _ in range(200):
+        if not log._refine_queue and log._refine_timer is None and not log._pending_rerender:
+            return
+        await pilot.pause(0.02)
+
+
+def run(coro) -> None:
+    asyncio.run(coro)
+
+
+def test_resize_renders_viewport_first_then_refines() -> None:
+    async def scenario() -> None:
+        app = LogApp()
+        async with app.run_test(size=(120, 30)) as pilot:
+            log = app.query_one(ConversationLog)
+            for i in range(300):
+                log.write(Text(f"{i}: {PARAGRAPH}"))
+            await pilot.pause()
+
+            rendered = []
+            original = log._render_block
+            log._render_block = lambda block, width: rendered.append(block.block_id) or original(block, width)
+            # Hold back idle refinement so the state right after the re-render is stable
+            log._schedule_refinement = lambda: None
+
+            await pilot.resize_terminal(60, 30)
+            # The re-render runs in one go, so any rendered block means it has finished
+            for _ in range(200):
+                if rendered:
+                    break
+                await pilot.pause(0.02)
+            # Only the blocks near the (bottom) viewport were rendered up front
+            assert 0 < len(rendered) < 300
+            assert log._refine_queue
+            assert log.virtual_size.height == len(log.lines)
+
+            del log._schedule_refinement
+            log._schedule_refinement()
+            await _settle(pilot, log)
+            width = log.scrollable_content_region.width
+            assert all(b.rendered_width == width for b in log._block_registry.get_all_blocks())
+            assert _plain(log) == _full_render(log, width)
+            assert log.virtual_size.height == len(log.lines)
+
+    run(scenario())
+
+
+def test_resizing_back_reuses_cached_strips() -> None:
+    async def scenario() -> None:
+        app = LogApp()
+        async with app.run_test(size=(120, 30)) as pilot:
+            log = app.query_one(ConversationLog)
+            for i in range(50):
+                log.write(Text(f"{i}: {PARAGRAPH}"))
+            await pilot.pause()
+            before = _plain(log)
+
+            await pilot.resize_terminal(60, 30)
+            await _settle(pilot, log)
+
+            rendered = []
+            original = log._render_block
+            log._render_block = lambda block, width: rendered.append(block.block_id) or original(block, width)
+            await pilot.resize_terminal(120, 30)
+            await _settle(pilot, log)
+            await pilot.resize_terminal(60, 30)
+            await _settle(pilot, log)
+
+            assert rendered == []
+            await pilot.resize_terminal(120, 30)
+            await _settle(pilot, log)
+            assert _plain(log) == before
+
+    run(scenario())
+
+
+def test_tracked_indices_follow_block_height_changes() -> None:
+    async def scenario() -> None:
+        app = LogApp()
+        async with app.run_test(size=(120, 30)) as pilot:
+            log = app.query_one(ConversationLog)
+            for i in range(40):
+                log.write(Text(f"{i}: {PARAGRAPH}"))
+            log.write(Text("APPROVAL", style="bold"), wrappable=False)
+            log._approval_start = len(log.lines) - 1
+            await pilot.pause()
+
+            await pilot.resize_terminal(50, 30)
+            await _settle(pilot, log)
+
+            assert log.lines[log._approval_start].text.rstrip() == "APPROVAL"
+
+    run(scenario())
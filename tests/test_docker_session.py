@@ -0,0 +1,121 @@
+"""Tests for the PTY-backed Docker runtime bash sessions."""
+
+import asyncio
+import subprocess
+import time
+
+import httpx
+import pytest
+
+from swecli.core.docker.exceptions import CommandTimeoutError, NonZeroExitCodeError
+from swecli.core.docker.local_runtime import LocalRuntime
+from swecli.core.docker.models import BashAction, CreateSessionRequest
+from swecli.core.docker.remote_runtime import RemoteRuntime
+from swecli.core.docker.server import create_app
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def test_exit_codes_and_state_in_one_round_trip(monkeypatch) -> None:
+    def no_subprocess(*args, **kwargs):
+        raise AssertionError("commands must not spawn helper processes")
+
+    async def scenario() -> None:
+        runtime = LocalRuntime()
+        try:
+            obs = await runtime.run_in_session(BashAction(command="cd /tmp && MARK=1 && echo hi"))
+            assert (obs.output, obs.exit_code, obs.failure_reason) == ("hi", 0, None)
+
+            monkeypatch.setattr(subprocess, "run", no_subprocess)
+            obs = await runtime.run_in_session(BashAction(command="pwd; false"))
+            assert (obs.output, obs.exit_code) == ("/tmp", 1)
+
+            script = "for i in 1 2; do\n  echo \"line $i\"\ndone\ncat <<'EOF'\nit's $HOME\nEOF"
+            obs = await runtime.run_in_session(BashAction(command=script))
+            assert obs.output == "line 1\nline 2\nit's $HOME"
+
+            obs = await runtime.run_in_session(BashAction(command="if then"))
+            assert obs.exit_code == 2 and "syntax error" in obs.output
+
+            obs = await runtime.run_in_session(BashAction(command="false", check="ignore"))
+            assert obs.exit_code is None
+            with pytest.raises(NonZeroExitCodeError):
+                await runtime.run_in_session(BashAction(command="(exit 4)", check="raise"))
+
+            # A command that exits the shell ends the session; the next one starts fresh
+            obs = await runtime.run_in_session(BashAction(command="echo bye; exit 7"))
+            assert obs.exit_code == 7 and obs.output.startswith("bye")
+            obs = await runtime.run_in_session(BashAction(command="echo ${MARK:-unset}"))
+            assert obs.output == "unset"
+        finally:
+            await runtime.close()
+
+    _run(scenario())
+
+
+def test_sessions_run_concurrently_and_stream() -> None:
+    async def scenario() -> None:
+        runtime = LocalRuntime()
+        try:
+            names = ["a", "b", "c"]
+            await asyncio.gather(
+                *(runtime.create_session(CreateSessionRequest(session=n)) for n in names)
+            )
+            started = time.monotonic()
+            results = await asyncio.gather(
+                *(
+                    runtime.run_in_session(BashAction(command=f"sleep 0.5; echo {n}", session=n))
+                    for n in names
+                )
+            )
+            assert time.monotonic() - started < 1.2
+            assert [obs.output for obs in results] == names
+
+            chunks: list[tuple[float, str]] = []
+            started = time.monotonic()
+            obs = await runtime.run_in_session(
+                BashAction(command="echo first; sleep 0.4; echo -n last", session="a"),
+                on_output=lambda chunk: chunks.append((time.monotonic() - started, chunk)),
+            )
+            assert [chunk for _, chunk in chunks] == ["first\n", "last"]
+            assert chunks[0][0] < 0.3  # Delivered before the command finished
+            assert obs.output == "first\nlast"
+
+            with pytest.raises(CommandTimeoutError):
+                await runtime.run_in_session(BashAction(command="sleep 5", session="b", timeout=0.2))
+            obs = await runtime.run_in_session(BashAction(command="echo ok", session="c"))
+            assert obs.output == "ok"
+        finally:
+            await runtime.close()
+
+    _run(scenario())
+
+
+def test_remote_runtime_streams_through_server() -> None:
+    async def scenario() -> None:
+        app = create_app()
+        remote = RemoteRuntime()
+        remote._client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://runtime"
+        )
+        try:
+            chunks: list[str] = []
+            obs = await remote.run_in_session_stream(
+                BashAction(command="printf 'a\\nb\\n'; (exit 3)"),
+                chunks.append,
+            )
+            assert "".join(chunks) == "a\nb\n"
+            assert (obs.output, obs.exit_code) == ("a\nb", 3)
+
+            with pytest.raises(NonZeroExitCodeError) as excinfo:
+                await remote.run_in_session_stream(
+                    BashAction(command="echo boom; (exit 5)", check="raise"), chunks.append
+                )
+            assert excinfo.value.exit_code == 5
+        finally:
+            await app.state.runtime.close()
+            await remote._client.aclose()
+
+    _run(scenario())
@@ -0,0 +1,117 @@
+"""Tests for EnvironmentCollector caching and invalidation."""
+
+import subprocess
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from swecli.core.agents.components.prompts.environment import EnvironmentCollector
+
+CONFIG = SimpleNamespace(model="test-model", model_provider="test")
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture()
+def repo(tmp_path: Path, monkeypatch) -> Path:
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    EnvironmentCollector.clear_cache()
+    repo = tmp_path / "repo"
+    (repo / "src").mkdir(parents=True)
+    (repo / "pyproject.toml").write_text("[project]\nname = 'x'\n")
+    _git(repo, "init", "-q", "-b", "main")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "first")
+    yield repo
+    EnvironmentCollector.clear_cache()
+
+
+@pytest.fixture()
+def probe_calls(monkeypatch) -> list[tuple[str, ...]]:
+    calls: list[tuple[str, ...]] = []
+    run_git = EnvironmentCollector._run_git
+
+    def counting(self, *args):
+        calls.append(args)
+        return run_git(self, *args)
+
+    monkeypatch.setattr(EnvironmentCollector, "_run_git", counting)
+    return calls
+
+
+def test_repeated_collect_reuses_snapshot(repo: Path, probe_calls) -> None:
+    first = EnvironmentCollector(repo, CONFIG).collect()
+    assert first.git_branch == "main"
+    assert first.git_recent_commits.endswith("first")
+    assert first.tech_stack == "Python"
+    assert "src/" in first.directory_tree
+    assert probe_calls
+
+    probe_calls.clear()
+    # A new collector (e.g. for another suite or subagent) shares the cache
+    second = EnvironmentCollector(repo, CONFIG).collect()
+    assert second == first
+    assert probe_calls == []
+
+
+def test_only_changed_sources_are_recollected(repo: Path, probe_calls) -> None:
+    collector = EnvironmentCollector(repo, CONFIG)
+    before = collector.collect()
+
+    probe_calls.clear()
+    (repo / "notes.txt").write_text("hi\n")
+    _git(repo, "add", "notes.txt")
+    _git(repo, "commit", "-q", "-m", "second")
+    after = collector.collect()
+    assert after.git_recent_commits.splitlines()[0].endswith("second")
+    assert "notes.txt" in after.directory_tree
+    commands = {args[0] for args in probe_calls}
+    assert {"status", "log"} <= commands
+    assert "config" not in commands  # Remote URL sources unchanged
+
+    probe_calls.clear()
+    _git(repo, "remote", "add", "origin", "https://example.com/x.git")
+    assert collector.collect().git_remote_url == "https://example.com/x.git"
+    assert [args[0] for args in probe_calls] == ["config"]
+
+    probe_calls.clear()
+    _git(repo, "checkout", "-q", "-b", "feature")
+    switched = collector.collect()
+    assert switched.git_branch == "feature"
+    assert switched.tech_stack == before.tech_stack
+
+
+def test_working_tree_edits_show_up_after_status_ttl(repo: Path, monkeypatch) -> None:
+    clock = [1000.0]
+    monkeypatch.setattr("swecli.core.agents.components.prompts.environment.time.monotonic",
+                        lambda: clock[0])
+    collector = EnvironmentCollector(repo, CONFIG)
+    assert collector.collect().git_status == "(clean)"
+
+    # Edits leave the index and HEAD alone, so only the TTL catches them
+    (repo / "pyproject.toml").write_text("[project]\nname = 'y'\n")
+    (repo / "new.txt").write_text("")
+    assert collector.collect().git_status == "(clean)"
+    clock[0] += EnvironmentCollector.GIT_STATUS_TTL
+    status = collector.collect().git_status
+    assert "M pyproject.toml" in status and "?? new.txt" in status
+
+
+def test_project_files_and_tree_follow_filesystem(repo: Path) -> None:
+    collector = EnvironmentCollector(repo, CONFIG)
+    assert collector.collect().tech_stack == "Python"
+
+    (repo / "Cargo.toml").write_text("[package]\n")
+    (repo / "src" / "lib.rs").write_text("")
+    snapshot = collector.collect()
+    assert snapshot.tech_stack == "Rust"
+    assert "Cargo.toml" in snapshot.project_config_files
+    assert "lib.rs" in snapshot.directory_tree
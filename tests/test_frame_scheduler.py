@@ -0,0 +1,135 @@
+"""Tests for the shared animation FrameScheduler and its use by SpinnerService."""
+
+import threading
+import time
+from types import SimpleNamespace
+
+from swecli.ui_textual.managers.frame_scheduler import FrameScheduler
+from swecli.ui_textual.managers.spinner_service import SpinnerService, SpinnerType
+
+
+class HeldApp:
+    """App stand-in that queues frames until run_pending() is called."""
+
+    def __init__(self) -> None:
+        self._loop = object()
+        self.pending = []
+
+    def call_later(self, callback) -> bool:
+        self.pending.append(callback)
+        return True
+
+    def run_pending(self) -> None:
+        pending, self.pending = self.pending, []
+        for callback in pending:
+            callback()
+
+
+def wait_until(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+def test_subscribers_share_frames_at_their_own_interval() -> None:
+    scheduler = FrameScheduler(SimpleNamespace(), fps=100)
+    fast, slow = [], []
+    scheduler.subscribe("fast", fast.append)
+    scheduler.subscribe("slow", slow.append, interval=0.1)
+    try:
+        assert wait_until(lambda: len(fast) >= 30)
+    finally:
+        scheduler.stop()
+    assert 1 <= len(slow) < len(fast) / 3
+    assert scheduler.stats.frames >= 30
+    assert scheduler.stats.avg_frame_ms >= 0
+
+
+def test_frames_are_dropped_while_ui_is_busy() -> None:
+    app = HeldApp()
+    scheduler = FrameScheduler(app, fps=200)
+    calls = []
+    scheduler.subscribe("anim", calls.append)
+    try:
+        # The first frame is never processed, so later ones are dropped
+        assert wait_until(lambda: scheduler.stats.dropped_frames >= 3)
+        assert len(app.pending) == 1
+        assert scheduler.stats.backoff > 1
+        app.run_pending()
+        assert len(calls) == 1
+        assert wait_until(lambda: len(app.pending) == 1)
+    finally:
+        scheduler.stop()
+
+
+def test_frame_refused_by_closing_app_is_not_left_pending() -> None:
+    app = SimpleNamespace(_loop=object(), call_later=lambda callback: False)
+    scheduler = FrameScheduler(app, fps=200)
+    scheduler.subscribe("anim", lambda now: None)
+    try:
+        time.sleep(0.05)
+        assert scheduler.stats.dropped_frames == 0
+    finally:
+        scheduler.stop()
+
+
+def test_frames_are_dropped_while_terminal_writer_is_saturated() -> None:
+    queue = SimpleNamespace(qsize=lambda: FrameScheduler.WRITE_QUEUE_HIGH_WATER)
+    app = SimpleNamespace(_driver=SimpleNamespace(_writer_thread=SimpleNamespace(_queue=queue)))
+    scheduler = FrameScheduler(app, fps=200)
+    calls = []
+    scheduler.subscribe("anim", calls.append)
+    try:
+        assert wait_until(lambda: scheduler.stats.dropped_frames >= 3)
+    finally:
+        scheduler.stop()
+    assert calls == []
+
+
+def test_invisible_subscribers_are_skipped() -> None:
+    scheduler = FrameScheduler(SimpleNamespace(), fps=200)
+    visible = threading.Event()
+    calls = []
+    scheduler.subscribe("anim", calls.append, is_visible=visible.is_set)
+    try:
+        assert wait_until(lambda: scheduler.stats.skipped_offscreen >= 3)
+        assert calls == []
+        visible.set()
+        assert wait_until(lambda: len(calls) >= 1)
+    finally:
+        scheduler.stop()
+
+
+def test_scheduler_idles_without_subscribers() -> None:
+    scheduler = FrameScheduler(SimpleNamespace(), fps=200)
+    scheduler.subscribe("anim", lambda now: None)
+    assert wait_until(lambda: scheduler.stats.frames >= 2)
+    scheduler.unsubscribe("anim")
+    time.sleep(0.03)
+    frames = scheduler.stats.frames
+    time.sleep(0.05)
+    assert scheduler.stats.frames == frames
+    scheduler.stop()
+
+
+def test_spinner_service_animates_without_timer_threads() -> None:
+    service = SpinnerService(SimpleNamespace())
+    frames, hidden_frames = [], []
+    todo = service.register(SpinnerType.TODO, frames.append)
+    hidden = service.register(SpinnerType.TOOL, hidden_frames.append, is_visible=lambda: False)
+    try:
+        assert wait_until(lambda: len(frames) >= 4)
+        timer_threads = [t for t in threading.enumerate() if isinstance(t, threading.Timer)]
+        assert timer_threads == []
+        # Only the initial frame was rendered for the hidden spinner
+        assert len(hidden_frames) == 1
+        assert service.frame_stats.skipped_offscreen >= 1
+        assert len({frame.char for frame in frames}) > 1
+    finally:
+        service.stop_all()
+    assert not service.frame_scheduler.is_subscribed(SpinnerService._SCHEDULER_KEY)
+    assert not service.is_active(todo) and not service.is_active(hidden)
+    service.frame_scheduler.stop()
@@ -0,0 +1,142 @@
+"""Tests for building the full symbol tree in SolidLanguageServer."""
+
+import os
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from swecli.core.context_engineering.tools.lsp.ls import SolidLanguageServer
+from swecli.core.context_engineering.tools.lsp.ls_handler import Request
+
+
+class FakeHandler:
+    """Answers documentSymbol requests with one function per file, tracking concurrency."""
+
+    def __init__(self) -> None:
+        self.notify = MagicMock()
+        self.send = MagicMock()
+        self.send.document_symbol.side_effect = self._symbols
+        self.requested: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._next_id = 1
+
+    def _symbols(self, params: dict) -> list[dict]:
+        uri = params["textDocument"]["uri"]
+        self.requested.append(uri)
+        name = "func_" + Path(uri).stem
+        rng = {"start": {"line": 0, "character": 0}, "end": {"line": 1, "character": 0}}
+        return [{"name": name, "kind": 12, "range": rng, "selectionRange": rng}]
+
+    def send_request_nowait(self, method: str, params: dict | None = None) -> Request:
+        assert method == "textDocument/documentSymbol"
+        request = Request(request_id=self._next_id, method=method)
+        self._next_id += 1
+        request.on_result(self._symbols(params))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        return request
+
+    def wait_for_response(self, request: Request, params: dict | None = None):
+        self.in_flight -= 1
+        return request.get_result().payload
+
+
+class FakeLanguageServer(SolidLanguageServer):
+    def __init__(self, root: Path) -> None:
+        # Bypass the real constructor, which launches a language server process
+        self.repository_root_path = str(root)
+        self.language_id = "python"
+        self._encoding = "utf-8"
+        self.open_file_buffers = {}
+        self.server = FakeHandler()
+        self.server_started = True
+        self._raw_document_symbols_cache = {}
+        self._document_symbols_cache = {}
+
+    def _start_server(self) -> None:
+        pass
+
+    def is_ignored_path(self, relative_path: str, ignore_unsupported_files: bool = True) -> bool:
+        abs_path = os.path.join(self.repository_root_path, relative_path)
+        if os.path.isfile(abs_path) and not relative_path.endswith(".py"):
+            return True
+        return any(part.startswith(".") for part in Path(relative_path).parts)
+
+
+def _write(root: Path, rel: str, text: str = "x = 1\n") -> None:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+@pytest.fixture()
+def repo(tmp_path: Path) -> Path:
+    root = tmp_path / "repo"
+    for i in range(20):
+        _write(root, f"pkg/mod{i}.py")
+    _write(root, "pkg/sub/deep.py")
+    _write(root, "main.py")
+    _write(root, "README.md")
+    _write(root, ".hidden/secret.py")
+    return root.resolve()
+
+
+def _shape(symbols: list[dict]) -> dict:
+    """Reduce a symbol tree to names and relative paths, ignoring listing order."""
+
+    def node(symbol: dict) -> tuple:
+        children = sorted(node(child) for child in symbol.get("children", []))
+        return (symbol["name"], symbol["kind"], symbol["location"].get("relativePath"), tuple(children))
+
+    return sorted(node(symbol) for symbol in symbols)
+
+
+class TestPipelinedSymbolTree:
+    def test_matches_serial_tree(self, repo: Path) -> None:
+        pipelined = FakeLanguageServer(repo).request_full_symbol_tree()
+        serial = FakeLanguageServer(repo).request_full_symbol_tree(pipelined=False)
+        assert _shape(pipelined) == _shape(serial)
+
+    def test_parents_are_linked(self, repo: Path) -> None:
+        (root,) = FakeLanguageServer(repo).request_full_symbol_tree()
+        pkg = next(child for child in root["children"] if child["name"] == "pkg")
+        assert pkg["parent"] is root
+        mod = next(child for child in pkg["children"] if child["name"] == "mod0")
+        assert mod["parent"] is pkg
+        assert mod["children"][0]["name"] == "func_mod0"
+        assert mod["children"][0]["parent"] is mod
+
+    def test_bounded_requests_in_flight(self, repo: Path) -> None:
+        ls = FakeLanguageServer(repo)
+        ls.FULL_SYMBOL_TREE_MAX_IN_FLIGHT = 4
+        ls.request_full_symbol_tree()
+        assert len(ls.server.requested) == 22
+        assert ls.server.max_in_flight == 4
+        assert ls.server.in_flight == 0
+        # Every file opened for a request is closed again
+        assert ls.open_file_buffers == {}
+
+    def test_cached_files_are_not_requested(self, repo: Path) -> None:
+        ls = FakeLanguageServer(repo)
+        ls.request_full_symbol_tree()
+        ls.server.requested.clear()
+        ls._document_symbols_cache.clear()
+
+        _write(repo, "pkg/mod3.py", "y = 2\n")
+        ls.request_full_symbol_tree()
+        assert [Path(uri).name for uri in ls.server.requested] == ["mod3.py"]
+
+    def test_progress_reporting(self, repo: Path) -> None:
+        progress: list[tuple[int, int]] = []
+        FakeLanguageServer(repo).request_full_symbol_tree(progress_callback=lambda done, total: progress.append((done, total)))
+        assert progress[0] == (0, 22)
+        assert progress[-1] == (22, 22)
+        assert [done for done, _ in progress] == sorted(done for done, _ in progress)
+
+    def test_within_relative_path(self, repo: Path) -> None:
+        (pkg,) = FakeLanguageServer(repo).request_full_symbol_tree("pkg/sub")
+        assert pkg["name"] == "sub"
+        assert pkg["location"]["relativePath"] == os.path.join("pkg", "sub")
+        assert [child["name"] for child in pkg["children"]] == ["deep"]
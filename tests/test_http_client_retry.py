@@ -2,8 +2,8 @@
 
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
-import requests
 
 from swecli.core.agents.components.api.http_client import (
     MAX_RETRIES,
@@ -13,8 +13,8 @@ from swecli.core.agents.components.api.http_client import (
 
 
 def _make_response(status_code: int = 200, headers: dict | None = None) -> MagicMock:
-    """Create a mock requests.Response with the given status code."""
-    resp = MagicMock(spec=requests.Response)
+    """Create a mock httpx.Response with the given status code."""
+    resp = MagicMock(spec=httpx.Response)
     resp.status_code = status_code
     resp.headers = headers or {}
     resp.text = ""
@@ -45,7 +45,7 @@ class TestHttpClientRetry:
             return float(call_count * 100)
 
         with (
-            patch("requests.post", side_effect=responses),
+            patch.object(client.pool, "post", side_effect=responses),
             patch(
                 "swecli.core.agents.components.api.http_client.time.monotonic",
                 side_effect=fast_monotonic,
@@ -70,7 +70,7 @@ class TestHttpClientRetry:
             return float(counter["n"] * 100)
 
         with (
-            patch("requests.post", side_effect=responses),
+            patch.object(client.pool, "post", side_effect=responses),
             patch(
                 "swecli.core.agents.components.api.http_client.time.monotonic",
                 side_effect=fast_monotonic,
@@ -85,7 +85,7 @@ class TestHttpClientRetry:
     def test_no_retry_on_400(self, client: AgentHttpClient) -> None:
         """Should NOT retry on client errors (400, 401, 404)."""
         for code in (400, 401, 404):
-            with patch("requests.post", return_value=_make_response(code)):
+            with patch.object(client.pool, "post", return_value=_make_response(code)):
                 result = client.post_json({"model": "test"})
             assert result.success  # HTTP result success (transport OK)
             assert result.response is not None
@@ -103,7 +103,7 @@ class TestHttpClientRetry:
             return float(counter["n"] * 100)
 
         with (
-            patch("requests.post", side_effect=[resp_429, resp_200]),
+            patch.object(client.pool, "post", side_effect=[resp_429, resp_200]),
             patch(
                 "swecli.core.agents.components.api.http_client.time.monotonic",
                 side_effect=fast_monotonic,
@@ -126,7 +126,7 @@ class TestHttpClientRetry:
             return float(counter["n"] * 100)
 
         with (
-            patch("requests.post", side_effect=responses),
+            patch.object(client.pool, "post", side_effect=responses),
             patch(
                 "swecli.core.agents.components.api.http_client.time.monotonic",
                 side_effect=fast_monotonic,
@@ -154,14 +154,14 @@ class TestHttpClientRetry:
 
     def test_no_retry_on_network_error(self, client: AgentHttpClient) -> None:
         """Network errors should not be retried."""
-        with patch("requests.post", side_effect=ConnectionError("Connection refused")):
+        with patch.object(client.pool, "post", side_effect=ConnectionError("Connection refused")):
             result = client.post_json({"model": "test"})
         assert not result.success
         assert "Connection refused" in (result.error or "")
 
     def test_success_on_first_try(self, client: AgentHttpClient) -> None:
         """Successful request should return immediately without retries."""
-        with patch("requests.post", return_value=_make_response(200)) as mock_post:
+        with patch.object(client.pool, "post", return_value=_make_response(200)) as mock_post:
             result = client.post_json({"model": "test"})
         assert result.success
         assert mock_post.call_count == 1
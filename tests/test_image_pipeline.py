@@ -0,0 +1,143 @@
+"""Tests for image preprocessing and history image dedup."""
+
+import base64
+import copy
+import io
+import random
+from pathlib import Path
+from types import SimpleNamespace
+
+from PIL import Image, ImageDraw
+
+from swecli.core.agents.prompts import injected_user_message
+from swecli.core.context_engineering.images import (
+    PROVIDER_IMAGE_LIMITS,
+    ImagePreprocessor,
+    base64_media_type,
+    strip_sent_images,
+)
+from swecli.core.context_engineering.tools.implementations.vlm_tool import VLMTool
+
+
+def _encode(image: Image.Image, fmt: str = "PNG") -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+def _screenshot(width: int, height: int) -> Image.Image:
+    image = Image.new("RGB", (width, height), "white")
+    draw = ImageDraw.Draw(image)
+    rng = random.Random(0)
+    for _ in range(400):
+        x, y = rng.randrange(width), rng.randrange(height)
+        draw.rectangle([x, y, x + 120, y + 16], fill=rng.choice(["black", "navy", "gray"]))
+    return image
+
+
+def _photo(width: int, height: int) -> Image.Image:
+    return Image.frombytes("RGB", (width, height), random.Random(1).randbytes(width * height * 3))
+
+
+def _decode(data: str) -> Image.Image:
+    return Image.open(io.BytesIO(base64.b64decode(data)))
+
+
+def test_large_images_are_downsampled_and_reencoded() -> None:
+    preprocessor = ImagePreprocessor(PROVIDER_IMAGE_LIMITS["anthropic"])
+
+    raw = _encode(_screenshot(3200, 2000))
+    prepared = preprocessor.prepare_bytes(raw)
+    assert prepared.media_type == "image/png"
+    assert max(prepared.width, prepared.height) <= 1568
+    assert prepared.width * prepared.height <= 1_150_000
+    assert _decode(prepared.data).size == (prepared.width, prepared.height)
+    # Cached by content hash
+    assert preprocessor.prepare_bytes(raw) is prepared
+
+    photo = preprocessor.prepare_bytes(_encode(_photo(1600, 1200)))
+    assert photo.media_type == "image/jpeg"
+    assert base64_media_type(photo.data) == "image/jpeg"
+    assert photo.bytes_saved > photo.size
+
+    openai = ImagePreprocessor(PROVIDER_IMAGE_LIMITS["openai"]).prepare_bytes(raw)
+    assert min(openai.width, openai.height) <= 768
+
+
+def test_small_and_undecodable_images_pass_through() -> None:
+    preprocessor = ImagePreprocessor()
+    raw = _encode(_photo(200, 100), "JPEG")
+    prepared = preprocessor.prepare_bytes(raw)
+    assert base64.b64decode(prepared.data) == raw
+    assert prepared.bytes_saved == 0
+
+    transparent = _encode(Image.new("RGBA", (3000, 100), (255, 0, 0, 128)))
+    assert preprocessor.prepare_bytes(transparent).media_type == "image/png"
+
+    junk = preprocessor.prepare_bytes(b"not an image")
+    assert base64.b64decode(junk.data) == b"not an image"
+    assert junk.width is None
+
+
+def test_vlm_tool_encodes_preprocessed_image(tmp_path: Path) -> None:
+    (tmp_path / "shot.png").write_bytes(_encode(_photo(2400, 1800)))
+    config = SimpleNamespace(model_vlm_provider="anthropic")
+    data = VLMTool(config, tmp_path).encode_image("shot.png")
+    assert base64_media_type(data) == "image/jpeg"
+    assert max(_decode(data).size) <= 1568
+    assert VLMTool(config, tmp_path).encode_image("missing.png") is None
+
+
+def _image_block(data: str) -> dict:
+    return {"type": "image", "source": {"type": "base64", "media_type": "image/png", "data": data}}
+
+
+def test_strip_sent_images_keeps_only_current_turn() -> None:
+    old, new = "A" * 1000, "B" * 500
+    messages = [
+        {"role": "system", "content": "sys"},
+        {"role": "user", "content": [{"type": "text", "text": "look"}, _image_block(old)]},
+        {"role": "assistant", "content": "It shows a login form."},
+        {
+            "role": "user",
+            "content": [{"type": "text", "text": "and now"}, _image_block(new), _image_block(old)],
+        },
+        {"role": "assistant", "content": None, "tool_calls": []},
+        {"role": "user", "content": [_image_block(new)]},
+    ]
+    original = copy.deepcopy(messages)
+
+    # Only the newest user message is the current turn
+    result, stats = strip_sent_images(messages)
+    assert messages == original
+    assert result[5] == messages[5]
+    assert result[1]["content"][1]["type"] == "text"
+    assert "already shown" in result[1]["content"][1]["text"]
+    assert [block["type"] for block in result[3]["content"]] == ["text", "text", "text"]
+    assert (stats.sent, stats.replaced, stats.bytes_saved) == (1, 3, 2500)
+
+    # Repeats within the current turn: the latest copy is sent
+    result, stats = strip_sent_images(messages[:4])
+    assert result[3]["content"][1:] == messages[3]["content"][1:]
+    assert result[1]["content"][1]["type"] == "text"
+    assert (stats.sent, stats.replaced) == (2, 1)
+
+    # Deterministic, so the request prefix stays cacheable
+    assert strip_sent_images(messages)[0] == strip_sent_images(messages)[0]
+
+
+def test_injected_messages_do_not_start_a_turn() -> None:
+    image = "C" * 800
+    messages = [
+        {"role": "system", "content": "sys"},
+        {"role": "user", "content": [{"type": "text", "text": "what?"}, _image_block(image)]},
+        injected_user_message("Thinking trace: inspect the screenshot"),
+        {"role": "assistant", "content": None, "tool_calls": []},
+        injected_user_message("Please fix the failed tool call"),
+    ]
+    result, stats = strip_sent_images(messages)
+    assert (stats.sent, stats.replaced) == (1, 0)
+    assert result[1] is messages[1]
+    # The marker never reaches the provider
+    assert result[2] == {"role": "user", "content": "Thinking trace: inspect the screenshot"}
+    assert "_injected" in messages[2]
@@ -0,0 +1,70 @@
+"""Tests for lazily constructed tools and the CLI's lazy import path."""
+
+import subprocess
+import sys
+import textwrap
+
+from swecli.core.context_engineering.tools.lazy_tool import LazyTool, resolve_tool
+
+
+class _Tool:
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+    def run(self) -> int:
+        return self.value * 2
+
+
+def test_lazy_tool_defers_construction() -> None:
+    built = []
+
+    def factory() -> _Tool:
+        built.append(True)
+        return _Tool(21)
+
+    tool = LazyTool(factory, "Example")
+    assert not tool.is_loaded
+    assert "not loaded" in repr(tool)
+    assert built == []
+
+    assert tool.run() == 42
+    assert tool.value == 21
+    assert built == [True]
+    assert resolve_tool(tool) is tool.resolve()
+    assert resolve_tool("plain") == "plain"
+
+
+def test_lazy_tool_from_path_imports_on_first_use() -> None:
+    tool = LazyTool.from_path("fractions:Fraction", 3, 4)
+    assert repr(tool) == "<LazyTool Fraction (not loaded)>"
+    assert tool.numerator == 3
+    assert tool.is_loaded
+
+
+def test_startup_path_skips_heavy_modules() -> None:
+    script = textwrap.dedent(
+        """
+        import sys
+        from pathlib import Path
+        import swecli.cli
+        from swecli.core.context_engineering.tools.registry import ToolRegistry
+        from swecli.core.base.factories import build_default_tools
+        from swecli.models.config import AppConfig
+
+        build_default_tools(AppConfig(), Path.cwd())
+        ToolRegistry()
+        heavy = [
+            "swecli.ui_textual.runner",
+            "swecli.core.context_engineering.mcp.manager",
+            "swecli.core.context_engineering.tools.implementations.pdf_tool",
+            "swecli.core.context_engineering.tools.implementations.web_fetch_tool",
+            "swecli.core.context_engineering.tools.implementations.vlm_tool",
+            "swecli.core.context_engineering.tools.symbol_tools",
+        ]
+        print(",".join(name for name in heavy if name in sys.modules))
+        """
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
@@ -0,0 +1,190 @@
+"""Tests for language server pooling and pre-warming in LSPServerWrapper."""
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from swecli.core.context_engineering.tools.lsp.ls_config import Language
+from swecli.core.context_engineering.tools.lsp.wrapper import (
+    LSPServerWrapper,
+    detect_workspace_languages,
+)
+
+
+class FakeServer:
+    def __init__(self, language: Language) -> None:
+        self.language = language
+        self.running = False
+        self.saved = False
+
+    def start(self) -> None:
+        self.running = True
+
+    def stop(self) -> None:
+        self.running = False
+
+    def is_running(self) -> bool:
+        return self.running
+
+    def save_cache(self) -> None:
+        self.saved = True
+
+
+class FakeFactory:
+    """Stands in for SolidLanguageServer.create; boots block until released."""
+
+    def __init__(self, blocking: bool = False) -> None:
+        self.created: list[FakeServer] = []
+        self.release = threading.Event()
+        if not blocking:
+            self.release.set()
+        self.booting = 0
+        self.max_booting = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, config, repository_root_path, timeout=None, solidlsp_settings=None) -> FakeServer:
+        with self._lock:
+            self.booting += 1
+            self.max_booting = max(self.max_booting, self.booting)
+        self.release.wait(timeout=5)
+        with self._lock:
+            self.booting -= 1
+            server = FakeServer(config.code_language)
+            self.created.append(server)
+        return server
+
+
+@pytest.fixture()
+def factory():
+    factory = FakeFactory()
+    with patch("swecli.core.context_engineering.tools.lsp.wrapper.SolidLanguageServer.create", side_effect=factory):
+        yield factory
+
+
+@pytest.fixture()
+def wrapper(tmp_path: Path):
+    wrapper = LSPServerWrapper(workspace_root=tmp_path, idle_ttl=None)
+    yield wrapper
+    wrapper.shutdown()
+
+
+def test_server_is_reused(wrapper: LSPServerWrapper, factory: FakeFactory) -> None:
+    server = wrapper.get_server(Language.PYTHON)
+    assert server is not None and server.is_running()
+    assert wrapper.get_server(Language.PYTHON) is server
+    assert len(factory.created) == 1
+    assert wrapper.stats == {"hits": 1, "waits": 0, "misses": 1}
+
+
+def test_concurrent_callers_wait_for_a_single_boot(wrapper: LSPServerWrapper, factory: FakeFactory) -> None:
+    factory.release.clear()
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(wrapper.get_server(Language.PYTHON))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    factory.release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(factory.created) == 1
+    assert len(results) == 4 and all(result is factory.created[0] for result in results)
+    stats = wrapper.stats
+    assert stats["misses"] == 1 and stats["waits"] + stats["hits"] == 3
+
+
+def test_prewarm_boots_in_background(wrapper: LSPServerWrapper, factory: FakeFactory) -> None:
+    factory.release.clear()
+    assert wrapper.prewarm([Language.PYTHON, Language.GO]) == [Language.PYTHON, Language.GO]
+    # Already booting; not submitted again
+    assert wrapper.prewarm([Language.PYTHON]) == []
+    factory.release.set()
+
+    server = wrapper.get_server(Language.GO)
+    assert server is not None and server.language == Language.GO
+    assert wrapper.stats["misses"] == 0
+    assert len(factory.created) == 2
+
+
+def test_boot_concurrency_is_bounded(tmp_path: Path, factory: FakeFactory) -> None:
+    factory.release.clear()
+    wrapper = LSPServerWrapper(workspace_root=tmp_path, max_concurrent_boots=2, idle_ttl=None)
+    try:
+        wrapper.prewarm([Language.PYTHON, Language.GO, Language.RUST, Language.JAVA])
+        time.sleep(0.05)
+        assert factory.booting == 2
+        factory.release.set()
+        assert wrapper.get_server(Language.JAVA) is not None
+        assert factory.max_booting == 2
+    finally:
+        wrapper.shutdown()
+
+
+def test_failed_boot_is_retried(wrapper: LSPServerWrapper, factory: FakeFactory) -> None:
+    with patch(
+        "swecli.core.context_engineering.tools.lsp.wrapper.SolidLanguageServer.create",
+        side_effect=RuntimeError("not installed"),
+    ):
+        assert wrapper.get_server(Language.RUST) is None
+    assert wrapper.get_server(Language.RUST) is not None
+    assert wrapper.stats["misses"] == 2
+
+
+def test_idle_servers_are_stopped(wrapper: LSPServerWrapper, factory: FakeFactory, tmp_path: Path) -> None:
+    wrapper.idle_ttl = 60
+    python = wrapper.get_server(Language.PYTHON)
+    go = wrapper.get_server(Language.GO)
+    wrapper._last_used[(tmp_path.resolve(), Language.PYTHON)] -= 120
+
+    assert wrapper.stop_idle_servers() == [Language.PYTHON]
+    assert not python.is_running() and python.saved
+    assert go.is_running()
+    # The next call boots a fresh server
+    assert wrapper.get_server(Language.PYTHON) is not python
+
+
+def test_changing_the_root_keeps_pooled_servers(
+    wrapper: LSPServerWrapper, factory: FakeFactory, tmp_path: Path
+) -> None:
+    wrapper.prewarm([Language.PYTHON])
+    project = wrapper.get_server(Language.PYTHON)
+    subdir = tmp_path / "pkg" / "sub"
+    subdir.mkdir(parents=True)
+    source = subdir / "mod.py"
+    source.write_text("x = 1\n")
+
+    # Symbol tools point the wrapper at the file's directory
+    wrapper.workspace_root = subdir
+    assert project.is_running()
+    assert wrapper.get_server_for_file(source) is project
+    assert len(factory.created) == 1
+
+    # A root outside the pooled ones gets its own server; the old one stays up
+    other = tmp_path.parent / f"{tmp_path.name}-other"
+    other.mkdir()
+    wrapper.workspace_root = other
+    assert wrapper.get_server(Language.PYTHON) is not project
+    assert project.is_running()
+
+
+def test_shutdown_stops_servers(tmp_path: Path, factory: FakeFactory) -> None:
+    wrapper = LSPServerWrapper(workspace_root=tmp_path)
+    server = wrapper.get_server(Language.PYTHON)
+    wrapper.shutdown()
+    assert not server.is_running() and server.saved
+    # The wrapper can be used again after shutdown
+    assert wrapper.get_server(Language.PYTHON).is_running()
+    wrapper.shutdown()
+
+
+def test_detect_workspace_languages(tmp_path: Path) -> None:
+    for name in ("a.py", "b.py", "pkg/c.py", "main.go", "util.go", "README.md", "data.bin"):
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x\n")
+
+    assert detect_workspace_languages(tmp_path) == [Language.PYTHON, Language.GO, Language.MARKDOWN]
+    assert detect_workspace_languages(tmp_path, min_files=3) == [Language.PYTHON]
@@ -0,0 +1,127 @@
+"""Tests for concurrent MCP startup and the persisted tool-schema cache."""
+
+import asyncio
+import time
+
+from fastmcp import FastMCP
+
+from swecli.core.context_engineering.mcp.manager import MCPManager
+from swecli.core.context_engineering.mcp.models import MCPConfig, MCPServerConfig
+from swecli.core.context_engineering.mcp.schema_cache import ToolSchemaCache
+
+
+def _manager(tmp_path, servers: dict[str, MCPServerConfig]) -> MCPManager:
+    manager = MCPManager(working_dir=tmp_path, schema_cache=ToolSchemaCache(tmp_path / "cache"))
+    manager._config = MCPConfig(mcpServers=servers)
+    return manager
+
+
+def _in_memory_server(tool_names: list[str]) -> FastMCP:
+    server = FastMCP("fake")
+    for name in tool_names:
+
+        def tool(text: str) -> str:
+            return text
+
+        server.tool(tool, name=name, description=f"{name.replace('_', ' ')} tool")
+    return server
+
+
+def test_schema_cache_keyed_by_launch_config(tmp_path) -> None:
+    cache = ToolSchemaCache(tmp_path)
+    config = MCPServerConfig(command="npx", args=["pkg@1.0"])
+    tools = [{"name": "mcp__srv__echo", "description": "Echo", "mcp_server": "srv"}]
+
+    assert cache.load("srv", config) is None
+    assert cache.store("srv", config, tools, server_version="1.0") is True
+    assert cache.store("srv", config, tools, server_version="1.0") is False  # Unchanged
+    assert cache.load("srv", config) == tools
+
+    assert cache.load("srv", MCPServerConfig(command="npx", args=["pkg@2.0"])) is None
+    assert cache.load("other", config) is None
+    cache.invalidate("srv", config)
+    assert cache.load("srv", config) is None
+
+
+def test_startup_connects_concurrently_with_per_server_timeout(tmp_path) -> None:
+    names = ["a", "b", "c", "d", "slow"]
+    manager = _manager(tmp_path, {name: MCPServerConfig(command="x") for name in names})
+    manager.MAX_CONCURRENT_CONNECTIONS = 2
+    manager.CONNECT_TIMEOUT = 0.5
+    active, peak = 0, 0
+
+    async def fake_connect(server_name: str) -> bool:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        try:
+            await asyncio.sleep(10 if server_name == "slow" else 0.2)
+        finally:
+            active -= 1
+        return True
+
+    manager._connect_internal = fake_connect
+    started = time.monotonic()
+    results = manager.connect_enabled_servers_sync()
+    elapsed = time.monotonic() - started
+
+    assert results == {"a": True, "b": True, "c": True, "d": True, "slow": False}
+    assert peak == 2
+    assert elapsed < 2.0  # Sequential would be 0.8s plus the full 10s slow server
+    assert not manager.is_connecting("slow")
+
+
+def test_hung_client_shutdown_does_not_block_startup(tmp_path, monkeypatch) -> None:
+    class HangingClient:
+        def __init__(self, transport) -> None:
+            pass
+
+        async def __aenter__(self):
+            await asyncio.sleep(10)
+
+        async def __aexit__(self, *exc_info) -> None:
+            await asyncio.sleep(10)
+
+    monkeypatch.setattr("swecli.core.context_engineering.mcp.manager.Client", HangingClient)
+    monkeypatch.setattr(MCPManager, "_create_transport_from_config", lambda self, config: None)
+    manager = _manager(tmp_path, {"hung": MCPServerConfig(command="x")})
+    manager.CONNECT_TIMEOUT = 0.2
+    manager.CLEANUP_TIMEOUT = 0.2
+
+    started = time.monotonic()
+    assert manager.connect_enabled_servers_sync() == {"hung": False}
+    assert time.monotonic() - started < 2.0
+    assert not manager.is_connected("hung")
+
+
+def test_cached_tools_offered_before_connect_and_revalidated(tmp_path, monkeypatch) -> None:
+    servers = {"fake": MCPServerConfig(command="fake-server")}
+    live_tools = ["read_file", "write_file"]
+    monkeypatch.setattr(
+        MCPManager,
+        "_create_transport_from_config",
+        lambda self, config: _in_memory_server(live_tools),
+    )
+
+    first = _manager(tmp_path, servers)
+    assert first.load_cached_tools() == []
+    assert first.connect_enabled_servers_sync() == {"fake": True}
+    first.disconnect_all_sync()
+
+    second = _manager(tmp_path, servers)
+    assert second.load_cached_tools() == ["fake"]
+    assert second.is_cached("fake") and not second.is_connected("fake")
+    assert [t["mcp_tool_name"] for t in second.tool_index.search("write")] == ["write_file"]
+
+    # The server gained a tool since the cache was written
+    live_tools.append("delete_file")
+    assert second.connect_enabled_servers_sync() == {"fake": True}
+    assert not second.is_cached("fake")
+    assert len(second.get_server_tools("fake")) == 3
+    result = second.call_tool_sync("fake", "read_file", {"text": "hi"})
+    assert result == {"success": True, "output": "hi"}
+    second.disconnect_all_sync()
+
+    third = _manager(tmp_path, servers)
+    third.load_cached_tools()
+    assert len(third.get_server_tools("fake")) == 3
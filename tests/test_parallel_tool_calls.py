@@ -0,0 +1,197 @@
+"""Tests for concurrent execution of read-only tool calls in ReactExecutor."""
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from swecli.repl.react_executor import IterationContext, LoopAction, ReactExecutor
+
+TOOL_DELAY = 0.2
+
+
+def _tool_call(call_id: str, name: str, **args) -> dict:
+    return {
+        "id": call_id,
+        "type": "function",
+        "function": {"name": name, "arguments": json.dumps(args)},
+    }
+
+
+class _RecordingUI:
+    """UI callback that records the order of tool notifications."""
+
+    def __init__(self) -> None:
+        self.events: list[tuple[str, str]] = []
+        self.threads: set[int] = set()
+
+    def on_tool_call(self, tool_name: str, args_str: str) -> None:
+        self.events.append(("call", json.loads(args_str)["tag"]))
+        self.threads.add(threading.get_ident())
+
+    def on_tool_result(self, tool_name: str, args_str: str, result: dict) -> None:
+        self.events.append(("result", json.loads(args_str)["tag"]))
+        self.threads.add(threading.get_ident())
+
+
+@pytest.fixture()
+def executor() -> ReactExecutor:
+    session_manager = MagicMock()
+    session_manager.current_session = None
+    return ReactExecutor(
+        console=MagicMock(),
+        session_manager=session_manager,
+        config=MagicMock(),
+        llm_caller=MagicMock(),
+        tool_executor=MagicMock(),
+    )
+
+
+@pytest.fixture()
+def timeline():
+    """Patch tool execution to sleep and record (tag, start, end) per call."""
+    entries: list[tuple[str, float, float]] = []
+    lock = threading.Lock()
+
+    def fake_execute(tool_call, *args, **kwargs):
+        start = time.monotonic()
+        time.sleep(TOOL_DELAY)
+        tag = json.loads(tool_call["function"]["arguments"])["tag"]
+        with lock:
+            entries.append((tag, start, time.monotonic()))
+        return {"success": True, "output": f"output {tag}"}
+
+    with (
+        patch.object(ReactExecutor, "_execute_tool_call", side_effect=fake_execute),
+        patch("swecli.repl.react_executor.TaskProgressDisplay"),
+    ):
+        yield entries
+
+
+def _ctx(ui=None) -> IterationContext:
+    return IterationContext(
+        query="q",
+        messages=[],
+        agent=MagicMock(),
+        tool_registry=MagicMock(),
+        approval_manager=MagicMock(),
+        undo_manager=MagicMock(),
+        ui_callback=ui,
+    )
+
+
+class TestToolBatchPlanning:
+    def test_reads_grouped_and_writes_isolated(self, executor: ReactExecutor) -> None:
+        calls = [
+            _tool_call("1", "read_file", tag="a"),
+            _tool_call("2", "search", tag="b"),
+            _tool_call("3", "write_file", tag="c"),
+            _tool_call("4", "find_symbol", tag="d"),
+            _tool_call("5", "run_command", tag="e"),
+            _tool_call("6", "run_command", tag="f"),
+        ]
+        batches = executor._plan_tool_batches(calls)
+        assert [[tc["id"] for tc in batch] for batch in batches] == [
+            ["1", "2"],
+            ["3"],
+            ["4"],
+            ["5"],
+            ["6"],
+        ]
+
+
+class TestScheduledExecution:
+    def test_reads_run_concurrently(self, executor: ReactExecutor, timeline) -> None:
+        calls = [_tool_call(str(i), "read_file", tag=str(i)) for i in range(4)]
+        started = time.monotonic()
+        results, cancelled = executor._execute_tools_scheduled(calls, _ctx())
+        elapsed = time.monotonic() - started
+
+        assert not cancelled
+        assert set(results) == {"0", "1", "2", "3"}
+        assert elapsed < TOOL_DELAY * 2
+
+    def test_write_waits_for_preceding_reads(self, executor: ReactExecutor, timeline) -> None:
+        calls = [
+            _tool_call("r1", "read_file", tag="r1"),
+            _tool_call("r2", "search", tag="r2"),
+            _tool_call("w", "edit_file", tag="w"),
+            _tool_call("r3", "read_file", tag="r3"),
+        ]
+        executor._execute_tools_scheduled(calls, _ctx())
+
+        spans = {tag: (start, end) for tag, start, end in timeline}
+        assert spans["w"][0] >= max(spans["r1"][1], spans["r2"][1])
+        assert spans["r3"][0] >= spans["w"][1]
+
+    def test_ui_notifications_in_call_order(self, executor: ReactExecutor, timeline) -> None:
+        ui = _RecordingUI()
+        calls = [_tool_call(str(i), "read_file", tag=str(i)) for i in range(3)]
+        executor._execute_tools_scheduled(calls, _ctx(ui))
+
+        assert ui.events == [
+            ("call", "0"), ("result", "0"),
+            ("call", "1"), ("result", "1"),
+            ("call", "2"), ("result", "2"),
+        ]
+        assert ui.threads == {threading.get_ident()}
+
+    def test_history_preserves_tool_call_order(self, executor: ReactExecutor, timeline) -> None:
+        calls = [_tool_call(str(i), "read_file", tag=str(i)) for i in range(3)]
+        ctx = _ctx()
+        with (
+            patch.object(executor, "_persist_step"),
+            patch.object(executor, "_should_nudge_agent", return_value=False),
+        ):
+            action = executor._process_tool_calls(ctx, calls, "", None)
+
+        assert action == LoopAction.CONTINUE
+        tool_messages = [m for m in ctx.messages if m["role"] == "tool"]
+        assert [m["tool_call_id"] for m in tool_messages] == ["0", "1", "2"]
+        assert [m["content"] for m in tool_messages] == ["output 0", "output 1", "output 2"]
+
+    def test_interrupt_skips_later_batches(self, executor: ReactExecutor) -> None:
+        def fake_execute(tool_call, *args, **kwargs):
+            if tool_call["function"]["name"] == "run_command":
+                return {"success": False, "error": "Interrupted", "interrupted": True}
+            return {"success": True, "output": "ok"}
+
+        calls = [
+            _tool_call("bash", "run_command", tag="bash"),
+            _tool_call("after", "read_file", tag="after"),
+        ]
+        with patch.object(ReactExecutor, "_execute_tool_call", side_effect=fake_execute) as mock:
+            results, cancelled = executor._execute_tools_scheduled(calls, _ctx())
+
+        assert cancelled
+        assert mock.call_count == 1
+        assert results["after"]["interrupted"]
+
+    def test_batch_shares_one_monitor_and_progress_display(
+        self, executor: ReactExecutor
+    ) -> None:
+        seen: list[tuple[object, object]] = []
+        lock = threading.Lock()
+
+        def fake_execute_tool(name, args, task_monitor=None, **kwargs):
+            time.sleep(TOOL_DELAY / 2 if args["tag"] == "0" else TOOL_DELAY)
+            with lock:
+                # The first call to finish must not clear the interrupt target
+                seen.append((task_monitor, executor._tool_executor._current_task_monitor))
+            return {"success": True, "output": args["tag"]}
+
+        ctx = _ctx()
+        ctx.tool_registry.execute_tool.side_effect = fake_execute_tool
+        calls = [_tool_call(str(i), "read_file", tag=str(i)) for i in range(3)]
+        with patch("swecli.repl.react_executor.TaskProgressDisplay") as display:
+            executor._execute_tools_scheduled(calls, ctx)
+
+        assert display.call_count == 1
+        assert display.return_value.start.call_count == 1
+        assert display.return_value.stop.call_count == 1
+        monitors = {id(monitor) for monitor, _ in seen}
+        assert len(monitors) == 1
+        assert all(current is monitor for monitor, current in seen)
+        assert executor._tool_executor._current_task_monitor is None
@@ -0,0 +1,130 @@
+"""Tests for PDFTool page ranges, section lookup and the page text cache."""
+
+from pathlib import Path
+
+import pytest
+from pypdf import PdfWriter
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+from swecli.core.context_engineering.tools.implementations import pdf_tool
+from swecli.core.context_engineering.tools.implementations.pdf_tool import PDFTool
+
+
+def _make_pdf(path: Path, pages: list[list[str]], outline: list[tuple[str, int]] = ()) -> Path:
+    """Write a PDF with one Helvetica text line per entry on each page."""
+    writer = PdfWriter()
+    font = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica"),
+            }
+        )
+    )
+    for lines in pages:
+        page = writer.add_blank_page(612, 792)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+        text = " ".join(f"({line}) Tj 0 -16 Td" for line in lines)
+        stream = DecodedStreamObject()
+        stream.set_data(f"BT /F1 12 Tf 72 720 Td {text} ET".encode("latin-1"))
+        page[NameObject("/Contents")] = writer._add_object(stream)
+    for title, page_number in outline:
+        writer.add_outline_item(title, page_number)
+    with open(path, "wb") as f:
+        writer.write(f)
+    return path
+
+
+@pytest.fixture()
+def extracted(monkeypatch) -> list[int]:
+    """Record every page extracted (serial path)."""
+    pages: list[int] = []
+    extract = pdf_tool._extract_pages
+
+    def counting(path, backend, page_numbers):
+        pages.extend(page_numbers)
+        return extract(path, backend, page_numbers)
+
+    monkeypatch.setattr(pdf_tool, "_extract_pages", counting)
+    return pages
+
+
+def test_page_ranges_and_cache(tmp_path: Path, extracted: list[int]) -> None:
+    pdf = _make_pdf(tmp_path / "doc.pdf", [[f"Body of page {n}"] for n in range(1, 7)])
+    tool = PDFTool(tmp_path, cache_dir=tmp_path / "cache")
+
+    result = tool.extract_text("doc.pdf", pages="2-3")
+    assert result["success"], result
+    assert result["pages"] == "2-3"
+    assert result["page_count"] == 6
+    assert "Body of page 2" in result["content"] and "page 4" not in result["content"]
+    assert extracted == [1, 2]
+
+    # Only missing pages are extracted; a new instance reads the disk cache
+    result = PDFTool(tmp_path, cache_dir=tmp_path / "cache").extract_text(str(pdf))
+    assert "--- Page 6 ---\nBody of page 6" in result["content"]
+    assert sorted(extracted) == [0, 1, 2, 3, 4, 5]
+    extracted.clear()
+    assert tool.extract_text("doc.pdf", pages="1,5-")["pages"] == "1,5-6"
+    assert extracted == []
+
+    bad = tool.extract_text("doc.pdf", pages="4-9")
+    assert not bad["success"] and "outside pages 1-6" in bad["error"]
+
+
+def test_section_from_detected_headings(tmp_path: Path) -> None:
+    _make_pdf(
+        tmp_path / "paper.pdf",
+        [
+            ["Abstract", "We study things"],
+            ["1 Introduction", "Motivation"],
+            ["4 Method", "Overview", "4.1 Data", "Corpus details"],
+            ["4.2 Training Details", "Learning rate schedule"],
+            ["More training notes"],
+            ["5 Results", "Numbers"],
+            ["References"],
+        ],
+    )
+    tool = PDFTool(tmp_path, cache_dir=tmp_path / "cache")
+
+    result = tool.extract_text("paper.pdf", section="section 4.2")
+    assert result["success"], result
+    assert result["section"] == "4.2 Training Details"
+    assert result["pages"] == "4-6"
+    assert "Learning rate schedule" in result["content"]
+    assert "Corpus details" not in result["content"]
+
+    method = tool.extract_text("paper.pdf", section="Method")
+    assert method["pages"] == "3-6"
+    assert tool.extract_text("paper.pdf", section="references")["pages"] == "7"
+
+    missing = tool.extract_text("paper.pdf", section="9.9")
+    assert not missing["success"] and "4.2 Training Details" in missing["error"]
+
+
+def test_section_from_outline(tmp_path: Path) -> None:
+    _make_pdf(
+        tmp_path / "spec.pdf",
+        [["Cover"], ["Scope text"], ["Terms text"], ["Index"]],
+        outline=[("1 Scope", 1), ("2 Terms", 2), ("Index", 3)],
+    )
+    result = PDFTool(tmp_path, cache_dir=tmp_path / "cache").extract_text(
+        "spec.pdf", section="2"
+    )
+    assert result["section"] == "2 Terms"
+    assert result["pages"] == "3-4"
+    assert "Terms text" in result["content"]
+
+
+def test_large_documents_extract_on_process_pool(tmp_path: Path) -> None:
+    _make_pdf(tmp_path / "big.pdf", [[f"Page text {n}"] for n in range(1, 9)])
+    tool = PDFTool(tmp_path, cache_dir=tmp_path / "cache")
+    tool.PARALLEL_MIN_PAGES, tool.PAGES_PER_CHUNK, tool.MAX_WORKERS = 2, 2, 2
+
+    result = tool.extract_text("big.pdf")
+    assert result["success"], result
+    for n in range(1, 9):
+        assert f"--- Page {n} ---\nPage text {n}" in result["content"]
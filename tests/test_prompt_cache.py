@@ -0,0 +1,193 @@
+"""Tests for the prompt-cache-friendly request layout."""
+
+import copy
+import json
+from unittest.mock import MagicMock, patch
+
+from swecli.core.agents.components.api import AnthropicAdapter, OpenAIResponsesAdapter
+from swecli.core.agents.components.api.prompt_cache import (
+    ToolSchemaFreezer,
+    add_anthropic_cache_breakpoints,
+    annotate_cache_usage,
+)
+from swecli.core.agents.swecli_agent import SwecliAgent
+
+
+def _tool(name: str) -> dict:
+    return {
+        "type": "function",
+        "function": {
+            "name": name,
+            "description": f"The {name} tool",
+            "parameters": {"type": "object", "properties": {"path": {"type": "string"}}},
+        },
+    }
+
+
+def _strip_cache_control(value):
+    """Drop breakpoints (they move every turn and are not part of the cached text)."""
+    if isinstance(value, dict):
+        return {k: _strip_cache_control(v) for k, v in value.items() if k != "cache_control"}
+    if isinstance(value, list):
+        return [_strip_cache_control(v) for v in value]
+    return value
+
+
+class FakeAnthropicProvider:
+    """HTTP client stand-in that converts requests like the Anthropic adapter.
+
+    Each request's serialized Anthropic payload is recorded; the reply is a
+    tool call until ``turns`` requests have been made.
+    """
+
+    def __init__(self, turns: int) -> None:
+        self.adapter = AnthropicAdapter("key")
+        self.turns = turns
+        self.sent: list[dict] = []
+
+    def post_json(self, payload, task_monitor=None):
+        anthropic_payload = self.adapter.convert_request(payload)
+        self.sent.append(json.loads(json.dumps(anthropic_payload)))
+        count = len(self.sent)
+        if count < self.turns:
+            content = [{"type": "tool_use", "id": f"call_{count}", "name": "read_file", "input": {}}]
+        else:
+            content = [{"type": "text", "text": "done"}]
+        response = MagicMock(status_code=200)
+        response.json.return_value = self.adapter.convert_response(
+            {
+                "content": content,
+                "stop_reason": "tool_use" if count < self.turns else "end_turn",
+                "usage": {
+                    "input_tokens": 10,
+                    "output_tokens": 5,
+                    "cache_read_input_tokens": 100 * (count - 1),
+                    "cache_creation_input_tokens": 100,
+                },
+            }
+        )
+        return MagicMock(success=True, response=response)
+
+
+def _agent(provider: FakeAnthropicProvider, schema_orders: list[list[str]]) -> SwecliAgent:
+    config = MagicMock()
+    config.model = "claude-test"
+    config.model_provider = "anthropic"
+    config.model_vlm = None
+    config.temperature = 0.2
+    config.max_tokens = 1024
+    config.enable_streaming = False
+    tool_registry = MagicMock()
+    tool_registry.subagent_manager = None
+    tool_registry.get_all_mcp_tools.return_value = []
+
+    with patch.object(SwecliAgent, "build_system_prompt", return_value="You are a test agent."):
+        agent = SwecliAgent(config, tool_registry, MagicMock())
+    # Simulate a builder whose output order varies between calls
+    orders = iter(schema_orders)
+    agent._schema_builder = MagicMock()
+    agent._schema_builder.build.side_effect = lambda **_: [_tool(n) for n in next(orders)]
+    agent._SwecliAgent__http_client = provider
+    return agent
+
+
+def test_request_prefix_is_stable_across_iterations():
+    turns = 4
+    provider = FakeAnthropicProvider(turns)
+    agent = _agent(
+        provider,
+        [["read_file", "edit_file", "search"], ["search", "read_file", "edit_file"]] * turns,
+    )
+    messages = [
+        {"role": "system", "content": agent.system_prompt},
+        {"role": "user", "content": "Fix the bug"},
+    ]
+    for _ in range(turns):
+        response = agent.call_llm(messages)
+        assert response["success"]
+        messages.append(response["message"])
+        for call in response["tool_calls"] or []:
+            messages.append({"role": "tool", "tool_call_id": call["id"], "content": "file text"})
+
+    first = provider.sent[0]
+    for later, sent in enumerate(provider.sent[1:], start=1):
+        # Tools and system prompt, breakpoints included, are byte-identical
+        assert json.dumps(sent["tools"]) == json.dumps(first["tools"])
+        assert json.dumps(sent["system"]) == json.dumps(first["system"])
+        # History is only appended to
+        previous = _strip_cache_control(provider.sent[later - 1]["messages"])
+        current = _strip_cache_control(sent["messages"])
+        assert current[: len(previous)] == previous
+
+    assert [t["name"] for t in first["tools"]] == ["edit_file", "read_file", "search"]
+    assert first["tools"][-1]["cache_control"] == {"type": "ephemeral"}
+    assert all("cache_control" not in t for t in first["tools"][:-1])
+    assert response["usage"]["cached_prompt_tokens"] == 300
+    assert response["usage"]["uncached_prompt_tokens"] == 110
+
+
+def test_anthropic_breakpoints_mark_previous_and_latest_turn():
+    messages = [
+        {"role": "user", "content": "Fix the bug"},
+        {"role": "assistant", "content": [{"type": "text", "text": "Looking"}]},
+        {"role": "user", "content": [{"type": "tool_result", "tool_use_id": "a", "content": "x"}]},
+    ]
+    payload = {
+        "tools": [{"name": "a"}, {"name": "b"}],
+        "system": "system prompt",
+        "messages": messages,
+    }
+    original = copy.deepcopy(messages)
+
+    result = add_anthropic_cache_breakpoints(payload)
+
+    assert messages == original  # Caller's history is not modified
+    assert result["system"] == [
+        {"type": "text", "text": "system prompt", "cache_control": {"type": "ephemeral"}}
+    ]
+    marked = [i for i, m in enumerate(result["messages"]) if "cache_control" in json.dumps(m)]
+    assert marked == [0, 2]
+    assert result["messages"][0]["content"][0]["text"] == "Fix the bug"
+    assert json.dumps(result).count("cache_control") == 4
+
+    single = add_anthropic_cache_breakpoints({"messages": [{"role": "user", "content": ""}]})
+    assert "cache_control" not in json.dumps(single)
+
+
+def test_tool_schema_freezer_reuses_unchanged_schemas():
+    freezer = ToolSchemaFreezer()
+    frozen = freezer.freeze([_tool("b"), _tool("a")])
+    assert [t["function"]["name"] for t in frozen] == ["a", "b"]
+    assert freezer.freeze([_tool("a"), _tool("b")]) is frozen
+    assert freezer.freeze([_tool("a")]) is not frozen
+
+
+def test_cache_usage_accounting():
+    adapter = AnthropicAdapter("key")
+    usage = adapter._convert_usage(
+        {
+            "input_tokens": 20,
+            "output_tokens": 7,
+            "cache_read_input_tokens": 1000,
+            "cache_creation_input_tokens": 50,
+        }
+    )
+    assert usage["prompt_tokens"] == 1070
+    assert usage["total_tokens"] == 1077
+    assert usage["prompt_tokens_details"] == {"cached_tokens": 1000}
+
+    annotated = annotate_cache_usage(usage)
+    assert annotated["cached_prompt_tokens"] == 1000
+    assert annotated["uncached_prompt_tokens"] == 70
+
+    # Usage without cache details is passed through as-is
+    plain = adapter._convert_usage({"input_tokens": 3, "output_tokens": 4})
+    assert plain == {"prompt_tokens": 3, "completion_tokens": 4, "total_tokens": 7}
+    assert annotate_cache_usage(plain) is plain
+    assert annotate_cache_usage(None) is None
+
+    responses = OpenAIResponsesAdapter._convert_usage(
+        {"input_tokens": 500, "output_tokens": 10, "input_tokens_details": {"cached_tokens": 384}}
+    )
+    assert responses["prompt_tokens_details"] == {"cached_tokens": 384}
+    assert annotate_cache_usage(responses)["uncached_prompt_tokens"] == 116
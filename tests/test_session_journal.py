@@ -0,0 +1,248 @@
+"""Tests for the append-only session journal."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from swecli.core.context_engineering.history import session_journal
+from swecli.core.context_engineering.history.session_journal import LazyMessageList
+from swecli.core.context_engineering.history.session_manager import SessionManager
+from swecli.models.file_change import FileChange, FileChangeType
+from swecli.models.message import ChatMessage, Role
+
+
+def _journal_events(path: Path) -> list[dict]:
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+
+
+@pytest.fixture()
+def manager(tmp_path: Path) -> SessionManager:
+    mgr = SessionManager(session_dir=tmp_path)
+    mgr.create_session(str(tmp_path))
+    return mgr
+
+
+def _add(manager: SessionManager, count: int, start: int = 0) -> None:
+    for i in range(start, start + count):
+        role = Role.USER if i % 2 == 0 else Role.ASSISTANT
+        manager.add_message(ChatMessage(role=role, content=f"message {i}"), auto_save_interval=10_000)
+
+
+class TestJournalWrites:
+    def test_first_save_writes_snapshot(self, manager: SessionManager) -> None:
+        _add(manager, 2)
+        manager.save_session()
+        session_id = manager.current_session.id
+
+        snapshot = json.loads((manager.session_dir / f"{session_id}.json").read_text())
+        assert len(snapshot["messages"]) == 2
+        assert _journal_events(manager.session_dir / f"{session_id}.jsonl") == []
+
+    def test_later_saves_append_only(self, manager: SessionManager) -> None:
+        _add(manager, 2)
+        manager.save_session()
+        session_id = manager.current_session.id
+        snapshot_path = manager.session_dir / f"{session_id}.json"
+        snapshot_before = snapshot_path.read_text()
+
+        _add(manager, 3, start=2)
+        manager.save_session()
+
+        assert snapshot_path.read_text() == snapshot_before
+        events = _journal_events(manager.session_dir / f"{session_id}.jsonl")
+        message_events = [e for e in events if e["type"] == "message"]
+        assert [e["data"]["content"] for e in message_events] == [
+            "message 2", "message 3", "message 4",
+        ]
+        assert [e["seq"] for e in events] == list(range(1, len(events) + 1))
+
+    def test_unchanged_save_writes_nothing(self, manager: SessionManager) -> None:
+        _add(manager, 2)
+        manager.save_session()
+        _add(manager, 1, start=2)
+        manager.save_session()
+        journal = manager.session_dir / f"{manager.current_session.id}.jsonl"
+        size = journal.stat().st_size
+
+        manager.save_session()
+        assert journal.stat().st_size == size
+
+    def test_replay_restores_updates_and_state(self, manager: SessionManager) -> None:
+        _add(manager, 2)
+        manager.save_session()
+
+        session = manager.current_session
+        session.messages[-1].content = "edited in place"
+        session.add_file_change(
+            FileChange(type=FileChangeType.CREATED, file_path="new.py", lines_added=3)
+        )
+        session.metadata["tags"] = ["journal"]
+        _add(manager, 1, start=2)
+        manager.save_session()
+
+        loaded = SessionManager(session_dir=manager.session_dir).load_session(session.id)
+        assert [m.content for m in loaded.messages] == ["message 0", "edited in place", "message 2"]
+        assert [fc.file_path for fc in loaded.file_changes] == ["new.py"]
+        assert loaded.metadata["tags"] == ["journal"]
+
+    def test_journal_folded_into_snapshot(self, manager: SessionManager) -> None:
+        _add(manager, 1)
+        manager.save_session()
+        with patch.object(session_journal, "SNAPSHOT_EVERY_EVENTS", 3):
+            for i in range(1, 6):
+                _add(manager, 1, start=i)
+                manager.save_session()
+
+        session_id = manager.current_session.id
+        snapshot = json.loads((manager.session_dir / f"{session_id}.json").read_text())
+        events = _journal_events(manager.session_dir / f"{session_id}.jsonl")
+        assert len(snapshot["messages"]) + len([e for e in events if e["type"] == "message"]) == 6
+
+        loaded = SessionManager(session_dir=manager.session_dir).load_session(session_id)
+        assert [m.content for m in loaded.messages] == [f"message {i}" for i in range(6)]
+
+    def test_set_title_on_disk_session(self, manager: SessionManager) -> None:
+        _add(manager, 2)
+        manager.save_session()
+        session_id = manager.current_session.id
+        manager.current_session = None
+
+        manager.set_title(session_id, "Renamed")
+        loaded = SessionManager(session_dir=manager.session_dir).load_session(session_id)
+        assert loaded.metadata["title"] == "Renamed"
+
+    def test_delete_removes_journal(self, manager: SessionManager) -> None:
+        _add(manager, 2)
+        manager.save_session()
+        _add(manager, 1, start=2)
+        manager.save_session()
+        session_id = manager.current_session.id
+
+        manager.delete_session(session_id)
+        assert not (manager.session_dir / f"{session_id}.json").exists()
+        assert not (manager.session_dir / f"{session_id}.jsonl").exists()
+
+
+class TestCrashRecovery:
+    def test_torn_tail_is_ignored(self, manager: SessionManager) -> None:
+        _add(manager, 2)
+        manager.save_session()
+        _add(manager, 1, start=2)
+        manager.save_session()
+        session_id = manager.current_session.id
+
+        with open(manager.session_dir / f"{session_id}.jsonl", "a") as f:
+            f.write('{"seq": 99, "type": "message", "data": {"role": "us')
+
+        loaded = SessionManager(session_dir=manager.session_dir).load_session(session_id)
+        assert [m.content for m in loaded.messages] == ["message 0", "message 1", "message 2"]
+
+    def test_appends_after_torn_tail_survive_reload(self, manager: SessionManager) -> None:
+        _add(manager, 2)
+        manager.save_session()
+        _add(manager, 1, start=2)
+        manager.save_session()
+        session_id = manager.current_session.id
+        journal_path = manager.session_dir / f"{session_id}.jsonl"
+
+        with open(journal_path, "a") as f:
+            f.write('{"seq": 99, "type": "message", "data": {"role": "us')
+        _add(manager, 2, start=3)
+        manager.save_session()
+
+        assert all(json.loads(line) for line in journal_path.read_text().splitlines())
+        loaded = SessionManager(session_dir=manager.session_dir).load_session(session_id)
+        assert [m.content for m in loaded.messages] == [f"message {i}" for i in range(5)]
+
+    def test_corrupt_line_does_not_hide_later_events(self, manager: SessionManager) -> None:
+        _add(manager, 1)
+        manager.save_session()
+        _add(manager, 1, start=1)
+        manager.save_session()
+        session_id = manager.current_session.id
+        journal_path = manager.session_dir / f"{session_id}.jsonl"
+        journal_path.write_text("not json\n" + journal_path.read_text())
+
+        loaded = SessionManager(session_dir=manager.session_dir).load_session(session_id)
+        assert [m.content for m in loaded.messages] == ["message 0", "message 1"]
+
+    def test_snapshot_before_truncate_does_not_duplicate(self, manager: SessionManager) -> None:
+        _add(manager, 2)
+        manager.save_session()
+        _add(manager, 2, start=2)
+        manager.save_session()
+        session_id = manager.current_session.id
+        journal_path = manager.session_dir / f"{session_id}.jsonl"
+        journal_before = journal_path.read_text()
+
+        # Simulate a crash after the snapshot was written but before truncation
+        manager._journal_for(manager.session_dir / f"{session_id}.json").write_snapshot(
+            manager.current_session
+        )
+        journal_path.write_text(journal_before)
+
+        loaded = SessionManager(session_dir=manager.session_dir).load_session(session_id)
+        assert [m.content for m in loaded.messages] == [f"message {i}" for i in range(4)]
+
+
+class TestLazyLoading:
+    def test_messages_validated_on_access(self, manager: SessionManager) -> None:
+        _add(manager, 5)
+        manager.save_session()
+        session_id = manager.current_session.id
+
+        loaded = SessionManager(session_dir=manager.session_dir).load_session(session_id)
+        messages = loaded.messages
+        assert isinstance(messages, LazyMessageList)
+        assert len(messages) == 5
+        assert not messages.is_materialized(0)
+
+        assert messages[2].content == "message 2"
+        assert messages.is_materialized(2)
+        assert not messages.is_materialized(1)
+        assert [m.content for m in messages[3:]] == ["message 3", "message 4"]
+
+    def test_resumed_session_keeps_journaling(self, manager: SessionManager) -> None:
+        _add(manager, 3)
+        manager.save_session()
+        session_id = manager.current_session.id
+
+        resumed = SessionManager(session_dir=manager.session_dir)
+        resumed.load_session(session_id)
+        _add(resumed, 1, start=3)
+        resumed.save_session()
+
+        assert not resumed.current_session.messages.is_materialized(0)
+        events = _journal_events(manager.session_dir / f"{session_id}.jsonl")
+        assert [e["data"]["content"] for e in events if e["type"] == "message"] == ["message 3"]
+
+    def test_iter_messages_pages(self, manager: SessionManager) -> None:
+        _add(manager, 6)
+        manager.save_session()
+        session_id = manager.current_session.id
+
+        current = [m.content for m in manager.iter_messages(offset=1, limit=2)]
+        assert current == ["message 1", "message 2"]
+
+        other = SessionManager(session_dir=manager.session_dir)
+        on_disk = [m.content for m in other.iter_messages(session_id, offset=4)]
+        assert on_disk == ["message 4", "message 5"]
+
+    def test_iter_messages_streams_snapshot_and_journal(self, manager: SessionManager) -> None:
+        _add(manager, 4)
+        manager.save_session()
+        session = manager.current_session
+        session.messages[-1].content = "edited"
+        _add(manager, 2, start=4)
+        manager.save_session()
+
+        journal = session_journal.SessionJournal(manager.session_dir / f"{session.id}.json")
+        with patch.object(session_journal.SessionJournal, "load_data", side_effect=AssertionError):
+            contents = [m.content for m in journal.iter_messages()]
+        assert contents == [
+            "message 0", "message 1", "message 2", "edited", "message 4", "message 5",
+        ]
@@ -0,0 +1,358 @@
+"""Tests for SSE streaming of chat completions across providers."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from swecli.core.agents.components.api.anthropic_adapter import AnthropicAdapter
+from swecli.core.agents.components.api.http_client import AgentHttpClient
+from swecli.core.agents.components.api.openai_responses_adapter import OpenAIResponsesAdapter
+from swecli.core.agents.components.api.streaming import (
+    ChatCompletionAccumulator,
+    SSEEvent,
+    iter_sse_events,
+)
+
+# Delay between the first token and the rest of the stream
+SLOW_TAIL_DELAY = 0.5
+
+
+def _sse(data, event=None) -> bytes:
+    frame = f"event: {event}\n" if event else ""
+    payload = data if isinstance(data, str) else json.dumps(data)
+    return (frame + f"data: {payload}\n\n").encode()
+
+
+def _chat_chunk(delta: dict, finish_reason=None) -> dict:
+    return {
+        "id": "chatcmpl-1",
+        "model": "fake-model",
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+
+
+def _tool_delta(index: int, call_id: str = "", name: str = "", arguments: str = "") -> dict:
+    function = {"arguments": arguments}
+    if name:
+        function["name"] = name
+    tc = {"index": index, "function": function}
+    if call_id:
+        tc["id"] = call_id
+    return _chat_chunk({"tool_calls": [tc]})
+
+
+CHAT_STREAM = [
+    [_chat_chunk({"role": "assistant", "content": "Let me "})],
+    [
+        _chat_chunk({"content": "look."}),
+        _tool_delta(0, "call_a", "read_file", '{"file_'),
+        _tool_delta(0, arguments='path": "a.py"}'),
+        _tool_delta(1, "call_b", "search", '{"pattern": "x"}'),
+        _chat_chunk({}, finish_reason="tool_calls"),
+        {"id": "chatcmpl-1", "choices": [], "usage": {
+            "prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15,
+        }},
+        "[DONE]",
+    ],
+]
+
+ANTHROPIC_STREAM = [
+    [
+        ("message_start", {"type": "message_start", "message": {
+            "id": "msg_1", "model": "claude-fake", "usage": {"input_tokens": 12},
+        }}),
+        ("content_block_start", {"type": "content_block_start", "index": 0,
+                                 "content_block": {"type": "text", "text": ""}}),
+        ("content_block_delta", {"type": "content_block_delta", "index": 0,
+                                 "delta": {"type": "text_delta", "text": "Reading"}}),
+    ],
+    [
+        ("content_block_stop", {"type": "content_block_stop", "index": 0}),
+        ("content_block_start", {"type": "content_block_start", "index": 1, "content_block": {
+            "type": "tool_use", "id": "toolu_1", "name": "read_file", "input": {},
+        }}),
+        ("content_block_delta", {"type": "content_block_delta", "index": 1, "delta": {
+            "type": "input_json_delta", "partial_json": '{"file_path": ',
+        }}),
+        ("content_block_delta", {"type": "content_block_delta", "index": 1, "delta": {
+            "type": "input_json_delta", "partial_json": '"a.py"}',
+        }}),
+        ("content_block_stop", {"type": "content_block_stop", "index": 1}),
+        ("message_delta", {"type": "message_delta", "delta": {"stop_reason": "tool_use"},
+                           "usage": {"output_tokens": 7}}),
+        ("message_stop", {"type": "message_stop"}),
+    ],
+]
+
+RESPONSES_STREAM = [
+    [
+        ("response.created", {"type": "response.created",
+                              "response": {"id": "resp_1", "model": "gpt-fake"}}),
+        ("response.output_text.delta", {"type": "response.output_text.delta",
+                                        "output_index": 0, "delta": "Checking"}),
+    ],
+    [
+        ("response.output_item.added", {"type": "response.output_item.added", "output_index": 1,
+                                        "item": {"type": "function_call", "call_id": "call_r",
+                                                 "name": "search", "arguments": ""}}),
+        ("response.function_call_arguments.delta", {
+            "type": "response.function_call_arguments.delta", "output_index": 1,
+            "delta": '{"pattern": "y"}',
+        }),
+        ("response.output_item.done", {"type": "response.output_item.done", "output_index": 1,
+                                       "item": {"type": "function_call", "call_id": "call_r",
+                                                "name": "search",
+                                                "arguments": '{"pattern": "y"}'}}),
+        ("response.completed", {"type": "response.completed", "response": {
+            "id": "resp_1", "status": "completed",
+            "usage": {"input_tokens": 20, "output_tokens": 4},
+        }}),
+    ],
+]
+
+
+class _FakeSSEServer:
+    """Local HTTP server that streams a scripted SSE response.
+
+    The script is a list of bursts; the server sleeps SLOW_TAIL_DELAY between
+    bursts so first-token latency can be distinguished from total latency.
+    """
+
+    def __init__(self, bursts, status: int = 200):
+        self.bursts = bursts
+        self.status = status
+        self.requests: list[dict] = []
+        outer = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):  # silence test output
+                pass
+
+            def write_chunk(self, data: bytes) -> None:
+                self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                outer.requests.append(json.loads(self.rfile.read(length)))
+                self.send_response(outer.status)
+                if outer.status != 200:
+                    body = b'{"error": "busy"}'
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                    return
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                for i, burst in enumerate(outer.bursts):
+                    if i:
+                        time.sleep(SLOW_TAIL_DELAY)
+                    for item in burst:
+                        if isinstance(item, tuple):
+                            self.write_chunk(_sse(item[1], event=item[0]))
+                        else:
+                            self.write_chunk(_sse(item))
+                    self.wfile.flush()
+                self.wfile.write(b"0\r\n\r\n")
+                self.wfile.flush()
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}/v1/chat/completions"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class TestSSEParsing:
+    def test_parses_events_and_multiline_data(self):
+        lines = [b"event: ping", b"data: {\"a\":", b"data: 1}", b"", b": comment", b"data: [DONE]", b""]
+        events = list(iter_sse_events(lines))
+        assert events[0].event == "ping"
+        assert events[0].json() == {"a": 1}
+        assert events[1].data == "[DONE]"
+
+    def test_tool_call_completes_when_next_index_starts(self):
+        completed = []
+        acc = ChatCompletionAccumulator(on_tool_call=completed.append)
+        acc.apply_chat_event(SSEEvent(None, json.dumps(_tool_delta(0, "a", "read_file", "{}"))))
+        assert completed == []
+        acc.apply_chat_event(SSEEvent(None, json.dumps(_tool_delta(1, "b", "search", "{}"))))
+        assert [tc["id"] for tc in completed] == ["a"]
+        acc.apply_chat_event(SSEEvent(None, "[DONE]"))
+        assert [tc["id"] for tc in completed] == ["a", "b"]
+
+
+class TestOpenAICompatibleStreaming:
+    def test_assembles_response_and_measures_first_token(self):
+        deltas: list[tuple[float, str]] = []
+        tool_calls: list[tuple[float, dict]] = []
+
+        with _FakeSSEServer(CHAT_STREAM) as server:
+            client = AgentHttpClient(server.url, {"Content-Type": "application/json"})
+            started = time.monotonic()
+            result = client.post_json_stream(
+                {"model": "fake-model", "messages": []},
+                on_text_delta=lambda d: deltas.append((time.monotonic() - started, d)),
+                on_tool_call=lambda tc: tool_calls.append((time.monotonic() - started, tc)),
+            )
+            total = time.monotonic() - started
+
+        assert result.success
+        assert server.requests[0]["stream"] is True
+        response = result.response
+        assert response.first_token_latency < SLOW_TAIL_DELAY
+        assert deltas[0][0] < SLOW_TAIL_DELAY <= total
+
+        message = response.json()["choices"][0]["message"]
+        assert message["content"] == "Let me look."
+        assert [tc["id"] for tc in message["tool_calls"]] == ["call_a", "call_b"]
+        assert json.loads(message["tool_calls"][0]["function"]["arguments"]) == {"file_path": "a.py"}
+        assert response.json()["usage"]["total_tokens"] == 15
+        assert [tc["function"]["name"] for _, tc in tool_calls] == ["read_file", "search"]
+
+    def test_non_200_is_returned_unchanged(self):
+        with _FakeSSEServer(CHAT_STREAM, status=400) as server:
+            client = AgentHttpClient(server.url, {})
+            result = client.post_json_stream({"model": "m", "messages": []})
+        assert result.success
+        assert result.response.status_code == 400
+
+    def test_interrupt_during_stream(self):
+        monitor = MagicMock()
+        monitor.should_interrupt.side_effect = lambda: time.monotonic() - started > 0.1
+
+        with _FakeSSEServer(CHAT_STREAM) as server:
+            client = AgentHttpClient(server.url, {})
+            started = time.monotonic()
+            result = client.post_json_stream({"model": "m", "messages": []}, task_monitor=monitor)
+            elapsed = time.monotonic() - started
+
+        assert result.interrupted
+        assert elapsed < SLOW_TAIL_DELAY
+
+
+class TestProviderAdapterStreaming:
+    def test_anthropic_stream(self):
+        completed = []
+        with _FakeSSEServer(ANTHROPIC_STREAM) as server:
+            adapter = AnthropicAdapter("key", api_url=server.url)
+            result = adapter.post_json_stream(
+                {"model": "claude-fake", "messages": [{"role": "user", "content": "hi"}]},
+                on_tool_call=completed.append,
+            )
+
+        assert result.success
+        assert server.requests[0]["stream"] is True
+        data = result.response.json()
+        message = data["choices"][0]["message"]
+        assert message["content"] == "Reading"
+        assert json.loads(message["tool_calls"][0]["function"]["arguments"]) == {"file_path": "a.py"}
+        assert data["choices"][0]["finish_reason"] == "tool_calls"
+        assert data["usage"] == {"prompt_tokens": 12, "completion_tokens": 7, "total_tokens": 19}
+        assert result.response.first_token_latency < SLOW_TAIL_DELAY
+        assert [tc["id"] for tc in completed] == ["toolu_1"]
+
+    def test_openai_responses_stream(self):
+        with _FakeSSEServer(RESPONSES_STREAM) as server:
+            adapter = OpenAIResponsesAdapter("key", api_url=server.url)
+            result = adapter.post_json_stream({"model": "gpt-fake", "messages": []})
+
+        assert result.success
+        data = result.response.json()
+        message = data["choices"][0]["message"]
+        assert message["content"] == "Checking"
+        assert message["tool_calls"][0]["id"] == "call_r"
+        assert data["choices"][0]["finish_reason"] == "tool_calls"
+        assert data["usage"]["total_tokens"] == 24
+        assert result.response.first_token_latency < SLOW_TAIL_DELAY
+
+
+class TestAgentStreaming:
+    @pytest.fixture()
+    def agent(self):
+        from swecli.core.agents.swecli_agent import SwecliAgent
+        from swecli.models.config import AppConfig
+
+        config = AppConfig(enable_streaming=True)
+        with patch.object(SwecliAgent, "build_system_prompt", return_value="Test prompt"), \
+             patch.object(SwecliAgent, "build_tool_schemas", return_value=[]):
+            agent = SwecliAgent(config, MagicMock(), MagicMock())
+        agent._maybe_compact = lambda messages: messages
+        return agent
+
+    def test_run_sync_executes_tool_calls_before_stream_ends(self, agent):
+        executed_at: list[float] = []
+
+        def execute_tool(name, args, **kwargs):
+            executed_at.append(time.monotonic())
+            return {"success": True, "output": f"{name} ok"}
+
+        agent.tool_registry.execute_tool.side_effect = execute_tool
+        first_stream = [
+            [_tool_delta(0, "call_a", "read_file", '{"file_path": "a.py"}'),
+             _tool_delta(1, "call_b", "search", '{"pattern": "x"}')],
+            [_chat_chunk({}, finish_reason="tool_calls"), "[DONE]"],
+        ]
+        deps = MagicMock()
+        ui_callback = MagicMock()
+
+        with _FakeSSEServer(first_stream) as server:
+            agent._SwecliAgent__http_client = AgentHttpClient(server.url, {})
+            original = agent._post_completion
+            calls = {"n": 0}
+
+            def post(*args, **kwargs):
+                calls["n"] += 1
+                if calls["n"] == 2:
+                    # Second turn: plain text answer ends the loop
+                    server.bursts = [[_chat_chunk({"content": "Done"}), "[DONE]"]]
+                return original(*args, **kwargs)
+
+            agent._post_completion = post
+            started = time.monotonic()
+            result = agent.run_sync("go", deps, ui_callback=ui_callback)
+
+        assert result["success"] is True
+        assert result["content"] == "Done"
+        # read_file ran as soon as the second tool call began streaming
+        assert executed_at[0] - started < SLOW_TAIL_DELAY
+        assert agent.tool_registry.execute_tool.call_count == 2
+        tool_messages = [m for m in result["messages"] if m["role"] == "tool"]
+        assert [m["tool_call_id"] for m in tool_messages] == ["call_a", "call_b"]
+        ui_callback.on_assistant_delta.assert_called_with("Done")
+
+    def test_only_read_only_tools_run_before_the_stream_ends(self, agent):
+        """A failed stream is not recorded, so it must not have run writes or commands."""
+        agent.tool_registry.execute_tool.return_value = {"success": True, "output": "ok"}
+        stream = [
+            [_tool_delta(0, "call_a", "read_file", '{"file_path": "a.py"}'),
+             _tool_delta(1, "call_b", "write_file", '{"file_path": "b.py", "content": ""}'),
+             _tool_delta(2, "call_c", "search", '{"pattern": "x"}'),
+             _tool_delta(3, "call_d", "list_files", '{"path": "."}')],
+            [{"error": {"message": "overloaded"}}],
+        ]
+
+        with _FakeSSEServer(stream) as server:
+            agent._SwecliAgent__http_client = AgentHttpClient(server.url, {})
+            result = agent.run_sync("go", MagicMock(), ui_callback=MagicMock())
+
+        assert result["success"] is False
+        assert "overloaded" in result["content"]
+        # Only the read ahead of write_file ran; nothing after it started early
+        executed = [c.args[0] for c in agent.tool_registry.execute_tool.call_args_list]
+        assert executed == ["read_file"]
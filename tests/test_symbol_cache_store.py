@@ -0,0 +1,172 @@
+"""Tests for the SQLite-backed LSP symbol cache store."""
+
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from swecli.core.context_engineering.tools.lsp.util.cache import SymbolCacheStore, save_cache
+
+
+@pytest.fixture()
+def db_path(tmp_path: Path) -> str:
+    return str(tmp_path / "cache" / "symbols.db")
+
+
+def _stored_paths(db_path: str) -> list[str]:
+    with sqlite3.connect(db_path) as conn:
+        return sorted(row[0] for row in conn.execute("SELECT path FROM entries"))
+
+
+class TestSymbolCacheStore:
+    def test_round_trip(self, db_path: str) -> None:
+        store = SymbolCacheStore(db_path, version=1)
+        store["src/a.py"] = ("hash-a", [{"name": "f"}])
+        store["src/b.py"] = ("hash-b", None)
+        assert store.flush() == 2
+        store.close()
+
+        reopened = SymbolCacheStore(db_path, version=1)
+        assert reopened["src/a.py"] == ("hash-a", [{"name": "f"}])
+        assert reopened.get("src/b.py") == ("hash-b", None)
+        assert reopened.get("missing.py") is None
+        assert len(reopened) == 2
+        assert not reopened.is_modified
+
+    def test_content_hash_without_loading_value(self, db_path: str) -> None:
+        store = SymbolCacheStore(db_path, version=1)
+        store["a.py"] = ("hash-a", ["symbols"])
+        store.flush()
+        store.close()
+
+        reopened = SymbolCacheStore(db_path, version=1)
+        assert reopened.get_content_hash("a.py") == "hash-a"
+        assert reopened._loaded == {}
+        assert reopened.get_content_hash("b.py") is None
+
+    def test_flush_writes_only_changes(self, db_path: str) -> None:
+        store = SymbolCacheStore(db_path, version=1)
+        for i in range(10):
+            store[f"m{i}.py"] = (f"h{i}", i)
+        store.flush()
+
+        store["m3.py"] = ("h3-new", 33)
+        del store["m4.py"]
+        assert store.is_modified
+        assert store.flush() == 2
+        assert store.flush() == 0
+
+        reopened = SymbolCacheStore(db_path, version=1)
+        assert reopened["m3.py"] == ("h3-new", 33)
+        assert "m4.py" not in reopened
+        assert len(reopened) == 9
+
+    def test_version_change_clears_entries(self, db_path: str) -> None:
+        store = SymbolCacheStore(db_path, version=(1, "a"))
+        store["a.py"] = ("h", 1)
+        store.flush()
+        store.close()
+
+        assert len(SymbolCacheStore(db_path, version=(1, "a"))) == 1
+        assert len(SymbolCacheStore(db_path, version=(2, "a"))) == 0
+
+    def test_evict_missing(self, db_path: str, tmp_path: Path) -> None:
+        root = tmp_path / "repo"
+        (root / "src").mkdir(parents=True)
+        (root / "src" / "kept.py").write_text("x = 1\n")
+        store = SymbolCacheStore(db_path, version=1)
+        store["src/kept.py"] = ("h1", 1)
+        store["src/deleted.py"] = ("h2", 2)
+        store.flush()
+
+        assert store.evict_missing(str(root)) == 1
+        store.flush()
+        assert _stored_paths(db_path) == ["src/kept.py"]
+
+    def test_background_eviction_keeps_entries_set_meanwhile(self, db_path: str, tmp_path: Path) -> None:
+        root = tmp_path / "repo"
+        root.mkdir()
+        store = SymbolCacheStore(db_path, version=1)
+        store["old.py"] = ("h1", 1)
+        store["new.py"] = ("h2", 2)
+        store.flush()
+
+        real_isfile = os.path.isfile
+        checked = threading.Event()
+        release = threading.Event()
+
+        def slow_isfile(path: str) -> bool:
+            checked.set()
+            release.wait(timeout=5)
+            return real_isfile(path)
+
+        with patch("swecli.core.context_engineering.tools.lsp.util.cache.os.path.isfile", side_effect=slow_isfile):
+            store.start_evicting_missing(str(root), "test")
+            assert checked.wait(timeout=5)
+            # Lookups and writes are not blocked while the files are checked
+            assert store.get_content_hash("old.py") == "h1"
+            store["new.py"] = ("h3", 3)
+            release.set()
+            store.wait_for_eviction(timeout=5)
+
+        store.flush()
+        assert _stored_paths(db_path) == ["new.py"]
+
+    def test_corrupt_entry_is_dropped(self, db_path: str) -> None:
+        store = SymbolCacheStore(db_path, version=1)
+        store["a.py"] = ("h", 1)
+        store.flush()
+        store.close()
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("UPDATE entries SET value = ? WHERE path = 'a.py'", (b"not a pickle",))
+
+        reopened = SymbolCacheStore(db_path, version=1)
+        assert reopened.get("a.py") is None
+        reopened.flush()
+        assert _stored_paths(db_path) == []
+
+    def test_legacy_pickle_is_importable(self, db_path: str, tmp_path: Path) -> None:
+        legacy = tmp_path / "cache" / "document_symbols.pkl"
+        save_cache(str(legacy), 3, {"a.py": ("h", ["sym"])})
+
+        from swecli.core.context_engineering.tools.lsp.ls import SolidLanguageServer
+
+        store = SymbolCacheStore(db_path, version=3)
+        SolidLanguageServer._migrate_pickled_symbol_cache(store, legacy, 3)
+        assert not legacy.exists()
+        assert _stored_paths(db_path) == ["a.py"]
+        assert store["a.py"] == ("h", ["sym"])
+
+    def test_deleted_files_evicted_after_load_not_on_save(self, tmp_path: Path) -> None:
+        from swecli.core.context_engineering.tools.lsp.ls import SolidLanguageServer
+
+        root = tmp_path / "repo"
+        root.mkdir()
+        (root / "kept.py").write_text("x = 1\n")
+        class Server(SolidLanguageServer):
+            def _start_server(self) -> None:
+                pass
+
+        server = Server.__new__(Server)
+        server.repository_root_path = str(root)
+        server.cache_dir = tmp_path / "cache"
+        server.cache_dir.mkdir()
+        cache_file = server.cache_dir / SolidLanguageServer.DOCUMENT_SYMBOL_CACHE_FILENAME
+
+        server._load_document_symbols_cache()
+        store = server._document_symbols_cache
+        store.wait_for_eviction()
+        store["kept.py"] = ("h1", 1)
+        store["deleted.py"] = ("h2", 2)
+        with patch.object(SymbolCacheStore, "evict_missing", side_effect=AssertionError):
+            server._save_document_symbols_cache()
+        assert _stored_paths(str(cache_file)) == ["deleted.py", "kept.py"]
+        store.close()
+
+        server._load_document_symbols_cache()
+        server._document_symbols_cache.wait_for_eviction()
+        server._save_document_symbols_cache()
+        assert _stored_paths(str(cache_file)) == ["kept.py"]
@@ -0,0 +1,154 @@
+"""Tests for incremental token accounting shared by compaction and sessions."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from swecli.core.context_engineering.compaction import ContextCompactor
+from swecli.core.context_engineering.history.session_manager import SessionManager
+from swecli.core.context_engineering.retrieval.token_monitor import (
+    ConversationTokenCounter,
+    MessageTokenCache,
+)
+from swecli.models.config import AppConfig
+from swecli.models.message import ChatMessage, Role, ToolCall
+
+
+def _word_counter(text: str) -> int:
+    """Deterministic stand-in for tiktoken: one token per word."""
+    return len(text.split())
+
+
+@pytest.fixture()
+def cache() -> MessageTokenCache:
+    return MessageTokenCache(counter=_word_counter)
+
+
+def _messages(count: int) -> list[dict]:
+    msgs = [{"role": "system", "content": "system prompt"}]
+    for i in range(count):
+        role = "user" if i % 2 == 0 else "assistant"
+        msgs.append({"role": role, "content": f"message {i} " + "word " * 10})
+    return msgs
+
+
+def _full_count(messages: list[dict], system_prompt: str) -> int:
+    total = _word_counter(system_prompt)
+    for msg in messages:
+        total += _word_counter(msg.get("content") or "")
+        for tc in msg.get("tool_calls", []):
+            total += _word_counter(tc["function"]["name"])
+            total += _word_counter(tc["function"]["arguments"])
+    return total
+
+
+class TestMessageTokenCache:
+    def test_text_encoded_once(self, cache: MessageTokenCache) -> None:
+        assert cache.count_text("a b c") == 3
+        assert cache.count_text("a b c") == 3
+        assert cache.encoded == 1
+        assert cache.count_text("") == 0
+
+    def test_lru_eviction(self) -> None:
+        cache = MessageTokenCache(counter=_word_counter, max_entries=2)
+        cache.count_text("one")
+        cache.count_text("two")
+        cache.count_text("three")
+        cache.count_text("one")
+        assert cache.encoded == 4
+
+    def test_chat_message_reuses_api_counts(self, cache: MessageTokenCache) -> None:
+        cache.count_api_message({"role": "assistant", "content": "reading the file now"})
+        encoded = cache.encoded
+        message = ChatMessage(role=Role.ASSISTANT, content="reading the file now")
+        assert cache.count_chat_message(message) == 4
+        assert cache.encoded == encoded
+
+    def test_chat_message_includes_tool_calls(self, cache: MessageTokenCache) -> None:
+        message = ChatMessage(
+            role=Role.ASSISTANT,
+            content="ok",
+            tool_calls=[ToolCall(id="1", name="read_file", parameters={"path": "a"},
+                                 result="line one")],
+        )
+        assert cache.count_chat_message(message) == 1 + 1 + 2 + 2
+
+
+class TestConversationTokenCounter:
+    def test_only_new_messages_counted(self, cache: MessageTokenCache) -> None:
+        counter = ConversationTokenCounter(cache)
+        messages = _messages(6)
+        assert counter.count(messages, "sys prompt") == _full_count(messages, "sys prompt")
+        encoded = cache.encoded
+
+        messages.append({"role": "user", "content": "brand new question here"})
+        assert counter.count(messages, "sys prompt") == _full_count(messages, "sys prompt")
+        assert cache.encoded == encoded + 1
+
+    def test_replaced_and_removed_messages(self, cache: MessageTokenCache) -> None:
+        counter = ConversationTokenCounter(cache)
+        messages = _messages(6)
+        counter.count(messages)
+
+        messages[3] = {"role": "assistant", "content": "replaced"}
+        assert counter.count(messages) == _full_count(messages, "")
+
+        messages[2]["content"] = "mutated in place with five"
+        assert counter.count(messages) == _full_count(messages, "")
+
+        del messages[1:4]
+        assert counter.count(messages) == _full_count(messages, "")
+
+    def test_tool_calls_counted(self, cache: MessageTokenCache) -> None:
+        counter = ConversationTokenCounter(cache)
+        messages = [{
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [{"function": {"name": "search", "arguments": '{"q": "x y"}'}}],
+        }]
+        assert counter.count(messages) == _full_count(messages, "")
+
+
+class TestCompactorAccounting:
+    def _compactor(self, cache: MessageTokenCache, max_tokens: int) -> ContextCompactor:
+        config = AppConfig()
+        config.max_context_tokens = max_tokens
+        config.model = "gpt-4"
+        client = MagicMock()
+        client.post_json.return_value.success = False
+        return ContextCompactor(config, client, token_cache=cache)
+
+    def test_usage_pct_tracks_incremental_total(self, cache: MessageTokenCache) -> None:
+        compactor = self._compactor(cache, 1000)
+        compactor._max_context = 1000
+        messages = _messages(4)
+        compactor.should_compact(messages, "sys")
+        assert compactor.token_count == _full_count(messages, "sys")
+        assert compactor.usage_pct == pytest.approx(compactor.token_count / 10)
+
+    def test_compaction_only_tokenizes_summary(self, cache: MessageTokenCache) -> None:
+        compactor = self._compactor(cache, 100)
+        messages = _messages(20)
+        compactor.should_compact(messages, "sys")
+        encoded = cache.encoded
+
+        compacted = compactor.compact(messages, "sys")
+        assert cache.encoded == encoded + 1
+        assert compactor.token_count == _full_count(compacted, "sys")
+        compactor.should_compact(compacted, "sys")
+        assert cache.encoded == encoded + 1
+
+
+class TestSessionTokens:
+    def test_add_message_stamps_cached_count(self, tmp_path, cache: MessageTokenCache) -> None:
+        manager = SessionManager(session_dir=tmp_path)
+        manager.create_session()
+        with patch(
+            "swecli.core.context_engineering.retrieval.token_monitor.get_message_token_cache",
+            return_value=cache,
+        ):
+            manager.add_message(ChatMessage(role=Role.USER, content="count these four words"))
+            manager.add_message(ChatMessage(role=Role.ASSISTANT, content="two words"))
+
+        assert [m.tokens for m in manager.current_session.messages] == [4, 2]
+        assert manager.current_session.total_tokens() == 6
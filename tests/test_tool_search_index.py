@@ -0,0 +1,114 @@
+"""Tests for the BM25 MCP tool search index and search_tools handler."""
+
+from unittest.mock import patch
+
+from swecli.core.context_engineering.mcp.tool_index import ToolSearchIndex
+from swecli.core.context_engineering.tools.handlers import search_tools_handler
+from swecli.core.context_engineering.tools.handlers.search_tools_handler import (
+    SearchToolsHandler,
+)
+
+
+def _tool(server: str, name: str, description: str) -> dict:
+    return {
+        "name": f"mcp__{server}__{name}",
+        "description": description,
+        "mcp_server": server,
+        "mcp_tool_name": name,
+    }
+
+
+GITHUB = [
+    _tool("github", "create_issue", "Create a new issue in a repository"),
+    _tool("github", "list_issues", "List issues in a repository"),
+    _tool("github", "create_pull_request", "Open a pull request"),
+    _tool("github", "search_code", "Search code across repositories"),
+]
+SLACK = [
+    _tool("slack", "postMessage", "Send a message to a channel"),
+    _tool("slack", "list_channels", "List channels in the workspace, including issue triage"),
+]
+
+
+def _names(tools: list[dict]) -> list[str]:
+    return [t["mcp_tool_name"] for t in tools]
+
+
+def test_ranks_name_matches_above_description_matches() -> None:
+    index = ToolSearchIndex()
+    index.set_server_tools("github", GITHUB)
+    index.set_server_tools("slack", SLACK)
+
+    results = _names(index.search("create issue"))
+    assert results[0] == "create_issue"
+    assert results.index("list_issues") < results.index("list_channels")
+    assert _names(index.search("issue", limit=1)) == ["create_issue"]
+    assert _names(index.search("post message")) == ["postMessage"]  # camelCase split
+    assert index.search("kubernetes") == []
+
+
+def test_abbreviation_and_prefix_expansion() -> None:
+    index = ToolSearchIndex.from_tools(GITHUB)
+    assert _names(index.search("pr"))[0] == "create_pull_request"
+    assert "search_code" in _names(index.search("repos"))
+    assert "search_code" in _names(index.search("repositor"))  # Extends to repositories
+    assert _names(index.search("creating"))[:2] == ["create_issue", "create_pull_request"]
+
+
+def test_incremental_server_updates() -> None:
+    index = ToolSearchIndex()
+    index.set_server_tools("github", GITHUB)
+    index.set_server_tools("slack", SLACK)
+    assert len(index) == 6
+    assert _names(index.search("issue", server="slack")) == ["list_channels"]
+
+    index.remove_server("github")
+    assert len(index) == 2
+    assert _names(index.search("issue")) == ["list_channels"]
+    assert index.search("pull") == []
+
+    index.set_server_tools("slack", SLACK[:1])
+    assert _names(index.search("channel")) == ["postMessage"]
+
+
+class _FakeManager:
+    def __init__(self) -> None:
+        self.tool_index = ToolSearchIndex()
+        self.servers = {"github": GITHUB, "slack": SLACK}
+        for name, tools in self.servers.items():
+            self.tool_index.set_server_tools(name, tools)
+
+    def list_servers(self) -> list[str]:
+        return list(self.servers)
+
+    def get_server_tools(self, server: str) -> list[dict]:
+        return self.servers.get(server, [])
+
+    def get_all_tools(self) -> list[dict]:
+        return [tool for tools in self.servers.values() for tool in tools]
+
+
+def test_search_tools_handler_uses_index_and_limit() -> None:
+    discovered = []
+    handler = SearchToolsHandler(_FakeManager(), on_discover=discovered.append)
+
+    result = handler.search_tools({"query": "list", "limit": 1, "detail_level": "names"})
+    assert result["count"] == 1
+
+    result = handler.search_tools({"query": "open github pull request", "detail_level": "full"})
+    assert result["tools"][0]["name"] == "mcp__github__create_pull_request"
+    assert discovered[0] == "mcp__github__create_pull_request"
+    assert all(name.startswith("mcp__github__") for name in discovered)
+
+    assert handler.search_tools({"query": "*"})["count"] == 6
+
+
+def test_search_tools_handler_coerces_limit() -> None:
+    handler = SearchToolsHandler(_FakeManager())
+
+    assert handler.search_tools({"query": "*", "limit": "2"})["count"] == 2
+    # Unusable limits fall back to the default
+    for limit in ("many", None, 0, -3, [1]):
+        assert handler.search_tools({"query": "*", "limit": limit})["count"] == 6
+    with patch.object(search_tools_handler, "_MAX_LIMIT", 3):
+        assert handler.search_tools({"query": "*", "limit": 10**9})["count"] == 3
@@ -0,0 +1,200 @@
+"""Tests for the persistent trigram content index."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from swecli.core.context_engineering.retrieval import trigram_index
+from swecli.core.context_engineering.retrieval.trigram_index import TrigramIndex, content_trigrams
+from swecli.core.context_engineering.retrieval.workspace_catalog import WorkspaceCatalog
+from swecli.core.context_engineering.tools.implementations.file_ops import (
+    DEFAULT_SEARCH_EXCLUDES,
+    FileOperations,
+)
+from swecli.models.config import AppConfig
+
+
+def _write(root: Path, rel: str, text: str) -> Path:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+@pytest.fixture()
+def tree(tmp_path: Path) -> Path:
+    root = tmp_path / "repo"
+    _write(root, "src/app.py", "import os\n\ndef handle_request():\n    return HandleRequest()\n")
+    _write(root, "src/util.py", "def helper():\n    pass\n")
+    _write(root, "docs/guide.md", "Call handle_request to serve.\n")
+    _write(root, "node_modules/dep/index.js", "handle_request()\n")
+    _write(root, "bundle.min.js", "handle_request()\n")
+    _write(root, ".hidden/secret.py", "handle_request()\n")
+    _write(root, "generated/out.py", "handle_request()\n")
+    _write(root, "generated/keep.py", "handle_request()\n")
+    _write(root, ".gitignore", "generated/*\n!generated/keep.py\n")
+    return root
+
+
+@pytest.fixture()
+def index(tree: Path, tmp_path: Path) -> TrigramIndex:
+    idx = TrigramIndex(tree, tmp_path / "cache" / "repo.idx", DEFAULT_SEARCH_EXCLUDES)
+    assert idx.ensure_ready(background=False)
+    return idx
+
+
+def _files(matches) -> list[str]:
+    return [Path(m["file"]).name for m in matches]
+
+
+class TestTrigramSearch:
+    def test_trigrams_are_case_folded_per_line(self) -> None:
+        grams = content_trigrams(b"AbC\nde")
+        assert grams == {b"abc"}
+
+    def test_literal_search(self, index: TrigramIndex, tree: Path) -> None:
+        matches = index.search("handle_request")
+        assert _files(matches) == ["guide.md", "keep.py", "app.py"]
+        app = next(m for m in matches if m["file"].endswith("app.py"))
+        assert app == {
+            "file": str(tree / "src" / "app.py"),
+            "line": 3,
+            "content": "def handle_request():",
+        }
+
+    def test_case_insensitive(self, index: TrigramIndex) -> None:
+        assert len(index.search("HANDLEREQUEST")) == 0
+        matches = index.search("handlerequest", case_insensitive=True)
+        assert [(Path(m["file"]).name, m["line"]) for m in matches] == [("app.py", 4)]
+
+    def test_excludes_hidden_and_gitignore(self, index: TrigramIndex) -> None:
+        candidates = index.candidates("handle_request")
+        assert "node_modules/dep/index.js" not in candidates
+        assert "bundle.min.js" not in candidates
+        assert ".hidden/secret.py" not in candidates
+        assert "generated/out.py" not in candidates
+        assert "generated/keep.py" in candidates
+
+    def test_restrict_to_subtree(self, index: TrigramIndex) -> None:
+        assert _files(index.search("handle_request", under="src")) == ["app.py"]
+        assert _files(index.search("handle_request", under="docs/guide.md")) == ["guide.md"]
+
+    def test_short_pattern_not_answered(self, index: TrigramIndex) -> None:
+        assert index.search("de") is None
+
+    def test_max_results(self, index: TrigramIndex) -> None:
+        assert len(index.search("handle_request", max_results=2)) == 2
+
+    def test_large_files_always_verified(self, tree: Path, tmp_path: Path) -> None:
+        _write(tree, "big.txt", "x" * 64 + "\nneedle here\n")
+        with patch.object(trigram_index, "MAX_INDEXED_FILE_BYTES", 32):
+            idx = TrigramIndex(tree, None, DEFAULT_SEARCH_EXCLUDES)
+            idx.ensure_ready(background=False)
+            assert "big.txt" in idx.candidates("nothing-like-this")
+            assert _files(idx.search("needle")) == ["big.txt"]
+
+
+class TestIncrementalRefresh:
+    def test_only_changed_files_reindexed(self, index: TrigramIndex, tree: Path) -> None:
+        _write(tree, "src/util.py", "def helper():\n    return handle_request()\n")
+        stats = index.refresh()
+        assert stats["indexed"] == 1
+        assert "src/util.py" in index.candidates("handle_request")
+
+    def test_touch_without_content_change(self, index: TrigramIndex, tree: Path) -> None:
+        path = tree / "src" / "util.py"
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+        index._catalog_generation = None  # Force a stat of every file
+        stats = index.refresh()
+        assert stats["indexed"] == 0
+        assert stats["unchanged"] == index.file_count
+
+    def test_incremental_refresh_checks_only_changed(self, index: TrigramIndex, tree: Path) -> None:
+        _write(tree, "docs/new.md", "handle_request again\n")
+        stats = index.refresh()
+        assert stats == {"indexed": 1, "unchanged": 0, "removed": 0}
+
+    def test_polling_refresh_is_throttled(self, tree: Path, tmp_path: Path) -> None:
+        catalog = WorkspaceCatalog(tree, watch=False, poll_interval=0)
+        idx = TrigramIndex(tree, tmp_path / "poll.idx", DEFAULT_SEARCH_EXCLUDES)
+        with patch.object(idx, "_catalog", return_value=catalog):
+            assert idx.ensure_ready(background=False)
+            _write(tree, "src/util.py", "def helper():\n    return handle_request()\n")
+            # The file list is unchanged, so the tree is not re-stat-ed yet
+            assert idx.refresh() == {"indexed": 0, "unchanged": 0, "removed": 0}
+
+            idx._last_full_refresh -= trigram_index.MIN_FULL_REFRESH_SECONDS
+            assert idx.refresh()["indexed"] == 1
+            _write(tree, "src/new.py", "handle_request()\n")
+            assert idx.refresh()["indexed"] == 1  # New files are picked up at once
+        catalog.close()
+
+    def test_moved_directory(self, index: TrigramIndex, tree: Path) -> None:
+        (tree / "src").rename(tree / "lib2")
+        index.refresh()
+        assert "lib2/app.py" in index.candidates("handle_request")
+        assert "src/app.py" not in index.candidates("handle_request")
+
+    def test_deleted_and_edited_away(self, index: TrigramIndex, tree: Path) -> None:
+        (tree / "docs" / "guide.md").unlink()
+        _write(tree, "src/app.py", "def renamed():\n    pass\n")
+        stats = index.refresh()
+        assert stats["removed"] == 1
+        assert _files(index.search("handle_request")) == ["keep.py"]
+
+    def test_persisted_index_reloaded(self, index: TrigramIndex, tree: Path, tmp_path: Path) -> None:
+        index.save()
+        reloaded = TrigramIndex(tree, index.index_path, DEFAULT_SEARCH_EXCLUDES)
+        assert reloaded.ensure_ready(background=False)
+        assert reloaded.file_count == index.file_count
+
+        _write(tree, "src/new.py", "handle_request()\n")
+        stats = reloaded.refresh()
+        assert stats == {"indexed": 1, "unchanged": index.file_count, "removed": 0}
+        assert "new.py" in _files(reloaded.search("handle_request"))
+
+    def test_corrupt_index_rebuilt(self, tree: Path, tmp_path: Path) -> None:
+        path = tmp_path / "broken.idx"
+        path.write_bytes(b"not a pickle")
+        idx = TrigramIndex(tree, path, DEFAULT_SEARCH_EXCLUDES)
+        assert idx.ensure_ready(background=False)
+        assert idx.search("handle_request")
+
+
+class TestFileOperationsIntegration:
+    @pytest.fixture()
+    def file_ops(self, tree: Path, tmp_path: Path):
+        with (
+            patch.object(trigram_index, "_indexes", {}),
+            patch.object(trigram_index, "_index_path_for", lambda root: tmp_path / "ops.idx"),
+        ):
+            yield FileOperations(AppConfig(), tree)
+
+    def test_grep_served_from_index_once_built(self, file_ops: FileOperations, tree: Path) -> None:
+        first = file_ops.grep_files("handle_request")
+        index = trigram_index.get_trigram_index(tree)
+        if index._builder is not None:
+            index._builder.join(timeout=10)
+        assert index.ready
+
+        with (
+            patch.object(FileOperations, "_python_grep", side_effect=AssertionError),
+            patch("subprocess.run", side_effect=AssertionError),
+        ):
+            matches = file_ops.grep_files("handle_request", "src")
+        assert _files(matches) == ["app.py"]
+        assert {m["file"] for m in matches} <= {m["file"] for m in first}
+
+    def test_index_disabled_by_config(self, tree: Path) -> None:
+        file_ops = FileOperations(AppConfig(enable_search_index=False), tree)
+        with patch.object(trigram_index, "get_trigram_index", side_effect=AssertionError):
+            assert isinstance(file_ops.grep_files("handle_request"), list)
+
+    def test_path_outside_root_falls_back(self, file_ops: FileOperations, tmp_path: Path) -> None:
+        assert file_ops._indexed_grep("handle_request", str(tmp_path), 50, False) is None
+
+    def test_context_lines_fall_back(self, file_ops: FileOperations) -> None:
+        assert file_ops._indexed_grep("handle_request", None, 50, False, context_lines=2) is None
@@ -0,0 +1,132 @@
+"""Tests for content-addressed undo snapshots."""
+
+from pathlib import Path
+
+from swecli.core.context_engineering.history.snapshot_store import SnapshotStore
+from swecli.core.context_engineering.history.undo_manager import UndoManager
+from swecli.models.operation import Operation, OperationType
+
+BASE = "".join(f"def func_{i}():\n    return {i}\n\n" for i in range(2000))
+
+
+def _edit(manager: UndoManager, path: Path, content: str) -> Operation:
+    operation = Operation(type=OperationType.FILE_EDIT, target=str(path))
+    manager.capture_state(operation)
+    path.write_text(content)
+    manager.record_operation(operation)
+    return operation
+
+
+def _object_count(root: Path) -> int:
+    return sum(1 for _ in (root / "objects").glob("*/*"))
+
+
+def test_store_dedups_and_stores_older_versions_as_deltas(tmp_path: Path) -> None:
+    store = SnapshotStore(tmp_path)
+    v1 = BASE.encode()
+    v2 = BASE.replace("return 7\n", "return 'seven'\n", 1).encode()
+
+    first = store.put(v1)
+    assert store.put(v1) == first
+    second = store.put(v2, previous=first)
+    assert _object_count(tmp_path) == 2
+
+    # The older version shrank to a delta against the newer one
+    sizes = {p.parent.name + p.name: p.stat().st_size for p in (tmp_path / "objects").glob("*/*")}
+    assert sizes[first] < sizes[second] / 10
+
+    fresh = SnapshotStore(tmp_path)  # No cached content
+    assert fresh.get(first) == v1
+    assert fresh.get(second) == v2
+
+
+def test_binary_content_is_stored_whole(tmp_path: Path) -> None:
+    store = SnapshotStore(tmp_path)
+    old = bytes(range(256)) * 10
+    first = store.put(old)
+    store.put(old + b"\0tail", previous=first)
+    assert SnapshotStore(tmp_path).get(first) == old
+
+
+def test_undo_restores_previous_states(tmp_path: Path) -> None:
+    manager = UndoManager(session_dir=tmp_path / "session")
+    path = tmp_path / "module.py"
+    path.write_text(BASE)
+
+    versions = [BASE]
+    operations = []
+    for i in range(5):
+        versions.append(versions[-1].replace(f"return {i}\n", f"return {i} + 1\n", 1))
+        operations.append(_edit(manager, path, versions[-1]))
+
+    assert operations[0].parameters["before_blob"] != operations[0].parameters["after_blob"]
+    assert not Path(str(path) + ".bak").exists()
+
+    assert manager.undo_last().success
+    assert path.read_text() == versions[4]
+
+    results = manager.undo_steps(2)
+    assert [r.success for r in results] == [True, True]
+    assert path.read_text() == versions[2]
+    assert manager.get_history_size() == 2
+
+    assert manager.restore_to_operation(operations[0].id).success
+    assert path.read_text() == versions[1]
+    assert not manager.restore_to_operation("missing").success
+
+
+def test_undo_write_of_new_file_deletes_it(tmp_path: Path) -> None:
+    manager = UndoManager(session_dir=tmp_path / "session")
+    path = tmp_path / "new.txt"
+    operation = Operation(type=OperationType.FILE_WRITE, target=str(path))
+    manager.capture_state(operation)
+    path.write_text("created\n")
+    manager.record_operation(operation)
+
+    assert operation.parameters["before_blob"] is None
+    assert manager.undo_last().success
+    assert not path.exists()
+
+
+def test_trimmed_history_snapshots_are_collected(tmp_path: Path) -> None:
+    session = tmp_path / "session"
+    manager = UndoManager(max_history=3, session_dir=session)
+    path = tmp_path / "notes.txt"
+    path.write_text("start\n")
+    for i in range(10):
+        _edit(manager, path, f"version {i}\n")
+
+    assert manager.collect_garbage() > 0
+    # Three operations reference at most four distinct states
+    assert _object_count(session / "snapshots") <= 4
+    assert manager.undo_steps(3)[-1].success
+    assert path.read_text() == "version 6\n"
+
+
+def test_relative_targets_resolve_against_the_tool_working_dir(tmp_path: Path, monkeypatch) -> None:
+    from swecli.core.context_engineering.tools.context import ToolExecutionContext
+    from swecli.core.context_engineering.tools.handlers.file_handlers import FileToolHandler
+    from swecli.core.context_engineering.tools.implementations.edit_tool import EditTool
+    from swecli.core.context_engineering.tools.implementations.write_tool import WriteTool
+    from swecli.models.config import AppConfig
+
+    workspace, cwd = tmp_path / "ws", tmp_path / "cwd"
+    workspace.mkdir()
+    cwd.mkdir()
+    (cwd / "app.py").write_text("unrelated\n")  # Same relative path under the cwd
+    monkeypatch.chdir(cwd)
+    config = AppConfig()
+    handler = FileToolHandler(None, WriteTool(config, workspace), EditTool(config, workspace))
+    manager = UndoManager()
+    context = ToolExecutionContext(undo_manager=manager)
+
+    assert handler.write_file({"file_path": "app.py", "content": "v1\n"}, context)["success"]
+    edit = {"file_path": "app.py", "old_content": "v1", "new_content": "v2"}
+    assert handler.edit_file(edit, context)["success"]
+    assert (workspace / "app.py").read_text() == "v2\n"
+
+    assert [result.success for result in manager.undo_steps(1)] == [True]
+    assert (workspace / "app.py").read_text() == "v1\n"
+    assert manager.undo_last().success
+    assert not (workspace / "app.py").exists()
+    assert (cwd / "app.py").read_text() == "unrelated\n"
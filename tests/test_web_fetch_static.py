@@ -0,0 +1,248 @@
+"""Tests for WebFetchTool's static HTTP tier, response cache and static deep crawl."""
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from swecli.core.context_engineering.tools.implementations.html_markdown import html_to_markdown
+from swecli.core.context_engineering.tools.implementations.web_cache import (
+    CachedResponse,
+    HttpCache,
+    freshness,
+)
+from swecli.core.context_engineering.tools.implementations.web_fetch_tool import WebFetchTool
+from swecli.models.config import AppConfig
+
+BODY_TEXT = "Static documentation text. " * 20
+
+
+def _page(title: str, links: list[str] = ()) -> str:
+    anchors = "".join(f'<li><a href="{href}">{href}</a></li>' for href in links)
+    return (
+        f"<html><head><title>{title}</title></head><body>"
+        f"<nav><a href='/nav-only'>Home</a></nav>"
+        f"<h1>{title}</h1><p>{BODY_TEXT}</p><ul>{anchors}</ul></body></html>"
+    )
+
+
+class _Site:
+    """Local HTTP server with fixed routes that records requests."""
+
+    def __init__(self, routes: dict[str, tuple[int, dict[str, str], str]], delay: float = 0.0):
+        self.routes = routes
+        self.delay = delay
+        self.requests: list[tuple[str, dict[str, str]]] = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                with site._lock:
+                    site.requests.append((self.path, dict(self.headers)))
+                    site.active += 1
+                    site.max_active = max(site.max_active, site.active)
+                try:
+                    time.sleep(site.delay)
+                    status, headers, body = site.routes.get(self.path, (404, {}, "missing"))
+                    if headers.get("ETag") and self.headers.get("If-None-Match") == headers["ETag"]:
+                        status, body = 304, ""
+                    data = body.encode("utf-8")
+                    self.send_response(status)
+                    for name, value in headers.items():
+                        self.send_header(name, value)
+                    self.send_header("Content-Length", str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                finally:
+                    with site._lock:
+                        site.active -= 1
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def paths(self) -> list[str]:
+        return [path for path, _ in self.requests]
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture()
+def tool(tmp_path: Path) -> WebFetchTool:
+    return WebFetchTool(AppConfig(), tmp_path, cache_dir=tmp_path / "web")
+
+
+@pytest.fixture()
+def browser_calls(tool: WebFetchTool, monkeypatch) -> list[str]:
+    """Replace the browser tier with a stub that records escalations."""
+    calls: list[str] = []
+
+    async def fake_browser(url, **kwargs):
+        calls.append(url)
+        return {"success": True, "content": "rendered", "error": None, "url": url}
+
+    monkeypatch.setattr(tool, "_fetch_with_browser", fake_browser)
+    return calls
+
+
+def test_static_pages_skip_the_browser_and_revalidate(tool, browser_calls) -> None:
+    html = {"Content-Type": "text/html; charset=utf-8", "ETag": '"v1"', "Cache-Control": "no-cache"}
+    site = _Site(
+        {
+            "/doc": (200, html, _page("Guide", ["/next"])),
+            "/data.json": (200, {"Content-Type": "application/json"}, '{"ok": true}'),
+        }
+    )
+    try:
+        result = tool.fetch_url(f"{site.url}/doc")
+        assert result["success"], result
+        assert result["content"].startswith("# Guide")
+        assert "Home" not in result["content"]  # Page chrome dropped
+        assert result["content_type"] == "text/markdown"
+        assert result["links"]["internal"][1] == {"href": f"{site.url}/next", "text": "/next"}
+        assert result["cached"] is False
+
+        # no-cache: revalidated with the ETag, served from disk on 304
+        again = tool.fetch_url(f"{site.url}/doc", extract_text=False)
+        assert again["cached"] is True
+        assert again["content"].startswith("<html>")
+        assert site.requests[-1][1].get("If-None-Match") == '"v1"'
+
+        data = tool.fetch_url(f"{site.url}/data.json")
+        assert (data["content"], data["content_type"]) == ('{"ok": true}', "application/json")
+        # Fresh by the default TTL: no request at all
+        tool.fetch_url(f"{site.url}/data.json")
+        assert site.paths().count("/data.json") == 1
+
+        missing = tool.fetch_url(f"{site.url}/gone")
+        assert not missing["success"] and "HTTP 404" in missing["error"]
+        assert browser_calls == []
+    finally:
+        site.close()
+
+
+def test_javascript_apps_and_bot_walls_escalate_to_browser(tool, browser_calls) -> None:
+    app = (
+        '<html><body><div id="root"></div>'
+        "<noscript>You need to enable JavaScript to run this app.</noscript>"
+        '<script src="/bundle.js"></script></body></html>'
+    )
+    site = _Site(
+        {
+            "/app": (200, {"Content-Type": "text/html"}, app),
+            "/blocked": (403, {"Content-Type": "text/html"}, "denied"),
+        }
+    )
+    try:
+        assert tool.fetch_url(f"{site.url}/app")["content"] == "rendered"
+        assert tool.fetch_url(f"{site.url}/blocked")["content"] == "rendered"
+        assert browser_calls == [f"{site.url}/app", f"{site.url}/blocked"]
+    finally:
+        site.close()
+
+
+def test_deep_crawl_fetches_levels_concurrently_per_host(tool, browser_calls) -> None:
+    html = {"Content-Type": "text/html"}
+    children = [f"/docs/{n}" for n in range(8)]
+    routes = {"/docs/": (200, html, _page("Index", children + ["/blog/post", "https://x.test/"]))}
+    routes.update({path: (200, html, _page(f"Page {path}")) for path in children})
+    site = _Site(routes, delay=0.1)
+    tool.MAX_CONNECTIONS_PER_HOST = 3
+    try:
+        result = tool.fetch_url(
+            f"{site.url}/docs/",
+            deep_crawl=True,
+            max_depth=1,
+            url_patterns=["*/docs/*"],
+            max_length=None,
+        )
+        assert result["success"], result
+        assert result["page_count"] == 9
+        assert [page["depth"] for page in result["pages"]] == [0] + [1] * 8
+        assert "### Page 2: " + f"{site.url}/docs/0" in result["content"]
+        assert "/blog/post" not in site.paths() and "/nav-only" not in site.paths()
+        assert site.max_active == 3
+
+        capped = tool.fetch_url(f"{site.url}/docs/", deep_crawl=True, max_pages=3)
+        assert capped["page_count"] == 3
+        assert browser_calls == []
+    finally:
+        site.close()
+
+
+def test_static_crawl_rejects_non_positive_max_pages(tool, browser_calls) -> None:
+    for max_pages in (0, -1):
+        result = asyncio.run(
+            tool._crawl_static(
+                "https://docs.test/",
+                extract_text=True,
+                max_length=None,
+                max_depth=1,
+                include_external=False,
+                max_pages=max_pages,
+                allowed_domains=None,
+                blocked_domains=None,
+                url_patterns=None,
+            )
+        )
+        assert not result["success"] and "max_pages" in result["error"]
+    assert browser_calls == []
+
+
+def test_http_cache_freshness_and_eviction(tmp_path: Path) -> None:
+    assert freshness({"cache-control": "no-store"}) is None
+    assert freshness({"cache-control": "public, max-age=60"}) == 60.0
+    assert freshness({}, default_ttl=5.0) == 5.0
+
+    def entry(n: int) -> CachedResponse:
+        return CachedResponse(f"https://e.test/{n}", 200, "text/plain", "x" * 500)
+
+    probe = HttpCache(tmp_path / "probe")
+    probe.put("https://e.test/0", entry(0))
+    entry_size = next((tmp_path / "probe").glob("*.json")).stat().st_size
+
+    # Room for three entries
+    cache = HttpCache(tmp_path / "web", max_bytes=entry_size * 3 + entry_size // 2)
+    for n in range(3):
+        assert cache.put(f"https://e.test/{n}", entry(n))
+        time.sleep(0.01)
+    # Least recently used entries go first; reads count as use
+    assert cache.get("https://e.test/0") is not None
+    time.sleep(0.01)
+    cache.put("https://e.test/3", entry(3))
+    assert cache.get("https://e.test/1") is None
+    assert [cache.get(f"https://e.test/{n}") is not None for n in (0, 2, 3)] == [True] * 3
+    assert len(list((tmp_path / "web").glob("*.json"))) == 3
+
+
+def test_html_to_markdown_structure() -> None:
+    document = html_to_markdown(
+        "<html><head><title>T</title><base href='/base/'></head><body>"
+        "<h2>Usage</h2><p>Call <code>run()</code> then <a href='api#x'>the <b>API</b></a>.</p>"
+        "<pre><code class='language-python'>print(1)\n</code></pre>"
+        "<ol><li>One<ul><li>Sub</li></ul></li><li>Two</li></ol>"
+        "<table><tr><th>k</th><th>v</th></tr><tr><td>a</td><td>1</td></tr></table>"
+        "</body></html>",
+        "https://docs.test/guide/",
+    )
+    assert document.title == "T"
+    assert document.markdown == (
+        "## Usage\n\n"
+        "Call `run()` then [the **API**](https://docs.test/base/api).\n\n"
+        "```python\nprint(1)\n```\n\n"
+        "1. One\n  - Sub\n2. Two\n\n"
+        "| k | v |\n| --- | --- |\n| a | 1 |"
+    )
+    assert document.links == [("https://docs.test/base/api", "the **API**")]
+    assert not document.needs_javascript
@@ -0,0 +1,236 @@
+"""Tests for the shared workspace file catalog."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from swecli.core.context_engineering.retrieval import workspace_catalog
+from swecli.core.context_engineering.retrieval.workspace_catalog import (
+    WorkspaceCatalog,
+    glob_to_regex,
+)
+from swecli.core.context_engineering.tools.implementations.file_ops import FileOperations
+from swecli.models.config import AppConfig
+from swecli.ui_textual.autocomplete_internal.utils import FileFinder
+
+
+def _write(root: Path, rel: str, text: str = "") -> Path:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+@pytest.fixture()
+def tree(tmp_path: Path) -> Path:
+    root = tmp_path / "ws"
+    _write(root, "README.md")
+    _write(root, "src/app.py")
+    _write(root, "src/pkg/models.py")
+    _write(root, "src2/other.py")
+    _write(root, "node_modules/dep/index.js")
+    _write(root, ".git/HEAD")
+    _write(root, "logs/run.log")
+    _write(root, "logs/keep.log")
+    _write(root, "web/.gitignore", "*.map\n")
+    _write(root, "web/app.js")
+    _write(root, "web/app.js.map")
+    _write(root, ".gitignore", "logs/*\n!logs/keep.log\n")
+    return root
+
+
+@pytest.fixture()
+def catalog(tree: Path):
+    cat = WorkspaceCatalog(tree)
+    yield cat
+    cat.close()
+
+
+@pytest.fixture()
+def polling(tree: Path):
+    cat = WorkspaceCatalog(tree, watch=False, poll_interval=0)
+    yield cat
+    cat.close()
+
+
+class TestCatalogListing:
+    def test_initial_scan_honours_ignores(self, catalog: WorkspaceCatalog) -> None:
+        assert catalog.files() == [
+            ".gitignore",
+            "README.md",
+            "logs/keep.log",
+            "node_modules/dep/index.js",
+            "src/app.py",
+            "src/pkg/models.py",
+            "src2/other.py",
+            "web/.gitignore",
+            "web/app.js",
+        ]
+        assert catalog.dirs() == [
+            "logs", "node_modules", "node_modules/dep", "src", "src/pkg", "src2", "web",
+        ]
+
+    def test_files_under_prefix(self, catalog: WorkspaceCatalog) -> None:
+        assert catalog.files("src") == ["src/app.py", "src/pkg/models.py"]
+        assert catalog.children("src") == {"app.py": False, "pkg": True}
+        assert catalog.children(".git") is None
+
+    @pytest.mark.parametrize(
+        ("pattern", "expected"),
+        [
+            ("**/*.py", ["src/app.py", "src/pkg/models.py", "src2/other.py"]),
+            ("src/*.py", ["src/app.py"]),
+            ("*.md", ["README.md"]),
+            ("src/**/models.py", ["src/pkg/models.py"]),
+            ("src[2]/*.py", ["src2/other.py"]),
+        ],
+    )
+    def test_glob(self, catalog: WorkspaceCatalog, pattern: str, expected: list[str]) -> None:
+        assert catalog.glob(pattern) == expected
+
+    def test_glob_under(self, catalog: WorkspaceCatalog) -> None:
+        assert catalog.glob("*.py", under="src") == ["src/app.py"]
+        assert glob_to_regex("**/*.py").match("a.py")
+
+    def test_find_ranks_and_fuzzy(self, catalog: WorkspaceCatalog) -> None:
+        assert catalog.find("app") == ["src/app.py", "web/app.js"]
+        assert catalog.find("smod", fuzzy=True) == ["src/pkg/models.py"]
+        assert "src/pkg" in catalog.find("pkg", include_dirs=True)
+        assert catalog.find("other", exclude_dirs={"src2"}) == []
+
+    def test_stats(self, catalog: WorkspaceCatalog) -> None:
+        stats = catalog.stats()
+        assert stats["files"] == 9
+        assert stats["dirs"] == 7
+        assert stats["memory_bytes"] > 0
+        assert stats["backend"] in ("inotify", "polling")
+
+
+class TestCatalogUpdates:
+    @pytest.fixture()
+    def watched(self, catalog: WorkspaceCatalog) -> WorkspaceCatalog:
+        catalog.sync()
+        if catalog.backend != "inotify":
+            pytest.skip("inotify not available")
+        return catalog
+
+    def test_inotify_create_delete(self, watched: WorkspaceCatalog, tree: Path) -> None:
+        token = watched.generation
+        _write(tree, "src/new.py")
+        (tree / "README.md").unlink()
+        _write(tree, "logs/ignored.log")
+
+        assert "src/new.py" in watched.files()
+        assert "README.md" not in watched.files()
+        assert "logs/ignored.log" not in watched.files()
+        assert watched.changes_since(token) == {"src/new.py", "README.md"}
+
+    def test_inotify_reports_content_writes(self, watched: WorkspaceCatalog, tree: Path) -> None:
+        token = watched.generation
+        (tree / "src" / "app.py").write_text("changed")
+        assert watched.changes_since(token) == {"src/app.py"}
+
+    def test_inotify_new_and_moved_dirs(self, watched: WorkspaceCatalog, tree: Path) -> None:
+        _write(tree, "lib/deep/nested/mod.py")
+        assert "lib/deep/nested/mod.py" in watched.files()
+
+        (tree / "src").rename(tree / "source")
+        assert watched.files("src") == []
+        assert watched.files("source") == ["source/app.py", "source/pkg/models.py"]
+
+        _write(tree, "source/pkg/later.py")
+        assert "source/pkg/later.py" in watched.files()
+
+    def test_gitignore_change_rescans(self, watched: WorkspaceCatalog, tree: Path) -> None:
+        token = watched.generation
+        _write(tree, "src/.gitignore", "pkg/\n")
+        assert watched.files("src") == ["src/.gitignore", "src/app.py"]
+        assert watched.changes_since(token) is None
+
+    def test_polling_backend(self, polling: WorkspaceCatalog, tree: Path) -> None:
+        assert polling.backend == "polling"
+        assert polling.tracks_content_changes is False
+        token = polling.generation
+
+        _write(tree, "src/pkg/added.py")
+        _write(tree, "newdir/inner.py")
+        (tree / "src2" / "other.py").unlink()
+
+        files = polling.files()
+        assert "src/pkg/added.py" in files
+        assert "newdir/inner.py" in files
+        assert "src2/other.py" not in files
+        assert polling.changes_since(token) is None
+
+    def test_watch_limit_falls_back_to_polling(self, tree: Path) -> None:
+        with patch.object(
+            workspace_catalog._Inotify, "add_watch", side_effect=OSError(28, "No space left")
+        ):
+            cat = WorkspaceCatalog(tree, poll_interval=0)
+            assert "src/app.py" in cat.files()
+        assert cat.backend == "polling"
+        _write(tree, "src/late.py")
+        assert "src/late.py" in cat.files()
+
+
+class TestCatalogConsumers:
+    @pytest.fixture(autouse=True)
+    def isolated_registry(self):
+        with patch.object(workspace_catalog, "_catalogs", {}):
+            yield
+            workspace_catalog.close_workspace_catalogs()
+
+    def test_glob_files_uses_catalog(self, tree: Path) -> None:
+        file_ops = FileOperations(AppConfig(), tree)
+        with patch.object(Path, "glob", side_effect=AssertionError("walked the disk")):
+            assert file_ops.glob_files("**/*.py") == [
+                "src/app.py", "src/pkg/models.py", "src2/other.py",
+            ]
+
+    def test_glob_files_falls_back_for_ignored(self, tree: Path) -> None:
+        file_ops = FileOperations(AppConfig(), tree)
+        assert file_ops.glob_files("logs/run.log") == ["logs/run.log"]
+
+    def test_glob_files_filters_wildcards_consistently(self, tree: Path) -> None:
+        file_ops = FileOperations(AppConfig(), tree)
+        with patch.object(Path, "glob", side_effect=AssertionError("walked the disk")):
+            assert file_ops.glob_files("**/*.log") == ["logs/keep.log"]
+            assert file_ops.glob_files("logs/*.log") == ["logs/keep.log"]
+            assert file_ops.glob_files("**/*.missing") == []
+
+    def test_glob_files_sees_dirs_pickers_skip(self, tree: Path) -> None:
+        _write(tree, "src/temp/a.py")
+        _write(tree, "src/deps/b.py")
+        _write(tree, ".vscode/settings.json")
+        file_ops = FileOperations(AppConfig(), tree)
+        found = file_ops.glob_files("**/*.py")
+        assert "src/temp/a.py" in found and "src/deps/b.py" in found
+        assert file_ops.glob_files(".vscode/*.json") == [".vscode/settings.json"]
+        # File pickers still leave dependency and cache directories out
+        finder = FileFinder(tree)
+        assert finder.find_files("temp/") == []
+        assert finder.find_files("index") == []
+
+    def test_indexer_counts_catalogued_files(self, tree: Path) -> None:
+        from swecli.core.context_engineering.retrieval.indexer import CodebaseIndexer
+
+        with patch(
+            "swecli.core.context_engineering.retrieval.indexer.ContextTokenMonitor"
+        ):
+            overview = CodebaseIndexer(working_dir=tree)._generate_overview()
+        assert "**Total Files:** 9" in overview
+
+    def test_list_directory_from_catalog(self, tree: Path) -> None:
+        file_ops = FileOperations(AppConfig(), tree)
+        listing = file_ops.list_directory(".", max_depth=2)
+        assert "app.js" in listing
+        assert "app.js.map" not in listing
+        assert "node_modules" not in listing
+
+    def test_autocomplete_finder(self, tree: Path) -> None:
+        finder = FileFinder(tree)
+        assert finder.find_files("models") == [tree / "src/pkg/models.py"]
+        _write(tree, "src/models_extra.py")
+        finder.invalidate_cache()
+        assert tree / "src/models_extra.py" in finder.find_files("models")